@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import random
+
+from features.expertise import ExpertiseClass
+from features.house.garden import SEED_DATA, GardenPlot
+from features.npcs.npc import NPC
+from features.player import Player
+from features.shared.constants import MAX_GARDEN_SIZE
+from features.shared.enums import ClassTag, HouseRoom, StateTag
+from features.shared.item import LOADED_ITEMS, Item, ItemKey
+from features.stories.forest.combat.npcs.brigand import Brigand
+from features.stories.forest.combat.npcs.evoker import Evoker
+from features.stories.forest.combat.npcs.marauder import Marauder
+from features.stories.forest.combat.npcs.mystic import Mystic
+
+from typing import TYPE_CHECKING, Dict, List
+if TYPE_CHECKING:
+    from features.equipment import Equipment
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Every fixture is built from its own seeded Random so adding or reordering
+# benchmarks never changes what the others run against.
+FIXTURE_SEED = 1234
+
+ALL_ITEM_KEYS: List[ItemKey] = list(ItemKey)
+
+GEM_KEYS: List[ItemKey] = [
+    item_key for item_key in ItemKey
+    if ClassTag.Valuable.Gemstone in LOADED_ITEMS.get_item_state(item_key)["class_tags"]
+]
+
+SEED_KEYS: List[ItemKey] = list(SEED_DATA.keys())
+
+SOIL_KEYS: List[ItemKey | None] = [None, ItemKey.Ash, ItemKey.Compost, ItemKey.Ichordross, ItemKey.WoodChips]
+
+EQUIPMENT_SLOTS: List[ClassTag.Equipment] = [
+    ClassTag.Equipment.Helmet,
+    ClassTag.Equipment.ChestArmor,
+    ClassTag.Equipment.Gloves,
+    ClassTag.Equipment.Boots,
+    ClassTag.Equipment.Amulet,
+    ClassTag.Equipment.Ring,
+    ClassTag.Equipment.Leggings,
+    ClassTag.Equipment.MainHand,
+    ClassTag.Equipment.OffHand
+]
+
+# Equipment that can hold gems, by the slot it goes in
+SOCKETABLE_EQUIPMENT: Dict[ClassTag.Equipment, List[ItemKey]] = {slot: [] for slot in EQUIPMENT_SLOTS}
+for _item_key in ItemKey:
+    _state = LOADED_ITEMS.get_item_state(_item_key)
+    if ClassTag.Equipment.Equipment not in _state["class_tags"] or len(_state.get("altering_item_keys", [])) == 0:
+        continue
+    for _slot in EQUIPMENT_SLOTS:
+        if _slot in _state["class_tags"]:
+            SOCKETABLE_EQUIPMENT[_slot].append(_item_key)
+            break
+
+# -----------------------------------------------------------------------------
+# FIXTURES
+# -----------------------------------------------------------------------------
+
+def get_rng(offset: int=0):
+    return random.Random(FIXTURE_SEED + offset)
+
+
+def make_socketed_item(item_key: ItemKey, rng: random.Random):
+    item = LOADED_ITEMS.get_new_item(item_key)
+    if StateTag.NeedsIdentification in item.get_state_tags():
+        item.get_state_tags().remove(StateTag.NeedsIdentification)
+    item.set_altering_item_keys([rng.choice(GEM_KEYS) for _ in item.get_altering_item_keys()])
+    return item
+
+
+def equip_socketed_gear(equipment: Equipment, rng: random.Random):
+    for slot in EQUIPMENT_SLOTS:
+        if len(SOCKETABLE_EQUIPMENT[slot]) > 0:
+            equipment.equip_item_to_slot(slot, make_socketed_item(rng.choice(SOCKETABLE_EQUIPMENT[slot]), rng))
+
+
+def fill_inventory(entity: Player | NPC, num_items: int, rng: random.Random):
+    # Adding items one at a time reorganizes the whole inventory every time,
+    # so add them all and let the inventory organize itself once
+    inventory = entity.get_inventory()
+    inventory.get_inventory_slots().extend(make_item_list(num_items, rng))
+    inventory.add_item(None)
+    inventory.add_coins(rng.randint(0, 100000))
+
+
+def fill_garden(player: Player, rng: random.Random):
+    house = player.get_house()
+    if HouseRoom.Garden not in house.house_rooms:
+        house.house_rooms.append(HouseRoom.Garden)
+
+    house.garden_plots = []
+    for _ in range(MAX_GARDEN_SIZE * MAX_GARDEN_SIZE):
+        plot = GardenPlot()
+        soil_key = rng.choice(SOIL_KEYS)
+        if soil_key is not None:
+            plot.soil = LOADED_ITEMS.get_new_item(soil_key)
+        # Leave some plots empty so there's somewhere for mutations to go
+        if rng.random() < 0.75:
+            plot.plant_seed(LOADED_ITEMS.get_new_item(rng.choice(SEED_KEYS)))
+            plot.growth_ticks = rng.randint(0, plot.seed_data.ticks_until_mature if plot.seed_data is not None else 0)
+            if plot.seed_data is not None and plot.growth_ticks >= plot.seed_data.ticks_until_mature:
+                plot.plant = LOADED_ITEMS.get_new_item(plot.seed_data.result)
+        house.garden_plots.append(plot)
+
+
+def make_player(player_id: str, level: int, num_items: int, rng: random.Random):
+    player = Player(player_id)
+    expertise = player.get_expertise()
+    for expertise_class in (ExpertiseClass.Fisher, ExpertiseClass.Guardian, ExpertiseClass.Merchant, ExpertiseClass.Alchemist):
+        expertise.add_xp_to_class_until_level(max(1, level // 4), expertise_class)
+    expertise.update_stats(player.get_combined_attributes())
+
+    equip_socketed_gear(player.get_equipment(), rng)
+    fill_inventory(player, num_items, rng)
+    fill_garden(player, rng)
+    return player
+
+
+def make_database(num_guilds: int, players_per_guild: int, num_items: int, offset: int=0):
+    rng = get_rng(offset)
+    database: dict = {}
+    for guild_index in range(num_guilds):
+        guild_id_str = str(100000 + guild_index)
+        database[guild_id_str] = {"members": {}}
+        for player_index in range(players_per_guild):
+            player_id_str = str(10000000 + guild_index * players_per_guild + player_index)
+            database[guild_id_str]["members"][player_id_str] = make_player(player_id_str, rng.randint(4, 60), num_items, rng)
+    return database
+
+
+def make_dungeon_enemies(rng: random.Random):
+    enemies: List[NPC] = [Brigand(" 1"), Marauder(" 2"), Evoker(" 3"), Mystic(" 4")]
+    for enemy in enemies:
+        equip_socketed_gear(enemy.get_equipment(), rng)
+    return enemies
+
+
+def make_item_list(num_items: int, rng: random.Random) -> List[Item]:
+    return [LOADED_ITEMS.get_new_item(rng.choice(ALL_ITEM_KEYS)) for _ in range(num_items)]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+from typing import Dict, List, Tuple
+
+# -----------------------------------------------------------------------------
+# IMPORT PROFILE
+# -----------------------------------------------------------------------------
+
+# Reports how long importing a module (by default the Adventures cog, which is
+# everything the bot needs before it can connect) takes, broken down by the
+# modules it pulls in. Uses Python's -X importtime in a fresh interpreter so
+# nothing is already cached in sys.modules.
+#
+#   python benchmarks/import_profile.py [--module cogs.adventures] [--top 30]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULE = "cogs.adventures"
+DEFAULT_TOP = 30
+DEFAULT_RUNS = 3
+
+
+def profile_import(module: str):
+    # Returns module -> (self us, cumulative us) for one fresh import
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def get_package_totals(timings: Dict[str, Tuple[int, int]], depth: int):
+    # Self time summed by the first few components of the module name, e.g.
+    # "features.stories" for depth 2
+    totals: Dict[str, int] = {}
+    for name, (self_us, _) in timings.items():
+        package = ".".join(name.split(".")[:depth])
+        totals[package] = totals.get(package, 0) + self_us
+    return totals
+
+
+def print_table(title: str, rows: List[Tuple[str, float]], total: float):
+    print(f"\n{title}")
+    for name, value in rows:
+        print(f"  {value / 1000:9.2f}ms  {value / total * 100:5.1f}%  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the import time of a module and everything it imports.")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Fresh imports to run; the fastest is reported")
+    args = parser.parse_args()
+
+    # Take the fastest run so disk cache and other noise count against it as
+    # little as possible
+    runs = [profile_import(args.module) for _ in range(args.runs)]
+    timings = min(runs, key=lambda run: run[args.module][1])
+    total = timings[args.module][1]
+
+    print(f"Importing {args.module}: {total / 1000:.2f}ms (fastest of {args.runs}), {len(timings)} modules")
+
+    by_cumulative = sorted(((name, cumulative) for name, (_, cumulative) in timings.items()), key=lambda row: row[1], reverse=True)
+    print_table("Cumulative (module and everything it imported first)", by_cumulative[:args.top], total)
+
+    by_self = sorted(((name, self_us) for name, (self_us, _) in timings.items()), key=lambda row: row[1], reverse=True)
+    print_table("Self (module body only)", by_self[:args.top], total)
+
+    by_package = sorted(get_package_totals(timings, 2).items(), key=lambda row: row[1], reverse=True)
+    print_table("Self time by package", by_package[:args.top], total)
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import jsonpickle
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+
+from dataclasses import dataclass, field
+
+from benchmarks.fixtures import ALL_ITEM_KEYS, fill_garden, get_rng, make_database, make_dungeon_enemies, make_item_list, make_player
+from cogs.adventures import TICK_SCHEDULER, Adventures
+from features.mail import MAIL_STORE
+from features.npcs.npc import NPC
+from features.player import Player
+from features.shared.ability import SeaSprayI
+from features.shared.item import LOADED_ITEMS
+from features.views.dueling_view import DuelView
+
+from typing import Callable, Dict, List
+
+# -----------------------------------------------------------------------------
+# MICROBENCHMARKS
+# -----------------------------------------------------------------------------
+
+# Times the game's hot paths against fixed-seed synthetic data and writes the
+# results to benchmarks/results/ so runs on different commits can be compared.
+# Run from the repo root:
+#
+#   python -m benchmarks.microbenchmarks [--filter duel] [--compare benchmarks/results/<file>.json]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+DEFAULT_REPEAT = 5
+
+# Fixture sizes
+LARGE_INVENTORY_ITEMS = 300
+PARTY_SIZE = 4
+PARTY_LEVEL = 40
+NUM_GUILDS = 20
+PLAYERS_PER_GUILD = 100
+ITEMS_PER_PLAYER = 20
+
+# Changes in median time smaller than this are reported as noise
+COMPARE_THRESHOLD = 0.05
+
+# -----------------------------------------------------------------------------
+# HARNESS
+# -----------------------------------------------------------------------------
+
+@dataclass
+class Benchmark():
+    name: str
+    # Builds fresh state for one repeat and returns the function to time, so
+    # benchmarks that change their fixtures never time a second run against
+    # already-changed data
+    setup: Callable[[], Callable[[], object]]
+    # Calls timed per repeat; the reported time is per call
+    number: int = 1
+    repeat: int = DEFAULT_REPEAT
+
+
+@dataclass
+class BenchmarkResult():
+    name: str
+    number: int
+    timings: List[float] = field(default_factory=list)
+
+    def get_summary(self):
+        return {
+            "number": self.number,
+            "repeat": len(self.timings),
+            "min": min(self.timings),
+            "median": statistics.median(self.timings),
+            "mean": statistics.mean(self.timings),
+            "stdev": statistics.stdev(self.timings) if len(self.timings) > 1 else 0
+        }
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int):
+    result = BenchmarkResult(benchmark.name, benchmark.number)
+    for _ in range(repeat):
+        func = benchmark.setup()
+        start_time = time.perf_counter()
+        for _ in range(benchmark.number):
+            func()
+        result.timings.append((time.perf_counter() - start_time) / benchmark.number)
+    return result
+
+# -----------------------------------------------------------------------------
+# FIXTURE HELPERS
+# -----------------------------------------------------------------------------
+
+class BenchmarkUser():
+    # Stands in for the discord.User objects the duel view looks players up by
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.display_name = f"Player {user_id}"
+        self.mention = f"<@{user_id}>"
+
+
+_DUEL_VIEW: DuelView | None = None
+
+def get_duel_view():
+    # Players against a dungeon party, built once since it's only ever copied
+    global _DUEL_VIEW
+    if _DUEL_VIEW is None:
+        rng = get_rng(1)
+        players = [make_player(str(20000000 + i), PARTY_LEVEL, ITEMS_PER_PLAYER, rng) for i in range(PARTY_SIZE)]
+        users = [BenchmarkUser(int(player.get_id())) for player in players]
+        _DUEL_VIEW = DuelView(None, {}, 0, users, players, make_dungeon_enemies(rng)) # type: ignore
+    return _DUEL_VIEW
+
+
+_DATABASE: dict | None = None
+
+def get_database():
+    global _DATABASE
+    if _DATABASE is None:
+        _DATABASE = make_database(NUM_GUILDS, PLAYERS_PER_GUILD, ITEMS_PER_PLAYER)
+    return _DATABASE
+
+# -----------------------------------------------------------------------------
+# BENCHMARKS
+# -----------------------------------------------------------------------------
+
+def setup_get_new_item():
+    item_keys = get_rng(2).choices(ALL_ITEM_KEYS, k=100)
+    def run():
+        for item_key in item_keys:
+            LOADED_ITEMS.get_new_item(item_key)
+    return run
+
+
+def setup_add_item():
+    rng = get_rng(3)
+    player = make_player("1", PARTY_LEVEL, LARGE_INVENTORY_ITEMS, rng)
+    new_items = make_item_list(10, rng)
+    inventory = player.get_inventory()
+    def run():
+        inventory.add_item(new_items.pop())
+    return run
+
+
+def setup_get_item_effects():
+    items = get_duel_view()._allies[0].get_equipment().get_all_equipped_items()
+    def run():
+        for item in items:
+            item.get_item_effects()
+    return run
+
+
+def setup_get_dmg_buff_effect_totals():
+    player = get_duel_view()._allies[0]
+    equipment = player.get_equipment()
+    return lambda: equipment.get_dmg_buff_effect_totals(player)
+
+
+def setup_create_copy():
+    duel_view = get_duel_view()
+    return duel_view.create_copy
+
+
+def setup_take_npc_turn():
+    duel_view = get_duel_view().create_copy()
+    duel_view._turn_index = next(i for i, entity in enumerate(duel_view._turn_order) if isinstance(entity, NPC))
+    random.seed(4)
+    return duel_view.take_npc_turn
+
+
+def setup_use_damage_ability():
+    duel_view = get_duel_view().create_copy()
+    caster = duel_view._allies[0]
+    targets = duel_view._enemies[:1]
+    ability = SeaSprayI()
+    random.seed(5)
+    return lambda: ability._use_damage_ability(caster, targets, range(2, 4))
+
+
+def setup_tick_garden():
+    player = Player("1")
+    fill_garden(player, get_rng(6))
+    random.seed(6)
+    return player.get_house().tick_garden
+
+
+def setup_adventures_tick():
+    database = get_database()
+    # Skip __init__, which loads adventuresdb.json and starts the task loops
+    adventures: Adventures = Adventures.__new__(Adventures)
+    adventures._database = database
+    # Companions that find something while ticking send it by mail
+    if not MAIL_STORE.is_open():
+        MAIL_STORE.open(":memory:")
+
+    # Pretend an hour has passed so every player has a tick to apply
+    for guild_id_str in database.keys():
+        for player in database[guild_id_str]["members"].values():
+            player._last_tick -= 1
+
+    async def run_all_slots():
+        for slot in range(TICK_SCHEDULER.get_num_slots()):
+            await TICK_SCHEDULER.run_slot(database, slot, adventures._tick_member)
+    return lambda: asyncio.run(run_all_slots())
+
+
+def setup_save_database():
+    database = get_database()
+    return lambda: jsonpickle.encode(database, make_refs=False)
+
+
+def setup_load_database():
+    frozen = jsonpickle.encode(get_database(), make_refs=False)
+    return lambda: jsonpickle.decode(frozen)
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("LoadedItems.get_new_item x100", setup_get_new_item, number=10),
+    Benchmark(f"Inventory.add_item ({LARGE_INVENTORY_ITEMS} items)", setup_add_item, number=5),
+    Benchmark("Item.get_item_effects (socketed gear)", setup_get_item_effects, number=100),
+    Benchmark("Equipment.get_dmg_buff_effect_totals", setup_get_dmg_buff_effect_totals, number=100),
+    Benchmark(f"DuelView.create_copy ({PARTY_SIZE}v4)", setup_create_copy, number=10),
+    Benchmark(f"DuelView.take_npc_turn ({PARTY_SIZE}v4)", setup_take_npc_turn),
+    Benchmark("Ability._use_damage_ability", setup_use_damage_ability, number=100),
+    Benchmark("House.tick_garden (full garden)", setup_tick_garden, number=10),
+    Benchmark(f"Adventures.tick ({NUM_GUILDS * PLAYERS_PER_GUILD} players)", setup_adventures_tick, repeat=3),
+    Benchmark(f"Save database ({NUM_GUILDS * PLAYERS_PER_GUILD} players)", setup_save_database, repeat=3),
+    Benchmark(f"Load database ({NUM_GUILDS * PLAYERS_PER_GUILD} players)", setup_load_database, repeat=3)
+]
+
+# -----------------------------------------------------------------------------
+# RESULTS
+# -----------------------------------------------------------------------------
+
+def get_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(results: List[BenchmarkResult], path: str | None):
+    commit = get_commit()
+    timestamp = datetime.datetime.now()
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{timestamp.strftime('%Y%m%d-%H%M%S')}-{commit}.json")
+
+    with open(path, "w") as file:
+        json.dump({
+            "commit": commit,
+            "timestamp": timestamp.isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "benchmarks": {result.name: result.get_summary() for result in results}
+        }, file, indent=2)
+    return path
+
+
+def format_time(seconds: float):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def print_comparison(results: List[BenchmarkResult], baseline_path: str):
+    with open(baseline_path, "r") as file:
+        baseline = json.load(file)
+    baseline_benchmarks: Dict[str, dict] = baseline["benchmarks"]
+
+    print(f"\nCompared to {baseline['commit']} ({baseline['timestamp']}):")
+    for result in results:
+        baseline_summary = baseline_benchmarks.get(result.name)
+        if baseline_summary is None:
+            print(f"  {result.name}: not in baseline")
+            continue
+
+        median = result.get_summary()["median"]
+        ratio = median / baseline_summary["median"]
+        verdict = "faster" if ratio < 1 - COMPARE_THRESHOLD else ("slower" if ratio > 1 + COMPARE_THRESHOLD else "same")
+        print(f"  {result.name}: {format_time(baseline_summary['median'])} -> {format_time(median)} ({ratio:.2f}x, {verdict})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the game's hot paths against fixed-seed synthetic data.")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=None, help="Override each benchmark's number of repeats")
+    parser.add_argument("--output", default=None, help="Where to write the results; defaults to benchmarks/results/")
+    parser.add_argument("--compare", default=None, help="A previous results file to compare against")
+    args = parser.parse_args()
+
+    results: List[BenchmarkResult] = []
+    for benchmark in BENCHMARKS:
+        if args.filter.lower() not in benchmark.name.lower():
+            continue
+        result = run_benchmark(benchmark, args.repeat if args.repeat is not None else benchmark.repeat)
+        summary = result.get_summary()
+        print(f"{benchmark.name}: median {format_time(summary['median'])}, min {format_time(summary['min'])}, stdev {format_time(summary['stdev'])} ({summary['repeat']}x{summary['number']})")
+        results.append(result)
+
+    if len(results) == 0:
+        print("No benchmarks matched.")
+    else:
+        print(f"\nResults written to {write_results(results, args.output)}")
+        if args.compare is not None:
+            print_comparison(results, args.compare)
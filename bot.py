@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import time
 
 from discord.ext import commands
 from discord import Intents
 from dotenv import load_dotenv
 
+from features.shared.guild_locks import GUILD_LOCKS, instrument_view_locking
+from features.shared.metrics import METRICS, instrument_view_callbacks
+from features.shared.profiler import PROFILER, instrument_view_profiling
+from features.shared.sharding import SHARD_CONFIG
+from features.shared.watchdog import WATCHDOG
+
 # -----------------------------------------------------------------------------
 # GLOBALS
 # -----------------------------------------------------------------------------
@@ -15,16 +23,34 @@ load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 VERSION_NUMBER = "20231001" # Just for tracking releases
 
-class BenjaminBowtieBot(commands.Bot):
+# AutoShardedBot runs whichever shards SHARD_CONFIG gives it in this process;
+# unsharded, that's however many Discord recommends, all in this process
+class BenjaminBowtieBot(commands.AutoShardedBot):
     def __init__(self):
-        super().__init__(command_prefix=commands.when_mentioned_or("b!"), intents=Intents().all())
+        super().__init__(
+            command_prefix=commands.when_mentioned_or("b!"),
+            intents=Intents().all(),
+            shard_count=SHARD_CONFIG.get_shard_count(),
+            shard_ids=SHARD_CONFIG.get_shard_ids()
+        )
 
     async def setup_hook(self):
+        WATCHDOG.start(asyncio.get_running_loop())
+
         await self.load_extension("cogs.images")
         await self.load_extension("cogs.randomization")
         await self.load_extension("cogs.adventures")
 
+    async def close(self):
+        WATCHDOG.stop()
+        await super().close()
+
 bot = BenjaminBowtieBot()
+if SHARD_CONFIG.is_sharded():
+    METRICS.set_constant_labels({"shard": SHARD_CONFIG.get_name()})
+instrument_view_callbacks(METRICS)
+instrument_view_profiling(PROFILER)
+instrument_view_locking(GUILD_LOCKS)
 
 # -----------------------------------------------------------------------------
 # LOGGING
@@ -53,6 +79,22 @@ INFO_LOGGER = setup_logger("discord", "info.log")
 async def globally_block_dms(context: commands.Context):
     return context.guild is not None
 
+@bot.before_invoke
+async def before_command(context: commands.Context):
+    setattr(context, "metrics_start_time", time.perf_counter())
+    if context.command is not None:
+        setattr(context, "is_profiled", PROFILER.start([context.command.qualified_name]))
+
+@bot.after_invoke
+async def after_command(context: commands.Context):
+    PROFILER.stop(getattr(context, "is_profiled", False))
+
+    start_time: float | None = getattr(context, "metrics_start_time", None)
+    if start_time is None or context.command is None:
+        return
+    status = "error" if context.command_failed else "ok"
+    METRICS.observe("bot_command_seconds", time.perf_counter() - start_time, {"command": context.command.qualified_name, "status": status})
+
 @bot.event
 async def on_command_error(context: commands.Context, error):
   if isinstance(error, commands.CommandOnCooldown):
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import datetime
+import asyncio
+import json
 import jsonpickle
 import os
 import random
 import shutil
+import signal
 import time
 
 from discord import User
@@ -27,7 +29,8 @@ from features.house.study import StudyView
 from features.house.workshop import WorkshopView
 from features.house.house import HouseView
 from features.inventory import InventoryView
-from features.mail import Mail, MailView, MailboxView
+from features.leaderboards import LEADERBOARDS, LeaderboardView
+from features.mail import MAIL_STORE, Mail, MailView, MailboxView
 from features.market import MarketView
 from features.npcs.abarra import Blacksmith
 from features.npcs.copperbroad import Chef
@@ -38,9 +41,18 @@ from features.npcs.tiatha import Druid
 from features.npcs.viktor import RandomItemMerchant
 from features.npcs.yenna import Yenna
 from features.player import Player
-from features.stats import StatCategory, StatView
+from features.stats import LeaderboardCategory, StatCategory, StatView
+from features.shared.constants import NOTIFICATION_FLUSH_SECONDS
 from features.shared.enums import ClassTag, CompanionKey, ForestSection, OceanSection, UnderworldSection
+from features.shared.guild_locks import GUILD_LOCKS
 from features.shared.item import Item, LOADED_ITEMS, ItemKey, Rarity
+from features.shared.loot import FISHING_LOOT_TABLE, FISHING_LUCK_MOD, WISHING_WELL_LOOT_TABLE, WISHING_WELL_LUCK_MOD, LootEntry, LootTable
+from features.shared.metrics import EVENT_LOOP_LAG_PROBE_SECONDS, METRICS, METRICS_EXPORT_SECONDS, METRICS_FILE
+from features.shared.notifications import NOTIFICATIONS
+from features.shared.profiler import PROFILER
+from features.shared.sharding import MAIL_DATABASE_FILE, SHARD_CONFIG
+from features.shared.tick_scheduler import TickScheduler
+from features.shared.watchdog import WATCHDOG
 from features.stories.forest.forest import ForestDungeonEntranceView, ForestStory
 from features.stories.ocean.ocean import OceanDungeonEntranceView, OceanStory
 from features.stories.story import Story
@@ -48,7 +60,7 @@ from features.stories.underworld.underworld import UnderworldDungeonEntranceView
 from features.trainers import TrainerView
 from games.knucklebones import Knucklebones
 
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 if TYPE_CHECKING:
     from features.dueling import Dueling
     from features.expertise import Expertise
@@ -57,15 +69,68 @@ if TYPE_CHECKING:
     from features.shared.ability import Ability
     from features.stats import Stats
 
+TICK_SCHEDULER = TickScheduler()
+
 class Adventures(commands.Cog):
     def __init__(self, bot: BenjaminBowtieBot):
         self._bot = bot
         
-        file_data = open("./adventuresdb.json", "r").read()
-        self._database: dict = jsonpickle.decode(file_data) if os.path.isfile("./adventuresdb.json") else {}
+        # When sharded, this process only loads the files for the shards it
+        # owns; a shard without a file hasn't had any guilds saved yet
+        SHARD_CONFIG.check_database_layout()
+        self._database: dict = {}
+        for database_path, _ in SHARD_CONFIG.get_database_paths().values():
+            if os.path.isfile(database_path):
+                with open(database_path, "r") as file:
+                    self._database.update(SHARD_CONFIG.filter_database(jsonpickle.decode(file.read())))
+
+        self._save_lock = asyncio.Lock()
 
         self._database_npc_and_story_setup()
+        self._open_mail_store()
+        LEADERBOARDS.rebuild(self._database)
+        self._set_player_gauges([self._count_players(guild_data) for guild_data in self._database.values()])
+
         self.tick.start()
+        self.flush_notifications.start()
+        self.probe_event_loop_lag.start()
+        self.export_metrics.start()
+
+    def _open_mail_store(self):
+        MAIL_STORE.open(MAIL_DATABASE_FILE)
+        MAIL_STORE.sync_with_database(self._database, SHARD_CONFIG.owns_guild)
+
+    async def cog_load(self):
+        # shard_coordinator.py asks every process to save at once with SIGUSR1;
+        # there's no equivalent on Windows
+        if hasattr(signal, "SIGUSR1"):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, lambda: asyncio.create_task(self.save_database()))
+
+    # Game commands change their guild's players the same way view callbacks
+    # do, so they hold the same lock. It's taken here rather than for every
+    # command so the ones that wait on the network, like b!xkcd, don't hold
+    # up the guild.
+    async def cog_before_invoke(self, context: commands.Context):
+        setattr(context, "holds_guild_lock", await GUILD_LOCKS.acquire(context.guild.id if context.guild is not None else None))
+
+    async def cog_after_invoke(self, context: commands.Context):
+        if getattr(context, "holds_guild_lock", False) and context.guild is not None:
+            GUILD_LOCKS.release(context.guild.id)
+            setattr(context, "holds_guild_lock", False)
+
+    async def cog_unload(self):
+        # The cog is unloaded when the bot closes, which is what Ctrl+C and
+        # shard_coordinator.py stopping or restarting a process both do, so
+        # anything since the last hourly save is saved here rather than lost
+        self.tick.cancel()
+        self.flush_notifications.cancel()
+        self.probe_event_loop_lag.cancel()
+        self.export_metrics.cancel()
+        if hasattr(signal, "SIGUSR1"):
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR1)
+
+        await self.save_database()
+        MAIL_STORE.close()
 
     def _database_npc_and_story_setup(self, specific_guild_id_str: str | None=None):
         def create_stories_and_npcs(guild_id_str: str):
@@ -111,7 +176,7 @@ class Adventures(commands.Cog):
                 create_stories_and_npcs(guild_id_str)
                 validate_user_ids(guild_id_str)
 
-    def _check_member_and_guild_existence(self, guild_id: int, user_id: int):
+    def _check_member_and_guild_existence(self, guild_id: int, user_id: int, is_author: bool=True):
         guild_id_str: str = str(guild_id)
         user_id_str: str = str(user_id)
 
@@ -122,6 +187,13 @@ class Adventures(commands.Cog):
         
         if self._database[guild_id_str]["members"].get(user_id_str) is None:
             self._database[guild_id_str]["members"][user_id_str] = Player(user_id_str)
+            LEADERBOARDS.add_player(guild_id_str, user_id_str, self._database[guild_id_str]["members"][user_id_str])
+
+        player: Player = self._database[guild_id_str]["members"][user_id_str]
+        player.catch_up_ticks(guild_id_str)
+        # Being mentioned or sent mail shouldn't keep a dormant player ticking
+        if is_author:
+            player.mark_active()
 
     def _get_player(self, guild_id: int, user_id: int) -> Player:
         return self._database[str(guild_id)]["members"][str(user_id)]
@@ -149,32 +221,120 @@ class Adventures(commands.Cog):
                 mapped.append(user)
         return mapped
 
-    @tasks.loop(time=[datetime.time(hour=i) for i in range(24)])
-    async def tick(self):
-        for guild_id in self._database.keys():
-            guild_id_str = str(guild_id)
-            for user_id in self._database[guild_id_str].get("members", {}).keys():
-                player: Player = self._get_player(guild_id, user_id)
-                await player.tick(self._bot)
-                
-                if not player.get_dueling().is_in_combat:
-                    player.get_dueling().decrement_all_ability_cds()
-                    player.get_dueling().decrement_statuses_time_remaining()
-
-            for npc_id in self._database[guild_id_str].get("npcs", {}).keys():
-                if npc_id == NPCRoles.RandomItemMerchant:
-                    npc: RandomItemMerchant = self._database[guild_id_str]["npcs"][npc_id]
-                    npc.tick()
- 
-        await self.save_database()
+    async def _tick_member(self, guild_id_str: str, user_id_str: str):
+        player: Player | None = self._database.get(guild_id_str, {}).get("members", {}).get(user_id_str)
+        # Dormant players are caught up the next time they're accessed instead
+        if player is None or not player.is_active():
+            return
+
+        async with GUILD_LOCKS.hold(guild_id_str):
+            player.tick(guild_id_str)
 
+    @tasks.loop(time=TICK_SCHEDULER.get_tick_times())
+    @METRICS.timed("bot_tick_seconds")
+    async def tick(self):
+        # Usually just the one slot this was scheduled for, but more if the
+        # last run was late
+        for slot in TICK_SCHEDULER.get_due_slots():
+            with PROFILER.profile("tick"):
+                await TICK_SCHEDULER.run_slot(self._database, slot, self._tick_member)
+            await NOTIFICATIONS.flush(self._bot)
+
+            # NPCs and the save still only happen once an hour
+            if slot == 0:
+                for guild_id_str in list(self._database.keys()):
+                    async with GUILD_LOCKS.hold(guild_id_str):
+                        for npc_id in self._database[guild_id_str].get("npcs", {}).keys():
+                            if npc_id == NPCRoles.RandomItemMerchant:
+                                npc: RandomItemMerchant = self._database[guild_id_str]["npcs"][npc_id]
+                                npc.tick()
+            
+            if slot == TICK_SCHEDULER.get_num_slots() - 1:
+                await self.save_database()
+
+    # Picks up notifications from outside the tick, like mail sent between players
+    @tasks.loop(seconds=NOTIFICATION_FLUSH_SECONDS)
+    async def flush_notifications(self):
+        await NOTIFICATIONS.flush(self._bot)
+
+    # Anything that blocks the event loop (a slow save, a long tick, an
+    # expensive NPC turn) shows up as this sleep waking up late
+    @tasks.loop(seconds=EVENT_LOOP_LAG_PROBE_SECONDS)
+    async def probe_event_loop_lag(self):
+        expected_sleep = 0.1
+        start_time = time.perf_counter()
+        await asyncio.sleep(expected_sleep)
+        METRICS.observe("bot_event_loop_lag_seconds", max(0, time.perf_counter() - start_time - expected_sleep))
+
+    def _count_players(self, guild_data: dict):
+        # Players, active players and inventory slots, for the metrics
+        num_players = 0
+        num_active_players = 0
+        num_items = 0
+        for player in guild_data.get("members", {}).values():
+            num_players += 1
+            if player.is_active():
+                num_active_players += 1
+            num_items += len(player.get_inventory().get_inventory_slots())
+        return num_players, num_active_players, num_items
+
+    def _set_player_gauges(self, guild_counts: List[Tuple[int, int, int]]):
+        METRICS.set_gauge("bot_players", sum(counts[0] for counts in guild_counts))
+        METRICS.set_gauge("bot_active_players", sum(counts[1] for counts in guild_counts))
+        METRICS.set_gauge("bot_inventory_items", sum(counts[2] for counts in guild_counts))
+
+    @tasks.loop(seconds=METRICS_EXPORT_SECONDS)
+    async def export_metrics(self):
+        # The player gauges are set when the database is loaded and saved,
+        # which already go through every player, rather than walking the whole
+        # database on the event loop every time
+        METRICS.set_gauge("bot_guilds", len(self._database))
+        METRICS.set_gauge("bot_notification_queue_depth", NOTIFICATIONS.get_queue_depth())
+
+        METRICS.write_prometheus(SHARD_CONFIG.get_metrics_path(METRICS_FILE))
+
+    def _freeze_guild(self, guild_data: dict):
+        # Run on a worker thread while holding the guild's lock, counting the
+        # players for the metrics while it's going through them anyway
+        return jsonpickle.encode(guild_data, make_refs=False), self._count_players(guild_data)
+
+    @METRICS.timed("bot_save_database_seconds")
     async def save_database(self):
-        if os.path.isfile("./adventuresdb.json"):
-            shutil.copy("adventuresdb.json", "adventuresdbbackup.json")
-        
-        frozen = jsonpickle.encode(self._database, make_refs=False)
-        with open("adventuresdb.json", "w") as file:
-            file.write(frozen)
+        # The tick, b!saveadventures, SIGUSR1 and unloading can all start a
+        # save, so they take turns rather than writing over each other
+        async with self._save_lock:
+            database_paths = SHARD_CONFIG.get_database_paths()
+            
+            with PROFILER.profile("save_database"):
+                # Each guild is encoded on a worker thread while holding its lock,
+                # so only that guild waits on the save rather than the whole bot.
+                # Joined together it's the same JSON as encoding the whole database,
+                # split into a file per shard when sharded.
+                frozen_guilds: Dict[int | None, List[str]] = {shard_id: [] for shard_id in database_paths.keys()}
+                mail_sequences: Dict[str, int] = {}
+                guild_counts: List[Tuple[int, int, int]] = []
+                for guild_id_str in list(self._database.keys()):
+                    async with GUILD_LOCKS.hold(guild_id_str):
+                        # Where the guild's mail was at when it was encoded,
+                        # saved along with it so the two can't get out of step;
+                        # nothing can change it while the guild's lock is held
+                        mail_sequences[guild_id_str] = MAIL_STORE.get_sequence()
+                        self._database[guild_id_str]["mail_sequence"] = mail_sequences[guild_id_str]
+                        frozen_guild, counts = await GUILD_LOCKS.run_in_executor(guild_id_str, self._freeze_guild, self._database[guild_id_str])
+                    guild_counts.append(counts)
+                    frozen_guilds[SHARD_CONFIG.get_database_shard_for_guild(guild_id_str)].append(f"{json.dumps(guild_id_str)}: {frozen_guild}")
+
+                # Written alongside and swapped in, so a crash mid-write leaves
+                # the last save in place
+                for shard_id, (database_path, database_backup_path) in database_paths.items():
+                    if os.path.isfile(database_path):
+                        shutil.copy(database_path, database_backup_path)
+                    with open(f"{database_path}.tmp", "w") as file:
+                        file.write("{" + ", ".join(frozen_guilds[shard_id]) + "}")
+                    os.replace(f"{database_path}.tmp", database_path)
+
+            self._set_player_gauges(guild_counts)
+            MAIL_STORE.compact(mail_sequences)
     
     @commands.is_owner()
     @commands.command(name="saveadventures", help="Saves the adventures database", hidden=True)
@@ -182,6 +342,92 @@ class Adventures(commands.Cog):
         await self.save_database()
         await context.send("The adventures database has been saved!")
 
+    @commands.is_owner()
+    @commands.command(name="tickstats", help="Shows how long each tick slot took", hidden=True)
+    async def tick_stats_handler(self, context: commands.Context):
+        slot_durations = TICK_SCHEDULER.get_slot_durations()
+        slot_player_counts = TICK_SCHEDULER.get_slot_player_counts()
+        if len(slot_durations) == 0:
+            await context.send("No tick slots have run yet.")
+            return
+
+        slot_strs: List[str] = [f"Slot {slot}: {slot_player_counts.get(slot, 0)} players in {slot_durations[slot] * 1000:.1f}ms" for slot in sorted(slot_durations.keys())]
+
+        notification_stats = NOTIFICATIONS.get_stats()
+        slot_strs.append(
+            f"\nNotifications: {notification_stats['queue_depth']} queued for {notification_stats['users_pending']} players, "
+            f"{notification_stats['total_sent']} sent, {notification_stats['total_failed']} failed, "
+            f"p50 latency {notification_stats['p50_latency']:.1f}s, last flush {notification_stats['last_flush_duration'] * 1000:.1f}ms"
+        )
+        await context.send("\n".join(slot_strs))
+
+    @commands.is_owner()
+    @commands.command(name="metrics", help="Shows where the bot is spending its time", hidden=True)
+    async def metrics_handler(self, context: commands.Context):
+        rows: List[tuple] = []
+        for name in METRICS.get_histogram_names():
+            for labels, histogram in METRICS.get_histograms(name).items():
+                label_str = ", ".join(value for _, value in labels)
+                rows.append((histogram.get_sum(), f"{name}{f' ({label_str})' if label_str != '' else ''}", histogram))
+
+        if len(rows) == 0:
+            await context.send("No metrics have been recorded yet.")
+            return
+
+        metric_strs: List[str] = []
+        total_len = 0
+        for total_time, label, histogram in sorted(rows, key=lambda row: row[0], reverse=True):
+            metric_str = (
+                f"{label}: {histogram.get_count()} in {total_time:.2f}s, "
+                f"p50 {histogram.get_percentile(0.5) * 1000:.1f}ms, p95 {histogram.get_percentile(0.95) * 1000:.1f}ms, "
+                f"p99 {histogram.get_percentile(0.99) * 1000:.1f}ms"
+            )
+            # Stay under Discord's message length limit
+            if total_len + len(metric_str) + 1 > 1900:
+                break
+            metric_strs.append(metric_str)
+            total_len += len(metric_str) + 1
+        await context.send("\n".join(metric_strs))
+
+    @commands.is_owner()
+    @commands.command(name="stalls", help="Shows where the event loop has been blocked", hidden=True)
+    async def stalls_handler(self, context: commands.Context):
+        records = sorted(WATCHDOG.get_records(), key=lambda record: record.total_duration, reverse=True)
+        if len(records) == 0:
+            await context.send("The event loop hasn't stalled yet.")
+            return
+
+        record_strs: List[str] = []
+        total_len = 0
+        for record in records:
+            record_str = f"{record.activity} at {record.call_site}: {record.count} stalls, {record.total_duration:.2f}s total, max {record.max_duration:.2f}s"
+            # Stay under Discord's message length limit
+            if total_len + len(record_str) + 1 > 1900:
+                break
+            record_strs.append(record_str)
+            total_len += len(record_str) + 1
+        await context.send("\n".join(record_strs))
+
+    @commands.is_owner()
+    @commands.command(name="profile", help="Profiles the next runs of a command, view, button, tick or save_database", hidden=True)
+    async def profile_handler(self, context: commands.Context, target: str | None=None, count: int=1):
+        if target is None:
+            armed_target = PROFILER.get_target()
+            status_str = f"Profiling {armed_target}: {PROFILER.get_num_runs()} runs done, {PROFILER.get_remaining()} to go." if armed_target is not None else "The profiler isn't armed."
+            last_output_path = PROFILER.get_last_output_path()
+            if last_output_path is not None:
+                status_str += f"\nLast profile: {last_output_path}"
+            await context.send(status_str)
+            return
+
+        if target.lower() == "stop":
+            PROFILER.disarm()
+            await context.send(f"The profiler has been disarmed. Last profile: {PROFILER.get_last_output_path()}")
+            return
+
+        PROFILER.arm(target, max(1, count))
+        await context.send(f"Profiling the next {max(1, count)} runs of {target}. Use `b!profile` to check on it.")
+
     @commands.is_owner()
     @commands.command(name="endduel", help="Ends combat for specific members", hidden=True)
     async def end_duel_handler(self, context: commands.Context, users: commands.Greedy[User]=None):
@@ -193,7 +439,7 @@ class Adventures(commands.Cog):
 
         players: List[Player] = []
         for user in users:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
             players.append(self._get_player(context.guild.id, user.id))
 
         for player in players:
@@ -234,7 +480,7 @@ class Adventures(commands.Cog):
 
         players: List[Player] = []
         for user in users:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
             players.append(self._get_player(context.guild.id, user.id))
 
         if any(player.get_dueling().is_in_combat for player in players):
@@ -309,91 +555,37 @@ class Adventures(commands.Cog):
         player_stats: Stats = author_player.get_stats()
         player_xp: Expertise = author_player.get_expertise()
 
-        # E(X) =
-        # 0.55 * (2 + 1 + 1) / 3 +
-        # 0.2 * (3 + 4 + 3) / 3 +
-        # 0.15 * (4 + 5) / 2 +
-        # 0.095 * (10 + 8 + 8 + 10) / 3 +
-        # 0.0049 * (40 + 30) / 2 +
-        # 0.0001 * 1 =
-        # 3.41 every 30 seconds -> 409.2 an hour
-
-        # TODO: Redo earnings analysis with luck later
-
-        LUCK_MOD = 0.005 # Luck adjusts total bias by 0.5% per point
+        # The exact expected value and variance for any luck are available from
+        # FISHING_LOOT_TABLE.get_expected_value_report()
+        LUCK_MOD = FISHING_LUCK_MOD
         total_luck: int = min(author_player.get_combined_attributes().luck, 100)
-        rand_val = random.choices(
-            [0, 1, 2, 3, 4, 5], k=1,
-            weights=[
-                # Luck Effect:
-                #   1  -> 54.5%, 20.1875%, 15.125%, 9.5938%, 0.5525%, 0.04125%
-                #   10 -> 50%, 21.875%, 16.25%, 10.4375%, 1.115%, 0.3225%
-                #   20 -> 45%, 23.75%, 17.5%, 11.375%, 1.74%, 0.635%
-                #   50 -> 30%, 29.375%, 21.25%, 14.1875%, 3.615%, 1.5725%
-                0.55 - LUCK_MOD * total_luck,
-                0.2 + 6 * (LUCK_MOD * total_luck) / 16,
-                0.15 + 4 * (LUCK_MOD * total_luck) / 16,
-                0.095 + 3 * (LUCK_MOD * total_luck) / 16,
-                0.0049 + 2 * (LUCK_MOD * total_luck) / 16,
-                0.0001 + 1 * (LUCK_MOD * total_luck) / 16
-            ]
-        )[0]
+        fishing_entry: LootEntry = FISHING_LOOT_TABLE.roll_entry(total_luck)
+        rand_val = fishing_entry.label
+        assert(isinstance(fishing_entry.outcome, LootTable))
+        fishing_result = fishing_entry.outcome.roll_item(total_luck)
 
         # 55% chance of getting a Common non-fish reward
         if rand_val == 0:
-            items = [
-                LOADED_ITEMS.get_new_item(ItemKey.TatteredBoot), 
-                LOADED_ITEMS.get_new_item(ItemKey.ClumpOfLeaves), 
-                LOADED_ITEMS.get_new_item(ItemKey.Conch),
-                LOADED_ITEMS.get_new_item(ItemKey.Stranglekelp)
-            ]
-            fishing_result = random.choice(items)
             player_stats.fish.common_items_caught += 1
         # 20% chance of getting a Common fish reward
         if rand_val == 1:
-            items = [
-                LOADED_ITEMS.get_new_item(ItemKey.Minnow),
-                LOADED_ITEMS.get_new_item(ItemKey.Roughy),
-                LOADED_ITEMS.get_new_item(ItemKey.Shrimp)
-            ]
-            fishing_result = random.choice(items)
             xp_to_add = 3
             player_stats.fish.common_fish_caught += 1
         # 15% chance of getting an Uncommon fish reward
         if rand_val == 2:
-            items = [
-                LOADED_ITEMS.get_new_item(ItemKey.Oyster),
-                LOADED_ITEMS.get_new_item(ItemKey.Pufferfish)
-            ]
-            fishing_result = random.choice(items)
             xp_to_add = 5
             player_stats.fish.uncommon_fish_caught += 1
         # 9.5% chance of getting a Rare fish reward
         if rand_val == 3:
-            items = [
-                LOADED_ITEMS.get_new_item(ItemKey.Squid),
-                LOADED_ITEMS.get_new_item(ItemKey.Crab),
-                LOADED_ITEMS.get_new_item(ItemKey.Lobster),
-                LOADED_ITEMS.get_new_item(ItemKey.Shark)
-            ]
-            fishing_result = random.choice(items)
             xp_to_add = 8
             player_stats.fish.rare_fish_caught += 1
         # 0.49% chance of getting a Rare non-fish reward
         if rand_val == 4:
-            items = [
-                LOADED_ITEMS.get_new_item(ItemKey.AncientVase),
-                LOADED_ITEMS.get_new_item(ItemKey.MysteriousScroll)
-            ]
-            fishing_result = random.choice(items)
             xp_class = ExpertiseClass.Merchant
             xp_to_add = 8
             player_stats.fish.rare_items_caught += 1
         # 0.01% chance of getting the Epic story reward
         if rand_val == 5:
-            items = [LOADED_ITEMS.get_new_item(ItemKey.FishMaybe)]
-            fishing_result = random.choice(items)
-
             story: OceanStory = self._get_story(context.guild.id, Story.Ocean)
             if story.first_to_find_maybe_fish_id == -1:
                 story.first_to_find_maybe_fish_id = context.author.id
@@ -443,7 +635,7 @@ class Adventures(commands.Cog):
             
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
         if isinstance(user, User):
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
 
         if amount < 0:
             await context.send(f"You have to bet a non-negative number of coins!")
@@ -555,7 +747,7 @@ class Adventures(commands.Cog):
             return
         
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
-        self._check_member_and_guild_existence(context.guild.id, giftee.id)
+        self._check_member_and_guild_existence(context.guild.id, giftee.id, is_author=False)
         # The process will be:
         # (1) The user gets to select an item (as a button) from their inventory
         #     There will be 5 items in a row (4 rows of that), along with a 
@@ -644,13 +836,23 @@ class Adventures(commands.Cog):
 
         display_user = context.author
         if user is not None:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
             display_user = user
 
         stat_view = StatView(self._bot, self._database, context.guild.id, context.author, display_user, stat_category_name)
         embed = stat_view.get_current_page_info()
         await context.send(embed=embed, view=stat_view)
 
+    @commands.command(name="leaderboard", help="See who's ahead in the server", aliases=["lb"])
+    async def leaderboard_handler(self, context: commands.Context, leaderboard_category: LeaderboardCategory | None=None):
+        assert(context.guild is not None)
+
+        self._check_member_and_guild_existence(context.guild.id, context.author.id)
+
+        leaderboard_view = LeaderboardView(self._bot, context.guild.id, context.author, leaderboard_category)
+        embed = leaderboard_view.get_current_page_info()
+        await context.send(embed=embed, view=leaderboard_view)
+
     @commands.command(name="wishingwell", help="Toss a coin into the wishing well", aliases=["ww"])
     @commands.cooldown(1, 5, commands.BucketType.user)
     async def wishing_well_handler(self, context: commands.Context):
@@ -677,30 +879,11 @@ class Adventures(commands.Cog):
         player_stats: Stats = author_player.get_stats()
         story: UnderworldStory = self._get_story(context.guild.id, Story.Underworld)
 
-        # TODO: Need to redo this analysis with all the new gemstone possibilities
-        # E(X) = 0.995 * -1 + 0.0021 * 100 = -0.68 every 5 seconds -> -489.6 per hour
-        # Luck Effect:
-        #   1  -> E(X) = 0.994 * -1 + 0.0021 * 125 -> -527 per hour
-        #   10 -> E(X) = 0.985 * -1 + 0.00585 * 125 -> -183 per hour
-        #   20 -> E(X) = 0.975 * -1 + 0.0096 * 125 -> 162 per hour
-        #   50 -> E(X) = 0.945 * -1 + 0.0115 * 125 -> 355 per hour
-
-        LUCK_MOD = 0.001 # Luck adjusts total bias by 0.1% per point
+        # The exact expected value and variance for any luck are available from
+        # WISHING_WELL_LOOT_TABLE.get_expected_value_report()
+        LUCK_MOD = WISHING_WELL_LUCK_MOD
         total_luck: int = min(author_player.get_combined_attributes().luck, 100)
-        rand_val = random.choices(
-            [0, 1, 2, 3], k=1,
-            weights=[
-                # Luck Effect:
-                #   1  -> 99.4%, 0.33%, 0.2475%, 0.0225%
-                #   10 -> 98.5%, 0.78%, 0.585%, 0.135%
-                #   20 -> 97.5%, 1.28%, 0.96%, 0.26%
-                #   50 -> 94.5%, 2.78%, 1.15%, 0.32%
-                0.9950 - LUCK_MOD * total_luck,
-                0.0028 + 4 * (LUCK_MOD * total_luck) / 8,
-                0.0021 + 3 * (LUCK_MOD * total_luck) / 8,
-                0.0001 + 1 * (LUCK_MOD * total_luck) / 8
-            ]
-        )[0]
+        rand_val = WISHING_WELL_LOOT_TABLE.roll_entry(total_luck).label
 
         # 99.5% base chance of getting nothing
         if rand_val == 0:
@@ -756,7 +939,7 @@ class Adventures(commands.Cog):
                 xp_str += f"\n\n*(+{xp_to_add} {ExpertiseClass.Merchant} xp)*"
 
             mail: Mail = Mail("Wishing Well", result, 0, "A piece of the whole.", str(time.time()).split(".")[0], -1)
-            author_player.get_mailbox().append(mail)
+            MAIL_STORE.send(str(context.guild.id), author_player.get_id(), mail)
 
             player_stats.wishingwell.items_received += 1
 
@@ -782,7 +965,7 @@ class Adventures(commands.Cog):
 
         display_user = context.author
         if user is not None:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
             display_user = user
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
@@ -800,7 +983,7 @@ class Adventures(commands.Cog):
 
         display_user = context.author
         if user is not None:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
             display_user = user
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
@@ -841,7 +1024,7 @@ class Adventures(commands.Cog):
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
         for user in users:
             if isinstance(user, User):
-                self._check_member_and_guild_existence(context.guild.id, user.id)
+                self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
         author_dueling: Dueling = author_player.get_dueling()
@@ -988,7 +1171,7 @@ class Adventures(commands.Cog):
             
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
         for user in users:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
         author_dueling: Dueling = author_player.get_dueling()
@@ -1230,7 +1413,7 @@ class Adventures(commands.Cog):
             
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
         for user in users:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
         author_dueling: Dueling = author_player.get_dueling()
@@ -1275,7 +1458,7 @@ class Adventures(commands.Cog):
             
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
         for user in users:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
         author_dueling: Dueling = author_player.get_dueling()
@@ -1325,7 +1508,7 @@ class Adventures(commands.Cog):
             
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
         for user in users:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
         author_dueling: Dueling = author_player.get_dueling()
@@ -1375,7 +1558,7 @@ class Adventures(commands.Cog):
             
         self._check_member_and_guild_existence(context.guild.id, context.author.id)
         for user in users:
-            self._check_member_and_guild_existence(context.guild.id, user.id)
+            self._check_member_and_guild_existence(context.guild.id, user.id, is_author=False)
 
         author_player: Player = self._get_player(context.guild.id, context.author.id)
         author_dueling: Dueling = author_player.get_dueling()
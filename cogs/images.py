@@ -3,44 +3,61 @@ from discord.ext import commands
 from discord import embeds
 from random import choice, randint
 from bot import BenjaminBowtieBot
+from http_client import HTTPClient
 from oauth2 import OAuth2
 
 import datetime
 import os
-import requests
+
+XKCD_BASE_URL = "https://xkcd.com"
+DA_OAUTH_URL = "https://www.deviantart.com/oauth2"
+DA_API_URL = "https://www.deviantart.com/api/v1/oauth2"
+
+# Numbered comics never change, but the latest one does
+XKCD_COMIC_TTL = 24 * 60 * 60
+XKCD_LATEST_TTL = 5 * 60
+DA_GALLERY_TTL = 60 * 60
 
 class Images(commands.Cog):
-    def __init__(self, bot: BenjaminBowtieBot):
+    # The URLs and client can be swapped out to point the cog at a local stub server
+    def __init__(self, bot: BenjaminBowtieBot, http_client: HTTPClient | None=None, xkcd_base_url: str=XKCD_BASE_URL, da_oauth_url: str=DA_OAUTH_URL, da_api_url: str=DA_API_URL):
         self._bot = bot
+        self._http_client = http_client if http_client is not None else HTTPClient()
+        self._xkcd_base_url = xkcd_base_url
+        self._da_api_url = da_api_url
 
         # DA Authorization
         # https://www.deviantart.com/developers/authentication
-        DA_AUTH_URL = "https://www.deviantart.com/oauth2/authorize"
-        DA_TOKEN_URL = "https://www.deviantart.com/oauth2/token"
+        da_auth_url = f"{da_oauth_url}/authorize"
+        da_token_url = f"{da_oauth_url}/token"
 
         # Remove the initial token, refresh_token, and code if you're running
         # this bot on a system where you can open the webbrowser for auth.
         self._DA_OAUTH = OAuth2(
-            DA_AUTH_URL, 
-            DA_TOKEN_URL, 
+            da_auth_url, 
+            da_token_url, 
             os.getenv("DA_CLIENT_ID"), 
             os.getenv("DA_CLIENT_SECRET"),
             os.getenv("DA_OAUTH_TOKEN"),
             os.getenv("DA_OAUTH_REFRESH_TOKEN"),
-            os.getenv("DA_OAUTH_CODE"))
+            os.getenv("DA_OAUTH_CODE"),
+            self._http_client)
         self._DA_OAUTH.auth("gallery", "browse")
 
+    async def cog_unload(self):
+        await self._http_client.close()
+
     @commands.command(name="xkcd", help="Gets the latest XKCD or a specific comic if a number is given.")
     async def xkcd_handler(self, context: commands.Context, arg=None):
         response = None
         if arg is None:
-            response = requests.get("https://xkcd.com/info.0.json")
+            response = await self._http_client.get(f"{self._xkcd_base_url}/info.0.json", ttl=XKCD_LATEST_TTL)
         elif not arg.isdecimal():
             await context.send("Usage: b!xkcd {optional comic number}")
             return
         else:
             comic_num = int(arg)
-            response = requests.get(f"https://xkcd.com/{comic_num}/info.0.json")
+            response = await self._http_client.get(f"{self._xkcd_base_url}/{comic_num}/info.0.json", ttl=XKCD_COMIC_TTL)
 
         if not response.ok:
             await context.send(f"Error: The XKCD API responded with {response.status_code}!")
@@ -68,7 +85,11 @@ class Images(commands.Cog):
             # This is a naive way of randomizing, based on the fact that all the above artists have 200+ deviations
             "offset": 20 * randint(0, 10)
         }
-        response = self._DA_OAUTH.get("https://www.deviantart.com/api/v1/oauth2/gallery/all", params)
+        try:
+            response = await self._DA_OAUTH.get(f"{self._da_api_url}/gallery/all", params, DA_GALLERY_TTL)
+        except PermissionError:
+            await context.send("Error: Couldn't authenticate with the DA API!")
+            return
         if not response.ok:
             await context.send(f"Error: The DA API responded with {response.status_code}!")
             return
@@ -26,11 +26,13 @@ from features.companions.npcs.voidseen_pup import VoidseenPup
 from features.companions.npcs.wanderbound_raven import WanderboundRaven
 
 from features.shared.attributes import Attributes
-from features.shared.constants import BASE_BEST_TIER_POINTS, BASE_GOOD_TIER_POINTS, BASE_GREAT_TIER_POINTS
+from features.shared.constants import BASE_BEST_TIER_POINTS, BASE_GOOD_TIER_POINTS, BASE_GREAT_TIER_POINTS, RENDERED_TEXT_CACHE_SIZE
 from features.shared.effect import Effect, EffectType, ItemEffectCategory
 from features.shared.enums import ClassTag, CompanionKey, CompanionTier
 from features.shared.item import ItemKey, Rarity
+from features.shared.render_cache import RenderCache
 from features.shared.statuseffect import StatusEffectKey
+from features.shared.xptable import XPTable
 
 from typing import TYPE_CHECKING, List
 if TYPE_CHECKING:
@@ -41,6 +43,10 @@ if TYPE_CHECKING:
 # BASE CLASS
 # -----------------------------------------------------------------------------
 
+RENDERED_COMPANION_DETAILS = RenderCache(RENDERED_TEXT_CACHE_SIZE)
+
+COMPANION_XP_TABLE = XPTable(lambda level: ceil(5 + 15 * level * (level - 1) + (2 ** ((level - 1) / 15.0) - 1) / (1 - 2 ** (-1 / 15.0))))
+
 class Companion():
     def __init__(self, icon: str, display_name: str, key: CompanionKey, rarity: Rarity, value: int, has_active_ability: bool, duel_xp_gain: int, pet_battle_xp_gain: int, preferred_foods: List[ItemKey], valid_food_categories: List[ClassTag], best_tier_items: List[ItemKey], talisman: ItemKey):        
         self._id: str = ""
@@ -99,12 +105,12 @@ class Companion():
         pass
 
     def get_xp_to_level(self, level: int) -> int:
-        return ceil(5 + 15 * level * (level - 1) + (2 ** ((level - 1) / 15.0) - 1) / (1 - 2 ** (-1 / 15.0)))
+        return COMPANION_XP_TABLE.get_xp_to_level(level)
 
     def level_up_check(self) -> int:
         org_level = self._level
-        while self._remaining_xp <= 0:
-            self._level += 1
+        if self._remaining_xp <= 0:
+            self._level = max(self._level, COMPANION_XP_TABLE.get_level_for_xp(self._xp))
             self._remaining_xp = self.get_xp_to_level(self._level + 1) - self._xp
         return self._level - org_level
 
@@ -181,7 +187,13 @@ class Companion():
         display_string += f"Level: {self._level} *({self.get_xp_to_level(self._level + 1) - self._xp} xp to next)*\n"
         display_string += f"{self.get_tier_str()} *({self.get_points_to_next_tier_str()})*"
 
-        display_string += "\n\n•••••••••••••••••••••••••••••••\n"
+        # The abilities, attributes and weapon only depend on the level and
+        # tier, but building them means creating the whole pet battle NPC
+        details_key = (type(self), self._level, self._companion_tier, use_base_abilities)
+        return display_string + RENDERED_COMPANION_DETAILS.get(details_key, lambda: self._render_details(use_base_abilities))
+
+    def _render_details(self, use_base_abilities: bool):
+        display_string = "\n\n•••••••••••••••••••••••••••••••\n"
         
         dueling_ability = self.get_dueling_ability(effect_category=None)
         effect_category_str = ""
@@ -90,14 +90,14 @@ class Dueling():
         for ability in self.abilities:
             ability.reset_cd()
 
-    def decrement_all_ability_cds(self):
+    def decrement_all_ability_cds(self, num_turns: int=1):
         for ability in self.abilities:
-            ability.decrement_cd()
+            ability.decrement_cd(num_turns)
 
-    def decrement_statuses_time_remaining(self):
+    def decrement_statuses_time_remaining(self, num_turns: int=1):
         remaining_effects = []
         for status_effect in self.status_effects:
-            status_effect.decrement_turns_remaining()
+            status_effect.decrement_turns_remaining(num_turns)
             if status_effect.turns_remaining > 0 or status_effect.turns_remaining == -1:
                 remaining_effects.append(status_effect)
         self.status_effects = remaining_effects
@@ -111,15 +111,14 @@ class Dueling():
             item_effects = item.get_item_effects()
             if item_effects is not None:
                 # Resistance effects should always be in the permanent category
-                for item_effect in item_effects.permanent:
+                for item_effect in item_effects.get_permanent_effects_of_type(EffectType.ResistStatusEffect):
                     if not item_effect.meets_conditions(target, item):
                         continue
 
-                    if item_effect.effect_type == EffectType.ResistStatusEffect:
-                        se_key: StatusEffectKey | None = item_effect.associated_status_effect
-                        if se_key is not None:
-                            current_resist_info = resist_status_effect.get(se_key, (0, []))
-                            resist_status_effect[se_key] = (item_effect.effect_value + current_resist_info[0], current_resist_info[1] + [item.get_full_name()])
+                    se_key: StatusEffectKey | None = item_effect.associated_status_effect
+                    if se_key is not None:
+                        current_resist_info = resist_status_effect.get(se_key, (0, []))
+                        resist_status_effect[se_key] = (item_effect.effect_value + current_resist_info[0], current_resist_info[1] + [item.get_full_name()])
 
         chance_resist, resist_item_strs = resist_status_effect.get(status_effect.key, (0, []))
         if random() >= chance_resist:
@@ -1618,9 +1617,7 @@ class Dueling():
                 if se.key == StatusEffectKey.DmgReflect:
                     dmg_reflect += se.value
 
-            for effect in target_entity.get_combined_req_met_effects().permanent:
-                if effect.effect_type == EffectType.DmgReflect:
-                    dmg_reflect += effect.effect_value
+            dmg_reflect += target_entity.get_combined_req_met_effects().get_permanent_effect_total(EffectType.DmgReflect)
 
             if dmg_reflect > 0:
                 reflected_damage: int = ceil(damage * dmg_reflect)
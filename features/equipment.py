@@ -247,12 +247,12 @@ class Equipment():
         for item in self.get_all_equipped_items():
             item_effects = item.get_item_effects()
             if item_effects is not None:
-                for item_effect in item_effects.permanent:
-                    if not item_effect.meets_conditions(entity, item):
-                        continue
+                for effect_type in result.keys():
+                    for item_effect in item_effects.get_permanent_effects_of_type(effect_type):
+                        if not item_effect.meets_conditions(entity, item):
+                            continue
 
-                    if item_effect.effect_type in result.keys():
-                        result[item_effect.effect_type] = result.get(item_effect.effect_type, 0) + item_effect.effect_value
+                        result[effect_type] += item_effect.effect_value
         
         return result
 
@@ -261,15 +261,14 @@ class Equipment():
         for item in self.get_all_equipped_items():
             item_effects = item.get_item_effects()
             if item_effects is not None:
-                for item_effect in item_effects.permanent:
+                for item_effect in item_effects.get_permanent_effects_of_type(EffectType.GrantAbility):
                     if not item_effect.meets_conditions(entity, item):
                         continue
 
-                    if item_effect.effect_type == EffectType.GrantAbility:
-                        if item_effect.granted_ability is not None:
-                            ability = next(ability() for ability in features.shared.ability.ALL_ABILITIES if ability().get_name() == item_effect.granted_ability)
-                            if ability is not None:
-                                abilities.append(ability)
+                    if item_effect.granted_ability is not None:
+                        ability = next(ability() for ability in features.shared.ability.ALL_ABILITIES if ability().get_name() == item_effect.granted_ability)
+                        if ability is not None:
+                            abilities.append(ability)
         return abilities
     
     def get_summons_enums(self, entity: Player | NPC):
@@ -277,11 +276,11 @@ class Equipment():
         for item in self.get_all_equipped_items():
             item_effects = item.get_item_effects()
             if item_effects is not None:
-                for item_effect in item_effects.permanent:
+                for item_effect in item_effects.get_permanent_effects_of_type(EffectType.Summon):
                     if not item_effect.meets_conditions(entity, item):
                         continue
 
-                    if item_effect.effect_type == EffectType.Summon and item_effect.summon is not None:
+                    if item_effect.summon is not None:
                         summons += [item_effect.summon for _ in range(int(item_effect.effect_value))]
         return summons
 
@@ -14,6 +14,7 @@ from features.shared.effect import EffectType
 from typing import TYPE_CHECKING, List
 
 from features.shared.statuseffect import DamageSplit, StatusEffectKey
+from features.shared.xptable import XPTable
 if TYPE_CHECKING:
     from bot import BenjaminBowtieBot
     from features.dueling import Dueling
@@ -58,6 +59,53 @@ class Attribute(StrEnum):
                 short_strs.append("Mem")
         return short_strs
 
+# -----------------------------------------------------------------------------
+# MAX HP AND MANA TABLES
+# -----------------------------------------------------------------------------
+
+# Max HP and mana compound once per point of Con and Int, so rather than
+# redoing that loop on every stat update, the results are tabulated by
+# attribute value. Attributes aren't capped, so the tables are extended on
+# demand past the initial range.
+
+INITIAL_TABLE_SIZE = 256
+
+_MAX_HP_BY_CON: List[int] = [BASE_HP]
+_MAX_MANA_BY_INT: List[int] = [BASE_MANA]
+
+
+def _extend_max_hp_table(constitution: int):
+    while len(_MAX_HP_BY_CON) <= constitution:
+        con = len(_MAX_HP_BY_CON) - 1
+        max_hp = _MAX_HP_BY_CON[-1]
+        _MAX_HP_BY_CON.append(max_hp + ceil(max_hp * max(BASE_CON_HEALTH_SCALE - CON_HEALTH_SCALE_REDUCTION * (con / CON_HEALTH_SCALE_ADJUST), MIN_CON_HEALTH_SCALE)))
+
+
+def _extend_max_mana_table(intelligence: int):
+    while len(_MAX_MANA_BY_INT) <= intelligence:
+        intel = len(_MAX_MANA_BY_INT) - 1
+        max_mana = _MAX_MANA_BY_INT[-1]
+        _MAX_MANA_BY_INT.append(max_mana + ceil(max_mana * max(BASE_INT_MANA_SCALE - INT_MANA_SCALE_REDUCTION * (intel / INT_MANA_SCALE_ADJUST), MIN_INT_MANA_SCALE)))
+
+
+def get_max_hp_for_con(constitution: int):
+    # Negative Con from debuffs gets no bonus over the base
+    constitution = max(0, constitution)
+    if constitution >= len(_MAX_HP_BY_CON):
+        _extend_max_hp_table(constitution)
+    return _MAX_HP_BY_CON[constitution]
+
+
+def get_max_mana_for_int(intelligence: int):
+    intelligence = max(0, intelligence)
+    if intelligence >= len(_MAX_MANA_BY_INT):
+        _extend_max_mana_table(intelligence)
+    return _MAX_MANA_BY_INT[intelligence]
+
+
+_extend_max_hp_table(INITIAL_TABLE_SIZE - 1)
+_extend_max_mana_table(INITIAL_TABLE_SIZE - 1)
+
 # -----------------------------------------------------------------------------
 # CLASSES
 # -----------------------------------------------------------------------------
@@ -76,8 +124,9 @@ class BaseExpertise():
 
     def level_up_check(self):
         org_level = self._level
-        while self._remaining_xp <= 0:
-            self._level += 1
+        if self._remaining_xp <= 0:
+            # Levels are never lost, even if XP has since been taken away
+            self._level = max(self._level, self.get_xp_table().get_level_for_xp(self._xp))
             self._remaining_xp = self.get_xp_to_level(self._level + 1) - self._xp
         return self._level - org_level
 
@@ -99,8 +148,11 @@ class BaseExpertise():
         return self._level
 
     @abstractmethod
+    def get_xp_table(self) -> XPTable:
+        pass
+
     def get_xp_to_level(self, level: int) -> int:
-        return 1
+        return self.get_xp_table().get_xp_to_level(level)
 
     def __getstate__(self):
         return self.__dict__
@@ -111,24 +163,32 @@ class BaseExpertise():
         self._remaining_xp = self.get_xp_to_level(self._level + 1) - self._xp
 
 
+FISHER_XP_TABLE = XPTable(lambda level: ceil(100 + 25 * level * (level - 1) + 75 * (2 ** ((level - 1) / 7.0) - 1) / (1 - 2 ** (-1 / 7.0))))
+
 class FisherExpertise(BaseExpertise):
-    def get_xp_to_level(self, level: int) -> int:
-        return ceil(100 + 25 * level * (level - 1) + 75 * (2 ** ((level - 1) / 7.0) - 1) / (1 - 2 ** (-1 / 7.0)))
+    def get_xp_table(self):
+        return FISHER_XP_TABLE
 
 
+MERCHANT_XP_TABLE = XPTable(lambda level: ceil(15 + 15 * level * (level - 1) + 25 * (2 ** ((level - 1) / 8.0) - 1) / (1 - 2 ** (-1 / 8.0))))
+
 class MerchantExpertise(BaseExpertise):
-    def get_xp_to_level(self, level: int) -> int:
-        return ceil(15 + 15 * level * (level - 1) + 25 * (2 ** ((level - 1) / 8.0) - 1) / (1 - 2 ** (-1 / 8.0)))
+    def get_xp_table(self):
+        return MERCHANT_XP_TABLE
+
 
+GUARDIAN_XP_TABLE = XPTable(lambda level: ceil(30 + 30 * level * (level - 1) + 20 * (2 ** ((level - 1) / 7.0) - 1) / (1 - 2 ** (-1 / 7.0))))
 
 class GuardianExpertise(BaseExpertise):
-    def get_xp_to_level(self, level: int) -> int:
-        return ceil(30 + 30 * level * (level - 1) + 20 * (2 ** ((level - 1) / 7.0) - 1) / (1 - 2 ** (-1 / 7.0)))
+    def get_xp_table(self):
+        return GUARDIAN_XP_TABLE
+
 
+ALCHEMIST_XP_TABLE = XPTable(lambda level: ceil(20 + 20 * level * (level - 1) + 30 * (2 ** ((level - 1) / 8.0) - 1) / (1 - 2 ** (-1 / 8.0))))
 
 class AlchemistExpertise(BaseExpertise):
-    def get_xp_to_level(self, level: int) -> int:
-        return ceil(20 + 20 * level * (level - 1) + 30 * (2 ** ((level - 1) / 8.0) - 1) / (1 - 2 ** (-1 / 8.0)))
+    def get_xp_table(self):
+        return ALCHEMIST_XP_TABLE
 
 
 class Expertise():
@@ -206,17 +266,11 @@ class Expertise():
 
     def update_stats(self, combined_attributes: Attributes):
         percent_health = self.hp / self.max_hp
-        updated_max_hp: int = BASE_HP
-        for con in range(combined_attributes.constitution):
-            updated_max_hp += ceil(updated_max_hp * max(BASE_CON_HEALTH_SCALE - CON_HEALTH_SCALE_REDUCTION * (con / CON_HEALTH_SCALE_ADJUST), MIN_CON_HEALTH_SCALE))
-        self.max_hp = updated_max_hp
+        self.max_hp = get_max_hp_for_con(combined_attributes.constitution)
         self.hp = int(percent_health * self.max_hp)
 
         percent_mana = self.mana / self.max_mana
-        updated_max_mana: int = BASE_MANA
-        for intel in range(combined_attributes.intelligence):
-            updated_max_mana += ceil(updated_max_mana * max(BASE_INT_MANA_SCALE - INT_MANA_SCALE_REDUCTION * (intel / INT_MANA_SCALE_ADJUST), MIN_INT_MANA_SCALE))
-        self.max_mana = updated_max_mana
+        self.max_mana = get_max_mana_for_int(combined_attributes.intelligence)
         self.mana = int(percent_mana * self.max_mana)
 
     def heal(self, heal_amount: int):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import discord
+import functools
 import random
 
 from discord.embeds import Embed
@@ -12,10 +13,10 @@ from features.shared.enums import ClassTag
 from features.shared.item import LOADED_ITEMS, ItemKey, Rarity
 from features.shared.nextbutton import NextButton
 from features.shared.prevbutton import PrevButton
-from math import sqrt
+from math import log, sqrt
 from types import MappingProxyType
 
-from typing import TYPE_CHECKING, List, Literal, Tuple
+from typing import TYPE_CHECKING, Dict, List, Literal, Tuple
 
 if TYPE_CHECKING:
     from bot import BenjaminBowtieBot
@@ -150,6 +151,82 @@ MUTATION_PROBS: MappingProxyType[Tuple[ItemKey | Literal[""], ItemKey | Literal[
     (ItemKey.GoldenClover, ItemKey.Azureberries): (ItemKey.GoldberrySeed, 0.04)
 })
 
+
+def _build_mutation_index():
+    index: Dict[ItemKey | Literal[""], List[Tuple[int, Tuple[ItemKey | Literal[""], ItemKey | Literal[""]], Tuple[ItemKey, float]]]] = {}
+    for i, (required_plants, possible_result) in enumerate(MUTATION_PROBS.items()):
+        for plant_key in set(required_plants):
+            index.setdefault(plant_key, []).append((i, required_plants, possible_result))
+    return MappingProxyType({plant_key: tuple(mutations) for plant_key, mutations in index.items()})
+
+# Plant -> the mutations it takes part in, tagged with their position in
+# MUTATION_PROBS, so a plot only has to look at what its neighbors can produce
+MUTATIONS_BY_PLANT = _build_mutation_index()
+
+
+def get_mutation_candidates(plant_keys: List[ItemKey | Literal[""]]):
+    # Returns the mutations the neighboring plant keys allow, in the same order
+    # as MUTATION_PROBS so the random rolls happen in a consistent order.
+    candidates: Dict[int, Tuple[Tuple[ItemKey | Literal[""], ItemKey | Literal[""]], Tuple[ItemKey, float]]] = {}
+    for plant_key in set(plant_keys):
+        if plant_key == "":
+            continue
+        for i, required_plants, possible_result in MUTATIONS_BY_PLANT.get(plant_key, ()):
+            if i in candidates or required_plants[0] not in plant_keys or required_plants[1] not in plant_keys:
+                continue
+            # In the case where two of the same plant can mutate itself, make sure there are at least
+            # two around to do that.
+            if required_plants[0] == required_plants[1] and plant_keys.count(required_plants[0]) < 2:
+                continue
+            candidates[i] = (required_plants, possible_result)
+    return [candidates[i] for i in sorted(candidates)]
+
+
+def sample_first_mutation(chances: List[Tuple[ItemKey, float]]) -> Tuple[int, ItemKey] | None:
+    # Every tick, each possible result is rolled against its chance and the
+    # least likely one that comes up wins, the later one on ties. A chance
+    # over 1 always comes up but is never picked. While the chances stay the
+    # same, the first tick a mutation happens on (counting from 1) and what it
+    # mutates into can be drawn directly instead of rolling tick by tick.
+    # None if it can't ever happen.
+    by_priority = sorted((chance, -i, result_key) for i, (result_key, chance) in enumerate(chances) if chance <= 1)
+    result_probs: List[Tuple[ItemKey, float]] = []
+    none_before = 1.0
+    for chance, _, result_key in by_priority:
+        result_probs.append((result_key, none_before * chance))
+        none_before *= 1 - chance
+
+    mutation_prob = 1 - none_before
+    if mutation_prob <= 0:
+        return None
+
+    first_tick = 1
+    if mutation_prob < 1:
+        first_tick = int(log(1 - random.random()) / log(1 - mutation_prob)) + 1
+
+    roll = random.random() * mutation_prob
+    for result_key, prob in result_probs:
+        if roll < prob:
+            return first_tick, result_key
+        roll -= prob
+    # Only reachable through rounding
+    return first_tick, next(result_key for result_key, prob in reversed(result_probs) if prob > 0)
+
+
+# Plot index -> indices of the (up to) 8 plots around it, for a size x size
+# garden stored row by row
+@functools.lru_cache(maxsize=None)
+def get_neighbor_indices(size: int):
+    neighbors: List[Tuple[int, ...]] = []
+    for i in range(size * size):
+        row, col = divmod(i, size)
+        neighbors.append(tuple(
+            (row + dr) * size + (col + dc)
+            for dr, dc in ((-1, 0), (0, -1), (0, 1), (1, 0), (-1, -1), (-1, 1), (1, -1), (1, 1))
+            if 0 <= row + dr < size and 0 <= col + dc < size
+        ))
+    return tuple(neighbors)
+
 # -----------------------------------------------------------------------------
 # GARDEN PLOT
 # -----------------------------------------------------------------------------
@@ -180,11 +257,13 @@ class GardenPlot():
 
         return harvested_plant
 
-    def tick(self):
+    def tick(self, num_ticks: int=1):
         if self.seed_data is None:
             return
 
-        self.growth_ticks += 1
+        # Skipping multiple ticks at once is only valid when none of the skipped
+        # ticks would've matured or killed the plant; see House.tick.
+        self.growth_ticks += num_ticks
 
         if self.growth_ticks == self.seed_data.ticks_until_mature:
             self.plant = LOADED_ITEMS.get_new_item(self.seed_data.result)
@@ -200,6 +279,14 @@ class GardenPlot():
         self.growth_ticks = 0
         self.may_mutate = False
 
+    def get_ticks_until_next_stage(self):
+        if self.seed_data is None:
+            return None
+
+        if self.growth_ticks < self.seed_data.ticks_until_mature:
+            return self.seed_data.ticks_until_mature - self.growth_ticks
+        return max(1, self.seed_data.ticks_until_death - self.growth_ticks)
+
     def is_mature(self):
         if self.seed_data is None:
             return False
@@ -263,10 +350,7 @@ class GardenPlot():
         
         mature_string = f"Mature in {ticks_until_mature} {mature_tick_str}" if ticks_until_mature > 0 else f"Will perish in {ticks_until_death} {death_tick_str}"
 
-        num_mutations = 0
-        for plant_key_1, plant_key_2 in MUTATION_PROBS.keys():
-            if self.seed_data.result == plant_key_1 or self.seed_data.result == plant_key_2:
-                num_mutations += 1
+        num_mutations = len(MUTATIONS_BY_PLANT.get(self.seed_data.result, ()))
         mutate_string = f"{num_mutations} possible mutation{'s' if num_mutations != 1 else ''}\n" if num_mutations > 0 else ""
 
         soil_str = f"{self.soil.get_full_name()}: {self.soil.get_description()}\n\n" if self.soil is not None else ""
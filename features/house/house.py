@@ -9,7 +9,7 @@ import features.companions.companion
 from discord.embeds import Embed
 from discord.ext import commands
 from features.house.alchemy import AlchemyChamberView
-from features.house.garden import MUTATION_PROBS, GardenView
+from features.house.garden import GardenView, get_mutation_candidates, get_neighbor_indices, sample_first_mutation
 from features.house.kitchen import KitchenView
 from features.house.storage import StorageView
 from features.house.study import StudyView
@@ -20,7 +20,7 @@ from features.mail import MailboxView
 from features.shared.enums import CompanionKey, HouseRoom
 from features.shared.item import LOADED_ITEMS, ItemKey
 
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Tuple
 if TYPE_CHECKING:
     from bot import BenjaminBowtieBot
     from features.house.garden import GardenPlot
@@ -53,88 +53,144 @@ class House():
                 plants.append(plot.plant)
         return plants
 
+    def _get_mutation_chances(self):
+        # Empty plots that could mutate -> each result they could mutate into
+        # and its chance this tick, in the order they're rolled. Also updates
+        # the plots' may_mutate for display.
+        mutation_chances: Dict[int, List[Tuple[ItemKey, float]]] = {}
+        size = int(sqrt(len(self.garden_plots)))
+        if size <= 1:
+            return mutation_chances
+
+        neighbor_indices = get_neighbor_indices(size)
+        # Mutations only plant seeds in empty plots, so which plots hold a mature
+        # plant can't change while rolling them and only needs to be worked out once.
+        mature_plant_keys = [(plot.seed_data.result if (
+            plot.seed_data is not None and plot.is_mature() and (
+                plot.soil is None or plot.soil.get_key() != ItemKey.Pebbles
+            )
+        ) else "") for plot in self.garden_plots]
+
+        for i, plot in enumerate(self.garden_plots):
+            if plot.seed is not None:
+                continue
+            
+            soil_key = plot.soil.get_key() if plot.soil is not None else None
+            if soil_key == ItemKey.Pebbles:
+                continue
+
+            plant_keys = [mature_plant_keys[j] for j in neighbor_indices[i]]
+
+            plot.may_mutate = False
+            mutation_adjustment = 2 if soil_key == ItemKey.Ash else 0
+            chances: List[Tuple[ItemKey, float]] = []
+            for _, possible_result in get_mutation_candidates(plant_keys):
+                plot.may_mutate = True
+                adjusted_mutation_chance = possible_result[1] * mutation_adjustment
+                if soil_key == ItemKey.Ichordross:
+                    adjusted_mutation_chance = 0.2
+                chances.append((possible_result[0], adjusted_mutation_chance))
+
+            if len(chances) > 0:
+                mutation_chances[i] = chances
+        return mutation_chances
+
     def tick_garden(self, only_update_display: bool=False):
         if HouseRoom.Garden not in self.house_rooms:
             return
 
-        size = int(sqrt(len(self.garden_plots)))
-
         # Do mutations first rather than as the plots tick to avoid plant death
         # and confusing results for the player.
-        if size > 1:
-            for i, plot in enumerate(self.garden_plots):
-                if plot.seed is not None:
-                    continue
-                
-                if plot.soil is not None and plot.soil.get_key() == ItemKey.Pebbles:
-                    continue
-
-                neighbors: List[GardenPlot] = []
-                if i - size >= 0:
-                    neighbors.append(self.garden_plots[i - size])
-                if i % size != 0:
-                    neighbors.append(self.garden_plots[i - 1])
-                if (i + 1) % size != 0:
-                    neighbors.append(self.garden_plots[i + 1])
-                if i + size < size * size:
-                    neighbors.append(self.garden_plots[i + size])
-                if i - size - 1 >= 0 and i % size != 0:
-                    neighbors.append(self.garden_plots[i - size - 1])
-                if i - size + 1 >= 0 and (i + 1) % size != 0:
-                    neighbors.append(self.garden_plots[i - size + 1])
-                if i + size - 1 < size * size and i % size != 0:
-                    neighbors.append(self.garden_plots[i + size - 1])
-                if i + size + 1 < size * size and (i + 1) % size != 0:
-                    neighbors.append(self.garden_plots[i + size + 1])
-        
-                plant_keys = [(neighbor_plot.seed_data.result if (
-                    neighbor_plot.seed_data is not None and neighbor_plot.is_mature() and (
-                        neighbor_plot.soil is None or neighbor_plot.soil.get_key() != ItemKey.Pebbles
-                    )
-                ) else "") for neighbor_plot in neighbors]
-
-                self.garden_plots[i].may_mutate = False
-                mutation_adjustment = 2 if plot.soil is not None and plot.soil.get_key() == ItemKey.Ash else 0
-                min_prob = 1
-                min_prob_result = None
-                for required_plants, possible_result in MUTATION_PROBS.items():
-                    if required_plants[0] in plant_keys and required_plants[1] in plant_keys:
-                        # In the case where two of the same plant can mutate itself, make sure there are at least
-                        # two around to do that.
-                        if required_plants[0] == required_plants[1] and plant_keys.count(required_plants[0]) < 2:
-                            continue
-                        
-                        self.garden_plots[i].may_mutate = True
-                        adjusted_mutation_chance = possible_result[1] * mutation_adjustment
-                        if plot.soil is not None and plot.soil.get_key() == ItemKey.Ichordross:
-                            adjusted_mutation_chance = 0.2
-
-                        if random.random() < adjusted_mutation_chance:
-                            # Favor the result with the lowest probability if random chance has willed it.
-                            if adjusted_mutation_chance <= min_prob:
-                                min_prob = adjusted_mutation_chance
-                                min_prob_result = possible_result[0]
-                
-                if min_prob_result is not None and not only_update_display:
-                    seed = LOADED_ITEMS.get_new_item(min_prob_result)
-                    self.garden_plots[i].plant_seed(seed)
+        for i, chances in self._get_mutation_chances().items():
+            min_prob = 1
+            min_prob_result = None
+            for result_key, adjusted_mutation_chance in chances:
+                if random.random() < adjusted_mutation_chance:
+                    # Favor the result with the lowest probability if random chance has willed it.
+                    if adjusted_mutation_chance <= min_prob:
+                        min_prob = adjusted_mutation_chance
+                        min_prob_result = result_key
+            
+            if min_prob_result is not None and not only_update_display:
+                seed = LOADED_ITEMS.get_new_item(min_prob_result)
+                self.garden_plots[i].plant_seed(seed)
 
         if not only_update_display:
-            for plot in self.garden_plots:
-                if plot.soil is not None and plot.soil.get_key() == ItemKey.Pebbles:
-                    continue
+            self._grow_garden_plots(1)
+
+    def _get_garden_ticks_to_skip(self, max_ticks: int):
+        # Nothing but mutations changes until the next plant matures or dies,
+        # so up to that point the garden's chances stay the same.
+        ticks_to_skip = max_ticks
+        for plot in self.garden_plots:
+            if plot.soil is not None and plot.soil.get_key() == ItemKey.Pebbles:
+                continue
+            ticks_until_next_stage = plot.get_ticks_until_next_stage()
+            if ticks_until_next_stage is not None:
+                ticks_to_skip = min(ticks_to_skip, ticks_until_next_stage)
+        return ticks_to_skip
+
+    def _sample_next_mutations(self, max_ticks: int):
+        # The first of the next max_ticks ticks that any plot mutates on and
+        # what each plot that mutates then becomes; max_ticks + 1 and none if
+        # nothing does. The chances have to stay the same over those ticks.
+        # Plots that would mutate later are drawn again after, which gives the
+        # same odds since each tick's rolls are independent.
+        first_tick = max_ticks + 1
+        mutations: Dict[int, ItemKey] = {}
+        for i, chances in self._get_mutation_chances().items():
+            first_mutation = sample_first_mutation(chances)
+            if first_mutation is None or first_mutation[0] > max_ticks or first_mutation[0] > first_tick:
+                continue
+            if first_mutation[0] < first_tick:
+                first_tick = first_mutation[0]
+                mutations = {}
+            mutations[i] = first_mutation[1]
+        return first_tick, mutations
+
+    def _grow_garden_plots(self, num_ticks: int):
+        for plot in self.garden_plots:
+            if plot.soil is not None and plot.soil.get_key() == ItemKey.Pebbles:
+                continue
 
-                plot.tick()
+            plot.tick(num_ticks)
 
-                if plot.soil is not None and plot.soil.get_key() == ItemKey.WoodChips:
-                    if plot.seed is not None and plot.plant is not None:
-                        self.auto_harvested_seeds.append(plot.seed.get_key())
-                        plot.reset(keep_soil=True)
+            if plot.soil is not None and plot.soil.get_key() == ItemKey.WoodChips:
+                if plot.seed is not None and plot.plant is not None:
+                    self.auto_harvested_seeds.append(plot.seed.get_key())
+                    plot.reset(keep_soil=True)
+
+    def tick(self, num_ticks: int=1):
+        if HouseRoom.Garden not in self.house_rooms:
+            return
+
+        if num_ticks == 1:
+            self.tick_garden()
+            # Update again to account for plants that just matured and therefore could
+            # mutate into empty plots (just for display purposes)
+            self.tick_garden(True)
+            return
+
+        # Catching up goes from one change to the next rather than tick by tick.
+        # Between plants maturing or dying the mutation chances don't change, so
+        # when the next mutation happens is drawn directly and the ticks before
+        # it are skipped. No mutation leads back to the plants it needs, so the
+        # number of changes is bounded however long the player was away.
+        remaining_ticks = num_ticks
+        while remaining_ticks > 0:
+            ticks_to_skip = self._get_garden_ticks_to_skip(remaining_ticks)
+            mutation_tick, mutations = self._sample_next_mutations(ticks_to_skip)
+            if len(mutations) == 0:
+                self._grow_garden_plots(ticks_to_skip)
+            else:
+                if mutation_tick > 1:
+                    self._grow_garden_plots(mutation_tick - 1)
+                for i, result_key in mutations.items():
+                    self.garden_plots[i].plant_seed(LOADED_ITEMS.get_new_item(result_key))
+                self._grow_garden_plots(1)
+                ticks_to_skip = mutation_tick
+            remaining_ticks -= ticks_to_skip
 
-    def tick(self):
-        self.tick_garden()
-        # Update again to account for plants that just matured and therefore could
-        # mutate into empty plots (just for display purposes)
         self.tick_garden(True)
 
     def __getstate__(self):
@@ -4,12 +4,12 @@ import discord
 
 from discord.embeds import Embed
 from features.house.recipe import LOADED_RECIPES
-from features.shared.enums import ClassTag, StateTag
+from features.shared.enums import ClassTag, StateTag, get_tag_mask
 from features.shared.item import LOADED_ITEMS, Item, ItemKey
 from features.shared.nextbutton import NextButton
 from features.shared.prevbutton import PrevButton
 
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 if TYPE_CHECKING:
     from bot import BenjaminBowtieBot
     from features.player import Player
@@ -87,6 +87,11 @@ class Inventory():
         self._inventory_slots.append(item)
         self._organize_inventory_slots()
 
+    def add_items(self, items: List[Item | None]):
+        # Organizes once for the whole batch
+        self._inventory_slots += [item for item in items if item is not None]
+        self._organize_inventory_slots()
+
     def remove_item(self, slot_index: int, count=1):
         if count <= 0:
             return None
@@ -97,6 +102,20 @@ class Inventory():
                 return result
         return None
 
+    def remove_items(self, slot_counts: Dict[int, int]):
+        # Removes from several slots and organizes once for the whole batch;
+        # slots that don't have enough are left alone
+        removed_items: List[Item] = []
+        for slot_index, count in slot_counts.items():
+            if count <= 0 or slot_index >= len(self._inventory_slots):
+                continue
+            result = self._inventory_slots[slot_index].remove_amount(count)
+            if result is not None:
+                removed_items.append(result)
+        if len(removed_items) > 0:
+            self._organize_inventory_slots()
+        return removed_items
+
     def add_coins(self, amount: int):
         self._coins += amount
     
@@ -111,10 +130,10 @@ class Inventory():
     
     def filter_inventory_slots(self, tags: List[ClassTag | StateTag], player_level: int | None=None, require_enchantable_equipment=False, require_craftable=False):
         item_indices: List[int] = []
+        tag_mask: int = get_tag_mask(tags)
         for i, item in enumerate(self._inventory_slots):
             item_class_tags: List[ClassTag] = item.get_class_tags()
-            item_state_tags: List[StateTag] = item.get_state_tags()
-            if any(tag in [*item_class_tags, *item_state_tags] for tag in tags):
+            if item.has_any_tag(tag_mask):
                 if player_level is not None and player_level < item.get_level_requirement():
                     continue
                 if require_enchantable_equipment and ClassTag.Equipment.Equipment in item_class_tags and len(item.get_altering_item_keys()) == 0:
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import discord
+
+from bisect import bisect_left, insort
+from discord.embeds import Embed
+from discord.ext import commands
+from features.shared.nextbutton import NextButton
+from features.shared.prevbutton import PrevButton
+from features.stats import LeaderboardCategory
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+if TYPE_CHECKING:
+    from features.player import Player
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+LEADERBOARD_PAGE_SIZE = 10
+
+LEADERBOARD_NAMES: Dict[LeaderboardCategory, str] = {
+    LeaderboardCategory.FishCaught: "Fish Caught",
+    LeaderboardCategory.CoinsMade: "Coins Made at Market",
+    LeaderboardCategory.KnucklebonesCoinsWon: "Coins Won at Knucklebones",
+    LeaderboardCategory.DuelsWon: "Duels Won",
+    LeaderboardCategory.DamageDealt: "Damage Dealt",
+    LeaderboardCategory.PlantsHarvested: "Plants Harvested",
+    LeaderboardCategory.ItemsCrafted: "Items Crafted",
+    LeaderboardCategory.CompanionBattlesWon: "Companion Battles Won",
+    LeaderboardCategory.AdventuresWon: "Adventures Won"
+}
+
+# -----------------------------------------------------------------------------
+# RANKED INDEX
+# -----------------------------------------------------------------------------
+
+# Every player in a guild ordered by one value, highest first. Entries are
+# (-value, player_id) so ties are broken by ID and each entry is unique, which
+# lets an update find a player's old entry with a binary search instead of a
+# scan. A player's rank is one more than the number of players with a strictly
+# higher value, so tied players share a rank.
+class RankedIndex():
+    def __init__(self):
+        self._entries: List[Tuple[int, str]] = []
+        self._values: Dict[str, int] = {}
+
+    def bulk_load(self, values: Dict[str, int]):
+        self._values = dict(values)
+        self._entries = sorted((-value, player_id) for player_id, value in self._values.items())
+
+    def set_value(self, player_id: str, value: int):
+        old_value = self._values.get(player_id)
+        if old_value == value:
+            return
+        if old_value is not None:
+            del self._entries[bisect_left(self._entries, (-old_value, player_id))]
+        self._values[player_id] = value
+        insort(self._entries, (-value, player_id))
+
+    def add_to_value(self, player_id: str, delta: int):
+        self.set_value(player_id, self._values.get(player_id, 0) + delta)
+
+    def get_value(self, player_id: str):
+        return self._values.get(player_id, 0)
+
+    def get_rank(self, player_id: str) -> int | None:
+        value = self._values.get(player_id)
+        if value is None:
+            return None
+        return bisect_left(self._entries, (-value,)) + 1
+
+    def get_top(self, n: int, start: int=0) -> List[Tuple[str, int]]:
+        return [(player_id, -negative_value) for negative_value, player_id in self._entries[start:start + n]]
+
+    def __len__(self):
+        return len(self._entries)
+
+# -----------------------------------------------------------------------------
+# LEADERBOARDS
+# -----------------------------------------------------------------------------
+
+# Nothing here is saved. The indexes are built from the database in bulk when
+# it's loaded, then each player's stats tell their guild's indexes whenever a
+# counter that feeds one changes, so viewing a leaderboard never has to go
+# through every player.
+class GuildLeaderboards():
+    def __init__(self):
+        self._indexes: Dict[LeaderboardCategory, RankedIndex] = {category: RankedIndex() for category in LeaderboardCategory}
+
+    def get_index(self, category: LeaderboardCategory):
+        return self._indexes[category]
+
+    def bulk_load(self, members: Dict[str, Player]):
+        for category, index in self._indexes.items():
+            index.bulk_load({player_id: player.get_stats().get_leaderboard_value(category) for player_id, player in members.items()})
+        for player_id, player in members.items():
+            self._listen_to(player_id, player)
+
+    def add_player(self, player_id: str, player: Player):
+        stats = player.get_stats()
+        for category, index in self._indexes.items():
+            index.set_value(player_id, stats.get_leaderboard_value(category))
+        self._listen_to(player_id, player)
+
+    def _listen_to(self, player_id: str, player: Player):
+        def on_stat_changed(category: LeaderboardCategory, delta: int):
+            self._indexes[category].add_to_value(player_id, delta)
+        player.get_stats().set_leaderboard_listener(on_stat_changed)
+
+
+class Leaderboards():
+    def __init__(self):
+        self._guilds: Dict[str, GuildLeaderboards] = {}
+
+    def rebuild(self, database: dict):
+        self._guilds = {}
+        for guild_id_str, guild_data in database.items():
+            guild_leaderboards = GuildLeaderboards()
+            guild_leaderboards.bulk_load(guild_data.get("members", {}))
+            self._guilds[guild_id_str] = guild_leaderboards
+
+    def add_player(self, guild_id: int | str, player_id: str, player: Player):
+        self.get_guild(guild_id).add_player(player_id, player)
+
+    def get_guild(self, guild_id: int | str):
+        guild_id_str = str(guild_id)
+        guild_leaderboards = self._guilds.get(guild_id_str)
+        if guild_leaderboards is None:
+            guild_leaderboards = GuildLeaderboards()
+            self._guilds[guild_id_str] = guild_leaderboards
+        return guild_leaderboards
+
+# -----------------------------------------------------------------------------
+# LEADERBOARD VIEW
+# -----------------------------------------------------------------------------
+
+class LeaderboardView(discord.ui.View):
+    def __init__(self, bot: commands.Bot, guild_id: int, user: discord.User, leaderboard_category: LeaderboardCategory | None=None):
+        super().__init__(timeout=900)
+
+        self._bot = bot
+        self._guild_id = guild_id
+        self._user = user
+        self._leaderboard_category = leaderboard_category
+
+        self._page = 0
+        self._categories = list(LeaderboardCategory)
+
+        if leaderboard_category is None:
+            self.add_item(PrevButton(0))
+            self.add_item(NextButton(0))
+
+    def get_current_page_info(self):
+        category = self._leaderboard_category if self._leaderboard_category is not None else self._categories[self._page]
+        index = LEADERBOARDS.get_guild(self._guild_id).get_index(category)
+
+        top_strs: List[str] = []
+        for player_id, value in index.get_top(LEADERBOARD_PAGE_SIZE):
+            if value <= 0:
+                break
+            top_strs.append(f"{index.get_rank(player_id)}. <@{player_id}>: {value}")
+        top_str = "\n".join(top_strs) if len(top_strs) > 0 else "*No one's on this leaderboard yet.*"
+
+        user_id_str = str(self._user.id)
+        rank = index.get_rank(user_id_str)
+        rank_str = f"Your rank: {rank}/{len(index)} ({index.get_value(user_id_str)})" if rank is not None else ""
+
+        page_str = f"*({self._page + 1}/{len(self._categories)})*" if self._leaderboard_category is None else ""
+        description = f"**{LEADERBOARD_NAMES[category]}**\n\n{top_str}\n\n{rank_str}\n\n{page_str}"
+        return Embed(title="Leaderboard", description=description)
+
+    def next_page(self):
+        self._page = (self._page + 1) % len(self._categories)
+        return self.get_current_page_info()
+
+    def prev_page(self):
+        self._page = (self._page - 1) % len(self._categories)
+        return self.get_current_page_info()
+
+    def get_user(self):
+        return self._user
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+LEADERBOARDS = Leaderboards()
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import discord
+import jsonpickle
+import sqlite3
 import time
 
 from bot import BenjaminBowtieBot
 from discord.embeds import Embed
 from discord.ext import commands
+from features.shared.constants import MAIL_RETENTION_SECONDS
 from features.shared.nextbutton import NextButton
 from features.shared.prevbutton import PrevButton
 from math import ceil
 
-from typing import List, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, TYPE_CHECKING
 if TYPE_CHECKING:
     from features.house.house import HouseView
     from features.inventory import Inventory, Item
@@ -19,13 +22,15 @@ if TYPE_CHECKING:
 
 
 class Mail():
-    def __init__(self, sender_name: str, item: Item | None, coins: int, message: str, send_date: str, sender_id: int):
+    def __init__(self, sender_name: str, item: Item | None, coins: int, message: str, send_date: str, sender_id: int, mail_id: int | None=None):
         self._sender_name = sender_name
         self._item = item
         self._message = message
         self._send_date = send_date
         self._coins = coins
         self._sender_id = sender_id
+        # Set once the mail is in the store
+        self._mail_id = mail_id
 
     def get_sender_name(self):
         return self._sender_name
@@ -45,6 +50,9 @@ class Mail():
     def get_sender_id(self):
         return self._sender_id
 
+    def get_mail_id(self):
+        return self._mail_id
+
     def __eq__(self, obj):
         if not isinstance(obj, Mail):
             return False
@@ -66,6 +74,203 @@ class Mail():
         self._send_date = state.get("_send_date", "")
         self._coins = state.get("_coins", 0)
         self._sender_id = state.get("_sender_id", -1)
+        self._mail_id = state.get("_mail_id", None)
+
+# -----------------------------------------------------------------------------
+# MAIL STORE
+# -----------------------------------------------------------------------------
+
+# Mail lives in its own SQLite database rather than in each Player, so it isn't
+# re-encoded on every save and a mailbox is read a page at a time through an
+# index on its recipient. Opened mail is marked claimed rather than deleted
+# and compacted away once it's old enough.
+#
+# The store commits as soon as anything changes, but the players that items
+# and coins come from or go to are only written out by the periodic save. To
+# keep the two in step, every change is numbered, each guild is saved with the
+# number it was at when it was encoded, and on startup anything newer
+# than that is undone: mail sent after the save is dropped (the sender, or the
+# tick that sent it, still has it in the loaded database) and mail claimed
+# after it goes back in the mailbox.
+#
+# When the bot runs as several processes they all share the one database, so
+# it doesn't matter how shards are grouped into processes. Every row belongs
+# to a guild and a process only touches its own guilds' rows, and the change
+# counter is read and bumped inside each transaction rather than kept in
+# memory, since any process can move it.
+
+# How long a process waits on another one's write before giving up
+MAIL_BUSY_TIMEOUT_SECONDS = 30
+
+MAIL_COLUMNS = "mail_id, sender_name, sender_id, item, coins, message, send_date"
+
+class MailStore():
+    def __init__(self):
+        self._connection: sqlite3.Connection | None = None
+
+    def open(self, path: str):
+        connection = sqlite3.connect(path, timeout=MAIL_BUSY_TIMEOUT_SECONDS)
+        # Has to be set before any tables exist to take effect
+        connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS mail ("
+                "mail_id INTEGER PRIMARY KEY, guild_id TEXT NOT NULL, recipient_id TEXT NOT NULL, "
+                "sender_name TEXT NOT NULL, sender_id INTEGER NOT NULL, item TEXT, coins INTEGER NOT NULL, "
+                "message TEXT NOT NULL, send_date TEXT NOT NULL, "
+                "created_sequence INTEGER NOT NULL, claimed_sequence INTEGER, claimed_time REAL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS mail_by_recipient ON mail (guild_id, recipient_id, claimed_sequence, mail_id)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('sequence', 0)")
+        self._connection = connection
+
+    def is_open(self):
+        return self._connection is not None
+
+    def close(self):
+        # The last connection to close checkpoints the WAL into the database
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _get_connection(self):
+        assert self._connection is not None, "The mail store hasn't been opened"
+        return self._connection
+
+    def _next_sequence(self, connection: sqlite3.Connection) -> int:
+        # Called inside the transaction making the change, which holds the
+        # write lock from here on, so no other process can take the same number
+        return connection.execute("UPDATE meta SET value = value + 1 WHERE key = 'sequence' RETURNING value").fetchone()[0]
+
+    def get_sequence(self) -> int:
+        return self._get_connection().execute("SELECT value FROM meta WHERE key = 'sequence'").fetchone()[0]
+
+    def _to_mail(self, row: tuple):
+        mail_id, sender_name, sender_id, item, coins, message, send_date = row
+        return Mail(sender_name, jsonpickle.decode(item) if item is not None else None, coins, message, send_date, sender_id, mail_id)
+
+    # -------------------------------------------------------------------------
+    # SENDING AND CLAIMING
+    # -------------------------------------------------------------------------
+
+    def send_all(self, guild_id: int | str, recipient_id: int | str, mail: Iterable[Mail]):
+        mail = list(mail)
+        if len(mail) == 0:
+            return
+
+        connection = self._get_connection()
+        with connection:
+            sequence = self._next_sequence(connection)
+            connection.executemany(
+                "INSERT INTO mail (guild_id, recipient_id, sender_name, sender_id, item, coins, message, send_date, created_sequence) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(
+                    str(guild_id), str(recipient_id), m.get_sender_name(), m.get_sender_id(),
+                    jsonpickle.encode(m.get_item(), make_refs=False) if m.get_item() is not None else None,
+                    m.get_coins(), m.get_message(), m.get_send_date(), sequence
+                ) for m in mail]
+            )
+
+    def send(self, guild_id: int | str, recipient_id: int | str, mail: Mail):
+        self.send_all(guild_id, recipient_id, [mail])
+
+    def get_page(self, guild_id: int | str, recipient_id: int | str, after_mail_id: int, limit: int):
+        # Unclaimed mail oldest first, starting after the last mail of the
+        # previous page, so a page costs the same however deep it is
+        rows = self._get_connection().execute(
+            f"SELECT {MAIL_COLUMNS} FROM mail WHERE guild_id = ? AND recipient_id = ? AND claimed_sequence IS NULL AND mail_id > ? "
+            "ORDER BY mail_id LIMIT ?",
+            (str(guild_id), str(recipient_id), after_mail_id, limit)
+        ).fetchall()
+        return [self._to_mail(row) for row in rows]
+
+    def get_unclaimed_count(self, guild_id: int | str, recipient_id: int | str) -> int:
+        return self._get_connection().execute(
+            "SELECT COUNT(*) FROM mail WHERE guild_id = ? AND recipient_id = ? AND claimed_sequence IS NULL",
+            (str(guild_id), str(recipient_id))
+        ).fetchone()[0]
+
+    def claim(self, guild_id: int | str, recipient_id: int | str, mail_id: int):
+        # None if it's already been claimed
+        connection = self._get_connection()
+        with connection:
+            sequence = self._next_sequence(connection)
+            row = connection.execute(
+                f"UPDATE mail SET claimed_sequence = ?, claimed_time = ? "
+                "WHERE mail_id = ? AND guild_id = ? AND recipient_id = ? AND claimed_sequence IS NULL "
+                f"RETURNING {MAIL_COLUMNS}",
+                (sequence, time.time(), mail_id, str(guild_id), str(recipient_id))
+            ).fetchone()
+        return self._to_mail(row) if row is not None else None
+
+    def claim_all(self, guild_id: int | str, recipient_id: int | str) -> List[Mail]:
+        connection = self._get_connection()
+        with connection:
+            sequence = self._next_sequence(connection)
+            rows = connection.execute(
+                f"UPDATE mail SET claimed_sequence = ?, claimed_time = ? "
+                "WHERE guild_id = ? AND recipient_id = ? AND claimed_sequence IS NULL "
+                f"RETURNING {MAIL_COLUMNS}",
+                (sequence, time.time(), str(guild_id), str(recipient_id))
+            ).fetchall()
+        # RETURNING doesn't promise any order
+        return [self._to_mail(row) for row in sorted(rows, key=lambda row: row[0])]
+
+    # -------------------------------------------------------------------------
+    # SAVES AND COMPACTION
+    # -------------------------------------------------------------------------
+
+    def roll_back_to_saved(self, saved_sequences: Dict[str, int | None], owns_guild: Callable[[str], bool]):
+        # Undoes everything newer than the loaded database for the guilds this
+        # process owns, given the sequence each guild was saved with; those
+        # that weren't saved with one lose all their mail. Other processes'
+        # guilds are left alone.
+        connection = self._get_connection()
+        with connection:
+            mail_guild_ids: List[str] = [row[0] for row in connection.execute("SELECT DISTINCT guild_id FROM mail").fetchall()]
+            for guild_id_str in mail_guild_ids:
+                if not owns_guild(guild_id_str):
+                    continue
+                saved_sequence = saved_sequences.get(guild_id_str)
+                if saved_sequence is None:
+                    connection.execute("DELETE FROM mail WHERE guild_id = ?", (guild_id_str,))
+                    continue
+                connection.execute("DELETE FROM mail WHERE guild_id = ? AND created_sequence > ?", (guild_id_str, saved_sequence))
+                connection.execute(
+                    "UPDATE mail SET claimed_sequence = NULL, claimed_time = NULL WHERE guild_id = ? AND claimed_sequence > ?",
+                    (guild_id_str, saved_sequence)
+                )
+
+    def sync_with_database(self, database: dict, owns_guild: Callable[[str], bool]):
+        # Anything the store has that's newer than the just loaded database is
+        # undone first, then mail still in players from before the store
+        # existed is moved in. Until a save records the guild's sequence, a
+        # restart undoes the move along with everything else, so the mail is
+        # only ever moved in once.
+        self.roll_back_to_saved({guild_id_str: guild_data.get("mail_sequence") for guild_id_str, guild_data in database.items()}, owns_guild)
+        for guild_id_str, guild_data in database.items():
+            for user_id_str, player in guild_data["members"].items():
+                self.send_all(guild_id_str, user_id_str, player.take_unmigrated_mail())
+
+    def compact(self, saved_sequences: Dict[str, int], now: float | None=None):
+        # Claimed mail past retention that the save with these sequences has
+        # already accounted for
+        if now is None:
+            now = time.time()
+        connection = self._get_connection()
+        with connection:
+            num_deleted = 0
+            for guild_id_str, saved_sequence in saved_sequences.items():
+                num_deleted += connection.execute(
+                    "DELETE FROM mail WHERE guild_id = ? AND claimed_time < ? AND claimed_sequence <= ?",
+                    (guild_id_str, now - MAIL_RETENTION_SECONDS, saved_sequence)
+                ).rowcount
+        if num_deleted > 0:
+            connection.execute("PRAGMA incremental_vacuum")
+        return num_deleted
 
 
 class InventoryMailButton(discord.ui.Button):
@@ -234,7 +439,7 @@ class MailModal(discord.ui.Modal):
             return
 
         mail = Mail(self._user.display_name, sent_item, sent_coins, self._message_input.value, str(time.time()).split(".")[0], self._user.id)
-        await giftee_player.send_mail(mail, self._bot)
+        giftee_player.send_mail(str(self._guild_id), mail)
         
         if sent_coins > 0:
             coin_str = "coin" if sent_coins == 1 else "coins"
@@ -286,7 +491,7 @@ class MailboxButton(discord.ui.Button):
         
         view: MailboxView = self.view
         if interaction.user == view.get_user():
-            if view.open_mail(self._mail_index, self._mail):
+            if view.open_mail(self._mail):
                 await interaction.response.edit_message(content=None, embed=view.get_current_page_info(), view=view)
 
                 player: Player = view.get_player()
@@ -336,16 +541,10 @@ class OpenAllButton(discord.ui.Button):
 
         combined_message_text: str = ""
         if interaction.user == view.get_user():
-            player = view.get_player()
-            mailbox: List[Mail] = player.get_mailbox()
-
-            for mail in mailbox:
-                player: Player = view.get_player()
-                player_stats: Stats = player.get_stats()
-
-                player.get_inventory().add_item(mail.get_item())
-                player.get_inventory().add_coins(mail.get_coins())
+            player: Player = view.get_player()
+            player_stats: Stats = player.get_stats()
 
+            for mail in view.open_all_mail():
                 coins_received = mail.get_coins()
                 mail_message = f"From: {mail.get_sender_name()} (<t:{mail.get_send_date()}:R>)"
                 mail_item = mail.get_item()
@@ -367,8 +566,6 @@ class OpenAllButton(discord.ui.Button):
 
                 combined_message_text += mail_message + '\n\n᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆\n\n'
 
-            player.get_mailbox().clear()
-
         for i in range(ceil(len(combined_message_text) / 1500)):
             chunked_text = combined_message_text[(1500 * i):(1500 * (i + 1))]
             await interaction.user.send(chunked_text)
@@ -407,8 +604,10 @@ class MailboxView(discord.ui.View):
         self._user = user
         self._house_view = house_view
 
-        self._page = 0
+        # The mail ID each page starts after; the last is the current page
+        self._page_cursors: List[int] = [0]
         self._NUM_PER_PAGE = 4
+        self._page_mail: List[Mail] = []
         
         self.block_buttons: bool = False
 
@@ -421,20 +620,27 @@ class MailboxView(discord.ui.View):
 
     def _get_current_page_buttons(self):
         self.clear_items()
-        player: Player = self.get_player()
-        mailbox: List[Mail] = player.get_mailbox()
 
-        page_slots = mailbox[self._page * self._NUM_PER_PAGE:min(len(mailbox), (self._page + 1) * self._NUM_PER_PAGE)]
-        for i, item in enumerate(page_slots):
-            self.add_item(MailboxButton(i, item, self.block_buttons))
-        if self._page != 0:
-            self.add_item(PrevButton(min(4, len(page_slots)), self.block_buttons))
-        if len(mailbox) - self._NUM_PER_PAGE * (self._page + 1) > 0:
-            self.add_item(NextButton(min(4, len(page_slots)), self.block_buttons))
-        if len(mailbox) > 0:
-            self.add_item(OpenAllButton(min(4, len(page_slots)), self.block_buttons))
+        # One extra to know whether there's a next page
+        page_mail = MAIL_STORE.get_page(self._guild_id, self._user.id, self._page_cursors[-1], self._NUM_PER_PAGE + 1)
+        while len(page_mail) == 0 and len(self._page_cursors) > 1:
+            # Everything on this page was opened elsewhere
+            self._page_cursors.pop()
+            page_mail = MAIL_STORE.get_page(self._guild_id, self._user.id, self._page_cursors[-1], self._NUM_PER_PAGE + 1)
+        
+        self._page_mail = page_mail[:self._NUM_PER_PAGE]
+        has_next_page = len(page_mail) > self._NUM_PER_PAGE
+
+        for i, mail in enumerate(self._page_mail):
+            self.add_item(MailboxButton(i, mail, self.block_buttons))
+        if len(self._page_cursors) > 1:
+            self.add_item(PrevButton(min(4, len(self._page_mail)), self.block_buttons))
+        if has_next_page:
+            self.add_item(NextButton(min(4, len(self._page_mail)), self.block_buttons))
+        if len(self._page_mail) > 0:
+            self.add_item(OpenAllButton(min(4, len(self._page_mail)), self.block_buttons))
         if self.get_house_view() is not None:
-            self.add_item(ExitToHouseButton(min(4, len(page_slots)), self.block_buttons))
+            self.add_item(ExitToHouseButton(min(4, len(self._page_mail)), self.block_buttons))
         
     def get_current_page_info(self):
         return Embed(
@@ -443,45 +649,56 @@ class MailboxView(discord.ui.View):
         )
         
     def next_page(self):
-        self._page += 1
+        last_mail_id = self._page_mail[-1].get_mail_id() if len(self._page_mail) > 0 else None
+        if last_mail_id is not None:
+            self._page_cursors.append(last_mail_id)
         self._get_current_page_buttons()
         return self.get_current_page_info()
 
     def prev_page(self):
-        self._page = max(0, self._page - 1)
+        if len(self._page_cursors) > 1:
+            self._page_cursors.pop()
         self._get_current_page_buttons()
         return self.get_current_page_info()
 
-    def _mail_exists(self, mailbox: List[Mail], mail: Mail):
-        for i, mailbox_mail in enumerate(mailbox):
-            if mailbox_mail == mail:
-                return i
-        return -1
-
-    def open_mail(self, mail_index: int, mail: Mail):
+    def open_mail(self, mail: Mail):
         player: Player = self.get_player()
         inventory: Inventory = player.get_inventory()
-        mailbox: List[Mail] = player.get_mailbox()
 
-        if mail_index >= len(mailbox):
-            self._get_current_page_buttons()
-            return False
-        
-        adjusted_index = mail_index + (self._page * self._NUM_PER_PAGE)
-        found_index = self._mail_exists(mailbox, mail)
-        if found_index != adjusted_index:
+        mail_id = mail.get_mail_id()
+        claimed_mail = MAIL_STORE.claim(self._guild_id, self._user.id, mail_id) if mail_id is not None else None
+        if claimed_mail is None:
             self._get_current_page_buttons()
             return False
 
-        mailbox_mail = mailbox.pop(adjusted_index)
-        inventory.add_item(mailbox_mail.get_item())
-        inventory.add_coins(mailbox_mail.get_coins())
+        inventory.add_item(claimed_mail.get_item())
+        inventory.add_coins(claimed_mail.get_coins())
 
         self._get_current_page_buttons()
         return True
 
+    def open_all_mail(self):
+        # Claimed in one transaction and added to the inventory all at once,
+        # rather than reorganizing the inventory for every item
+        player: Player = self.get_player()
+        inventory: Inventory = player.get_inventory()
+
+        claimed_mail = MAIL_STORE.claim_all(self._guild_id, self._user.id)
+        inventory.add_items([mail.get_item() for mail in claimed_mail])
+        inventory.add_coins(sum(mail.get_coins() for mail in claimed_mail))
+
+        self._page_cursors = [0]
+        self._get_current_page_buttons()
+        return claimed_mail
+
     def get_user(self):
         return self._user
 
     def get_house_view(self):
         return self._house_view
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+MAIL_STORE = MailStore()
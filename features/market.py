@@ -10,11 +10,12 @@ from features.npcs.copperbroad import ChefView
 from features.npcs.tiatha import DruidView
 from features.npcs.viktor import RandomItemMerchantView
 from features.npcs.yenna import YennaView
+from features.shared.enums import ClassTag, find_class_tag, get_tag_mask
 from features.shared.item import Rarity
 from features.shared.nextbutton import NextButton
 from features.shared.prevbutton import PrevButton
 
-from typing import TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 if TYPE_CHECKING:
     from bot import BenjaminBowtieBot
     from features.inventory import Inventory
@@ -23,7 +24,73 @@ if TYPE_CHECKING:
     from features.shared.item import Item
 
 # -----------------------------------------------------------------------------
-# MODAL
+# SELLING
+# -----------------------------------------------------------------------------
+
+SELL_XP_BY_RARITY: Dict[Rarity, int] = {
+    Rarity.Uncommon: 1,
+    Rarity.Rare: 2,
+    Rarity.Epic: 3,
+    Rarity.Legendary: 5,
+    Rarity.Artifact: 8
+}
+
+# Shown in the bulk sell select, which can't have more options than this
+MAX_BULK_SELL_OPTIONS = 25
+
+
+def sell_items(player: Player, slot_counts: Dict[int, int]):
+    # Sells the given number of each inventory slot in one go: the inventory
+    # is organized once, and stats and xp are added once for the whole sale.
+    # Returns the number of items sold, coins made and Merchant xp gained.
+    inventory: Inventory = player.get_inventory()
+    sold_items = inventory.remove_items(slot_counts)
+
+    num_sold: int = 0
+    total_amount: int = 0
+    base_xp: int = 0
+    for item in sold_items:
+        num_sold += item.get_count()
+        total_amount += item.get_value() * item.get_count()
+        base_xp += SELL_XP_BY_RARITY.get(item.get_rarity(), 0) * item.get_count()
+
+    inventory.add_coins(total_amount)
+
+    player_stats: Stats = player.get_stats()
+    player_stats.market.items_sold += num_sold
+    player_stats.market.coins_made += total_amount
+
+    player_xp: Expertise = player.get_expertise()
+    xp_to_add: int = player_xp.add_xp_to_class(base_xp, ExpertiseClass.Merchant, player.get_equipment())
+
+    return num_sold, total_amount, xp_to_add
+
+
+def get_filtered_sell_counts(inventory: Inventory, rarities: List[Rarity], tag_mask: int, keep: int):
+    # Everything that isn't bound and matches the filters, less however many
+    # of each stack to keep. No rarities or a zero mask matches anything.
+    inventory_slots = inventory.get_inventory_slots()
+    slot_counts: Dict[int, int] = {}
+    for i in inventory.get_non_bound_items():
+        item = inventory_slots[i]
+        if len(rarities) > 0 and item.get_rarity() not in rarities:
+            continue
+        if tag_mask != 0 and not item.has_any_tag(tag_mask):
+            continue
+        if item.get_count() > keep:
+            slot_counts[i] = item.get_count() - keep
+    return slot_counts
+
+
+def get_sold_str(num_sold: int, total_amount: int, xp_to_add: int, sold_name: str):
+    amount_str: str = "1 coin" if total_amount == 1 else f"{total_amount} coins"
+    sold_str = f"*Sold {num_sold} {sold_name} for {amount_str}!*"
+    if xp_to_add > 0:
+        sold_str += f" *(+{xp_to_add} Merchant xp)*"
+    return sold_str
+
+# -----------------------------------------------------------------------------
+# MODALS
 # -----------------------------------------------------------------------------
 
 class SellModal(discord.ui.Modal):
@@ -75,41 +142,9 @@ class SellModal(discord.ui.Modal):
             return
 
         amount_to_sell: int = int(self._count_input.value)
-        inventory.remove_item(self._item_index, amount_to_sell)
-        item_value: int = self._item.get_value()
-        item_rarity: Rarity = self._item.get_rarity()
-        total_amount: int = item_value * amount_to_sell
-        inventory.add_coins(total_amount)
-
-        player_stats: Stats = player.get_stats()
-        player_stats.market.items_sold += amount_to_sell
-        player_stats.market.coins_made += item_value * amount_to_sell
-
-        player_xp: Expertise = player.get_expertise()
-        base_xp: int = 0
-        if item_rarity == Rarity.Uncommon:
-            base_xp = 1
-        if item_rarity == Rarity.Rare:
-            base_xp = 2
-        if item_rarity == Rarity.Epic:
-            base_xp = 3
-        if item_rarity == Rarity.Legendary:
-            base_xp = 5
-        if item_rarity == Rarity.Artifact:
-            base_xp = 8
-
-        xp_to_add: int = amount_to_sell * base_xp
-        xp_to_add = player_xp.add_xp_to_class(xp_to_add, ExpertiseClass.Merchant, player.get_equipment())
-    
-        amount_str: str = ""
-        if total_amount == 1:
-            amount_str = "1 coin"
-        else:
-            amount_str = f"{total_amount} coins"
+        num_sold, total_amount, xp_to_add = sell_items(player, { self._item_index: amount_to_sell })
 
-        description = f"Choose an item from your inventory to sell. You have {inventory.get_coins_str()}.\n\n*Sold {amount_to_sell} {self._item.get_full_name()} for {amount_str}!*"
-        if xp_to_add > 0:
-            description += f" *(+{xp_to_add} Merchant xp)*"
+        description = f"Choose an item from your inventory to sell. You have {inventory.get_coins_str()}.\n\n{get_sold_str(num_sold, total_amount, xp_to_add, self._item.get_full_name())}"
 
         embed = Embed(
             title="Selling at the Market",
@@ -122,6 +157,87 @@ class SellModal(discord.ui.Modal):
     async def on_error(self, interaction: discord.Interaction, error: Exception):
         await interaction.response.send_message("Error: Something has gone terribly wrong.")
 
+
+class BulkSellModal(discord.ui.Modal):
+    def __init__(self, database: dict, guild_id: int, user: discord.User, view: MarketView, message_id: int):
+        super().__init__(title="Sell Everything Matching")
+
+        self._database = database
+        self._guild_id = guild_id
+        self._user = user
+        self._view = view
+        self._message_id = message_id
+
+        self._rarities_input: discord.ui.TextInput = discord.ui.TextInput(
+            label="Rarities",
+            placeholder="Common, Uncommon",
+            required=False
+        )
+
+        self._tags_input: discord.ui.TextInput = discord.ui.TextInput(
+            label="Item Types",
+            placeholder="Fish, Gemstone",
+            required=False
+        )
+
+        self._keep_input: discord.ui.TextInput = discord.ui.TextInput(
+            label="Keep This Many of Each",
+            default="0",
+            required=True
+        )
+        
+        self.add_item(self._rarities_input)
+        self.add_item(self._tags_input)
+        self.add_item(self._keep_input)
+
+    def _get_player(self, user_id: int) -> Player:
+        return self._database[str(self._guild_id)]["members"][str(user_id)]
+
+    async def on_submit(self, interaction: discord.Interaction):
+        player: Player = self._get_player(self._user.id)
+        inventory: Inventory = player.get_inventory()
+
+        rarity_names: List[str] = [name.strip().lower() for name in self._rarities_input.value.split(",") if name.strip() != ""]
+        rarities: List[Rarity] = [rarity for rarity in Rarity if rarity != Rarity.Unknown and rarity.lower() in rarity_names]
+        if len(rarities) != len(set(rarity_names)):
+            await interaction.response.send_message(f"Error: Rarities must be some of {', '.join(rarity for rarity in Rarity if rarity != Rarity.Unknown)}.")
+            return
+
+        tag_names: List[str] = [name.strip() for name in self._tags_input.value.split(",") if name.strip() != ""]
+        tags: List[ClassTag] = []
+        for tag_name in tag_names:
+            tag = find_class_tag(tag_name)
+            if tag is None:
+                await interaction.response.send_message(f"Error: {tag_name} isn't an item type. Try one like Fish, Gemstone or Raw Food.")
+                return
+            tags.append(tag)
+        
+        if len(rarities) == 0 and len(tags) == 0:
+            await interaction.response.send_message(f"Error: You must choose at least one rarity or item type to sell.")
+            return
+
+        if not self._keep_input.value.isnumeric():
+            await interaction.response.send_message(f"Error: You must keep a non-negative number of each item.")
+            return
+
+        slot_counts = get_filtered_sell_counts(inventory, rarities, get_tag_mask(tags), int(self._keep_input.value))
+        if len(slot_counts) == 0:
+            await interaction.response.send_message(f"Error: You don't have anything like that to sell.")
+            return
+
+        num_sold, total_amount, xp_to_add = sell_items(player, slot_counts)
+
+        embed = Embed(
+            title="Selling at the Market",
+            description=f"{self._view.get_bulk_sell_description()}\n\n{get_sold_str(num_sold, total_amount, xp_to_add, 'items')}"
+        )
+
+        await self._view.refresh(self._message_id, embed)
+        await interaction.response.defer()
+
+    async def on_error(self, interaction: discord.Interaction, error: Exception):
+        await interaction.response.send_message("Error: Something has gone terribly wrong.")
+
 # -----------------------------------------------------------------------------
 # MARKET VIEW
 # -----------------------------------------------------------------------------
@@ -150,6 +266,75 @@ class InventorySellButton(discord.ui.Button):
             )
 
 
+class BulkSellSelect(discord.ui.Select):
+    def __init__(self, item_indices: List[int], items: List[Item]):
+        options: List[discord.SelectOption] = [
+            discord.SelectOption(label=item.get_name_and_count(), value=str(i), description=f"{item.get_value_str()} each", emoji=item.get_icon())
+            for i, item in enumerate(items)
+        ]
+        super().__init__(placeholder="Sell all of...", min_values=1, max_values=len(options), options=options, row=0)
+
+        self._item_indices = item_indices
+        self._items = items
+
+    async def callback(self, interaction: discord.Interaction):
+        if self.view is None:
+            return
+        
+        view: MarketView = self.view
+        if interaction.user == view.get_user():
+            selected = [int(value) for value in self.values]
+            response = view.sell_selected([self._item_indices[i] for i in selected], [self._items[i] for i in selected])
+            await interaction.response.edit_message(content=None, embed=response, view=view)
+
+
+class BulkSellFilterButton(discord.ui.Button):
+    def __init__(self, row: int):
+        super().__init__(style=discord.ButtonStyle.secondary, label="Sell by Rarity or Type", row=row)
+
+    async def callback(self, interaction: discord.Interaction):
+        if self.view is None:
+            return
+        
+        view: MarketView = self.view
+        if interaction.user == view.get_user():
+            await interaction.response.send_modal(BulkSellModal(
+                view.get_database(),
+                view.get_guild_id(),
+                view.get_user(),
+                view,
+                interaction.message.id)
+            )
+
+
+class BulkSellButton(discord.ui.Button):
+    def __init__(self, row: int):
+        super().__init__(style=discord.ButtonStyle.blurple, label="Bulk Sell", row=row)
+
+    async def callback(self, interaction: discord.Interaction):
+        if self.view is None:
+            return
+        
+        view: MarketView = self.view
+        if interaction.user == view.get_user():
+            response = view.enter_bulk_sell()
+            await interaction.response.edit_message(content=None, embed=response, view=view)
+
+
+class ExitBulkSellButton(discord.ui.Button):
+    def __init__(self, row: int):
+        super().__init__(style=discord.ButtonStyle.red, label="Back", row=row)
+
+    async def callback(self, interaction: discord.Interaction):
+        if self.view is None:
+            return
+        
+        view: MarketView = self.view
+        if interaction.user == view.get_user():
+            response = view.exit_bulk_sell()
+            await interaction.response.edit_message(content=None, embed=response, view=view)
+
+
 class MarketSellButton(discord.ui.Button):
     def __init__(self, row: int):
         super().__init__(style=discord.ButtonStyle.blurple, label="Sell", row=row)
@@ -265,6 +450,7 @@ class MarketView(discord.ui.View):
 
         self._page = 0
         self._NUM_PER_PAGE = 4
+        self._bulk_selling: bool = False
         
         self._display_initial_buttons()
 
@@ -272,6 +458,10 @@ class MarketView(discord.ui.View):
         return self._database[str(self._guild_id)]["members"][str(self._user.id)]
 
     def _get_current_page_buttons(self):
+        if self._bulk_selling:
+            self._get_bulk_sell_buttons()
+            return
+
         self.clear_items()
         player: Player = self._get_player()
         inventory: Inventory = player.get_inventory()
@@ -288,7 +478,58 @@ class MarketView(discord.ui.View):
             self.add_item(PrevButton(min(4, len(page_slots))))
         if len(filtered_items) - self._NUM_PER_PAGE * (self._page + 1) > 0:
             self.add_item(NextButton(min(4, len(page_slots))))
+        if len(filtered_items) > 0:
+            self.add_item(BulkSellButton(min(4, len(page_slots))))
         self.add_item(MarketExitButton(min(4, len(page_slots))))
+
+    def _get_bulk_sell_buttons(self):
+        self.clear_items()
+        player: Player = self._get_player()
+        inventory: Inventory = player.get_inventory()
+        inventory_slots = inventory.get_inventory_slots()
+
+        # Starts from the page the player was looking at
+        filtered_indices = inventory.get_non_bound_items()
+        start = min(self._page * self._NUM_PER_PAGE, max(0, len(filtered_indices) - MAX_BULK_SELL_OPTIONS))
+        select_indices = filtered_indices[start:start + MAX_BULK_SELL_OPTIONS]
+        if len(select_indices) > 0:
+            self.add_item(BulkSellSelect(select_indices, [inventory_slots[i] for i in select_indices]))
+            self.add_item(BulkSellFilterButton(1))
+        self.add_item(ExitBulkSellButton(1))
+
+    def get_bulk_sell_description(self):
+        player: Player = self._get_player()
+        inventory = player.get_inventory()
+        return f"Choose items to sell all of at once, or sell everything of some rarities or types. Bound items are never sold. You have {inventory.get_coins_str()}."
+
+    def enter_bulk_sell(self):
+        self._bulk_selling = True
+        self._get_current_page_buttons()
+        return Embed(title="Selling at the Market", description=self.get_bulk_sell_description())
+
+    def exit_bulk_sell(self):
+        self._bulk_selling = False
+        return self.enter_sell_market()
+
+    def sell_selected(self, item_indices: List[int], items: List[Item]):
+        player: Player = self._get_player()
+        inventory: Inventory = player.get_inventory()
+
+        # Everything selected has to still be where it was
+        for item_index, item in zip(item_indices, items):
+            if inventory.item_exists(item) != item_index:
+                self._get_current_page_buttons()
+                return Embed(
+                    title="Selling at the Market",
+                    description=f"{self.get_bulk_sell_description()}\n\n*Error: Something about your inventory changed.*"
+                )
+
+        num_sold, total_amount, xp_to_add = sell_items(player, { item_index: item.get_count() for item_index, item in zip(item_indices, items) })
+        self._get_current_page_buttons()
+        return Embed(
+            title="Selling at the Market",
+            description=f"{self.get_bulk_sell_description()}\n\n{get_sold_str(num_sold, total_amount, xp_to_add, 'items')}"
+        )
         
     def next_page(self):
         self._page += 1
@@ -335,6 +576,7 @@ class MarketView(discord.ui.View):
         )
     
     def exit_to_main_menu(self):
+        self._bulk_selling = False
         self._display_initial_buttons()
         return Embed(
             title="Welcome to the Market!",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+
 from copy import deepcopy
 from uuid import uuid4
 from enum import StrEnum
@@ -13,7 +15,7 @@ from features.shared.enums import ClassTag
 from features.shared.item import LOADED_ITEMS, ItemKey
 from features.stats import Stats
 
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
 if TYPE_CHECKING:
     from features.inventory import Inventory
 
@@ -27,6 +29,128 @@ class Difficulty(StrEnum):
     Hard = "Hard"
     MrBones = "MrBones"
 
+# -----------------------------------------------------------------------------
+# EXPECTIMAX
+# -----------------------------------------------------------------------------
+
+# Only which dice are in a column matters for scoring and removal, so columns
+# are encoded as sorted tuples of their dice and boards as a tuple of columns.
+KnucklebonesColumn = Tuple[int, ...]
+KnucklebonesBoard = Tuple[KnucklebonesColumn, KnucklebonesColumn, KnucklebonesColumn]
+
+# Plies searched: Mr. Bones' move, the player's roll and move, then his next
+# roll and move.
+EXPECTIMAX_DEPTH = 3
+# Added to a finished game's score difference so winning always beats a
+# bigger margin on an unfinished board
+EXPECTIMAX_WIN_VALUE = 1000
+MAX_TRANSPOSITION_ENTRIES = 200000
+
+UNIFORM_ROLL_WEIGHTS = (1/6, 1/6, 1/6, 1/6, 1/6, 1/6)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_col_score(col: KnucklebonesColumn):
+    return sum(value * col.count(value) * col.count(value) for value in set(col))
+
+
+# Returns the mover's and opponent's new columns, or None if the column is full
+@functools.lru_cache(maxsize=None)
+def _place_in_col(mover_col: KnucklebonesColumn, opponent_col: KnucklebonesColumn, roll: int):
+    if len(mover_col) == 3:
+        return None
+    return (tuple(sorted(mover_col + (roll,))), tuple(value for value in opponent_col if value != roll))
+
+
+def _encode_board(board: List[List[int]]) -> KnucklebonesBoard:
+    return tuple(tuple(sorted(board[i][col] for i in range(3) if board[i][col] != 0)) for col in range(3)) # type: ignore
+
+
+class KnucklebonesExpectimax():
+    def __init__(self, npc_roll_weights: Sequence[float], player_roll_weights: Sequence[float], depth: int=EXPECTIMAX_DEPTH):
+        self._npc_roll_probs = self._normalize(npc_roll_weights)
+        self._player_roll_probs = self._normalize(player_roll_weights)
+        self._depth = depth
+        # (column pairs, NPC to roll, depth) -> expected value for Mr. Bones
+        self._transposition_table: Dict[Tuple, float] = {}
+
+    def _normalize(self, weights: Sequence[float]):
+        # Very high luck can push the low rolls' weights below 0
+        weights = [max(0, weight) for weight in weights]
+        total = sum(weights)
+        return tuple(weight / total for weight in weights)
+
+    def _evaluate(self, npc_board: KnucklebonesBoard, player_board: KnucklebonesBoard, game_over: bool):
+        diff = sum(_get_col_score(col) for col in npc_board) - sum(_get_col_score(col) for col in player_board)
+        if game_over and diff != 0:
+            return diff + (EXPECTIMAX_WIN_VALUE if diff > 0 else -EXPECTIMAX_WIN_VALUE)
+        return diff
+
+    def _get_placements(self, mover_board: KnucklebonesBoard, opponent_board: KnucklebonesBoard, roll: int):
+        placements: List[Tuple[int, KnucklebonesBoard, KnucklebonesBoard]] = []
+        for col in range(3):
+            placed = _place_in_col(mover_board[col], opponent_board[col], roll)
+            if placed is None:
+                continue
+            new_mover_board = mover_board[:col] + (placed[0],) + mover_board[col + 1:]
+            new_opponent_board = opponent_board[:col] + (placed[1],) + opponent_board[col + 1:]
+            placements.append((col, new_mover_board, new_opponent_board)) # type: ignore
+        return placements
+
+    def _move_value(self, npc_board: KnucklebonesBoard, player_board: KnucklebonesBoard, roll: int, npc_to_move: bool, depth: int):
+        best_value = None
+        if npc_to_move:
+            for _, new_npc_board, new_player_board in self._get_placements(npc_board, player_board, roll):
+                value = self._after_move_value(new_npc_board, new_player_board, True, depth - 1)
+                if best_value is None or value > best_value:
+                    best_value = value
+        else:
+            # The player is assumed to play the move that's worst for Mr. Bones
+            for _, new_player_board, new_npc_board in self._get_placements(player_board, npc_board, roll):
+                value = self._after_move_value(new_npc_board, new_player_board, False, depth - 1)
+                if best_value is None or value < best_value:
+                    best_value = value
+        return best_value if best_value is not None else self._evaluate(npc_board, player_board, False)
+
+    def _after_move_value(self, npc_board: KnucklebonesBoard, player_board: KnucklebonesBoard, npc_moved: bool, depth: int):
+        mover_board = npc_board if npc_moved else player_board
+        game_over = all(len(col) == 3 for col in mover_board)
+        if game_over or depth == 0:
+            return self._evaluate(npc_board, player_board, game_over)
+        return self._chance_value(npc_board, player_board, not npc_moved, depth)
+
+    def _chance_value(self, npc_board: KnucklebonesBoard, player_board: KnucklebonesBoard, npc_to_move: bool, depth: int):
+        # Columns can be swapped as long as both boards swap them together, so
+        # sorting the column pairs lets mirrored positions share an entry.
+        key = (tuple(sorted(zip(npc_board, player_board))), npc_to_move, depth)
+        value = self._transposition_table.get(key)
+        if value is not None:
+            return value
+
+        probs = self._npc_roll_probs if npc_to_move else self._player_roll_probs
+        value = 0
+        for roll, prob in enumerate(probs, start=1):
+            if prob > 0:
+                value += prob * self._move_value(npc_board, player_board, roll, npc_to_move, depth)
+
+        if len(self._transposition_table) >= MAX_TRANSPOSITION_ENTRIES:
+            self._transposition_table.clear()
+        self._transposition_table[key] = value
+        return value
+
+    def get_best_col(self, npc_board: List[List[int]], player_board: List[List[int]], roll: int):
+        encoded_npc_board = _encode_board(npc_board)
+        encoded_player_board = _encode_board(player_board)
+
+        best_col = 0
+        best_value = None
+        for col, new_npc_board, new_player_board in self._get_placements(encoded_npc_board, encoded_player_board, roll):
+            value = self._after_move_value(new_npc_board, new_player_board, True, self._depth - 1)
+            if best_value is None or value > best_value:
+                best_col = col
+                best_value = value
+        return best_col
+
 # -----------------------------------------------------------------------------
 # NPC CLASS
 # -----------------------------------------------------------------------------
@@ -105,7 +229,7 @@ class MrBones(NPC):
 
         return best_greedy_choice
                 
-    def make_move(self, player_board: List[List[int]], npc_board: List[List[int]], difficulty: Difficulty, compute_points_in_col: Callable[[List[List[int]], int], int], current_roll: int, npc_name: str) -> str:
+    def make_move(self, player_board: List[List[int]], npc_board: List[List[int]], difficulty: Difficulty, compute_points_in_col: Callable[[List[List[int]], int], int], current_roll: int, npc_name: str, npc_roll_weights: Sequence[float]=UNIFORM_ROLL_WEIGHTS, player_roll_weights: Sequence[float]=UNIFORM_ROLL_WEIGHTS) -> str:
         if difficulty == Difficulty.Easy:
             best_greedy_choice = 0
             best_greedy_choice_diff = -163
@@ -134,6 +258,10 @@ class MrBones(NPC):
         elif difficulty == Difficulty.Hard:
             best_greedy_choice = self._try_move_with_lookahead(player_board, npc_board, current_roll, compute_points_in_col)
             return f"{npc_name} has placed their {current_roll} in column {best_greedy_choice + 1}!"
+        elif difficulty == Difficulty.MrBones:
+            best_col = KnucklebonesExpectimax(npc_roll_weights, player_roll_weights).get_best_col(npc_board, player_board, current_roll)
+            self._try_move(player_board, npc_board, best_col, current_roll, compute_points_in_col, True)
+            return f"{npc_name} has placed their {current_roll} in column {best_col + 1}!"
 
         return f"{npc_name} has skipped their turn."
 
@@ -1,34 +1,34 @@
 from __future__ import annotations
 
-import logging
+import numpy
 import random
 import time
 
-from bot import ERROR_LOGGER
 from features.companions.player_companions import PlayerCompanions
 from features.dueling import Dueling
 from features.equipment import Equipment
 from features.expertise import Expertise
 from features.house.house import House
 from features.inventory import Inventory
-from features.mail import Mail
+from features.mail import MAIL_STORE, Mail
 from features.settings import Settings
 from features.shared.effect import Effect, ItemEffects
+from features.shared.constants import ACTIVE_PLAYER_TICKS
 from features.shared.enums import CompanionTier
 from features.shared.item import LOADED_ITEMS
+from features.shared.loot import COMPANION_FIND_PROB, get_uniform_loot_table
+from features.shared.notifications import NOTIFICATIONS
+from features.shared.tick_scheduler import get_current_tick_number
 from features.stats import Stats
 from features.stories.player_dungeon_run import PlayerDungeonRun
 
-from typing import List, TYPE_CHECKING
-if TYPE_CHECKING:
-    from bot import BenjaminBowtieBot
+from typing import List
 
 class Player():
     def __init__(self, id: str):
         self._id = id
 
         self._inventory: Inventory = Inventory()
-        self._mailbox: List[Mail] = []
         self._stats: Stats = Stats()
         self._expertise: Expertise = Expertise()
         self._equipment: Equipment = Equipment()
@@ -38,41 +38,87 @@ class Player():
         self._dungeon_run: PlayerDungeonRun = PlayerDungeonRun()
         self._settings: Settings = Settings()
 
-    async def tick(self, bot: BenjaminBowtieBot):
-        self._house.tick()
+        self._last_tick: int = get_current_tick_number()
+        self._last_active_tick: int = self._last_tick
+
+    def _apply_ticks(self, num_ticks: int):
+        # Applies num_ticks hourly ticks at once and returns the mail that the
+        # player's companions sent during them.
+        new_mail: List[Mail] = []
+
+        self._house.tick(num_ticks)
+        # Companions can be fed again once a tick has passed, no matter how many
         self._companions.tick()
 
         for key in self._companions.companions.keys():
             if self._companions.companions[key].get_tier() == CompanionTier.Best:
                 companion = self._companions.companions[key]
 
-                # 5% chance per tick means roughly an item a day
-                if random.random() < 0.05:
-                    item_key = random.choice(companion.get_best_tier_items())
-                    item = LOADED_ITEMS.get_new_item(item_key)
+                # 5% chance per tick means roughly an item a day; over many ticks
+                # that's a single binomial draw for how many items were found.
+                num_finds: int = 1 if num_ticks == 1 and random.random() < COMPANION_FIND_PROB else 0
+                if num_ticks > 1:
+                    num_finds = int(numpy.random.binomial(num_ticks, COMPANION_FIND_PROB))
+
+                for _ in range(num_finds):
+                    item = get_uniform_loot_table(companion.get_best_tier_items()).roll_item()
                     
                     time_str: str = str(time.time()).split(".")[0]
-                    mail: Mail = Mail(companion.get_name(), item, 0, f"{companion.get_icon_and_name()} found this and brought it to you!", time_str, -1)
-                    
-                    await self.send_mail(mail, bot)
+                    new_mail.append(Mail(companion.get_name(), item, 0, f"{companion.get_icon_and_name()} found this and brought it to you!", time_str, -1))
 
                 if not companion.talisman_given:
                     talisman = LOADED_ITEMS.get_new_item(companion.talisman)
 
-                    mail = Mail(companion.get_name(), talisman, 0, f"{companion.get_icon_and_name()} has given this to you as a symbol of your incredible bond!", str(time.time()).split(".")[0], -1)
-                    await self.send_mail(mail, bot)
+                    new_mail.append(Mail(companion.get_name(), talisman, 0, f"{companion.get_icon_and_name()} has given this to you as a symbol of your incredible bond!", str(time.time()).split(".")[0], -1))
                     
                     companion.talisman_given = True
 
+        if not self._dueling.is_in_combat:
+            self._dueling.decrement_all_ability_cds(num_ticks)
+            self._dueling.decrement_statuses_time_remaining(num_ticks)
+
+        return new_mail
+
+    def catch_up_ticks(self, guild_id_str: str, tick_number: int | None=None):
+        # Players are only ticked while they're active, so whenever a player is
+        # accessed again they're fast-forwarded through every tick they missed.
+        # They're here already, so there's no need to notify them about mail.
+        if tick_number is None:
+            tick_number = get_current_tick_number()
+        
+        num_ticks = tick_number - self._last_tick
+        if num_ticks <= 0:
+            return 0
+        self._last_tick = tick_number
+
+        MAIL_STORE.send_all(guild_id_str, self._id, self._apply_ticks(num_ticks))
+        return num_ticks
+
+    def tick(self, guild_id_str: str, tick_number: int | None=None):
+        if tick_number is None:
+            tick_number = get_current_tick_number()
+
+        num_ticks = tick_number - self._last_tick
+        if num_ticks <= 0:
+            return
+        self._last_tick = tick_number
+
+        for mail in self._apply_ticks(num_ticks):
+            self.send_mail(guild_id_str, mail)
+
         if self._settings.mature_plant_notifications:
             plants_just_matured = self._house.get_plants_just_matured()
             if len(plants_just_matured) > 0:
-                try:
-                    plants_str: str = "\n".join(list(map(lambda plant: plant.get_full_name(), plants_just_matured)))
-                    user = await bot.fetch_user(int(self._id))
-                    await user.send(f"The following plants have matured in your garden:\n\n{plants_str}")
-                except Exception as e:
-                    ERROR_LOGGER.log(logging.ERROR, f"Failed to send plant notification to user: {e}")
+                plants_str: str = "\n".join(list(map(lambda plant: plant.get_full_name(), plants_just_matured)))
+                NOTIFICATIONS.notify(self._id, f"The following plants have matured in your garden:\n\n{plants_str}")
+
+    def mark_active(self, tick_number: int | None=None):
+        self._last_active_tick = get_current_tick_number() if tick_number is None else tick_number
+
+    def is_active(self, tick_number: int | None=None):
+        if tick_number is None:
+            tick_number = get_current_tick_number()
+        return tick_number - self._last_active_tick <= ACTIVE_PLAYER_TICKS
 
     def get_id(self):
         return self._id
@@ -106,18 +152,16 @@ class Player():
     def get_inventory(self):
         return self._inventory
 
-    def get_mailbox(self):
-        return self._mailbox
-
-    async def send_mail(self, mail: Mail, bot: BenjaminBowtieBot):
-        self._mailbox.append(mail)
+    def send_mail(self, guild_id_str: str, mail: Mail):
+        MAIL_STORE.send(guild_id_str, self._id, mail)
 
+        # The DM is queued and sent with anything else for this player at the
+        # next flush rather than immediately
         if self._settings.mail_notifications:
-            try:
-                user = await bot.fetch_user(int(self._id))
-                await user.send(f"You have new mail from {mail.get_sender_name()}!")
-            except Exception as e:
-                ERROR_LOGGER.log(logging.ERROR, f"Failed to send mail notification to user: {e}")
+            NOTIFICATIONS.notify(self._id, f"You have new mail from {mail.get_sender_name()}!")
+
+    def take_unmigrated_mail(self) -> List[Mail]:
+        return self.__dict__.pop("_unmigrated_mail", [])
 
     def get_stats(self):
         return self._stats
@@ -149,7 +193,9 @@ class Player():
     def __setstate__(self, state: dict):
         self._id = state.get("_id", "")
         self._inventory = state.get("_inventory", Inventory())
-        self._mailbox = state.get("_mailbox", [])
+        # Mail used to be kept here; it's moved to the mail store after loading
+        if len(state.get("_mailbox", [])) > 0:
+            self._unmigrated_mail: List[Mail] = state["_mailbox"]
         self._stats = state.get("_stats", Stats())
         self._expertise = state.get("_expertise", Expertise())
         self._equipment = state.get("_equipment", Equipment())
@@ -158,3 +204,8 @@ class Player():
         self._companions = state.get("_companions", PlayerCompanions())
         self._dungeon_run = state.get("_dungeon_run", PlayerDungeonRun())
         self._settings = state.get("_settings", Settings())
+
+        # Players saved before ticks were tracked were ticked every hour, so
+        # they're already up to date.
+        self._last_tick = state.get("_last_tick", get_current_tick_number())
+        self._last_active_tick = state.get("_last_active_tick", self._last_tick)
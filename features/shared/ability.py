@@ -7,10 +7,11 @@ from random import randint, random, choice
 
 from features.equipment import Equipment
 from features.expertise import Attribute, ExpertiseClass
-from features.shared.constants import BLEED_PERCENT_HP, DEX_DMG_SCALE, DEX_DODGE_SCALE, INT_DMG_SCALE, LCK_DMG_SCALE, LUCK_CRIT_DMG_BOOST, LUCK_CRIT_SCALE, POISONED_PERCENT_HP, STR_DMG_SCALE
+from features.shared.constants import BLEED_PERCENT_HP, DEX_DMG_SCALE, DEX_DODGE_SCALE, INT_DMG_SCALE, LCK_DMG_SCALE, LUCK_CRIT_DMG_BOOST, LUCK_CRIT_SCALE, POISONED_PERCENT_HP, RENDERED_TEXT_CACHE_SIZE, STR_DMG_SCALE
 from features.shared.effect import EffectType, ItemEffectCategory
 from features.shared.enums import ClassTag
 from features.shared.item import ItemKey, WeaponStats
+from features.shared.render_cache import RenderCache
 from features.shared.statuseffect import *
 
 from typing import Dict, List, Set, TYPE_CHECKING
@@ -29,6 +30,10 @@ class NegativeAbilityResult():
     dodged: bool
 
 
+# Keyed by the fields an ability's details show
+RENDERED_ABILITY_DETAILS = RenderCache(RENDERED_TEXT_CACHE_SIZE)
+
+
 class Ability():
     def __init__(self, icon: str, name: str, class_key: ExpertiseClass, description: str, flavor_text: str, mana_cost: int, cooldown: int, num_targets: int, level_requirement: int, target_own_group: bool, purchase_cost: int, scaling: List[Attribute], alt_currency: ItemKey | None=None):
         self._icon = icon
@@ -100,12 +105,14 @@ class Ability():
         self._cur_cooldown = 0
         self._turn_after_lapsed = True
 
-    def decrement_cd(self):
-        if self._turn_after_lapsed and self._cur_cooldown != -1:
-            self._cur_cooldown = max(0, self._cur_cooldown - 1)
-
+    def decrement_cd(self, num_turns: int=1):
+        # The first turn after using the ability only marks the cooldown as lapsed
         if not self._turn_after_lapsed:
             self._turn_after_lapsed = True
+            num_turns -= 1
+
+        if self._cur_cooldown != -1:
+            self._cur_cooldown = max(0, self._cur_cooldown - num_turns)
 
     @abstractmethod
     def use_ability(self, caster: Player | NPC, targets: List[Player | NPC]) -> str:
@@ -526,6 +533,22 @@ class Ability():
         return results
 
     def __str__(self):
+        cur_cooldown_str: str = ""
+        if self._cur_cooldown == -1:
+            cur_cooldown_str = "\n\n**Already used once this duel**"
+        if self._cur_cooldown > 0:
+            cur_cooldown_str = f"\n\n**CD Remaining: {self._cur_cooldown}**"
+
+        # Saved abilities keep the costs and text they were saved with rather
+        # than their class' current ones, so the details are keyed on
+        # everything they show; only the current cooldown is added after
+        details_key = (
+            self._icon, self._name, self._class_key, self._description, self._flavor_text, self._mana_cost,
+            self._cooldown, self._num_targets, self._level_requirement, tuple(self._scaling)
+        )
+        return RENDERED_ABILITY_DETAILS.get(details_key, self._render_details) + cur_cooldown_str
+
+    def _render_details(self):
         target_str: str = ""
         if self._num_targets == -2:
             target_str = "Targets All"
@@ -548,12 +571,6 @@ class Ability():
 
         flavor_text: str = f"*{self._flavor_text}*\n\n" if self._flavor_text != "" else ""
 
-        cur_cooldown_str: str = ""
-        if self._cur_cooldown == -1:
-            cur_cooldown_str = "\n\n**Already used once this duel**"
-        if self._cur_cooldown > 0:
-            cur_cooldown_str = f"\n\n**CD Remaining: {self._cur_cooldown}**"
-
         attr_short_strs = ", ".join(Attribute.get_short_strs(self._scaling))
         scaling_str = f"Scales with {attr_short_strs}\n\n" if len(self._scaling) > 0 else ""
 
@@ -564,7 +581,6 @@ class Ability():
             f"{self._description}\n\n"
             f"{flavor_text}"
             f"*Requires {self._class_key} Level {self._level_requirement}*"
-            f"{cur_cooldown_str}"
         )
 
     def __getstate__(self):
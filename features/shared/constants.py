@@ -57,3 +57,41 @@ COMPANION_BATTLE_POINTS = 6
 FOREST_ROOMS = 15
 OCEAN_ROOMS = 15
 UNDERWORLD_ROOMS = 15
+
+# -----------------------------------------------------------------------------
+# TICK CONSTANTS
+# -----------------------------------------------------------------------------
+
+# The hourly tick is spread over this many evenly spaced slots, so each player
+# is still ticked once an hour but not all at the top of the hour.
+TICK_SLOTS = 12
+# Players ticked before yielding back to the event loop
+TICK_BATCH_SIZE = 25
+# Players who haven't used the bot in this many ticks are skipped by the hourly
+# tick and caught up on all the ticks they missed the next time they're accessed
+ACTIVE_PLAYER_TICKS = 168
+
+# Queued DMs for events outside the tick are sent this often
+NOTIFICATION_FLUSH_SECONDS = 60
+
+# -----------------------------------------------------------------------------
+# DISPLAY CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Rendered item and companion descriptions kept around for views to reuse
+RENDERED_TEXT_CACHE_SIZE = 4096
+
+# -----------------------------------------------------------------------------
+# ITEM CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Combined effects of an item and the gems socketed into it, by item and gems
+SOCKETED_ITEM_EFFECTS_CACHE_SIZE = 4096
+
+# -----------------------------------------------------------------------------
+# MAIL CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Opened mail is kept this long before it's compacted away, and never before
+# a database save that includes whatever it was claimed into
+MAIL_RETENTION_SECONDS = 7 * 24 * 60 * 60
@@ -8,7 +8,7 @@ from features.shared.statuseffect import StatusEffectKey
 from types import MappingProxyType
 from enum import StrEnum
 
-from typing import List, TYPE_CHECKING
+from typing import Dict, FrozenSet, List, Set, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from features.shared.item import Item
     from features.npcs.npc import NPC
@@ -176,6 +176,42 @@ EFFECT_PRIORITY: MappingProxyType[EffectType, int] = MappingProxyType({
     EffectType.GrantAbility: 46,
 })
 
+def get_effect_priority(effect: Effect):
+    return EFFECT_PRIORITY[effect.effect_type]
+
+# -----------------------------------------------------------------------------
+# CONDITIONS
+# -----------------------------------------------------------------------------
+
+ITEM_CONDITIONS: FrozenSet[ConditionType] = frozenset({
+    ConditionType.IsItemInHand,
+    ConditionType.IsItemArmor
+})
+
+HEALTH_CONDITIONS: FrozenSet[ConditionType] = frozenset({
+    ConditionType.IsBelowPercentHealth,
+    ConditionType.IsAbovePercentHealth,
+    ConditionType.IsFullHealth
+})
+
+# Item class tags always come from the catalog, so which item conditions an
+# item meets only has to be worked out once per item key
+ITEM_CONDITIONS_MET: Dict[str, FrozenSet[ConditionType]] = {}
+
+def get_item_conditions_met(item: Item) -> FrozenSet[ConditionType]:
+    conditions_met = ITEM_CONDITIONS_MET.get(item.get_key())
+    if conditions_met is None:
+        class_tags = item.get_class_tags()
+        is_in_hand = ClassTag.Equipment.MainHand in class_tags or ClassTag.Equipment.OffHand in class_tags
+        is_armor = ClassTag.Equipment.Equipment in class_tags and not is_in_hand
+
+        conditions_met = frozenset(
+            ([ConditionType.IsItemInHand] if is_in_hand else []) +
+            ([ConditionType.IsItemArmor] if is_armor else [])
+        )
+        ITEM_CONDITIONS_MET[item.get_key()] = conditions_met
+    return conditions_met
+
 # -----------------------------------------------------------------------------
 # EFFECT CLASS
 # -----------------------------------------------------------------------------
@@ -191,6 +227,22 @@ class Effect():
         self.summon = summon
         self.granted_ability = granted_ability
 
+        self._compile_conditions()
+
+    def _compile_conditions(self):
+        # Conditions about the item are only ever true or false for a given
+        # item, so they're checked against the set that item meets and only the
+        # health checks are evaluated on every call. Not saved; rebuilt on load.
+        item_conditions: Set[ConditionType] = set()
+        health_conditions: List[Tuple[ConditionType, int | float]] = []
+        for i, condition in enumerate(self.conditions):
+            if condition in ITEM_CONDITIONS:
+                item_conditions.add(condition)
+            elif condition in HEALTH_CONDITIONS:
+                health_conditions.append((condition, self.condition_values[i] if i < len(self.condition_values) else 0))
+        self._item_conditions: FrozenSet[ConditionType] = frozenset(item_conditions)
+        self._health_conditions: Tuple[Tuple[ConditionType, int | float], ...] = tuple(health_conditions)
+
     @staticmethod
     def load_from_state(effect_data: dict):
         return Effect(
@@ -205,28 +257,24 @@ class Effect():
         )
 
     def meets_conditions(self, entity: Player | NPC, item: Item):
-        conditions_met = True
-        for i, condition in enumerate(self.conditions):
+        if len(self._item_conditions) > 0 and not self._item_conditions <= get_item_conditions_met(item):
+            return False
+
+        if len(self._health_conditions) == 0:
+            return True
+
+        expertise = entity.get_expertise()
+        for condition, value in self._health_conditions:
             if condition == ConditionType.IsAbovePercentHealth:
-                conditions_met &= entity.get_expertise().hp / entity.get_expertise().max_hp > self.condition_values[i]
-            if condition == ConditionType.IsBelowPercentHealth:
-                conditions_met &= entity.get_expertise().hp / entity.get_expertise().max_hp < self.condition_values[i]
-            if condition == ConditionType.IsFullHealth:
-                conditions_met &= entity.get_expertise().hp == entity.get_expertise().max_hp
-            if condition == ConditionType.IsItemArmor:
-                class_tags = item.get_class_tags()
-                conditions_met &= (
-                    ClassTag.Equipment.Equipment in class_tags and 
-                    not ClassTag.Equipment.MainHand in class_tags and
-                    not ClassTag.Equipment.OffHand in class_tags
-                )
-            if condition == ConditionType.IsItemInHand:
-                class_tags = item.get_class_tags()
-                conditions_met &= (
-                    ClassTag.Equipment.MainHand in class_tags or
-                    ClassTag.Equipment.OffHand in class_tags
-                )
-        return conditions_met
+                if not expertise.hp / expertise.max_hp > value:
+                    return False
+            elif condition == ConditionType.IsBelowPercentHealth:
+                if not expertise.hp / expertise.max_hp < value:
+                    return False
+            elif condition == ConditionType.IsFullHealth:
+                if expertise.hp != expertise.max_hp:
+                    return False
+        return True
 
     def get_descriptive_name(self) -> str:
         match self.effect_type:
@@ -703,7 +751,7 @@ class Effect():
         return display_string
 
     def __getstate__(self):
-        return self.__dict__
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
 
     def __setstate__(self, state: dict):
         self.effect_type = state.get("effect_type", EffectType.Unknown)
@@ -715,6 +763,8 @@ class Effect():
         self.summon = state.get("summon", None)
         self.granted_ability = state.get("granted_ability", None)
 
+        self._compile_conditions()
+
 # -----------------------------------------------------------------------------
 # ITEM EFFECTS CLASS
 # -----------------------------------------------------------------------------
@@ -733,37 +783,65 @@ class ItemEffects():
         self.on_attacked: List[Effect] = on_attacked # On being attacked (not dodged)
         self.on_ability_used_against: List[Effect] = on_ability_used_against
 
+        self._reset_caches()
+
+    def _reset_caches(self):
+        # Everything below is derived from the lists above, built the first time
+        # it's needed and never saved. Anything that changes the lists after
+        # they've been read needs to go through add_effect_in_category.
+        self._sorted_categories: Dict[ItemEffectCategory, List[Effect]] = {}
+        self._permanent_by_type: Dict[EffectType, List[Effect]] | None = None
+        self._permanent_totals: Dict[EffectType, float] | None = None
+        self._effect_types: Set[EffectType] | None = None
+
+    def _get_permanent_by_type(self):
+        if self._permanent_by_type is None:
+            permanent_by_type: Dict[EffectType, List[Effect]] = {}
+            for effect in self.permanent:
+                permanent_by_type.setdefault(effect.effect_type, []).append(effect)
+            self._permanent_by_type = permanent_by_type
+        return self._permanent_by_type
+
+    def get_permanent_effects_of_type(self, effect_type: EffectType) -> List[Effect]:
+        return self._get_permanent_by_type().get(effect_type, [])
+
+    def get_permanent_effect_total(self, effect_type: EffectType) -> float:
+        # Doesn't check conditions, so this is for effects that have already
+        # been filtered, like the result of get_combined_req_met_effects
+        if self._permanent_totals is None:
+            self._permanent_totals = {
+                permanent_effect_type: sum(effect.effect_value for effect in effects)
+                for permanent_effect_type, effects in self._get_permanent_by_type().items()
+            }
+        return self._permanent_totals.get(effect_type, 0)
+
     def get_permanent_attribute_mods(self) -> Attributes:
         attr_mods = Attributes(0, 0, 0, 0, 0, 0)
-        for effect in self.permanent:
-            if effect.effect_type == EffectType.ConMod:
-                attr_mods.constitution += int(effect.effect_value)
-            if effect.effect_type == EffectType.StrMod:
-                attr_mods.strength += int(effect.effect_value)
-            if effect.effect_type == EffectType.DexMod:
-                attr_mods.dexterity += int(effect.effect_value)
-            if effect.effect_type == EffectType.IntMod:
-                attr_mods.intelligence += int(effect.effect_value)
-            if effect.effect_type == EffectType.LckMod:
-                attr_mods.luck += int(effect.effect_value)
-            if effect.effect_type == EffectType.MemMod:
-                attr_mods.memory += int(effect.effect_value)
+        attr_mods.constitution += sum(int(effect.effect_value) for effect in self.get_permanent_effects_of_type(EffectType.ConMod))
+        attr_mods.strength += sum(int(effect.effect_value) for effect in self.get_permanent_effects_of_type(EffectType.StrMod))
+        attr_mods.dexterity += sum(int(effect.effect_value) for effect in self.get_permanent_effects_of_type(EffectType.DexMod))
+        attr_mods.intelligence += sum(int(effect.effect_value) for effect in self.get_permanent_effects_of_type(EffectType.IntMod))
+        attr_mods.luck += sum(int(effect.effect_value) for effect in self.get_permanent_effects_of_type(EffectType.LckMod))
+        attr_mods.memory += sum(int(effect.effect_value) for effect in self.get_permanent_effects_of_type(EffectType.MemMod))
         return attr_mods
 
     def has_item_effect(self, effect_type: EffectType):
-        all_effects: List[List[Effect]] = [
-            self.permanent,
-            self.on_turn_start,
-            self.on_turn_end,
-            self.on_damaged,
-            self.on_successful_ability_used,
-            self.on_successful_attack,
-            self.on_attacked,
-            self.on_ability_used_against
-        ]
-        return any(any(effect.effect_type == effect_type for effect in effect_group) for effect_group in all_effects)        
+        if self._effect_types is None:
+            all_effects: List[List[Effect]] = [
+                self.permanent,
+                self.on_turn_start,
+                self.on_turn_end,
+                self.on_damaged,
+                self.on_successful_ability_used,
+                self.on_successful_attack,
+                self.on_attacked,
+                self.on_ability_used_against
+            ]
+            self._effect_types = {effect.effect_type for effect_group in all_effects for effect in effect_group}
+        return effect_type in self._effect_types
 
     def add_effect_in_category(self, effect: Effect, category: ItemEffectCategory):
+        self._reset_caches()
         if category == ItemEffectCategory.Permanent:
             self.permanent.append(effect)
         elif category == ItemEffectCategory.OnTurnStart:
@@ -800,7 +878,14 @@ class ItemEffects():
             return self.on_ability_used_against
 
     def sort_by_priority(self, effects: List[Effect]):
-        return sorted(effects, key=lambda effect: EFFECT_PRIORITY[effect.effect_type])
+        return sorted(effects, key=get_effect_priority)
+
+    def get_sorted_effects_by_category(self, category: ItemEffectCategory) -> List[Effect]:
+        sorted_effects = self._sorted_categories.get(category)
+        if sorted_effects is None:
+            sorted_effects = self.sort_by_priority(self.get_effects_by_category(category) or [])
+            self._sorted_categories[category] = sorted_effects
+        return sorted_effects
 
     def get_socket_str(self, condition_type: ConditionType):
         def filter_by_condition(effect_lst: List[Effect], ct: ConditionType):
@@ -835,16 +920,27 @@ class ItemEffects():
         return display_string
 
     def __add__(self, other: ItemEffects):
-        return ItemEffects(
-            self.sort_by_priority(self.permanent + other.permanent),
-            self.sort_by_priority(self.on_turn_start + other.on_turn_start),
-            self.sort_by_priority(self.on_turn_end + other.on_turn_end),
-            self.sort_by_priority(self.on_damaged + other.on_damaged),
-            self.sort_by_priority(self.on_successful_ability_used + other.on_successful_ability_used),
-            self.sort_by_priority(self.on_successful_attack + other.on_successful_attack),
-            self.sort_by_priority(self.on_attacked + other.on_attacked),
-            self.sort_by_priority(self.on_ability_used_against + other.on_ability_used_against)
+        # Both sides are already sorted (or sort once and keep it), so each
+        # category is two sorted runs back to back, which sorted() recognizes
+        # and merges in a single linear pass. Folding a whole set of equipment
+        # together never re-sorts anything, and ties keep self's effects first
+        # the same as sorting the unsorted concatenation did.
+        def merge(category: ItemEffectCategory):
+            return self.sort_by_priority(self.get_sorted_effects_by_category(category) + other.get_sorted_effects_by_category(category))
+
+        result = ItemEffects(
+            merge(ItemEffectCategory.Permanent),
+            merge(ItemEffectCategory.OnTurnStart),
+            merge(ItemEffectCategory.OnTurnEnd),
+            merge(ItemEffectCategory.OnDamaged),
+            merge(ItemEffectCategory.OnSuccessfulAbilityUsed),
+            merge(ItemEffectCategory.OnSuccessfulAttack),
+            merge(ItemEffectCategory.OnAttacked),
+            merge(ItemEffectCategory.OnAbilityUsedAgainst)
         )
+        for category in ItemEffectCategory:
+            result._sorted_categories[category] = result.get_effects_by_category(category) or []
+        return result
 
     def __str__(self):
         display_string = ""
@@ -885,15 +981,15 @@ class ItemEffects():
         return display_string[:-2]
 
     def __len__(self):
-        return len(
-            self.permanent +
-            self.on_turn_start +
-            self.on_turn_end +
-            self.on_damaged +
-            self.on_successful_ability_used +
-            self.on_successful_attack +
-            self.on_attacked +
-            self.on_ability_used_against
+        return (
+            len(self.permanent) +
+            len(self.on_turn_start) +
+            len(self.on_turn_end) +
+            len(self.on_damaged) +
+            len(self.on_successful_ability_used) +
+            len(self.on_successful_attack) +
+            len(self.on_attacked) +
+            len(self.on_ability_used_against)
         )
 
     def load_effect_from_state(self, data):
@@ -902,9 +998,11 @@ class ItemEffects():
         return Effect.load_from_state(data)
 
     def __getstate__(self):
-        return self.__dict__
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
 
     def __setstate__(self, state: dict):
+        self._reset_caches()
+
         self.permanent = [self.load_effect_from_state(data) for data in state.get("permanent", [])]
         self.on_turn_start = [self.load_effect_from_state(data) for data in state.get("on_turn_start", [])]
         self.on_turn_end = [self.load_effect_from_state(data) for data in state.get("on_turn_end", [])]
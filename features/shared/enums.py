@@ -3,6 +3,8 @@ from __future__ import annotations
 from aenum import Enum, skip
 from enum import StrEnum
 
+from typing import Dict, Iterable
+
 # -----------------------------------------------------------------------------
 # ITEM ENUMS
 # -----------------------------------------------------------------------------
@@ -239,3 +241,40 @@ class RoomType(StrEnum):
 class Summons(StrEnum):
     Waveform = "Waveform"
     CrabServant = "CrabServant"
+
+# -----------------------------------------------------------------------------
+# TAG MASKS
+# -----------------------------------------------------------------------------
+
+# Class and state tags share one bit space so an item's tags can be held as a
+# single int and filtered with one &. Tags get a bit the first time they're
+# seen, which also covers any that have since been removed from the enums but
+# are still in saved data.
+TAG_BITS: Dict[str, int] = {}
+
+def get_tag_bit(tag: ClassTag | StateTag | str) -> int:
+    bit = TAG_BITS.get(tag)
+    if bit is None:
+        bit = 1 << len(TAG_BITS)
+        TAG_BITS[tag] = bit
+    return bit
+
+def get_tag_mask(tags: Iterable[ClassTag | StateTag | str]) -> int:
+    mask = 0
+    for tag in tags:
+        mask |= get_tag_bit(tag)
+    return mask
+
+# Every class tag by its name as a player would type it (lowercase, with
+# spaces or underscores), each given its bit up front so looking one up never
+# adds to TAG_BITS
+CLASS_TAGS_BY_NAME: Dict[str, ClassTag] = {
+    tag.lower(): tag
+    for tag_class in vars(ClassTag).values() if isinstance(tag_class, type) and issubclass(tag_class, StrEnum)
+    for tag in tag_class
+}
+for class_tag in CLASS_TAGS_BY_NAME.values():
+    get_tag_bit(class_tag)
+
+def find_class_tag(name: str) -> ClassTag | None:
+    return CLASS_TAGS_BY_NAME.get("_".join(name.replace("_", " ").lower().split()))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import discord
+import time
+
+from contextlib import asynccontextmanager
+from features.shared.metrics import METRICS
+
+from typing import Any, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+# -----------------------------------------------------------------------------
+# GUILD LOCKS
+# -----------------------------------------------------------------------------
+
+# Every guild's players, stories and NPCs are only ever changed while holding
+# that guild's lock: game commands and view callbacks take it for as long as
+# they run, and the tick takes it for each player. Code on the event loop that
+# doesn't await was already safe from itself, but with the lock held a guild's
+# data can also be handed to another thread (for a save or anything else
+# expensive) without something on the loop changing it underneath.
+#
+# The lock is reentrant within a task, so a callback that already holds it can
+# still call something that takes it again.
+
+class GuildLocks():
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._owners: Dict[str, asyncio.Task | None] = {}
+
+    def _get_lock(self, guild_id_str: str):
+        lock = self._locks.get(guild_id_str)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[guild_id_str] = lock
+        return lock
+
+    async def acquire(self, guild_id: int | str | None):
+        # Returns whether this took the lock, which is when it should later be
+        # released; it doesn't if there's no guild or the task already holds it
+        if guild_id is None:
+            return False
+
+        guild_id_str = str(guild_id)
+        task = asyncio.current_task()
+        if task is not None and self._owners.get(guild_id_str) is task:
+            return False
+
+        lock = self._get_lock(guild_id_str)
+        # Only waits are timed; taking a free lock is most of what the tick does
+        start_time = time.perf_counter() if lock.locked() else None
+        await lock.acquire()
+        if start_time is not None:
+            METRICS.observe("bot_guild_lock_wait_seconds", time.perf_counter() - start_time)
+        self._owners[guild_id_str] = task
+        return True
+
+    def release(self, guild_id: int | str):
+        guild_id_str = str(guild_id)
+        self._owners.pop(guild_id_str, None)
+        self._get_lock(guild_id_str).release()
+
+    @asynccontextmanager
+    async def hold(self, guild_id: int | str | None):
+        acquired = await self.acquire(guild_id)
+        try:
+            yield
+        finally:
+            if acquired:
+                assert guild_id is not None
+                self.release(guild_id)
+
+    async def run_in_executor(self, guild_id: int | str, func: Callable[..., T], *args: Any) -> T:
+        # Runs on the default thread pool while holding the guild's lock, so
+        # func can read or change that guild's data and nothing else will
+        async with self.hold(guild_id):
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def snapshot(self, guild_id: int | str, data: T) -> T:
+        # A copy that's safe to read at leisure, from any thread, after the
+        # lock is released
+        async with self.hold(guild_id):
+            return copy.deepcopy(data)
+
+# -----------------------------------------------------------------------------
+# DISCORD UI INSTRUMENTATION
+# -----------------------------------------------------------------------------
+
+# Like the metrics and profiler instrumentation, this hooks where discord.py
+# runs component and modal callbacks so every view takes its guild's lock
+# without having to touch each of them. Modals have their own _scheduled_task.
+def instrument_view_locking(locks: GuildLocks):
+    original_scheduled_task = discord.ui.View._scheduled_task
+    if not getattr(original_scheduled_task, "_is_locked", False):
+        async def scheduled_task(view: discord.ui.View, item: discord.ui.Item, interaction: discord.Interaction):
+            async with locks.hold(interaction.guild_id):
+                return await original_scheduled_task(view, item, interaction)
+
+        setattr(scheduled_task, "_is_locked", True)
+        discord.ui.View._scheduled_task = scheduled_task # type: ignore
+
+    original_modal_scheduled_task = discord.ui.Modal._scheduled_task
+    if not getattr(original_modal_scheduled_task, "_is_locked", False):
+        async def modal_scheduled_task(modal: discord.ui.Modal, interaction: discord.Interaction, *args):
+            async with locks.hold(interaction.guild_id):
+                return await original_modal_scheduled_task(modal, interaction, *args)
+
+        setattr(modal_scheduled_task, "_is_locked", True)
+        discord.ui.Modal._scheduled_task = modal_scheduled_task # type: ignore
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+GUILD_LOCKS = GuildLocks()
+
+METRICS.describe("bot_guild_lock_wait_seconds", "How long commands, callbacks, ticks and saves waited for their guild's lock when another held it")
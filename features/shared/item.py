@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 
 from random import randint
 from enum import StrEnum
 
 from features.shared.attributes import Attributes
-from features.shared.constants import WEAPON_OVERLEVELED_DEBUFF
+from features.shared.constants import RENDERED_TEXT_CACHE_SIZE, SOCKETED_ITEM_EFFECTS_CACHE_SIZE, WEAPON_OVERLEVELED_DEBUFF
 from features.shared.effect import ConditionType, EffectType, ItemEffects
-from features.shared.enums import ClassTag, StateTag
+from features.shared.enums import ClassTag, StateTag, get_tag_bit, get_tag_mask
+from features.shared.render_cache import RenderCache
 from types import MappingProxyType
 
-from typing import List
+from typing import Dict, List, Tuple
 
 # -----------------------------------------------------------------------------
 # ENUMS
@@ -3631,6 +3634,7 @@ class Item():
         self._description: str = description
         self._flavor_text: str = flavor_text
         self._class_tags: List[ClassTag] = class_tags
+        self._class_tag_mask: int = get_tag_mask(class_tags)
         self._state_tags: List[StateTag] = [] if state_tags is None else state_tags
         self._count: int = count
         self._level_requirement: int = level_requirement
@@ -3788,9 +3792,20 @@ class Item():
     def get_class_tags(self) -> List[ClassTag]:
         return self._class_tags
 
+    def get_class_tag_mask(self) -> int:
+        return self._class_tag_mask
+
     def get_state_tags(self) -> List[StateTag]:
         return self._state_tags
 
+    def get_state_tag_mask(self) -> int:
+        # State tags can be changed in place through get_state_tags, so this
+        # isn't stored, but there's rarely more than one of them
+        return get_tag_mask(self._state_tags)
+
+    def has_any_tag(self, tag_mask: int) -> bool:
+        return (self._class_tag_mask | self.get_state_tag_mask()) & tag_mask != 0
+
     def set_state_tags(self, new_tags: List[StateTag]) -> None:
         self._state_tags = new_tags
 
@@ -3801,22 +3816,12 @@ class Item():
         return self._level_requirement
 
     def get_item_effects(self) -> ItemEffects:
-        # Start with this item's base effects
-        combined_effects = self._item_effects if self._item_effects is not None else ItemEffects([], [], [], [], [], [], [], [])
-
-        # Add in everything from items that are altering it
-        for item_key in self._altering_item_keys:
-            if item_key != "":
-                item_effects_data = LOADED_ITEMS.get_item_state(item_key).get("item_effects")
-                item_effects = None
-                if item_effects_data is not None:
-                    item_effects = ItemEffects([], [], [], [], [], [], [], [])
-                    item_effects.__setstate__(item_effects_data)
-                
-                if item_effects is not None:
-                    combined_effects += item_effects
-
-        return combined_effects
+        if all(item_key == "" for item_key in self._altering_item_keys):
+            return self._item_effects if self._item_effects is not None else ItemEffects([], [], [], [], [], [], [], [])
+
+        # Base effects always come from the catalog, so the combination only
+        # depends on the keys and is shared by every item socketed the same way
+        return get_socketed_item_effects(self._key, tuple(self._altering_item_keys))
 
     def get_altering_item_keys(self) -> List[ItemKey]:
         return self._altering_item_keys
@@ -3846,7 +3851,13 @@ class Item():
         return slot
 
     def __str__(self):
-        display_string = f"**{self.get_full_name_and_count()}**\n*{self._rarity} Item*" + (" / *Unique*" if ClassTag.Misc.IsUnique in self._class_tags else "")
+        # Only the count changes between items with the same key, state tags
+        # and sockets, so everything after the name is rendered once
+        details_key = (self._key, tuple(self._state_tags), tuple(self._altering_item_keys))
+        return f"**{self.get_full_name_and_count()}**" + RENDERED_ITEM_DETAILS.get(details_key, self._render_details)
+
+    def _render_details(self):
+        display_string = f"\n*{self._rarity} Item*" + (" / *Unique*" if ClassTag.Misc.IsUnique in self._class_tags else "")
         
         has_any_stats: bool = False
 
@@ -3932,16 +3943,18 @@ class Item():
         if not isinstance(obj, Item):
             return False
         
-        if (ClassTag.Misc.IsUnique in self.get_state_tags() or
-            ClassTag.Misc.IsUnique in obj.get_state_tags()):
+        state_tag_mask = self.get_state_tag_mask()
+        other_state_tag_mask = obj.get_state_tag_mask()
+        if (state_tag_mask | other_state_tag_mask) & get_tag_bit(ClassTag.Misc.IsUnique) != 0:
             return False
 
         return (self._key == obj.get_key() and 
-                self._state_tags == obj.get_state_tags() and
+                state_tag_mask == other_state_tag_mask and
                 self._altering_item_keys == obj.get_altering_item_keys())
 
     def __getstate__(self):
-        return self.__dict__
+        # The mask is rebuilt from the class tags on load
+        return {key: value for key, value in self.__dict__.items() if key != "_class_tag_mask"}
 
     def __setstate__(self, state: dict):
         # TODO: This handles the case where I've deleted an item JSON or the key
@@ -3965,6 +3978,7 @@ class Item():
         self._flavor_text = base_data.get("flavor_text", "")
         self._level_requirement = base_data.get("level_requirement", 0)
         self._class_tags = base_data.get("class_tags", [])
+        self._class_tag_mask = get_tag_mask(self._class_tags)
 
         armor_data = base_data.get("armor_stats")
         if armor_data is not None:
@@ -4021,6 +4035,24 @@ class Item():
         else:
             self._altering_item_keys = state.get("_altering_item_keys", base_data_sockets)
 
+# Generated items (see item_generator.py) are kept together in one catalog
+# keyed by item key rather than a file each, and don't need an ItemKey
+GENERATED_ITEM_CATALOG_FILE = "./features/items/generated_catalog.json"
+
+def load_item_states(catalog_path: str=GENERATED_ITEM_CATALOG_FILE):
+    states: Dict[ItemKey | str, dict] = {}
+    for item_key in ItemKey:
+        with open(f"./features/{item_key.value}.json", "r") as file:
+            states[item_key.value] = json.load(file)
+
+    if os.path.isfile(catalog_path):
+        with open(catalog_path, "r") as file:
+            for key, state in json.load(file).items():
+                # The generator never reuses a key, but if an item has since
+                # been added by hand with the same one, it wins
+                states.setdefault(key, state)
+    return MappingProxyType(states)
+
 # I'm doing it this way because having a dict[ItemKey, Item] would
 # mean that using the items in the dict would all point to the same
 # reference of the object. That seems extremely risky, even if I copy
@@ -4031,21 +4063,51 @@ class Item():
 # with multiple potentially happening every second, that could yield
 # a lot of errors due to the file being locked.
 class LoadedItems():
-    _states: MappingProxyType[ItemKey, dict] = MappingProxyType({
-        item_key.value: json.load(open(f"./features/{item_key.value}.json", "r")) for item_key in ItemKey
-    })
+    _states: MappingProxyType[ItemKey | str, dict] = load_item_states()
 
     def get_all_keys(self):
         return self._states.keys()
 
+    def __init__(self):
+        # Parsed on first use and shared by every item socketed with that key,
+        # so these must never be changed
+        self._item_effects: Dict[ItemKey, ItemEffects | None] = {}
+
     def get_item_state(self, key: ItemKey):
         return self._states[key]
 
+    def get_item_effects(self, key: ItemKey):
+        if key not in self._item_effects:
+            item_effects_data = self._states[key].get("item_effects")
+            item_effects = None
+            if item_effects_data is not None:
+                item_effects = ItemEffects([], [], [], [], [], [], [], [])
+                item_effects.__setstate__(item_effects_data)
+            self._item_effects[key] = item_effects
+        return self._item_effects[key]
+
     def get_new_item(self, key: ItemKey):
         return Item.load_from_state(self._states[key])
 
+# The result is shared, so callers must never change it
+@functools.lru_cache(maxsize=SOCKETED_ITEM_EFFECTS_CACHE_SIZE)
+def get_socketed_item_effects(key: ItemKey, altering_item_keys: Tuple[ItemKey, ...]) -> ItemEffects:
+    # Start with this item's base effects
+    combined_effects = LOADED_ITEMS.get_item_effects(key) or ItemEffects([], [], [], [], [], [], [], [])
+
+    # Add in everything from items that are altering it
+    for item_key in altering_item_keys:
+        if item_key != "":
+            item_effects = LOADED_ITEMS.get_item_effects(item_key)
+            if item_effects is not None:
+                combined_effects += item_effects
+
+    return combined_effects
+
 # -----------------------------------------------------------------------------
 # GLOBALS
 # -----------------------------------------------------------------------------
 
 LOADED_ITEMS = LoadedItems()
+
+RENDERED_ITEM_DETAILS = RenderCache(RENDERED_TEXT_CACHE_SIZE)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import importlib
+
+from typing import Dict, List
+
+# -----------------------------------------------------------------------------
+# LAZY CLASS REGISTRY
+# -----------------------------------------------------------------------------
+
+# Dungeon rooms, and the NPCs and abilities they pull in, make up a large part
+# of the import time before the bot can connect, but any one of them is only
+# needed once a party actually walks into that room. Registering them by name
+# and importing on first use moves that cost out of startup.
+
+class LazyClassRegistry():
+    def __init__(self, class_modules: Dict[str, str]):
+        # Class name -> module it's defined in
+        self._class_modules = class_modules
+        self._loaded: Dict[str, type] = {}
+
+    def get(self, class_name: str) -> type:
+        loaded = self._loaded.get(class_name)
+        if loaded is None:
+            module = importlib.import_module(self._class_modules[class_name])
+            loaded = getattr(module, class_name)
+            self._loaded[class_name] = loaded
+        return loaded
+
+    def get_names(self) -> List[str]:
+        return list(self._class_modules.keys())
+
+    def load_all(self):
+        for class_name in self._class_modules.keys():
+            self.get(class_name)
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import numpy
+import random
+
+from features.shared.enums import ClassTag
+from features.shared.item import LOADED_ITEMS, ItemKey, Rarity
+
+from typing import Callable, Dict, Hashable, List, Tuple
+
+# -----------------------------------------------------------------------------
+# LOOT TABLES
+# -----------------------------------------------------------------------------
+
+# Luck is capped at 100 everywhere drops are rolled, so the alias tables for a
+# loot table can be built once per luck value and reused for every roll.
+MAX_LOOT_LUCK = 100
+
+# An entry's weight is linear in luck, which is the shape all of the hand-written
+# weights already had (e.g. 0.2 + 6 * (LUCK_MOD * luck) / 16 for common fish).
+# The outcome is either an ItemKey, a nested LootTable that's rolled with the same
+# luck, or any other label (like a fishing tier) that the caller handles itself.
+class LootEntry():
+    def __init__(self, outcome: ItemKey | LootTable | Hashable | None, weight: float, luck_weight: float=0, value: float | None=None, label: Hashable | None=None):
+        self.outcome = outcome
+        self.weight = weight
+        self.luck_weight = luck_weight
+        # Lets callers tell which entry was rolled when the outcome is a nested table
+        self.label = label
+        # Overrides the value used in the expected value report; by default ItemKeys
+        # are worth their catalog value, nested tables their own expected value and
+        # anything else is worth nothing.
+        self.value = value
+
+    def get_weight(self, luck: int):
+        return max(0, self.weight + self.luck_weight * luck)
+
+
+class LootTable():
+    def __init__(self, entries: List[LootEntry]):
+        self._entries: List[LootEntry] = entries
+        self._alias_tables: Dict[int, Tuple[List[float], List[int]]] = {}
+
+    @staticmethod
+    def from_weights(outcomes: List[ItemKey | LootTable | Hashable | None], weights: List[float] | None=None):
+        if weights is None:
+            return LootTable([LootEntry(outcome, 1) for outcome in outcomes])
+        return LootTable([LootEntry(outcome, weight) for outcome, weight in zip(outcomes, weights)])
+
+    def _clamp_luck(self, luck: int):
+        return max(0, min(int(luck), MAX_LOOT_LUCK))
+
+    def _get_alias_table(self, luck: int):
+        alias_table = self._alias_tables.get(luck)
+        if alias_table is not None:
+            return alias_table
+
+        # Vose's alias method: each column holds at most two outcomes, so a roll
+        # is one uniform column pick and one biased coin flip regardless of size.
+        n: int = len(self._entries)
+        weights = [entry.get_weight(luck) for entry in self._entries]
+        total_weight = sum(weights)
+        if n == 0 or total_weight <= 0:
+            raise ValueError("Cannot roll a loot table without any positive weights")
+
+        scaled = [weight * n / total_weight for weight in weights]
+        prob: List[float] = [0 for _ in range(n)]
+        alias: List[int] = [i for i in range(n)]
+
+        small: List[int] = [i for i in range(n) if scaled[i] < 1]
+        large: List[int] = [i for i in range(n) if scaled[i] >= 1]
+        while len(small) > 0 and len(large) > 0:
+            less = small.pop()
+            more = large.pop()
+
+            prob[less] = scaled[less]
+            alias[less] = more
+
+            scaled[more] = (scaled[more] + scaled[less]) - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Anything left over is only off from 1 due to floating point error
+        for i in large + small:
+            prob[i] = 1
+
+        alias_table = (prob, alias)
+        self._alias_tables[luck] = alias_table
+        return alias_table
+
+    def get_entries(self):
+        return self._entries
+
+    def get_probabilities(self, luck: int=0):
+        weights = [entry.get_weight(self._clamp_luck(luck)) for entry in self._entries]
+        total_weight = sum(weights)
+        if total_weight <= 0:
+            return [0.0 for _ in weights]
+        return [weight / total_weight for weight in weights]
+
+    def roll_entry(self, luck: int=0) -> LootEntry:
+        prob, alias = self._get_alias_table(self._clamp_luck(luck))
+        column: int = random.randrange(len(prob))
+        if random.random() < prob[column]:
+            return self._entries[column]
+        return self._entries[alias[column]]
+
+    def roll(self, luck: int=0):
+        outcome = self.roll_entry(luck).outcome
+        while isinstance(outcome, LootTable):
+            outcome = outcome.roll_entry(luck).outcome
+        return outcome
+
+    def roll_many(self, k: int, luck: int=0):
+        return [self.roll(luck) for _ in range(k)]
+
+    def roll_item(self, luck: int=0):
+        # Items are only materialized for the outcome that was actually rolled
+        outcome = self.roll(luck)
+        if outcome is None or outcome not in LOADED_ITEMS.get_all_keys():
+            return None
+        return LOADED_ITEMS.get_new_item(outcome)
+
+    def _get_entry_moments(self, entry: LootEntry, lucks: numpy.ndarray, value_fn: Callable[[ItemKey | Hashable | None], float] | None):
+        if entry.value is not None:
+            return numpy.full(lucks.shape, float(entry.value)), numpy.full(lucks.shape, float(entry.value) ** 2)
+        if isinstance(entry.outcome, LootTable):
+            return entry.outcome.get_moments(lucks, value_fn)
+
+        value: float = 0
+        if value_fn is not None:
+            value = value_fn(entry.outcome)
+        elif entry.outcome is not None and entry.outcome in LOADED_ITEMS.get_all_keys():
+            value = LOADED_ITEMS.get_item_state(entry.outcome).get("value", 0)
+        return numpy.full(lucks.shape, float(value)), numpy.full(lucks.shape, float(value) ** 2)
+
+    def get_moments(self, lucks: numpy.ndarray, value_fn: Callable[[ItemKey | Hashable | None], float] | None=None):
+        lucks = numpy.clip(numpy.asarray(lucks, dtype=numpy.float64), 0, MAX_LOOT_LUCK)
+
+        base_weights = numpy.array([entry.weight for entry in self._entries], dtype=numpy.float64)
+        luck_weights = numpy.array([entry.luck_weight for entry in self._entries], dtype=numpy.float64)
+
+        # Rows are luck values and columns are entries, which lets a whole luck sweep
+        # come out of a single matrix expression.
+        weights = numpy.maximum(0, base_weights[None, :] + lucks[:, None] * luck_weights[None, :])
+        # A luck value where nothing has any weight can't be rolled, so it's
+        # treated as dropping nothing rather than dividing by zero
+        total_weights = weights.sum(axis=1, keepdims=True)
+        probs = numpy.divide(weights, total_weights, out=numpy.zeros(weights.shape), where=total_weights > 0)
+
+        first_moments = numpy.empty(weights.shape)
+        second_moments = numpy.empty(weights.shape)
+        for i, entry in enumerate(self._entries):
+            first_moments[:, i], second_moments[:, i] = self._get_entry_moments(entry, lucks, value_fn)
+
+        return (probs * first_moments).sum(axis=1), (probs * second_moments).sum(axis=1)
+
+    def get_expected_value_report(self, lucks: numpy.ndarray | List[int] | None=None, value_fn: Callable[[ItemKey | Hashable | None], float] | None=None):
+        # Returns (lucks, expected values, variances) for a single roll of this table,
+        # where the default sweep is every luck value a player can have.
+        lucks = numpy.arange(0, MAX_LOOT_LUCK + 1) if lucks is None else numpy.asarray(lucks)
+        first_moments, second_moments = self.get_moments(lucks, value_fn)
+        return lucks, first_moments, numpy.maximum(0, second_moments - first_moments ** 2)
+
+# -----------------------------------------------------------------------------
+# CATALOG TABLES
+# -----------------------------------------------------------------------------
+
+_treasure_loot_tables: Dict[Tuple, LootTable] = {}
+_uniform_loot_tables: Dict[Tuple, LootTable] = {}
+
+def get_uniform_loot_table(outcomes: List[ItemKey]):
+    cache_key = tuple(outcomes)
+    loot_table = _uniform_loot_tables.get(cache_key)
+    if loot_table is None:
+        loot_table = LootTable.from_weights(list(outcomes))
+        _uniform_loot_tables[cache_key] = loot_table
+    return loot_table
+
+# Treasure rooms used to load every item in the catalog each time one was
+# created just to filter them; this reads the raw states once per distinct room
+# configuration and caches the resulting table.
+def get_treasure_loot_table(prob_map: Dict[Rarity, float], valid_class_tags: List[str], min_level: int, max_level: int):
+    cache_key = (tuple(sorted(prob_map.items())), tuple(valid_class_tags), min_level, max_level)
+    loot_table = _treasure_loot_tables.get(cache_key)
+    if loot_table is not None:
+        return loot_table
+
+    entries: List[LootEntry] = []
+    for item_key in ItemKey:
+        state = LOADED_ITEMS.get_item_state(item_key)
+        class_tags = state.get("class_tags", [])
+        rarity = Rarity(state.get("rarity", Rarity.Unknown))
+        if any(tag in class_tags for tag in valid_class_tags):
+            if Rarity.Common < rarity < Rarity.Cursed:
+                if ClassTag.Equipment.Equipment in class_tags and not (min_level <= state.get("level_requirement", 0) <= max_level):
+                    continue
+                entries.append(LootEntry(item_key, prob_map[rarity]))
+
+    loot_table = LootTable(entries)
+    _treasure_loot_tables[cache_key] = loot_table
+    return loot_table
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+# Fishing tiers, where luck adjusts total bias by 0.5% per point:
+#   1  -> 54.5%, 20.1875%, 15.125%, 9.5938%, 0.5525%, 0.04125%
+#   10 -> 50%, 21.875%, 16.25%, 10.4375%, 1.115%, 0.3225%
+#   20 -> 45%, 23.75%, 17.5%, 11.375%, 1.74%, 0.635%
+#   50 -> 30%, 29.375%, 21.25%, 14.1875%, 3.615%, 1.5725%
+FISHING_LUCK_MOD = 0.005
+FISHING_LOOT_TABLE = LootTable([
+    LootEntry(LootTable.from_weights([ItemKey.TatteredBoot, ItemKey.ClumpOfLeaves, ItemKey.Conch, ItemKey.Stranglekelp]), 0.55, -FISHING_LUCK_MOD, label=0),
+    LootEntry(LootTable.from_weights([ItemKey.Minnow, ItemKey.Roughy, ItemKey.Shrimp]), 0.2, 6 * FISHING_LUCK_MOD / 16, label=1),
+    LootEntry(LootTable.from_weights([ItemKey.Oyster, ItemKey.Pufferfish]), 0.15, 4 * FISHING_LUCK_MOD / 16, label=2),
+    LootEntry(LootTable.from_weights([ItemKey.Squid, ItemKey.Crab, ItemKey.Lobster, ItemKey.Shark]), 0.095, 3 * FISHING_LUCK_MOD / 16, label=3),
+    LootEntry(LootTable.from_weights([ItemKey.AncientVase, ItemKey.MysteriousScroll]), 0.0049, 2 * FISHING_LUCK_MOD / 16, label=4),
+    LootEntry(LootTable.from_weights([ItemKey.FishMaybe]), 0.0001, 1 * FISHING_LUCK_MOD / 16, label=5)
+])
+
+# Gemstones from the wishing well once all the Sunless pieces have been given out,
+# with each quality's gemstones sharing its weight proportionally.
+_GEMSTONE_PROPORTIONS: List[Tuple[str, int]] = [
+    ("Agate", 2), ("Amethyst", 5), ("Bloodstone", 6), ("Diamond", 3),
+    ("Emerald", 7), ("Jade", 6), ("Lapis", 1), ("Malachite", 4),
+    ("Moonstone", 2), ("Opal", 2), ("Onyx", 2), ("Peridot", 8),
+    ("Quartz", 10), ("Ruby", 1), ("Sapphire", 1), ("Tanzanite", 2),
+    ("Topaz", 1), ("Turquoise", 6), ("Zircon", 5)
+]
+WISHING_WELL_GEMSTONE_LOOT_TABLE = LootTable(
+    [LootEntry(ItemKey[f"Cracked{name}"], 0.035 * proportion / 76) for name, proportion in _GEMSTONE_PROPORTIONS] +
+    [LootEntry(ItemKey[name], 0.01 * proportion / 76) for name, proportion in _GEMSTONE_PROPORTIONS] +
+    [LootEntry(ItemKey[f"Flawless{name}"], 0.005 * proportion / 76) for name, proportion in _GEMSTONE_PROPORTIONS]
+)
+
+# Wishing well results, where luck adjusts total bias by 0.1% per point:
+#   1  -> 99.4%, 0.33%, 0.2475%, 0.0225%
+#   10 -> 98.5%, 0.78%, 0.585%, 0.135%
+#   20 -> 97.5%, 1.28%, 0.96%, 0.26%
+#   50 -> 94.5%, 2.78%, 1.15%, 0.32%
+# The coin tossed in isn't included in the values, so subtract 1 from the EV.
+WISHING_WELL_LUCK_MOD = 0.001
+WISHING_WELL_LOOT_TABLE = LootTable([
+    LootEntry(None, 0.9950, -WISHING_WELL_LUCK_MOD, label=0),
+    LootEntry(None, 0.0028, 4 * WISHING_WELL_LUCK_MOD / 8, value=125, label=1),
+    LootEntry(WISHING_WELL_GEMSTONE_LOOT_TABLE, 0.0021, 3 * WISHING_WELL_LUCK_MOD / 8, label=2),
+    LootEntry(None, 0.0001, 1 * WISHING_WELL_LUCK_MOD / 8, label=3)
+])
+
+# Best tier companions have a 5% chance per tick to bring back one of their items,
+# which works out to roughly an item a day.
+COMPANION_FIND_PROB = 0.05
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import discord
+import functools
+import os
+import time
+
+from contextlib import contextmanager
+
+from typing import Callable, Dict, List, Tuple
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Upper bounds in seconds, following Prometheus' convention of cumulative
+# "le" buckets with an implicit +Inf at the end
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+)
+
+METRICS_FILE = "metrics.prom"
+METRICS_EXPORT_SECONDS = 60
+EVENT_LOOP_LAG_PROBE_SECONDS = 1
+
+# -----------------------------------------------------------------------------
+# HISTOGRAM
+# -----------------------------------------------------------------------------
+
+class Histogram():
+    def __init__(self, buckets: Tuple[float, ...]=LATENCY_BUCKETS):
+        self._buckets = buckets
+        # One more than the number of buckets for everything past the last one
+        self._counts: List[int] = [0] * (len(buckets) + 1)
+        self._count: int = 0
+        self._sum: float = 0
+        self._max: float = 0
+
+    def observe(self, value: float):
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._max = max(self._max, value)
+
+    def get_count(self):
+        return self._count
+
+    def get_sum(self):
+        return self._sum
+
+    def get_max(self):
+        return self._max
+
+    def get_cumulative_counts(self):
+        cumulative: List[Tuple[float, int]] = []
+        total = 0
+        for bucket, count in zip(self._buckets + (float("inf"),), self._counts):
+            total += count
+            cumulative.append((bucket, total))
+        return cumulative
+
+    # The upper bound of the bucket the percentile falls in, which is as
+    # precise as a bucketed histogram gets
+    def get_percentile(self, percentile: float):
+        if self._count == 0:
+            return 0
+        target = percentile * self._count
+        for bucket, cumulative_count in self.get_cumulative_counts():
+            if cumulative_count >= target:
+                return min(bucket, self._max)
+        return self._max
+
+# -----------------------------------------------------------------------------
+# METRICS REGISTRY
+# -----------------------------------------------------------------------------
+
+Labels = Tuple[Tuple[str, str], ...]
+
+class MetricsRegistry():
+    def __init__(self):
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._counters: Dict[str, Dict[Labels, int]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        self._help: Dict[str, str] = {}
+        # Added to every exported series, e.g. which shard a process is running
+        self._constant_labels: Labels = ()
+
+    def set_constant_labels(self, labels: Dict[str, str]):
+        self._constant_labels = self._get_labels(labels)
+
+    def _get_labels(self, labels: Dict[str, str] | None) -> Labels:
+        return tuple(sorted((labels or {}).items()))
+
+    def describe(self, name: str, help_text: str):
+        self._help[name] = help_text
+
+    def observe(self, name: str, value: float, labels: Dict[str, str] | None=None):
+        histograms = self._histograms.setdefault(name, {})
+        key = self._get_labels(labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = Histogram()
+            histograms[key] = histogram
+        histogram.observe(value)
+
+    def increment(self, name: str, amount: int=1, labels: Dict[str, str] | None=None):
+        counters = self._counters.setdefault(name, {})
+        key = self._get_labels(labels)
+        counters[key] = counters.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, labels: Dict[str, str] | None=None):
+        self._gauges.setdefault(name, {})[self._get_labels(labels)] = value
+
+    @contextmanager
+    def timer(self, name: str, labels: Dict[str, str] | None=None):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start_time, labels)
+
+    def timed(self, name: str, labels: Dict[str, str] | None=None):
+        # Decorator version of timer for both regular and async functions
+        def decorator(func: Callable):
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.timer(name, labels):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def get_histograms(self, name: str):
+        return self._histograms.get(name, {})
+
+    def get_gauges(self, name: str):
+        return self._gauges.get(name, {})
+
+    def get_histogram_names(self):
+        return list(self._histograms.keys())
+
+    def _format_labels(self, labels: Labels, extra: Tuple[Tuple[str, str], ...]=()):
+        all_labels = self._constant_labels + labels + extra
+        if len(all_labels) == 0:
+            return ""
+        return "{" + ",".join(f'{key}="{self._escape_label_value(value)}"' for key, value in all_labels) + "}"
+
+    def _escape_label_value(self, value: str):
+        # Prometheus label values escape backslashes, quotes and newlines
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def render_prometheus(self):
+        lines: List[str] = []
+
+        for name, histograms in sorted(self._histograms.items()):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(histograms.items()):
+                for bucket, cumulative_count in histogram.get_cumulative_counts():
+                    bucket_str = "+Inf" if bucket == float("inf") else repr(bucket)
+                    lines.append(f"{name}_bucket{self._format_labels(labels, (('le', bucket_str),))} {cumulative_count}")
+                lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.get_sum()}")
+                lines.append(f"{name}_count{self._format_labels(labels)} {histogram.get_count()}")
+
+        for name, counters in sorted(self._counters.items()):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in sorted(counters.items()):
+                lines.append(f"{name}{self._format_labels(labels)} {value}")
+
+        for name, gauges in sorted(self._gauges.items()):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in sorted(gauges.items()):
+                lines.append(f"{name}{self._format_labels(labels)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str=METRICS_FILE):
+        # Write then rename so a scraper never reads a half-written file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            file.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+# -----------------------------------------------------------------------------
+# DISCORD UI INSTRUMENTATION
+# -----------------------------------------------------------------------------
+
+# Every button, select and modal callback in the bot runs through
+# View._scheduled_task, so timing it there covers all of them without having
+# to touch each of the views.
+def instrument_view_callbacks(metrics: MetricsRegistry):
+    original_scheduled_task = discord.ui.View._scheduled_task
+    if not getattr(original_scheduled_task, "_is_instrumented", False):
+        async def scheduled_task(view: discord.ui.View, item: discord.ui.Item, interaction: discord.Interaction):
+            start_time = time.perf_counter()
+            try:
+                return await original_scheduled_task(view, item, interaction)
+            finally:
+                metrics.observe("bot_interaction_seconds", time.perf_counter() - start_time, {"view": type(view).__name__, "item": type(item).__name__})
+
+        setattr(scheduled_task, "_is_instrumented", True)
+        discord.ui.View._scheduled_task = scheduled_task # type: ignore
+
+    # Modals have their own _scheduled_task, so submits need hooking separately
+    original_modal_scheduled_task = discord.ui.Modal._scheduled_task
+    if not getattr(original_modal_scheduled_task, "_is_instrumented", False):
+        async def modal_scheduled_task(modal: discord.ui.Modal, interaction: discord.Interaction, *args):
+            start_time = time.perf_counter()
+            try:
+                return await original_modal_scheduled_task(modal, interaction, *args)
+            finally:
+                metrics.observe("bot_interaction_seconds", time.perf_counter() - start_time, {"view": type(modal).__name__, "item": "Submit"})
+
+        setattr(modal_scheduled_task, "_is_instrumented", True)
+        discord.ui.Modal._scheduled_task = modal_scheduled_task # type: ignore
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+METRICS = MetricsRegistry()
+
+METRICS.describe("bot_command_seconds", "Time to run a prefix command handler")
+METRICS.describe("bot_interaction_seconds", "Time to run a discord.ui component callback or modal submit")
+METRICS.describe("bot_tick_seconds", "Time to run one hourly tick slot")
+METRICS.describe("bot_save_database_seconds", "Time to serialize and write the database")
+METRICS.describe("bot_npc_turn_seconds", "Time for an NPC to pick and take its turn in a duel")
+METRICS.describe("bot_knucklebones_npc_move_seconds", "Time for a Knucklebones NPC to pick a move")
+METRICS.describe("bot_event_loop_lag_seconds", "How late a short sleep on the event loop wakes up")
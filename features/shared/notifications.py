@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import discord
+import logging
+import time
+
+from bot import ERROR_LOGGER
+from collections import OrderedDict, deque
+from features.shared.sharding import SHARD_CONFIG
+
+from typing import TYPE_CHECKING, Deque, Dict, List, Tuple
+if TYPE_CHECKING:
+    from bot import BenjaminBowtieBot
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+# How many DMs can be in flight at once
+MAX_CONCURRENT_SENDS = 5
+# Discord allows a global 50 requests per second per bot token, and each route
+# has its own limit on top of that. These are for the whole bot rather than
+# each process, since every shard process sends with the same token; each
+# process gets its share of them. Staying well under the global limit leaves
+# room for everything else the bot is doing.
+MAX_REQUESTS_PER_SECOND = 10
+MAX_ROUTE_REQUESTS_PER_SECOND = {
+    "fetch_user": 5,
+    "create_dm": 5,
+    "send_message": 10
+}
+# Users fetched over REST are kept around this long before being fetched again,
+# and only this many of them, dropping whoever was used least recently
+USER_CACHE_SECONDS = 60 * 60
+MAX_CACHED_USERS = 1000
+# Discord's limit on the length of a message
+MAX_DM_LENGTH = 2000
+# Users with DMs closed aren't retried until this much time has passed
+FORBIDDEN_RETRY_SECONDS = 24 * 60 * 60
+
+# -----------------------------------------------------------------------------
+# RATE LIMITER
+# -----------------------------------------------------------------------------
+
+# Allows at most max_per_second waits through in any one second window
+class RateLimiter():
+    def __init__(self, max_per_second: int):
+        self._max_per_second = max_per_second
+        self._times: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    def get_max_per_second(self):
+        return self._max_per_second
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            while len(self._times) > 0 and now - self._times[0] >= 1:
+                self._times.popleft()
+
+            if len(self._times) >= self._max_per_second:
+                await asyncio.sleep(1 - (now - self._times[0]))
+                self._times.popleft()
+
+            self._times.append(time.monotonic())
+
+# -----------------------------------------------------------------------------
+# NOTIFICATION DISPATCHER
+# -----------------------------------------------------------------------------
+
+# Rather than each event fetching the user and sending a DM immediately, events
+# are queued per user and flushed together, so a player who gets three pieces of
+# mail and a matured garden in one tick gets one DM instead of four.
+class NotificationDispatcher():
+    def __init__(self, share: float=1):
+        # User ID -> [(message, time queued)]
+        self._pending: Dict[int, List[Tuple[str, float]]] = {}
+        self._user_cache: OrderedDict[int, Tuple[discord.User, float]] = OrderedDict()
+        self._forbidden_users: Dict[int, float] = {}
+
+        # Every request waits on its route's limiter and then the global one.
+        # discord.py already waits out any 429s it gets, so these are to keep
+        # a large flush from running into them in the first place.
+        self._global_limiter = RateLimiter(max(1, int(MAX_REQUESTS_PER_SECOND * share)))
+        self._route_limiters: Dict[str, RateLimiter] = {
+            route: RateLimiter(max(1, int(max_per_second * share))) for route, max_per_second in MAX_ROUTE_REQUESTS_PER_SECOND.items()
+        }
+
+        self._total_sent: int = 0
+        self._total_failed: int = 0
+        self._last_flush_duration: float = 0
+        self._latencies: Deque[float] = deque(maxlen=1000)
+
+    def notify(self, user_id: int | str, message: str):
+        self._pending.setdefault(int(user_id), []).append((message, time.time()))
+
+    def get_queue_depth(self):
+        return sum(len(messages) for messages in self._pending.values())
+
+    def get_stats(self):
+        latencies = sorted(self._latencies)
+        return {
+            "queue_depth": self.get_queue_depth(),
+            "users_pending": len(self._pending),
+            "total_sent": self._total_sent,
+            "total_failed": self._total_failed,
+            "last_flush_duration": self._last_flush_duration,
+            "p50_latency": latencies[len(latencies) // 2] if len(latencies) > 0 else 0,
+            "max_latency": latencies[-1] if len(latencies) > 0 else 0
+        }
+
+    async def _wait_for_rate_limit(self, route: str):
+        await self._route_limiters[route].wait()
+        await self._global_limiter.wait()
+
+    async def _resolve_user(self, bot: BenjaminBowtieBot, user_id: int):
+        # The gateway cache is free, so only fall back to REST when the user
+        # isn't in it.
+        user = bot.get_user(user_id)
+        if user is not None:
+            return user
+
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            if time.time() - cached[1] < USER_CACHE_SECONDS:
+                self._user_cache.move_to_end(user_id)
+                return cached[0]
+            del self._user_cache[user_id]
+
+        await self._wait_for_rate_limit("fetch_user")
+        user = await bot.fetch_user(user_id)
+        self._user_cache[user_id] = (user, time.time())
+        if len(self._user_cache) > MAX_CACHED_USERS:
+            self._user_cache.popitem(last=False)
+        return user
+
+    def _prune_expired(self, now: float):
+        for user_id, (_, cached_time) in list(self._user_cache.items()):
+            if now - cached_time >= USER_CACHE_SECONDS:
+                del self._user_cache[user_id]
+        for user_id, forbidden_time in list(self._forbidden_users.items()):
+            if now - forbidden_time >= FORBIDDEN_RETRY_SECONDS:
+                del self._forbidden_users[user_id]
+
+    def _get_chunks(self, messages: List[Tuple[str, float]]) -> List[str]:
+        # Coalesced messages are packed into as few DMs as fit under Discord's
+        # limit, only splitting a message itself if it's too long on its own
+        chunks: List[str] = []
+        current_chunk: str = ""
+        for message, _ in messages:
+            for i in range(0, max(len(message), 1), MAX_DM_LENGTH):
+                part = message[i:i + MAX_DM_LENGTH]
+                if current_chunk == "":
+                    current_chunk = part
+                elif len(current_chunk) + 2 + len(part) <= MAX_DM_LENGTH:
+                    current_chunk += "\n\n" + part
+                else:
+                    chunks.append(current_chunk)
+                    current_chunk = part
+        if current_chunk != "":
+            chunks.append(current_chunk)
+        return chunks
+
+    async def _send(self, bot: BenjaminBowtieBot, semaphore: asyncio.Semaphore, user_id: int, messages: List[Tuple[str, float]]):
+        async with semaphore:
+            try:
+                user = await self._resolve_user(bot, user_id)
+                # Opening the DM channel is its own request the first time
+                channel = user.dm_channel
+                if channel is None:
+                    await self._wait_for_rate_limit("create_dm")
+                    channel = await user.create_dm()
+                for chunk in self._get_chunks(messages):
+                    await self._wait_for_rate_limit("send_message")
+                    await channel.send(chunk)
+                    self._total_sent += 1
+
+                now = time.time()
+                for _, queued_time in messages:
+                    self._latencies.append(now - queued_time)
+            except discord.Forbidden:
+                self._forbidden_users[user_id] = time.time()
+                self._total_failed += 1
+            except Exception as e:
+                self._total_failed += 1
+                ERROR_LOGGER.log(logging.ERROR, f"Failed to send notification to user: {e}")
+
+    async def flush(self, bot: BenjaminBowtieBot):
+        if len(self._pending) == 0:
+            return
+
+        start_time = time.perf_counter()
+
+        pending = self._pending
+        self._pending = {}
+
+        now = time.time()
+        self._prune_expired(now)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        sends = []
+        for user_id, messages in pending.items():
+            forbidden_time = self._forbidden_users.get(user_id)
+            if forbidden_time is not None and now - forbidden_time < FORBIDDEN_RETRY_SECONDS:
+                continue
+            sends.append(self._send(bot, semaphore, user_id, messages))
+        await asyncio.gather(*sends)
+
+        self._last_flush_duration = time.perf_counter() - start_time
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+NOTIFICATIONS = NotificationDispatcher(SHARD_CONFIG.get_share())
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import cProfile
+import datetime
+import discord
+import io
+import logging
+import os
+import pstats
+
+from contextlib import contextmanager
+
+from typing import List
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+PROFILES_DIR = "profiles"
+# Functions listed in the text summary written next to the .pstats file
+PROFILE_SUMMARY_LINES = 60
+
+# -----------------------------------------------------------------------------
+# ON-DEMAND PROFILER
+# -----------------------------------------------------------------------------
+
+# Armed by an owner command for the next few runs of one command, view, button
+# or task, then writes out a cProfile dump so hot spots can be measured against
+# the live database without redeploying.
+#
+# cProfile is per-thread rather than per-task, so anything else the event loop
+# runs while a profiled coroutine is awaiting ends up in the profile too. Only
+# one run is profiled at a time, so overlapping matches are skipped rather than
+# counted.
+
+class OnDemandProfiler():
+    def __init__(self):
+        self._target: str | None = None
+        self._remaining: int = 0
+        self._num_runs: int = 0
+
+        self._profile: cProfile.Profile | None = None
+        self._is_active: bool = False
+
+        self._last_output_path: str | None = None
+        self._logger = logging.getLogger("discord")
+
+    def arm(self, target: str, count: int):
+        # Starting over throws away anything collected for the previous target
+        if self._is_active and self._profile is not None:
+            self._profile.disable()
+        self._target = target.lower()
+        self._remaining = count
+        self._num_runs = 0
+        self._profile = cProfile.Profile()
+        self._is_active = False
+
+    def disarm(self):
+        # Keeps whatever was collected so far
+        if self._profile is not None and self._num_runs > 0:
+            self._write_output()
+        self._target = None
+        self._remaining = 0
+        self._profile = None
+        self._is_active = False
+
+    def get_target(self):
+        return self._target
+
+    def get_remaining(self):
+        return self._remaining
+
+    def get_num_runs(self):
+        return self._num_runs
+
+    def get_last_output_path(self):
+        return self._last_output_path
+
+    def _matches(self, names: List[str]):
+        return self._target is not None and any(name.lower() == self._target for name in names)
+
+    def start(self, names: List[str]):
+        # Returns whether this run is being profiled, which the caller passes
+        # back to stop
+        if self._is_active or self._profile is None or self._remaining <= 0 or not self._matches(names):
+            return False
+        self._is_active = True
+        self._profile.enable()
+        return True
+
+    def stop(self, started: bool):
+        if not started or not self._is_active or self._profile is None:
+            return
+        self._profile.disable()
+        self._is_active = False
+        self._remaining -= 1
+        self._num_runs += 1
+
+        if self._remaining <= 0:
+            self.disarm()
+
+    @contextmanager
+    def profile(self, *names: str):
+        started = self.start(list(names))
+        try:
+            yield
+        finally:
+            self.stop(started)
+
+    def _write_output(self):
+        assert self._profile is not None and self._target is not None
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+
+        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        base_path = os.path.join(PROFILES_DIR, f"{self._target}-{timestamp}")
+
+        # The .pstats file can be loaded with pstats or snakeviz; the .txt is
+        # there to read straight off the server
+        self._profile.dump_stats(f"{base_path}.pstats")
+
+        summary = io.StringIO()
+        summary.write(f"{self._target}: {self._num_runs} runs\n\n")
+        stats = pstats.Stats(self._profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_SUMMARY_LINES)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(PROFILE_SUMMARY_LINES)
+        with open(f"{base_path}.txt", "w") as file:
+            file.write(summary.getvalue())
+
+        self._last_output_path = f"{base_path}.pstats"
+        self._logger.info(f"Wrote profile of {self._num_runs} runs of {self._target} to {self._last_output_path}")
+
+# -----------------------------------------------------------------------------
+# DISCORD UI INSTRUMENTATION
+# -----------------------------------------------------------------------------
+
+# Like the metrics instrumentation, this hooks View._scheduled_task so any view
+# or component can be profiled by its class name.
+def instrument_view_profiling(profiler: OnDemandProfiler):
+    original_scheduled_task = discord.ui.View._scheduled_task
+    if not getattr(original_scheduled_task, "_is_profiled", False):
+        async def scheduled_task(view: discord.ui.View, item: discord.ui.Item, interaction: discord.Interaction):
+            with profiler.profile(type(view).__name__, type(item).__name__):
+                return await original_scheduled_task(view, item, interaction)
+
+        setattr(scheduled_task, "_is_profiled", True)
+        discord.ui.View._scheduled_task = scheduled_task # type: ignore
+
+    # Modals have their own _scheduled_task, so submits need hooking separately
+    original_modal_scheduled_task = discord.ui.Modal._scheduled_task
+    if not getattr(original_modal_scheduled_task, "_is_profiled", False):
+        async def modal_scheduled_task(modal: discord.ui.Modal, interaction: discord.Interaction, *args):
+            with profiler.profile(type(modal).__name__, "Submit"):
+                return await original_modal_scheduled_task(modal, interaction, *args)
+
+        setattr(modal_scheduled_task, "_is_profiled", True)
+        discord.ui.Modal._scheduled_task = modal_scheduled_task # type: ignore
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+PROFILER = OnDemandProfiler()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from typing import Callable, Hashable
+
+# -----------------------------------------------------------------------------
+# RENDER CACHE
+# -----------------------------------------------------------------------------
+
+# Item, ability and companion descriptions are rebuilt every time a view pages,
+# but almost all of that text comes from the catalog and never changes while
+# the bot is running. Callers key the static part of the text on whatever it
+# depends on and render it once; anything that changes per instance (counts,
+# cooldowns, xp) is still formatted on every call.
+
+class RenderCache():
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._rendered: OrderedDict[Hashable, str] = OrderedDict()
+
+    def get(self, key: Hashable, render: Callable[[], str]) -> str:
+        rendered = self._rendered.get(key)
+        if rendered is not None:
+            self._rendered.move_to_end(key)
+            return rendered
+
+        rendered = render()
+        self._rendered[key] = rendered
+        if len(self._rendered) > self._max_size:
+            self._rendered.popitem(last=False)
+        return rendered
+
+    def clear(self):
+        self._rendered.clear()
+
+    def __len__(self):
+        return len(self._rendered)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+
+from typing import Dict, List, Tuple
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Set by shard_coordinator.py for each bot process it starts. When they're not
+# set the bot runs as a single process that owns every guild, like it always has.
+SHARD_COUNT_ENV = "SHARD_COUNT"
+SHARD_IDS_ENV = "SHARD_IDS"
+
+DATABASE_FILE = "adventuresdb.json"
+DATABASE_BACKUP_FILE = "adventuresdbbackup.json"
+# Shared by every process rather than split, see MailStore
+MAIL_DATABASE_FILE = "mail.db"
+
+# Files a split has replaced are renamed with this rather than deleted
+SPLIT_FILE_SUFFIX = ".presplit"
+
+# -----------------------------------------------------------------------------
+# SHARD FILES
+# -----------------------------------------------------------------------------
+
+# Sharded, the database is kept as one file per shard rather than per process,
+# named for the shard and how many there are (adventuresdb-shard3of8.json). A
+# process loads and saves the files of every shard it owns, so the files stay
+# the same however the shards are grouped into processes. They only change
+# when the shard count does, which split_database handles before the bot
+# processes start.
+
+def get_shard_file_path(path: str, shard_id: int, shard_count: int):
+    base, extension = os.path.splitext(path)
+    return f"{base}-shard{shard_id}of{shard_count}{extension}"
+
+
+def get_shard_id_for_guild(guild_id: int | str, shard_count: int):
+    # The formula Discord uses to route a guild to a shard
+    return (int(guild_id) >> 22) % shard_count
+
+
+def find_shard_files(path: str=DATABASE_FILE) -> Dict[int, List[int]]:
+    # Shard count -> the IDs of the shards that have a file for that count
+    directory = os.path.dirname(path) or "."
+    base, extension = os.path.splitext(os.path.basename(path))
+    pattern = re.compile(rf"^{re.escape(base)}-shard(\d+)of(\d+){re.escape(extension)}$")
+
+    shard_files: Dict[int, List[int]] = {}
+    for filename in os.listdir(directory):
+        match = pattern.match(filename)
+        if match is not None:
+            shard_files.setdefault(int(match.group(2)), []).append(int(match.group(1)))
+    for shard_ids in shard_files.values():
+        shard_ids.sort()
+    return shard_files
+
+
+def split_database(shard_count: int):
+    # Run by shard_coordinator.py before it starts any bot processes, so
+    # nothing else has the files open. Splits the unsharded database, or the
+    # files from a different shard count, into a file for each shard. The
+    # database is split as plain JSON: it's keyed by guild at the top and
+    # saved without jsonpickle references, so each guild's data stands alone.
+    # Returns whether anything was split.
+    shard_files = find_shard_files()
+    other_shard_counts = [count for count in shard_files.keys() if count != shard_count]
+
+    source_paths: List[str] = []
+    if os.path.isfile(DATABASE_FILE):
+        # Files for this count alongside it are from a split that didn't finish
+        if len(other_shard_counts) > 0:
+            raise RuntimeError(f"Found both {DATABASE_FILE} and database files for {', '.join(str(count) for count in other_shard_counts)} shards; move aside whichever is out of date")
+        source_paths = [DATABASE_FILE]
+    elif len(other_shard_counts) > 0:
+        if len(other_shard_counts) > 1 or shard_count in shard_files:
+            raise RuntimeError(f"Found database files for {', '.join(str(count) for count in shard_files.keys())} shards; move aside whichever are out of date")
+        old_shard_count = other_shard_counts[0]
+        if shard_files[old_shard_count] != list(range(old_shard_count)):
+            raise RuntimeError(f"Some of the database files for {old_shard_count} shards are missing, so they can't be split into {shard_count}")
+        source_paths = [get_shard_file_path(DATABASE_FILE, shard_id, old_shard_count) for shard_id in range(old_shard_count)]
+    else:
+        return False
+
+    database: dict = {}
+    for source_path in source_paths:
+        with open(source_path, "r") as file:
+            database.update(json.load(file))
+
+    # Every shard gets a file, even an empty one, so no shard that was split
+    # is ever mistaken for one that wasn't
+    for shard_id in range(shard_count):
+        shard_database = {guild_id_str: guild_data for guild_id_str, guild_data in database.items() if get_shard_id_for_guild(guild_id_str, shard_count) == shard_id}
+        shard_path = get_shard_file_path(DATABASE_FILE, shard_id, shard_count)
+        with open(f"{shard_path}.tmp", "w") as file:
+            json.dump(shard_database, file)
+        os.replace(f"{shard_path}.tmp", shard_path)
+
+    for source_path in source_paths:
+        os.replace(source_path, f"{source_path}{SPLIT_FILE_SUFFIX}")
+    return True
+
+# -----------------------------------------------------------------------------
+# SHARD CONFIG
+# -----------------------------------------------------------------------------
+
+# Discord assigns each guild to a shard by its ID, so a process that connects
+# with a set of shard IDs only ever gets events for those shards' guilds. Each
+# process keeps the database files for just those shards, along with its own
+# tick schedule and metrics, so processes never share state.
+class ShardConfig():
+    def __init__(self, shard_count: int | None=None, shard_ids: List[int] | None=None):
+        self._shard_count = shard_count
+        self._shard_ids = shard_ids
+
+    @staticmethod
+    def from_env():
+        shard_count_str = os.getenv(SHARD_COUNT_ENV)
+        shard_ids_str = os.getenv(SHARD_IDS_ENV)
+        if shard_count_str is None or shard_ids_str is None:
+            return ShardConfig()
+        shard_ids = [int(shard_id) for shard_id in shard_ids_str.split(",") if shard_id.strip() != ""]
+        return ShardConfig(int(shard_count_str), shard_ids)
+
+    def is_sharded(self):
+        return self._shard_count is not None and self._shard_ids is not None
+
+    def get_shard_count(self):
+        return self._shard_count
+
+    def get_shard_ids(self):
+        return self._shard_ids
+
+    def get_name(self):
+        if self._shard_ids is None:
+            return "all"
+        return "-".join(str(shard_id) for shard_id in self._shard_ids)
+
+    def get_shard_id_for_guild(self, guild_id: int | str):
+        assert self._shard_count is not None
+        return get_shard_id_for_guild(guild_id, self._shard_count)
+
+    def owns_guild(self, guild_id: int | str):
+        if not self.is_sharded():
+            return True
+        assert self._shard_ids is not None
+        return self.get_shard_id_for_guild(guild_id) in self._shard_ids
+
+    def _get_file_path(self, path: str):
+        if not self.is_sharded():
+            return path
+        base, extension = os.path.splitext(path)
+        return f"{base}-shard{self.get_name()}{extension}"
+
+    def get_database_paths(self) -> Dict[int | None, Tuple[str, str]]:
+        # The database and backup path for each shard this process owns, or
+        # for the whole database under None when it isn't sharded
+        if not self.is_sharded():
+            return {None: (DATABASE_FILE, DATABASE_BACKUP_FILE)}
+        assert self._shard_count is not None and self._shard_ids is not None
+        return {
+            shard_id: (get_shard_file_path(DATABASE_FILE, shard_id, self._shard_count), get_shard_file_path(DATABASE_BACKUP_FILE, shard_id, self._shard_count))
+            for shard_id in self._shard_ids
+        }
+
+    def get_database_shard_for_guild(self, guild_id: int | str):
+        # Which of get_database_paths a guild is saved in
+        return self.get_shard_id_for_guild(guild_id) if self.is_sharded() else None
+
+    def check_database_layout(self):
+        # Loading the wrong files would quietly roll back every guild in them,
+        # so the bot refuses to start unless the files on disk are laid out
+        # for the shards it was started with
+        shard_files = find_shard_files()
+        if not self.is_sharded():
+            if len(shard_files) > 0:
+                raise RuntimeError(f"The database has been split into {', '.join(str(count) for count in shard_files.keys())} shards, so the bot has to be run through shard_coordinator.py")
+            return
+
+        other_shard_counts = [count for count in shard_files.keys() if count != self._shard_count]
+        if len(other_shard_counts) > 0:
+            raise RuntimeError(f"The database is split into {', '.join(str(count) for count in other_shard_counts)} shards rather than {self._shard_count}; start shard_coordinator.py with --shards {self._shard_count} to split it again")
+        if os.path.isfile(DATABASE_FILE):
+            raise RuntimeError(f"{DATABASE_FILE} hasn't been split into shards yet; start the bot through shard_coordinator.py, which splits it first")
+
+    def get_share(self):
+        # The fraction of the bot's shards this process runs, for splitting
+        # limits that every process shares between them
+        if not self.is_sharded():
+            return 1
+        assert self._shard_count is not None and self._shard_ids is not None
+        return len(self._shard_ids) / self._shard_count
+
+    def get_metrics_path(self, path: str):
+        return self._get_file_path(path)
+
+    def filter_database(self, database: dict):
+        if not self.is_sharded():
+            return database
+        return {guild_id_str: guild_data for guild_id_str, guild_data in database.items() if self.owns_guild(guild_id_str)}
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+SHARD_CONFIG = ShardConfig.from_env()
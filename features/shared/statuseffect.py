@@ -145,16 +145,16 @@ class StatusEffect():
         self.trigger_first_turn: bool = trigger_first_turn
         self.value_stackable: bool = value_stackable
         
-    def decrement_turns_remaining(self):
+    def decrement_turns_remaining(self, num_turns: int=1):
         if isinstance(self, DamageSplit):
             self.triggered_this_turn = False
 
         if not self.trigger_first_turn:
             self.trigger_first_turn = True
-            return
+            num_turns -= 1
 
         if self.turns_remaining != -1:
-            self.turns_remaining = max(0, self.turns_remaining - 1)
+            self.turns_remaining = max(0, self.turns_remaining - num_turns)
 
     def set_trigger_first_turn(self, is_self_cast: bool):
         # Used for mapping this to account for self-cast abilities
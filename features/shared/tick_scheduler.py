@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+import zlib
+
+from features.shared.constants import TICK_BATCH_SIZE, TICK_SLOTS
+
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+# -----------------------------------------------------------------------------
+# TICK SCHEDULER
+# -----------------------------------------------------------------------------
+
+# Ticks are numbered by the hours since the epoch, which means a player's last
+# tick can be compared against the current one without storing a global counter.
+def get_current_tick_number() -> int:
+    return int(time.time() // 3600)
+
+
+# Each player is hashed into one of the slots spread across the hour. The hash
+# needs to be stable across restarts (unlike Python's hash for str) so a player
+# doesn't get ticked twice or skipped in the hour a deploy happens.
+class TickScheduler():
+    def __init__(self, num_slots: int=TICK_SLOTS, batch_size: int=TICK_BATCH_SIZE):
+        if num_slots <= 0 or 60 % num_slots != 0:
+            raise ValueError(f"The number of tick slots must divide an hour evenly, got {num_slots}")
+
+        self._num_slots = num_slots
+        self._batch_size = batch_size
+        self._slot_minutes = 60 // num_slots
+        # Slots are numbered from the epoch like ticks are, so the next one to
+        # run is still right when it falls in the next hour
+        self._next_slot_number: int | None = None
+
+        self._slot_durations: Dict[int, float] = {}
+        self._slot_player_counts: Dict[int, int] = {}
+
+    def get_num_slots(self):
+        return self._num_slots
+
+    def get_tick_times(self) -> List[datetime.time]:
+        return [datetime.time(hour=h, minute=slot * self._slot_minutes) for h in range(24) for slot in range(self._num_slots)]
+
+    def get_slot_for_user(self, user_id: str) -> int:
+        return zlib.crc32(str(user_id).encode()) % self._num_slots
+
+    def get_current_slot(self, now: datetime.datetime | None=None) -> int:
+        # The task loop's times are in UTC by default
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+        return min(now.minute // self._slot_minutes, self._num_slots - 1)
+
+    def get_due_slots(self, now: datetime.datetime | None=None) -> List[int]:
+        # The loop can fire late, like after the event loop stalls, and then
+        # the current minute isn't the slot it was scheduled for. Working from
+        # the next slot that hasn't run yet means a late slot never runs twice
+        # and one that was passed over still runs. Anything more than an hour
+        # behind is left for players to catch up on when they're next accessed.
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+        current_slot_number = int(now.timestamp() // 3600) * self._num_slots + self.get_current_slot(now)
+
+        if self._next_slot_number is None:
+            self._next_slot_number = current_slot_number
+        first_slot_number = max(self._next_slot_number, current_slot_number - self._num_slots + 1)
+        self._next_slot_number = max(self._next_slot_number, current_slot_number + 1)
+        return [slot_number % self._num_slots for slot_number in range(first_slot_number, current_slot_number + 1)]
+
+    def get_slot_members(self, database: dict, slot: int) -> List[Tuple[str, str]]:
+        # Take a snapshot since the database can change whenever the tick yields
+        slot_members: List[Tuple[str, str]] = []
+        for guild_id_str in list(database.keys()):
+            for user_id_str in list(database[guild_id_str].get("members", {}).keys()):
+                if self.get_slot_for_user(user_id_str) == slot:
+                    slot_members.append((guild_id_str, user_id_str))
+        return slot_members
+
+    async def run_slot(self, database: dict, slot: int, tick_member: Callable[[str, str], Awaitable[None]]):
+        start_time = time.perf_counter()
+
+        slot_members = self.get_slot_members(database, slot)
+        for i, (guild_id_str, user_id_str) in enumerate(slot_members):
+            await tick_member(guild_id_str, user_id_str)
+
+            if (i + 1) % self._batch_size == 0:
+                await asyncio.sleep(0)
+
+        self._slot_durations[slot] = time.perf_counter() - start_time
+        self._slot_player_counts[slot] = len(slot_members)
+
+    def get_slot_durations(self):
+        return self._slot_durations
+
+    def get_slot_player_counts(self):
+        return self._slot_player_counts
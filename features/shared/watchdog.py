@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from features.shared.metrics import METRICS
+
+from types import FrameType
+from typing import Dict, List, Tuple
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Discord gives us 3 seconds to respond to an interaction, so anything close
+# to that is worth knowing about
+STALL_THRESHOLD_SECONDS = 1
+STALL_POLL_SECONDS = 0.25
+# Frames kept in the logged stack, innermost last
+STALL_STACK_LIMIT = 30
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Frames from these files are plumbing rather than the code that stalled,
+# including the metrics, profiler and guild lock wrappers that every view and
+# modal callback runs under
+IGNORED_FILES = (
+    os.path.join(REPO_ROOT, "features", "shared", "guild_locks.py"),
+    os.path.join(REPO_ROOT, "features", "shared", "metrics.py"),
+    os.path.join(REPO_ROOT, "features", "shared", "profiler.py"),
+    os.path.join(REPO_ROOT, "features", "shared", "watchdog.py")
+)
+
+# -----------------------------------------------------------------------------
+# STALL RECORD
+# -----------------------------------------------------------------------------
+
+class StallRecord():
+    def __init__(self, activity: str, call_site: str):
+        self.activity = activity
+        self.call_site = call_site
+        self.count: int = 0
+        self.total_duration: float = 0
+        self.max_duration: float = 0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+# -----------------------------------------------------------------------------
+# EVENT LOOP WATCHDOG
+# -----------------------------------------------------------------------------
+
+# A background thread keeps asking the event loop to run a tiny callback. If
+# the callback hasn't run within the threshold, something is blocking the loop
+# and, since it's still blocking, the loop thread's current stack shows what.
+#
+# A running coroutine's frame sits on the thread's stack under the coroutines
+# awaiting it, so the outermost frame from this repo is the command, view
+# callback or task that was running (e.g. Adventures.save_database) and the
+# innermost is where it's actually spending its time (e.g.
+# DuelView.take_npc_turn).
+
+class EventLoopWatchdog():
+    def __init__(self, threshold: float=STALL_THRESHOLD_SECONDS, poll_interval: float=STALL_POLL_SECONDS):
+        self._threshold = threshold
+        self._poll_interval = poll_interval
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+        # When the outstanding heartbeat was sent, or None if it's been answered
+        self._heartbeat_sent_at: float | None = None
+        # The stall currently in progress, if it's already been reported
+        self._current_stall: Tuple[str, str] | None = None
+
+        self._records: Dict[Tuple[str, str], StallRecord] = {}
+        self._logger = logging.getLogger("discord")
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        # Must be called from the loop's thread, which is the one we'll sample
+        if self._thread is not None:
+            return
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def get_records(self) -> List[StallRecord]:
+        with self._lock:
+            return list(self._records.values())
+
+    def _heartbeat(self):
+        now = time.monotonic()
+        with self._lock:
+            sent_at = self._heartbeat_sent_at
+            stall = self._current_stall
+            self._heartbeat_sent_at = None
+            self._current_stall = None
+
+        if stall is not None and sent_at is not None:
+            duration = now - sent_at
+            with self._lock:
+                self._records[stall].add(duration)
+            METRICS.observe("bot_event_loop_stall_seconds", duration)
+            self._logger.warning(f"Event loop stall in {stall[0]} at {stall[1]} lasted {duration:.2f}s")
+
+    def _run(self):
+        assert self._loop is not None
+        while not self._stop_event.wait(self._poll_interval):
+            if self._loop.is_closed():
+                return
+
+            with self._lock:
+                sent_at = self._heartbeat_sent_at
+                already_reported = self._current_stall is not None
+
+            if sent_at is None:
+                with self._lock:
+                    self._heartbeat_sent_at = time.monotonic()
+                try:
+                    self._loop.call_soon_threadsafe(self._heartbeat)
+                except RuntimeError:
+                    # The loop was closed between the check and the call
+                    return
+            elif not already_reported and time.monotonic() - sent_at >= self._threshold:
+                self._report_stall(time.monotonic() - sent_at)
+
+    def _report_stall(self, elapsed: float):
+        frame = sys._current_frames().get(self._loop_thread_id) # type: ignore
+        if frame is None:
+            return
+
+        activity, call_site = self._get_activity_and_call_site(frame)
+        stack_str = "".join(traceback.format_stack(frame, limit=STALL_STACK_LIMIT))
+
+        with self._lock:
+            self._current_stall = (activity, call_site)
+            if self._current_stall not in self._records:
+                self._records[self._current_stall] = StallRecord(activity, call_site)
+
+        METRICS.increment("bot_event_loop_stalls_total", labels={"activity": activity, "call_site": call_site})
+        self._logger.warning(f"Event loop blocked for {elapsed:.2f}s in {activity} at {call_site}:\n{stack_str}")
+
+    def _get_activity_and_call_site(self, frame: FrameType | None):
+        repo_frames: List[FrameType] = []
+        while frame is not None:
+            # Frozen modules like <frozen runpy> aren't files, and abspath would
+            # otherwise put them under the working directory
+            is_frozen_frame = frame.f_code.co_filename.startswith("<")
+            filename = os.path.abspath(frame.f_code.co_filename)
+            # Module level frames are just bot.py starting the loop
+            is_module_frame = frame.f_code.co_name == "<module>"
+            if filename.startswith(REPO_ROOT) and "site-packages" not in filename and filename not in IGNORED_FILES and not is_module_frame and not is_frozen_frame:
+                repo_frames.append(frame)
+            frame = frame.f_back
+
+        if len(repo_frames) == 0:
+            return "unknown", "unknown"
+
+        # Frames were collected innermost first
+        return repo_frames[-1].f_code.co_qualname, repo_frames[0].f_code.co_qualname
+
+# -----------------------------------------------------------------------------
+# GLOBALS
+# -----------------------------------------------------------------------------
+
+WATCHDOG = EventLoopWatchdog()
+
+METRICS.describe("bot_event_loop_stall_seconds", "How long the event loop was blocked, for stalls past the watchdog threshold")
+METRICS.describe("bot_event_loop_stalls_total", "Event loop stalls past the watchdog threshold by where they happened")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+
+from typing import Callable, List
+
+# -----------------------------------------------------------------------------
+# XP TABLE
+# -----------------------------------------------------------------------------
+
+# Cumulative XP needed for each level, computed once from a level formula so
+# resolving a level from an XP total is a bisect rather than stepping through
+# the formula one level at a time. Levels aren't capped, so the table grows
+# whenever something asks about a level or XP total past the end of it.
+
+INITIAL_XP_TABLE_LEVELS = 128
+
+class XPTable():
+    def __init__(self, xp_formula: Callable[[int], int]):
+        self._xp_formula = xp_formula
+        self._xp_to_level: List[int] = []
+        self._extend_to_level(INITIAL_XP_TABLE_LEVELS)
+
+    def _extend_to_level(self, level: int):
+        while len(self._xp_to_level) <= level:
+            self._xp_to_level.append(self._xp_formula(len(self._xp_to_level)))
+
+    def _extend_to_xp(self, xp: int):
+        while self._xp_to_level[-1] <= xp:
+            self._xp_to_level.append(self._xp_formula(len(self._xp_to_level)))
+
+    def get_xp_to_level(self, level: int) -> int:
+        if level < 0:
+            return self._xp_formula(level)
+        if level >= len(self._xp_to_level):
+            self._extend_to_level(level)
+        return self._xp_to_level[level]
+
+    # The highest level whose XP requirement has been met, assuming the
+    # formula increases with level.
+    def get_level_for_xp(self, xp: int) -> int:
+        if xp >= self._xp_to_level[-1]:
+            self._extend_to_xp(xp)
+        return max(0, bisect_right(self._xp_to_level, xp) - 1)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import discord
+import weakref
 
 from discord.embeds import Embed
 from discord.ext import commands
@@ -8,6 +9,8 @@ from enum import StrEnum
 from features.shared.nextbutton import NextButton
 from features.shared.prevbutton import PrevButton
 
+from typing import Callable, Dict, List
+
 
 class StatCategory(StrEnum):
     Fish = "fish"
@@ -21,6 +24,69 @@ class StatCategory(StrEnum):
     Companions = "companions"
     Adventures = "adventures"
 
+
+class LeaderboardCategory(StrEnum):
+    FishCaught = "fish"
+    CoinsMade = "market"
+    KnucklebonesCoinsWon = "knucklebones"
+    DuelsWon = "duels"
+    DamageDealt = "damage"
+    PlantsHarvested = "garden"
+    ItemsCrafted = "crafting"
+    CompanionBattlesWon = "companions"
+    AdventuresWon = "adventures"
+
+# -----------------------------------------------------------------------------
+# LEADERBOARD TRACKING
+# -----------------------------------------------------------------------------
+
+# Called with the category and how much it changed by whenever a counter that
+# feeds a leaderboard changes. Kept out of the stats themselves so they don't
+# get saved or copied, and keyed by id rather than weakly since every counter
+# set looks here; a finalizer drops the entry when the stats go away.
+STAT_LISTENERS: Dict[int, Callable[[LeaderboardCategory, int], None]] = {}
+
+def set_stat_listener(stat_class: object, listener: Callable[[LeaderboardCategory, int], None]):
+    key = id(stat_class)
+    if key not in STAT_LISTENERS:
+        weakref.finalize(stat_class, STAT_LISTENERS.pop, key, None)
+    STAT_LISTENERS[key] = listener
+
+class LeaderboardStat():
+    # A counter that adds to a leaderboard. The value still lives in the
+    # instance's __dict__ under the same name, so saving and loading are the
+    # same as for any other counter; only setting it goes through here.
+    def __init__(self, category: LeaderboardCategory):
+        self.category = category
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner: type | None=None):
+        if instance is None:
+            return self
+        return instance.__dict__.get(self.name, 0)
+
+    def __set__(self, instance, value: int):
+        listener = STAT_LISTENERS.get(id(instance))
+        if listener is not None:
+            delta = value - instance.__dict__.get(self.name, 0)
+            if delta != 0:
+                listener(self.category, delta)
+        instance.__dict__[self.name] = value
+
+
+class TrackedStats():
+    _leaderboard_stats: List[LeaderboardStat] = []
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls._leaderboard_stats = [stat for stat in cls.__dict__.values() if isinstance(stat, LeaderboardStat)]
+
+    def get_leaderboard_value(self, category: LeaderboardCategory) -> int:
+        return sum(self.__dict__.get(stat.name, 0) for stat in self._leaderboard_stats if stat.category == category)
+
 # Based on the command names; the user will do b!stats [name] or omit the name
 # and get all of them at once. I'm using a class to help with deserializing the
 # object and having some type safety -- a strange thing to say in Python, I
@@ -28,7 +94,13 @@ class StatCategory(StrEnum):
 class Stats():
     # Using subclasses because these should never be instantiated by anything
     # other than Stats.
-    class FishStats():
+    class FishStats(TrackedStats):
+        common_fish_caught = LeaderboardStat(LeaderboardCategory.FishCaught)
+        uncommon_fish_caught = LeaderboardStat(LeaderboardCategory.FishCaught)
+        rare_fish_caught = LeaderboardStat(LeaderboardCategory.FishCaught)
+        epic_fish_caught = LeaderboardStat(LeaderboardCategory.FishCaught)
+        legendary_fish_caught = LeaderboardStat(LeaderboardCategory.FishCaught)
+
         def __init__(self):
             self.common_items_caught: int = 0
             self.rare_items_caught: int = 0
@@ -66,7 +138,7 @@ class Stats():
             self.epic_fish_caught = state.get("epic_fish_caught", 0)
             self.legendary_fish_caught = state.get("legendary_fish_caught", 0)
 
-    class MailStats():
+    class MailStats(TrackedStats):
         def __init__(self):
             self.mail_sent: int = 0
             self.mail_opened: int = 0
@@ -119,7 +191,9 @@ class Stats():
             self.coins_sent_to_self = state.get("coins_sent_to_self", 0)
             self.messages_sent_to_self = state.get("messages_sent_to_self", 0)
 
-    class MarketStats():
+    class MarketStats(TrackedStats):
+        coins_made = LeaderboardStat(LeaderboardCategory.CoinsMade)
+
         def __init__(self):
             self.items_sold: int = 0
             self.coins_made: int = 0
@@ -140,7 +214,9 @@ class Stats():
             self.items_sold = state.get("items_sold", 0)
             self.coins_made = state.get("coins_made", 0)
 
-    class KnucklebonesStats():
+    class KnucklebonesStats(TrackedStats):
+        coins_won = LeaderboardStat(LeaderboardCategory.KnucklebonesCoinsWon)
+
         def __init__(self):
             self.games_won: int = 0
             self.games_tied: int = 0
@@ -217,7 +293,7 @@ class Stats():
             self.mr_bones_games_tied = state.get("mr_bones_games_tied", 0)
             self.mr_bones_games_played = state.get("mr_bones_games_played", 0)
 
-    class WishingWellStats():
+    class WishingWellStats(TrackedStats):
         def __init__(self):
             self.coins_tossed: int = 0
             self.coins_received: int = 0
@@ -246,7 +322,10 @@ class Stats():
             self.items_received = state.get("items_received", 0)
             self.something_stirs = state.get("something_stirs", 0)
 
-    class DuelingStats():
+    class DuelingStats(TrackedStats):
+        duels_won = LeaderboardStat(LeaderboardCategory.DuelsWon)
+        damage_dealt = LeaderboardStat(LeaderboardCategory.DamageDealt)
+
         def __init__(self):
             self.duels_fought: int = 0
             self.duels_won: int = 0
@@ -313,7 +392,13 @@ class Stats():
             self.guardian_abilities_used = state.get("guardian_abilities_used", 0)
             self.merchant_abilities_used = state.get("merchant_abilities_used", 0)
 
-    class GardenStats():
+    class GardenStats(TrackedStats):
+        common_plants_harvested = LeaderboardStat(LeaderboardCategory.PlantsHarvested)
+        uncommon_plants_harvested = LeaderboardStat(LeaderboardCategory.PlantsHarvested)
+        rare_plants_harvested = LeaderboardStat(LeaderboardCategory.PlantsHarvested)
+        epic_plants_harvested = LeaderboardStat(LeaderboardCategory.PlantsHarvested)
+        legendary_plants_harvested = LeaderboardStat(LeaderboardCategory.PlantsHarvested)
+
         def __init__(self):
             self.common_plants_harvested: int = 0
             self.uncommon_plants_harvested: int = 0
@@ -361,7 +446,14 @@ class Stats():
             self.epic_seeds_dropped = state.get("epic_seeds_dropped", 0)
             self.legendary_seeds_dropped = state.get("legendary_seeds_dropped", 0)
 
-    class CraftingStats():
+    class CraftingStats(TrackedStats):
+        common_items_crafted = LeaderboardStat(LeaderboardCategory.ItemsCrafted)
+        uncommon_items_crafted = LeaderboardStat(LeaderboardCategory.ItemsCrafted)
+        rare_items_crafted = LeaderboardStat(LeaderboardCategory.ItemsCrafted)
+        epic_items_crafted = LeaderboardStat(LeaderboardCategory.ItemsCrafted)
+        legendary_items_crafted = LeaderboardStat(LeaderboardCategory.ItemsCrafted)
+        artifact_items_crafted = LeaderboardStat(LeaderboardCategory.ItemsCrafted)
+
         def __init__(self):
             self.patterns_discovered: int = 0
             self.common_items_crafted: int = 0
@@ -445,7 +537,9 @@ class Stats():
             self.legendary_items_cooked = state.get("legendary_items_cooked", 0)
             self.artifact_items_cooked = state.get("artifact_items_cooked", 0)
 
-    class CompanionsStats():
+    class CompanionsStats(TrackedStats):
+        companion_battles_won = LeaderboardStat(LeaderboardCategory.CompanionBattlesWon)
+
         def __init__(self):
             self.companions_found: int = 0
             self.items_fed: int = 0
@@ -484,7 +578,11 @@ class Stats():
             self.companion_battles_won = state.get("companion_battles_won", 0)
             self.companion_battles_tied = state.get("companion_battles_tied", 0)
 
-    class DungeonRunStats():
+    class DungeonRunStats(TrackedStats):
+        forest_adventures_won = LeaderboardStat(LeaderboardCategory.AdventuresWon)
+        ocean_adventures_won = LeaderboardStat(LeaderboardCategory.AdventuresWon)
+        underworld_adventures_won = LeaderboardStat(LeaderboardCategory.AdventuresWon)
+
         def __init__(self):
             self.forest_rooms_explored: int = 0
             self.forest_combat_encounters: int = 0
@@ -631,6 +729,13 @@ class Stats():
         # to be organized differently.
         return [self.fish, self.mail, self.market, self.knucklebones, self.wishingwell, self.dueling, self.garden, self.crafting, self.companions, self.dungeon_runs]
 
+    def get_leaderboard_value(self, category: LeaderboardCategory) -> int:
+        return sum(stat_class.get_leaderboard_value(category) for stat_class in self.list())
+
+    def set_leaderboard_listener(self, listener: Callable[[LeaderboardCategory, int], None]):
+        for stat_class in self.list():
+            set_stat_listener(stat_class, listener)
+
     def __getstate__(self):
         return self.__dict__
 
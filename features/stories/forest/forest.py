@@ -10,70 +10,140 @@ from discord.embeds import Embed
 from features.player import Player
 from features.shared.constants import FOREST_ROOMS
 from features.shared.enums import CompanionKey, ForestSection
+from features.shared.lazy_import import LazyClassRegistry
 from features.stories.dungeon_run import DungeonRun
-from features.stories.forest.combat.quiet_grove.bridge_golem_duel import BridgeGolemDuelView, WhisperingWoodsIntroView
-from features.stories.forest.combat.quiet_grove.brigand_mystic_duel import BrigandMysticDuelView
-from features.stories.forest.combat.quiet_grove.deepwood_bear_duel import BearDuelView
-from features.stories.forest.combat.quiet_grove.evoker_brigand_thief_duel import EvokerBrigandThiefDuelView
-from features.stories.forest.combat.quiet_grove.evoker_mystic_duel import EvokerMysticDuelView
-from features.stories.forest.combat.quiet_grove.giant_snake_duel import GiantSnakeDuelView
-from features.stories.forest.combat.quiet_grove.thief_marauder_duel import ThiefMarauderDuelView
-from features.stories.forest.combat.quiet_grove.timberwolves_duel import TimberwolvesDuelView
-from features.stories.forest.combat.quiet_grove.triple_snake_duel import TripleSnakeDuelView
-from features.stories.forest.combat.quiet_grove.wild_boar_duel import WildBoarDuelView
-from features.stories.forest.combat.screaming_copse.briar_wall_duel import BriarWallDuelView
-from features.stories.forest.combat.screaming_copse.horrifying_bone_amalgam_duel import HorrifyingBoneAmalgamDuelView
-from features.stories.forest.combat.screaming_copse.starving_dire_wolves_duel import StarvingDireWolvesDuelView
-from features.stories.forest.combat.screaming_copse.undead_treants_duel import UndeadTreantsDuelView
-from features.stories.forest.combat.screaming_copse.voidburnt_treant_duel import VoidburntTreantDuelView
-from features.stories.forest.combat.screaming_copse.wailing_bones_duel import WailingBonesDuelView
-from features.stories.forest.combat.whispering_woods.armored_centipede_duel import ArmoredCentipedeDuelView
-from features.stories.forest.combat.whispering_woods.bladedancer_stormcaller_duel import BladedancerStormcallerDuelView
-from features.stories.forest.combat.whispering_woods.dire_wolves_duel import DireWolvesDuelView
-from features.stories.forest.combat.whispering_woods.double_shadowsneak_duel import DoubleShadowsneakDuelView
-from features.stories.forest.combat.whispering_woods.fleeing_treant_duel import FleeingTreantDuelView
-from features.stories.forest.combat.whispering_woods.ironbound_bladedancer_duel import IronboundBladedancerDuelView
-from features.stories.forest.combat.whispering_woods.lifestitcher_ironbound_duel import LifestitcherIronboundDuelView
-from features.stories.forest.combat.whispering_woods.lifestitcher_shadowsneak_duel import LifestitcherShadowsneakDuelView
-from features.stories.forest.combat.whispering_woods.mad_knights_duel import MadKnightsDuelView
-from features.stories.forest.combat.whispering_woods.shambling_bones_duel import ScreamingCopseIntroView
-from features.stories.forest.combat.whispering_woods.treants_duel import TreantsDuelView
-from features.stories.forest.combat.whispering_woods.triple_stormcaller_duel import TripleStormcallerDuelView
-from features.stories.forest.events.quiet_grove.aestival_light import AestivalLightView
-from features.stories.forest.events.quiet_grove.camp_of_fools import CampOfFoolsView
-from features.stories.forest.events.quiet_grove.fishing_pond import QuietGroveFishingPondView
-from features.stories.forest.events.quiet_grove.jackalope import JackalopeView
-from features.stories.forest.events.quiet_grove.the_path_is_lost import ThePathIsLostView
-from features.stories.forest.events.quiet_grove.wandering_cook import WanderingCookView
-from features.stories.forest.events.quiet_grove.wild_herbs import QuietGroveWildHerbsView
-from features.stories.forest.events.quiet_grove.wildlife_gathering import WildlifeGatheringView
-from features.stories.forest.events.screaming_copse.a_nearby_roar import ANearbyRoarView
-from features.stories.forest.events.screaming_copse.dangerous_undergrowth import DangerousUndergrowthView
-from features.stories.forest.events.screaming_copse.dark_between_the_stars import DarkBetweenTheStarsView
-from features.stories.forest.events.screaming_copse.fishing_pond import ScreamingCopseFishingPondView
-from features.stories.forest.events.screaming_copse.hallucinatory_smoke import HallucinatorySmokeView
-from features.stories.forest.events.screaming_copse.stagnant_water import StagnantWaterView
-from features.stories.forest.events.screaming_copse.sword_in_an_old_bonfire import SwordInAnOldBonfireView
-from features.stories.forest.events.screaming_copse.wild_herbs import ScreamingCopseWildHerbsView
-from features.stories.forest.events.whispering_woods.chorus_of_the_wind import ChorusOfTheWindView
-from features.stories.forest.events.whispering_woods.colorful_mushrooms import ColorfulMushroomsView
-from features.stories.forest.events.whispering_woods.fishing_pond import WhisperingWoodsFishingPondView
-from features.stories.forest.events.whispering_woods.form_in_the_fog import FormInTheFogView
-from features.stories.forest.events.whispering_woods.omen_of_disaster import OmenOfDisasterView
-from features.stories.forest.events.whispering_woods.petrifying_plant import PetrifyingPlantView
-from features.stories.forest.events.whispering_woods.riddle_bird import RiddleBirdView
-from features.stories.forest.events.whispering_woods.the_sound import TheSoundView
-from features.stories.forest.events.whispering_woods.unnamed_grave import UnnamedGraveView
-from features.stories.forest.events.whispering_woods.wild_herbs import WhisperingWoodsWildHerbsView
-from features.stories.forest.events.whispering_woods.witch_of_the_woods import WitchOfTheWoodsView
-from features.stories.forest.merchant.mysterious_merchant import MysteriousMerchantView
-from features.stories.forest.treasure.quiet_grove_treasure import QuietGroveTreasureRoomView
-from features.stories.forest.treasure.screaming_copse_treasure import ScreamingCopseTreasureRoomView
-from features.stories.forest.treasure.whispering_woods_treasure import WhisperingWoodsTreasureRoomView
 from features.stories.forest_room_selection import ForestRoomSelectionView
 from features.stories.story import Story
 
-from typing import List, Set, Tuple
+from typing import TYPE_CHECKING, List, Set, Tuple
+if TYPE_CHECKING:
+    from features.stories.forest.combat.quiet_grove.bridge_golem_duel import BridgeGolemDuelView, WhisperingWoodsIntroView
+    from features.stories.forest.combat.quiet_grove.brigand_mystic_duel import BrigandMysticDuelView
+    from features.stories.forest.combat.quiet_grove.deepwood_bear_duel import BearDuelView
+    from features.stories.forest.combat.quiet_grove.evoker_brigand_thief_duel import EvokerBrigandThiefDuelView
+    from features.stories.forest.combat.quiet_grove.evoker_mystic_duel import EvokerMysticDuelView
+    from features.stories.forest.combat.quiet_grove.giant_snake_duel import GiantSnakeDuelView
+    from features.stories.forest.combat.quiet_grove.thief_marauder_duel import ThiefMarauderDuelView
+    from features.stories.forest.combat.quiet_grove.timberwolves_duel import TimberwolvesDuelView
+    from features.stories.forest.combat.quiet_grove.triple_snake_duel import TripleSnakeDuelView
+    from features.stories.forest.combat.quiet_grove.wild_boar_duel import WildBoarDuelView
+    from features.stories.forest.combat.screaming_copse.briar_wall_duel import BriarWallDuelView
+    from features.stories.forest.combat.screaming_copse.horrifying_bone_amalgam_duel import HorrifyingBoneAmalgamDuelView
+    from features.stories.forest.combat.screaming_copse.starving_dire_wolves_duel import StarvingDireWolvesDuelView
+    from features.stories.forest.combat.screaming_copse.undead_treants_duel import UndeadTreantsDuelView
+    from features.stories.forest.combat.screaming_copse.voidburnt_treant_duel import VoidburntTreantDuelView
+    from features.stories.forest.combat.screaming_copse.wailing_bones_duel import WailingBonesDuelView
+    from features.stories.forest.combat.whispering_woods.armored_centipede_duel import ArmoredCentipedeDuelView
+    from features.stories.forest.combat.whispering_woods.bladedancer_stormcaller_duel import BladedancerStormcallerDuelView
+    from features.stories.forest.combat.whispering_woods.dire_wolves_duel import DireWolvesDuelView
+    from features.stories.forest.combat.whispering_woods.double_shadowsneak_duel import DoubleShadowsneakDuelView
+    from features.stories.forest.combat.whispering_woods.fleeing_treant_duel import FleeingTreantDuelView
+    from features.stories.forest.combat.whispering_woods.ironbound_bladedancer_duel import IronboundBladedancerDuelView
+    from features.stories.forest.combat.whispering_woods.lifestitcher_ironbound_duel import LifestitcherIronboundDuelView
+    from features.stories.forest.combat.whispering_woods.lifestitcher_shadowsneak_duel import LifestitcherShadowsneakDuelView
+    from features.stories.forest.combat.whispering_woods.mad_knights_duel import MadKnightsDuelView
+    from features.stories.forest.combat.whispering_woods.shambling_bones_duel import ScreamingCopseIntroView
+    from features.stories.forest.combat.whispering_woods.treants_duel import TreantsDuelView
+    from features.stories.forest.combat.whispering_woods.triple_stormcaller_duel import TripleStormcallerDuelView
+    from features.stories.forest.events.quiet_grove.aestival_light import AestivalLightView
+    from features.stories.forest.events.quiet_grove.camp_of_fools import CampOfFoolsView
+    from features.stories.forest.events.quiet_grove.fishing_pond import QuietGroveFishingPondView
+    from features.stories.forest.events.quiet_grove.jackalope import JackalopeView
+    from features.stories.forest.events.quiet_grove.the_path_is_lost import ThePathIsLostView
+    from features.stories.forest.events.quiet_grove.wandering_cook import WanderingCookView
+    from features.stories.forest.events.quiet_grove.wild_herbs import QuietGroveWildHerbsView
+    from features.stories.forest.events.quiet_grove.wildlife_gathering import WildlifeGatheringView
+    from features.stories.forest.events.screaming_copse.a_nearby_roar import ANearbyRoarView
+    from features.stories.forest.events.screaming_copse.dangerous_undergrowth import DangerousUndergrowthView
+    from features.stories.forest.events.screaming_copse.dark_between_the_stars import DarkBetweenTheStarsView
+    from features.stories.forest.events.screaming_copse.fishing_pond import ScreamingCopseFishingPondView
+    from features.stories.forest.events.screaming_copse.hallucinatory_smoke import HallucinatorySmokeView
+    from features.stories.forest.events.screaming_copse.stagnant_water import StagnantWaterView
+    from features.stories.forest.events.screaming_copse.sword_in_an_old_bonfire import SwordInAnOldBonfireView
+    from features.stories.forest.events.screaming_copse.wild_herbs import ScreamingCopseWildHerbsView
+    from features.stories.forest.events.whispering_woods.chorus_of_the_wind import ChorusOfTheWindView
+    from features.stories.forest.events.whispering_woods.colorful_mushrooms import ColorfulMushroomsView
+    from features.stories.forest.events.whispering_woods.fishing_pond import WhisperingWoodsFishingPondView
+    from features.stories.forest.events.whispering_woods.form_in_the_fog import FormInTheFogView
+    from features.stories.forest.events.whispering_woods.omen_of_disaster import OmenOfDisasterView
+    from features.stories.forest.events.whispering_woods.petrifying_plant import PetrifyingPlantView
+    from features.stories.forest.events.whispering_woods.riddle_bird import RiddleBirdView
+    from features.stories.forest.events.whispering_woods.the_sound import TheSoundView
+    from features.stories.forest.events.whispering_woods.unnamed_grave import UnnamedGraveView
+    from features.stories.forest.events.whispering_woods.wild_herbs import WhisperingWoodsWildHerbsView
+    from features.stories.forest.events.whispering_woods.witch_of_the_woods import WitchOfTheWoodsView
+    from features.stories.forest.merchant.mysterious_merchant import MysteriousMerchantView
+    from features.stories.forest.treasure.quiet_grove_treasure import QuietGroveTreasureRoomView
+    from features.stories.forest.treasure.screaming_copse_treasure import ScreamingCopseTreasureRoomView
+    from features.stories.forest.treasure.whispering_woods_treasure import WhisperingWoodsTreasureRoomView
+
+# -----------------------------------------------------------------------------
+# ROOM VIEWS
+# -----------------------------------------------------------------------------
+
+# Imported the first time a party reaches them; see LazyClassRegistry
+ROOM_VIEWS = LazyClassRegistry({
+    "BridgeGolemDuelView": "features.stories.forest.combat.quiet_grove.bridge_golem_duel",
+    "WhisperingWoodsIntroView": "features.stories.forest.combat.quiet_grove.bridge_golem_duel",
+    "BrigandMysticDuelView": "features.stories.forest.combat.quiet_grove.brigand_mystic_duel",
+    "BearDuelView": "features.stories.forest.combat.quiet_grove.deepwood_bear_duel",
+    "EvokerBrigandThiefDuelView": "features.stories.forest.combat.quiet_grove.evoker_brigand_thief_duel",
+    "EvokerMysticDuelView": "features.stories.forest.combat.quiet_grove.evoker_mystic_duel",
+    "GiantSnakeDuelView": "features.stories.forest.combat.quiet_grove.giant_snake_duel",
+    "ThiefMarauderDuelView": "features.stories.forest.combat.quiet_grove.thief_marauder_duel",
+    "TimberwolvesDuelView": "features.stories.forest.combat.quiet_grove.timberwolves_duel",
+    "TripleSnakeDuelView": "features.stories.forest.combat.quiet_grove.triple_snake_duel",
+    "WildBoarDuelView": "features.stories.forest.combat.quiet_grove.wild_boar_duel",
+    "BriarWallDuelView": "features.stories.forest.combat.screaming_copse.briar_wall_duel",
+    "HorrifyingBoneAmalgamDuelView": "features.stories.forest.combat.screaming_copse.horrifying_bone_amalgam_duel",
+    "StarvingDireWolvesDuelView": "features.stories.forest.combat.screaming_copse.starving_dire_wolves_duel",
+    "UndeadTreantsDuelView": "features.stories.forest.combat.screaming_copse.undead_treants_duel",
+    "VoidburntTreantDuelView": "features.stories.forest.combat.screaming_copse.voidburnt_treant_duel",
+    "WailingBonesDuelView": "features.stories.forest.combat.screaming_copse.wailing_bones_duel",
+    "ArmoredCentipedeDuelView": "features.stories.forest.combat.whispering_woods.armored_centipede_duel",
+    "BladedancerStormcallerDuelView": "features.stories.forest.combat.whispering_woods.bladedancer_stormcaller_duel",
+    "DireWolvesDuelView": "features.stories.forest.combat.whispering_woods.dire_wolves_duel",
+    "DoubleShadowsneakDuelView": "features.stories.forest.combat.whispering_woods.double_shadowsneak_duel",
+    "FleeingTreantDuelView": "features.stories.forest.combat.whispering_woods.fleeing_treant_duel",
+    "IronboundBladedancerDuelView": "features.stories.forest.combat.whispering_woods.ironbound_bladedancer_duel",
+    "LifestitcherIronboundDuelView": "features.stories.forest.combat.whispering_woods.lifestitcher_ironbound_duel",
+    "LifestitcherShadowsneakDuelView": "features.stories.forest.combat.whispering_woods.lifestitcher_shadowsneak_duel",
+    "MadKnightsDuelView": "features.stories.forest.combat.whispering_woods.mad_knights_duel",
+    "ScreamingCopseIntroView": "features.stories.forest.combat.whispering_woods.shambling_bones_duel",
+    "TreantsDuelView": "features.stories.forest.combat.whispering_woods.treants_duel",
+    "TripleStormcallerDuelView": "features.stories.forest.combat.whispering_woods.triple_stormcaller_duel",
+    "AestivalLightView": "features.stories.forest.events.quiet_grove.aestival_light",
+    "CampOfFoolsView": "features.stories.forest.events.quiet_grove.camp_of_fools",
+    "QuietGroveFishingPondView": "features.stories.forest.events.quiet_grove.fishing_pond",
+    "JackalopeView": "features.stories.forest.events.quiet_grove.jackalope",
+    "ThePathIsLostView": "features.stories.forest.events.quiet_grove.the_path_is_lost",
+    "WanderingCookView": "features.stories.forest.events.quiet_grove.wandering_cook",
+    "QuietGroveWildHerbsView": "features.stories.forest.events.quiet_grove.wild_herbs",
+    "WildlifeGatheringView": "features.stories.forest.events.quiet_grove.wildlife_gathering",
+    "ANearbyRoarView": "features.stories.forest.events.screaming_copse.a_nearby_roar",
+    "DangerousUndergrowthView": "features.stories.forest.events.screaming_copse.dangerous_undergrowth",
+    "DarkBetweenTheStarsView": "features.stories.forest.events.screaming_copse.dark_between_the_stars",
+    "ScreamingCopseFishingPondView": "features.stories.forest.events.screaming_copse.fishing_pond",
+    "HallucinatorySmokeView": "features.stories.forest.events.screaming_copse.hallucinatory_smoke",
+    "StagnantWaterView": "features.stories.forest.events.screaming_copse.stagnant_water",
+    "SwordInAnOldBonfireView": "features.stories.forest.events.screaming_copse.sword_in_an_old_bonfire",
+    "ScreamingCopseWildHerbsView": "features.stories.forest.events.screaming_copse.wild_herbs",
+    "ChorusOfTheWindView": "features.stories.forest.events.whispering_woods.chorus_of_the_wind",
+    "ColorfulMushroomsView": "features.stories.forest.events.whispering_woods.colorful_mushrooms",
+    "WhisperingWoodsFishingPondView": "features.stories.forest.events.whispering_woods.fishing_pond",
+    "FormInTheFogView": "features.stories.forest.events.whispering_woods.form_in_the_fog",
+    "OmenOfDisasterView": "features.stories.forest.events.whispering_woods.omen_of_disaster",
+    "PetrifyingPlantView": "features.stories.forest.events.whispering_woods.petrifying_plant",
+    "RiddleBirdView": "features.stories.forest.events.whispering_woods.riddle_bird",
+    "TheSoundView": "features.stories.forest.events.whispering_woods.the_sound",
+    "UnnamedGraveView": "features.stories.forest.events.whispering_woods.unnamed_grave",
+    "WhisperingWoodsWildHerbsView": "features.stories.forest.events.whispering_woods.wild_herbs",
+    "WitchOfTheWoodsView": "features.stories.forest.events.whispering_woods.witch_of_the_woods",
+    "MysteriousMerchantView": "features.stories.forest.merchant.mysterious_merchant",
+    "QuietGroveTreasureRoomView": "features.stories.forest.treasure.quiet_grove_treasure",
+    "ScreamingCopseTreasureRoomView": "features.stories.forest.treasure.screaming_copse_treasure",
+    "WhisperingWoodsTreasureRoomView": "features.stories.forest.treasure.whispering_woods_treasure"
+})
 
 # -----------------------------------------------------------------------------
 # FOREST DEFEAT VIEW
@@ -375,17 +445,17 @@ class StartButton(discord.ui.Button):
 
             await interaction.response.edit_message(embed=initial_info, view=qg_entrance_view, content=None)
         elif starting_section == ForestSection.WhisperingWoods:
-            ww_entrance_view: WhisperingWoodsIntroView = WhisperingWoodsIntroView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            ww_entrance_view: WhisperingWoodsIntroView = ROOM_VIEWS.get("WhisperingWoodsIntroView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: Embed = ww_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=ww_entrance_view, content=None)
         elif starting_section == ForestSection.ScreamingCopse:
-            sc_entrance_view: ScreamingCopseIntroView = ScreamingCopseIntroView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            sc_entrance_view: ScreamingCopseIntroView = ROOM_VIEWS.get("ScreamingCopseIntroView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: Embed = sc_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=sc_entrance_view, content=None)
         elif starting_section == ForestSection.FinalBoss:
-            final_boss_entrance_view = BriarWallDuelView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            final_boss_entrance_view = ROOM_VIEWS.get("BriarWallDuelView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: discord.Embed = final_boss_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=final_boss_entrance_view, content=None)
@@ -479,7 +549,7 @@ class ForestStory():
 
     @staticmethod
     def generate_shopkeep_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
-        return MysteriousMerchantView(bot, database, guild_id, users, dungeon_run)
+        return ROOM_VIEWS.get("MysteriousMerchantView")(bot, database, guild_id, users, dungeon_run)
 
     @staticmethod
     def generate_rest_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
@@ -488,140 +558,140 @@ class ForestStory():
     @staticmethod
     def generate_treasure_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
         if dungeon_run.section == ForestSection.ScreamingCopse:
-            return ScreamingCopseTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("ScreamingCopseTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
         elif dungeon_run.section == ForestSection.WhisperingWoods:
-            return WhisperingWoodsTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("WhisperingWoodsTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
         else:
-            return QuietGroveTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("QuietGroveTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
 
     @staticmethod
     def generate_combat_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun) -> Tuple[discord.ui.View, int]:
         if dungeon_run.section == ForestSection.QuietGrove:
             rand_val: int = random.choice([i for i in range(0, 9) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return BrigandMysticDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BrigandMysticDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return BearDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BearDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return EvokerBrigandThiefDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("EvokerBrigandThiefDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return EvokerMysticDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("EvokerMysticDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return GiantSnakeDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GiantSnakeDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return ThiefMarauderDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ThiefMarauderDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return TimberwolvesDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TimberwolvesDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 7:
-                return TripleSnakeDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TripleSnakeDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WildBoarDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WildBoarDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
         elif dungeon_run.section == ForestSection.WhisperingWoods:
             rand_val: int = random.choice([i for i in range(0, 10) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return ArmoredCentipedeDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ArmoredCentipedeDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return BladedancerStormcallerDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BladedancerStormcallerDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return DireWolvesDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DireWolvesDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return DoubleShadowsneakDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DoubleShadowsneakDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return IronboundBladedancerDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("IronboundBladedancerDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return LifestitcherIronboundDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("LifestitcherIronboundDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return LifestitcherShadowsneakDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("LifestitcherShadowsneakDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 7:
-                return MadKnightsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MadKnightsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 8:
-                return TreantsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TreantsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return TripleStormcallerDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TripleStormcallerDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
         else:
             rand_val: int = random.choice([i for i in range(0, 5) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return HorrifyingBoneAmalgamDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("HorrifyingBoneAmalgamDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return StarvingDireWolvesDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("StarvingDireWolvesDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return UndeadTreantsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("UndeadTreantsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return VoidburntTreantDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("VoidburntTreantDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WailingBonesDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WailingBonesDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
 
     @staticmethod
     def generate_event_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun) -> Tuple[discord.ui.View, int]:
         if dungeon_run.section == ForestSection.QuietGrove:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return AestivalLightView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("AestivalLightView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return CampOfFoolsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("CampOfFoolsView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return QuietGroveFishingPondView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("QuietGroveFishingPondView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return JackalopeView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("JackalopeView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return ThePathIsLostView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ThePathIsLostView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return WanderingCookView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WanderingCookView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return QuietGroveWildHerbsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("QuietGroveWildHerbsView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WildlifeGatheringView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WildlifeGatheringView")(bot, database, guild_id, users, dungeon_run), rand_val
         elif dungeon_run.section == ForestSection.WhisperingWoods:
             rand_val: int = random.choice([i for i in range(0, 11) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return ChorusOfTheWindView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ChorusOfTheWindView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return ColorfulMushroomsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ColorfulMushroomsView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return WhisperingWoodsFishingPondView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WhisperingWoodsFishingPondView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return FormInTheFogView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("FormInTheFogView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return OmenOfDisasterView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("OmenOfDisasterView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return PetrifyingPlantView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("PetrifyingPlantView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return RiddleBirdView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("RiddleBirdView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 7:
-                return TheSoundView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TheSoundView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 8:
-                return UnnamedGraveView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("UnnamedGraveView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 9:
-                return WhisperingWoodsWildHerbsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WhisperingWoodsWildHerbsView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WitchOfTheWoodsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WitchOfTheWoodsView")(bot, database, guild_id, users, dungeon_run), rand_val
         else:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return ANearbyRoarView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ANearbyRoarView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return DangerousUndergrowthView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DangerousUndergrowthView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return DarkBetweenTheStarsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DarkBetweenTheStarsView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return ScreamingCopseFishingPondView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ScreamingCopseFishingPondView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return HallucinatorySmokeView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("HallucinatorySmokeView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return StagnantWaterView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("StagnantWaterView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return SwordInAnOldBonfireView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("SwordInAnOldBonfireView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return ScreamingCopseWildHerbsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ScreamingCopseWildHerbsView")(bot, database, guild_id, users, dungeon_run), rand_val
 
     @staticmethod
     def generate_boss_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
         if dungeon_run.section == ForestSection.QuietGrove:
-            return BridgeGolemDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("BridgeGolemDuelView")(bot, database, guild_id, users, dungeon_run)
         elif dungeon_run.section == ForestSection.WhisperingWoods:
-            return FleeingTreantDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("FleeingTreantDuelView")(bot, database, guild_id, users, dungeon_run)
         else:
-            return BriarWallDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("BriarWallDuelView")(bot, database, guild_id, users, dungeon_run)
 
     def __getstate__(self):
         return self.__dict__
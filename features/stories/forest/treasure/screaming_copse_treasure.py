@@ -7,7 +7,8 @@ from bot import BenjaminBowtieBot
 from discord.embeds import Embed
 from features.player import Player
 from features.shared.enums import ClassTag
-from features.shared.item import LOADED_ITEMS, ItemKey, Rarity
+from features.shared.item import LOADED_ITEMS, Rarity
+from features.shared.loot import LootTable, get_treasure_loot_table
 from features.stories.dungeon_run import DungeonRun
 from features.stories.forest_room_selection import ForestRoomSelectionView
 
@@ -55,17 +56,7 @@ class ScreamingCopseTreasureRoomView(discord.ui.View):
         self._min_level = 20
         self._max_level = 30
         self._valid_class_tags = [ClassTag.Equipment.Equipment, ClassTag.Valuable.Gemstone, ClassTag.Consumable.Potion]
-        self._possible_rewards: List[ItemKey] = []
-        for item_key in ItemKey:
-            item = LOADED_ITEMS.get_new_item(item_key)
-            if any(tag in item.get_class_tags() for tag in self._valid_class_tags):
-                if Rarity.Common < item.get_rarity() < Rarity.Cursed:
-                    if ClassTag.Equipment.Equipment in item.get_class_tags():
-                        if self._min_level <= item.get_level_requirement() <= self._max_level:
-                            self._possible_rewards.append(item_key)
-                    else:
-                        self._possible_rewards.append(item_key)
-        self._weights = [self._prob_map[LOADED_ITEMS.get_new_item(item_key).get_rarity()] for item_key in self._possible_rewards]
+        self._loot_table: LootTable = get_treasure_loot_table(self._prob_map, self._valid_class_tags, self._min_level, self._max_level)
 
         self._EXTRA_REWARD_LUCK_PROB = 0.01
 
@@ -84,7 +75,7 @@ class ScreamingCopseTreasureRoomView(discord.ui.View):
             total_luck = player.get_combined_attributes().luck
 
             get_additional_reward = random.random() < total_luck * self._EXTRA_REWARD_LUCK_PROB
-            rewards = random.choices(self._possible_rewards, k=2 if get_additional_reward else 1, weights=self._weights)
+            rewards = self._loot_table.roll_many(2 if get_additional_reward else 1)
             
             for reward_key in rewards:
                 item = LOADED_ITEMS.get_new_item(reward_key)
@@ -9,58 +9,115 @@ from discord.embeds import Embed
 from features.player import Player
 from features.shared.constants import OCEAN_ROOMS
 from features.shared.enums import CompanionKey, OceanSection
+from features.shared.lazy_import import LazyClassRegistry
 from features.stories.dungeon_run import DungeonRun
 
-from features.stories.ocean.combat.abyssal_plain.ancient_kraken_duel import AncientKrakenDuelView
-from features.stories.ocean.combat.abyssal_plain.faceless_husks_duel import FacelessHusksDuelView
-from features.stories.ocean.combat.abyssal_plain.fish_maybe_duel import FishMaybeDuelView
-from features.stories.ocean.combat.abyssal_plain.lurking_isopod_duel import LurkingIsopodDuelView
-from features.stories.ocean.combat.abyssal_plain.mysterious_tentacle_duel import MysteriousTentacleDuelView
-from features.stories.ocean.combat.abyssal_plain.sandwyrm_duel import SandwyrmDuelView
-from features.stories.ocean.combat.abyssal_plain.voidseen_angler_duel import VoidseenAnglerDuelView
-from features.stories.ocean.combat.abyssal_plain.wriggling_mass_duel import WrigglingMassDuelView
-from features.stories.ocean.combat.coral_forest.banded_eel_duel import BandedEelDuelView
-from features.stories.ocean.combat.coral_forest.bloodcoral_behemoth_duel import AbyssalPlainIntroView, BloodcoralBehemothDuelView
-from features.stories.ocean.combat.coral_forest.grand_lionfish_duel import GrandLionfishDuelView
-from features.stories.ocean.combat.coral_forest.rockfish_duel import RockfishDuelView
-from features.stories.ocean.combat.coral_forest.sand_lurker_duel import SandLurkerDuelView
-from features.stories.ocean.combat.coral_forest.sea_dragons_duel import SeaDragonsDuelView
-from features.stories.ocean.combat.coral_forest.wandering_bloodcoral_duel import WanderingBloodcoralDuelView
-from features.stories.ocean.combat.tidewater_shallows.brittle_star_duel import BrittleStarDuelView
-from features.stories.ocean.combat.tidewater_shallows.giant_cone_snail_duel import GiantConeSnailDuelView
-
-from features.stories.ocean.combat.tidewater_shallows.jellyfish_swarm_duel import CoralForestIntroView, JellyfishSwarmDuelView
-from features.stories.ocean.combat.tidewater_shallows.lesser_kraken_duel import LesserKrakenDuelView
-from features.stories.ocean.combat.tidewater_shallows.mesmerfish_swarm_duel import MesmerfishSwarmDuelView
-from features.stories.ocean.combat.tidewater_shallows.shallows_shark_duel import ShallowsSharkDuelView
-from features.stories.ocean.combat.tidewater_shallows.stranglekelp_forest_duel import StranglekelpForestDuelView
-from features.stories.ocean.combat.tidewater_shallows.stranglekelp_host_duel import StranglekelpHostDuelView
-from features.stories.ocean.combat.tidewater_shallows.titanfish_duel import TitanfishDuelView
-from features.stories.ocean.events.abyssal_plain.hydrothermal_vents import HydrothermalVentsView
-from features.stories.ocean.events.abyssal_plain.sandstorm import SandstormView
-from features.stories.ocean.events.abyssal_plain.strange_effigy import StrangeEffigyView
-from features.stories.ocean.events.abyssal_plain.underwater_whirlpool import UnderwaterWhirlpoolView
-from features.stories.ocean.events.coral_forest.bloodcoral_polyps import BloodcoralPolypsView
-from features.stories.ocean.events.coral_forest.coral_grove import CoralForestCoralGroveView
-from features.stories.ocean.events.coral_forest.glowing_coral import GlowingCoralView
-from features.stories.ocean.events.coral_forest.school_of_fish import CoralForestSchoolOfFishView
-from features.stories.ocean.events.coral_forest.the_hook import TheHookView
-from features.stories.ocean.events.coral_forest.voice_of_the_sea import VoiceOfTheSeaView
-from features.stories.ocean.events.tidewater_shallows.a_curious_crab import ACuriousCrabView
-from features.stories.ocean.events.tidewater_shallows.ancient_shipwreck import AncientShipwreckView
-from features.stories.ocean.events.tidewater_shallows.coral_grove import TidewaterShallowsCoralGroveView
-from features.stories.ocean.events.tidewater_shallows.dangerous_current import DangerousCurrentView
-from features.stories.ocean.events.tidewater_shallows.giant_clams import GiantClamsView
-from features.stories.ocean.events.tidewater_shallows.school_of_fish import TidewaterShallowsSchoolOfFishView
-from features.stories.ocean.events.tidewater_shallows.wayward_conch import WaywardConchView
-from features.stories.ocean.merchant.mysterious_merchant import MysteriousMerchantView
-from features.stories.ocean.treasure.abyssal_plain_treasure import AbyssalPlainTreasureRoomView
-from features.stories.ocean.treasure.coral_forest_treasure import CoralForestTreasureRoomView
-from features.stories.ocean.treasure.tidewater_shallows_treasure import TidewaterShallowsTreasureRoomView
+
 from features.stories.ocean_room_selection import OceanRoomSelectionView
 from features.stories.story import Story
 
-from typing import List, Set, Tuple
+from typing import TYPE_CHECKING, List, Set, Tuple
+if TYPE_CHECKING:
+    from features.stories.ocean.combat.abyssal_plain.ancient_kraken_duel import AncientKrakenDuelView
+    from features.stories.ocean.combat.abyssal_plain.faceless_husks_duel import FacelessHusksDuelView
+    from features.stories.ocean.combat.abyssal_plain.fish_maybe_duel import FishMaybeDuelView
+    from features.stories.ocean.combat.abyssal_plain.lurking_isopod_duel import LurkingIsopodDuelView
+    from features.stories.ocean.combat.abyssal_plain.mysterious_tentacle_duel import MysteriousTentacleDuelView
+    from features.stories.ocean.combat.abyssal_plain.sandwyrm_duel import SandwyrmDuelView
+    from features.stories.ocean.combat.abyssal_plain.voidseen_angler_duel import VoidseenAnglerDuelView
+    from features.stories.ocean.combat.abyssal_plain.wriggling_mass_duel import WrigglingMassDuelView
+    from features.stories.ocean.combat.coral_forest.banded_eel_duel import BandedEelDuelView
+    from features.stories.ocean.combat.coral_forest.bloodcoral_behemoth_duel import AbyssalPlainIntroView, BloodcoralBehemothDuelView
+    from features.stories.ocean.combat.coral_forest.grand_lionfish_duel import GrandLionfishDuelView
+    from features.stories.ocean.combat.coral_forest.rockfish_duel import RockfishDuelView
+    from features.stories.ocean.combat.coral_forest.sand_lurker_duel import SandLurkerDuelView
+    from features.stories.ocean.combat.coral_forest.sea_dragons_duel import SeaDragonsDuelView
+    from features.stories.ocean.combat.coral_forest.wandering_bloodcoral_duel import WanderingBloodcoralDuelView
+    from features.stories.ocean.combat.tidewater_shallows.brittle_star_duel import BrittleStarDuelView
+    from features.stories.ocean.combat.tidewater_shallows.giant_cone_snail_duel import GiantConeSnailDuelView
+    from features.stories.ocean.combat.tidewater_shallows.jellyfish_swarm_duel import CoralForestIntroView, JellyfishSwarmDuelView
+    from features.stories.ocean.combat.tidewater_shallows.lesser_kraken_duel import LesserKrakenDuelView
+    from features.stories.ocean.combat.tidewater_shallows.mesmerfish_swarm_duel import MesmerfishSwarmDuelView
+    from features.stories.ocean.combat.tidewater_shallows.shallows_shark_duel import ShallowsSharkDuelView
+    from features.stories.ocean.combat.tidewater_shallows.stranglekelp_forest_duel import StranglekelpForestDuelView
+    from features.stories.ocean.combat.tidewater_shallows.stranglekelp_host_duel import StranglekelpHostDuelView
+    from features.stories.ocean.combat.tidewater_shallows.titanfish_duel import TitanfishDuelView
+    from features.stories.ocean.events.abyssal_plain.hydrothermal_vents import HydrothermalVentsView
+    from features.stories.ocean.events.abyssal_plain.sandstorm import SandstormView
+    from features.stories.ocean.events.abyssal_plain.strange_effigy import StrangeEffigyView
+    from features.stories.ocean.events.abyssal_plain.underwater_whirlpool import UnderwaterWhirlpoolView
+    from features.stories.ocean.events.coral_forest.bloodcoral_polyps import BloodcoralPolypsView
+    from features.stories.ocean.events.coral_forest.coral_grove import CoralForestCoralGroveView
+    from features.stories.ocean.events.coral_forest.glowing_coral import GlowingCoralView
+    from features.stories.ocean.events.coral_forest.school_of_fish import CoralForestSchoolOfFishView
+    from features.stories.ocean.events.coral_forest.the_hook import TheHookView
+    from features.stories.ocean.events.coral_forest.voice_of_the_sea import VoiceOfTheSeaView
+    from features.stories.ocean.events.tidewater_shallows.a_curious_crab import ACuriousCrabView
+    from features.stories.ocean.events.tidewater_shallows.ancient_shipwreck import AncientShipwreckView
+    from features.stories.ocean.events.tidewater_shallows.coral_grove import TidewaterShallowsCoralGroveView
+    from features.stories.ocean.events.tidewater_shallows.dangerous_current import DangerousCurrentView
+    from features.stories.ocean.events.tidewater_shallows.giant_clams import GiantClamsView
+    from features.stories.ocean.events.tidewater_shallows.school_of_fish import TidewaterShallowsSchoolOfFishView
+    from features.stories.ocean.events.tidewater_shallows.wayward_conch import WaywardConchView
+    from features.stories.ocean.merchant.mysterious_merchant import MysteriousMerchantView
+    from features.stories.ocean.treasure.abyssal_plain_treasure import AbyssalPlainTreasureRoomView
+    from features.stories.ocean.treasure.coral_forest_treasure import CoralForestTreasureRoomView
+    from features.stories.ocean.treasure.tidewater_shallows_treasure import TidewaterShallowsTreasureRoomView
+
+# -----------------------------------------------------------------------------
+# ROOM VIEWS
+# -----------------------------------------------------------------------------
+
+# Imported the first time a party reaches them; see LazyClassRegistry
+ROOM_VIEWS = LazyClassRegistry({
+    "AncientKrakenDuelView": "features.stories.ocean.combat.abyssal_plain.ancient_kraken_duel",
+    "FacelessHusksDuelView": "features.stories.ocean.combat.abyssal_plain.faceless_husks_duel",
+    "FishMaybeDuelView": "features.stories.ocean.combat.abyssal_plain.fish_maybe_duel",
+    "LurkingIsopodDuelView": "features.stories.ocean.combat.abyssal_plain.lurking_isopod_duel",
+    "MysteriousTentacleDuelView": "features.stories.ocean.combat.abyssal_plain.mysterious_tentacle_duel",
+    "SandwyrmDuelView": "features.stories.ocean.combat.abyssal_plain.sandwyrm_duel",
+    "VoidseenAnglerDuelView": "features.stories.ocean.combat.abyssal_plain.voidseen_angler_duel",
+    "WrigglingMassDuelView": "features.stories.ocean.combat.abyssal_plain.wriggling_mass_duel",
+    "BandedEelDuelView": "features.stories.ocean.combat.coral_forest.banded_eel_duel",
+    "AbyssalPlainIntroView": "features.stories.ocean.combat.coral_forest.bloodcoral_behemoth_duel",
+    "BloodcoralBehemothDuelView": "features.stories.ocean.combat.coral_forest.bloodcoral_behemoth_duel",
+    "GrandLionfishDuelView": "features.stories.ocean.combat.coral_forest.grand_lionfish_duel",
+    "RockfishDuelView": "features.stories.ocean.combat.coral_forest.rockfish_duel",
+    "SandLurkerDuelView": "features.stories.ocean.combat.coral_forest.sand_lurker_duel",
+    "SeaDragonsDuelView": "features.stories.ocean.combat.coral_forest.sea_dragons_duel",
+    "WanderingBloodcoralDuelView": "features.stories.ocean.combat.coral_forest.wandering_bloodcoral_duel",
+    "BrittleStarDuelView": "features.stories.ocean.combat.tidewater_shallows.brittle_star_duel",
+    "GiantConeSnailDuelView": "features.stories.ocean.combat.tidewater_shallows.giant_cone_snail_duel",
+    "CoralForestIntroView": "features.stories.ocean.combat.tidewater_shallows.jellyfish_swarm_duel",
+    "JellyfishSwarmDuelView": "features.stories.ocean.combat.tidewater_shallows.jellyfish_swarm_duel",
+    "LesserKrakenDuelView": "features.stories.ocean.combat.tidewater_shallows.lesser_kraken_duel",
+    "MesmerfishSwarmDuelView": "features.stories.ocean.combat.tidewater_shallows.mesmerfish_swarm_duel",
+    "ShallowsSharkDuelView": "features.stories.ocean.combat.tidewater_shallows.shallows_shark_duel",
+    "StranglekelpForestDuelView": "features.stories.ocean.combat.tidewater_shallows.stranglekelp_forest_duel",
+    "StranglekelpHostDuelView": "features.stories.ocean.combat.tidewater_shallows.stranglekelp_host_duel",
+    "TitanfishDuelView": "features.stories.ocean.combat.tidewater_shallows.titanfish_duel",
+    "HydrothermalVentsView": "features.stories.ocean.events.abyssal_plain.hydrothermal_vents",
+    "SandstormView": "features.stories.ocean.events.abyssal_plain.sandstorm",
+    "StrangeEffigyView": "features.stories.ocean.events.abyssal_plain.strange_effigy",
+    "UnderwaterWhirlpoolView": "features.stories.ocean.events.abyssal_plain.underwater_whirlpool",
+    "BloodcoralPolypsView": "features.stories.ocean.events.coral_forest.bloodcoral_polyps",
+    "CoralForestCoralGroveView": "features.stories.ocean.events.coral_forest.coral_grove",
+    "GlowingCoralView": "features.stories.ocean.events.coral_forest.glowing_coral",
+    "CoralForestSchoolOfFishView": "features.stories.ocean.events.coral_forest.school_of_fish",
+    "TheHookView": "features.stories.ocean.events.coral_forest.the_hook",
+    "VoiceOfTheSeaView": "features.stories.ocean.events.coral_forest.voice_of_the_sea",
+    "ACuriousCrabView": "features.stories.ocean.events.tidewater_shallows.a_curious_crab",
+    "AncientShipwreckView": "features.stories.ocean.events.tidewater_shallows.ancient_shipwreck",
+    "TidewaterShallowsCoralGroveView": "features.stories.ocean.events.tidewater_shallows.coral_grove",
+    "DangerousCurrentView": "features.stories.ocean.events.tidewater_shallows.dangerous_current",
+    "GiantClamsView": "features.stories.ocean.events.tidewater_shallows.giant_clams",
+    "TidewaterShallowsSchoolOfFishView": "features.stories.ocean.events.tidewater_shallows.school_of_fish",
+    "WaywardConchView": "features.stories.ocean.events.tidewater_shallows.wayward_conch",
+    "MysteriousMerchantView": "features.stories.ocean.merchant.mysterious_merchant",
+    "AbyssalPlainTreasureRoomView": "features.stories.ocean.treasure.abyssal_plain_treasure",
+    "CoralForestTreasureRoomView": "features.stories.ocean.treasure.coral_forest_treasure",
+    "TidewaterShallowsTreasureRoomView": "features.stories.ocean.treasure.tidewater_shallows_treasure"
+})
 
 # -----------------------------------------------------------------------------
 # OCEAN DEFEAT VIEW
@@ -362,17 +419,17 @@ class StartButton(discord.ui.Button):
 
             await interaction.response.edit_message(embed=initial_info, view=ts_entrance_view, content=None)
         elif starting_section == OceanSection.CoralForest:
-            cf_entrance_view: CoralForestIntroView = CoralForestIntroView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            cf_entrance_view: CoralForestIntroView = ROOM_VIEWS.get("CoralForestIntroView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: Embed = cf_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=cf_entrance_view, content=None)
         elif starting_section == OceanSection.AbyssalPlain:
-            ap_entrance_view: AbyssalPlainIntroView = AbyssalPlainIntroView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            ap_entrance_view: AbyssalPlainIntroView = ROOM_VIEWS.get("AbyssalPlainIntroView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: Embed = ap_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=ap_entrance_view, content=None)
         elif starting_section == OceanSection.FinalBoss:
-            final_boss_entrance_view = SandwyrmDuelView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            final_boss_entrance_view = ROOM_VIEWS.get("SandwyrmDuelView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: discord.Embed = final_boss_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=final_boss_entrance_view, content=None)
@@ -466,7 +523,7 @@ class OceanStory():
 
     @staticmethod
     def generate_shopkeep_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
-        return MysteriousMerchantView(bot, database, guild_id, users, dungeon_run)
+        return ROOM_VIEWS.get("MysteriousMerchantView")(bot, database, guild_id, users, dungeon_run)
 
     @staticmethod
     def generate_rest_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
@@ -475,114 +532,114 @@ class OceanStory():
     @staticmethod
     def generate_treasure_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
         if dungeon_run.section == OceanSection.AbyssalPlain:
-            return AbyssalPlainTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("AbyssalPlainTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
         elif dungeon_run.section == OceanSection.CoralForest:
-            return CoralForestTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("CoralForestTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
         else:
-            return TidewaterShallowsTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("TidewaterShallowsTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
 
     @staticmethod
     def generate_combat_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun) -> Tuple[discord.ui.View, int]:
         if dungeon_run.section == OceanSection.TidewaterShallows:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return BrittleStarDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BrittleStarDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return GiantConeSnailDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GiantConeSnailDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return LesserKrakenDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("LesserKrakenDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return MesmerfishSwarmDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MesmerfishSwarmDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return ShallowsSharkDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ShallowsSharkDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return StranglekelpForestDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("StranglekelpForestDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return StranglekelpHostDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("StranglekelpHostDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return TitanfishDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TitanfishDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
         elif dungeon_run.section == OceanSection.CoralForest:
             rand_val: int = random.choice([i for i in range(0, 6) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return BandedEelDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BandedEelDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return GrandLionfishDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GrandLionfishDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return RockfishDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("RockfishDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return SandLurkerDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("SandLurkerDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return SeaDragonsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("SeaDragonsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WanderingBloodcoralDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WanderingBloodcoralDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
         else:
             rand_val: int = random.choice([i for i in range(0, 7) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return AncientKrakenDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("AncientKrakenDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return FacelessHusksDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("FacelessHusksDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return FishMaybeDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("FishMaybeDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return LurkingIsopodDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("LurkingIsopodDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return MysteriousTentacleDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MysteriousTentacleDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return VoidseenAnglerDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("VoidseenAnglerDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WrigglingMassDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WrigglingMassDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
 
     @staticmethod
     def generate_event_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun) -> Tuple[discord.ui.View, int]:
         if dungeon_run.section == OceanSection.TidewaterShallows:
             rand_val: int = random.choice([i for i in range(0, 7) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return AncientShipwreckView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("AncientShipwreckView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return TidewaterShallowsCoralGroveView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TidewaterShallowsCoralGroveView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return DangerousCurrentView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DangerousCurrentView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return GiantClamsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GiantClamsView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return TidewaterShallowsSchoolOfFishView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TidewaterShallowsSchoolOfFishView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return WaywardConchView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WaywardConchView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return ACuriousCrabView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ACuriousCrabView")(bot, database, guild_id, users, dungeon_run), rand_val
         elif dungeon_run.section == OceanSection.CoralForest:
             rand_val: int = random.choice([i for i in range(0, 6) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return BloodcoralPolypsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BloodcoralPolypsView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return CoralForestCoralGroveView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("CoralForestCoralGroveView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return GlowingCoralView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GlowingCoralView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return CoralForestSchoolOfFishView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("CoralForestSchoolOfFishView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return TheHookView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TheHookView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return VoiceOfTheSeaView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("VoiceOfTheSeaView")(bot, database, guild_id, users, dungeon_run), rand_val
         else:
             rand_val: int = random.choice([i for i in range(0, 4) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return HydrothermalVentsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("HydrothermalVentsView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return SandstormView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("SandstormView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return StrangeEffigyView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("StrangeEffigyView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return UnderwaterWhirlpoolView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("UnderwaterWhirlpoolView")(bot, database, guild_id, users, dungeon_run), rand_val
 
     @staticmethod
     def generate_boss_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
         if dungeon_run.section == OceanSection.TidewaterShallows:
-            return JellyfishSwarmDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("JellyfishSwarmDuelView")(bot, database, guild_id, users, dungeon_run)
         elif dungeon_run.section == OceanSection.CoralForest:
-            return BloodcoralBehemothDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("BloodcoralBehemothDuelView")(bot, database, guild_id, users, dungeon_run)
         else:
-            return SandwyrmDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("SandwyrmDuelView")(bot, database, guild_id, users, dungeon_run)
 
     def __getstate__(self):
         return self.__dict__
@@ -10,68 +10,134 @@ from discord.ext import commands
 from features.shared.constants import UNDERWORLD_ROOMS
 from features.shared.enums import CompanionKey, UnderworldSection
 from features.shared.item import LOADED_ITEMS, ItemKey
+from features.shared.lazy_import import LazyClassRegistry
+from features.shared.loot import WISHING_WELL_GEMSTONE_LOOT_TABLE
 from features.stories.dungeon_run import DungeonRun
 from features.stories.story import Story
-from features.stories.underworld.combat.fungal_caverns.agaric_alchemists_duel import AgaricAlchemistsDuelView
-from features.stories.underworld.combat.fungal_caverns.blind_salamander_duel import BlindSalamanderDuelView
-from features.stories.underworld.combat.fungal_caverns.chanterspell_duel import ChanterspellDuelView
-from features.stories.underworld.combat.fungal_caverns.deathless_caps_duel import DeathlessCapsDuelView
-from features.stories.underworld.combat.fungal_caverns.glowing_moss_duel import GlowingMossDuelView
-from features.stories.underworld.combat.fungal_caverns.hen_of_the_caverns_duel import HenOfTheCavernsDuelView
-from features.stories.underworld.combat.fungal_caverns.malevolent_morel_duel import MalevolentMorelDuelView
-from features.stories.underworld.combat.fungal_caverns.mushroom_maze_duel import MushroomMazeDuelView, TombsIngressIntroView
-from features.stories.underworld.combat.fungal_caverns.mycelium_tree_duel import MyceliumTreeDuelView
-from features.stories.underworld.combat.misty_tunnels.breath_of_darkness_duel import BreathOfDarknessDuelView
-from features.stories.underworld.combat.misty_tunnels.choking_fog_duel import ChokingFogDuelView
-from features.stories.underworld.combat.misty_tunnels.ichordrink_bats_duel import IchordrinkBatsDuelView
-from features.stories.underworld.combat.misty_tunnels.misty_apparition_duel import MistyApparitionDuelView
-from features.stories.underworld.combat.misty_tunnels.pale_widows_duel import PaleWidowDuelView
-from features.stories.underworld.combat.misty_tunnels.scuttledark_scorpion_duel import ScuttledarkScorpionDuelView
-from features.stories.underworld.combat.misty_tunnels.stonewalker_duel import StonewalkerDuelView
-from features.stories.underworld.combat.misty_tunnels.tunneldigger_duel import FungalCavernsIntroView, TunneldiggerDuelView
-from features.stories.underworld.combat.misty_tunnels.winding_tunnels_duel import WindingTunnelsDuelView
-from features.stories.underworld.combat.tombs_ingress.cultists_of_avarice_duel import CultistsOfAvariceDuelView
-from features.stories.underworld.combat.tombs_ingress.eyeless_echoes_duel import EyelessEchoesDuelView
-from features.stories.underworld.combat.tombs_ingress.molten_gold_duel import MoltenGoldDuelView
-from features.stories.underworld.combat.tombs_ingress.quaking_tunnels import QuakingTunnelsDuelView
-from features.stories.underworld.combat.tombs_ingress.scratches_on_the_wall_duel import ScratchesOnTheWallDuelView
-from features.stories.underworld.combat.tombs_ingress.timelost_echo_duel import TimelostEchoDuelView
-from features.stories.underworld.combat.tombs_ingress.tomb_guardians_duel import TombGuardiansDuelView
-from features.stories.underworld.combat.tombs_ingress.warping_anomaly_duel import WarpingAnomalyDuelView
-from features.stories.underworld.combat.tombs_ingress.waylaid_chest_duel import WaylaidChestDuelView
-from features.stories.underworld.events.fungal_caverns.crimson_rot import CrimsonRotView
-from features.stories.underworld.events.fungal_caverns.deep_hole import DeepHoleView
-from features.stories.underworld.events.fungal_caverns.dense_clusters import DenseClustersView
-from features.stories.underworld.events.fungal_caverns.grand_mushroom_staff import GrandMushroomStaffView
-from features.stories.underworld.events.fungal_caverns.mushroom_grove import MushroomGroveView
-from features.stories.underworld.events.fungal_caverns.ore_vein import FungalCavernsOreVeinView
-from features.stories.underworld.events.fungal_caverns.purple_cloud import PurpleCloudView
-from features.stories.underworld.events.fungal_caverns.underground_lake import FungalCavernsUndergroundLakeView
-from features.stories.underworld.events.misty_tunnels.crack_in_the_wall import CrackInTheWallView
-from features.stories.underworld.events.misty_tunnels.dead_spelunker import DeadSpelunkerView
-from features.stories.underworld.events.misty_tunnels.form_in_the_fog import FormInTheFogView
-from features.stories.underworld.events.misty_tunnels.ore_vein import MistyTunnelsOreVeinView
-from features.stories.underworld.events.misty_tunnels.spider_nest import SpiderNestView
-from features.stories.underworld.events.misty_tunnels.torches_go_out import TorchesGoOutView
-from features.stories.underworld.events.misty_tunnels.underground_lake import MistyTunnelsUndergroundLakeView
-from features.stories.underworld.events.tombs_ingress.arcane_traps import ArcaneTrapsView
-from features.stories.underworld.events.tombs_ingress.echo_of_knowledge import EchoOfKnowledgeView
-from features.stories.underworld.events.tombs_ingress.golden_idol import GoldenIdolView
-from features.stories.underworld.events.tombs_ingress.heavy_stone_door import HeavyStoneDoorView
-from features.stories.underworld.events.tombs_ingress.old_notes import OldNotesView
-from features.stories.underworld.events.tombs_ingress.ore_vein import TombsIngressOreVeinView
-from features.stories.underworld.events.tombs_ingress.supply_room import SupplyRoomView
-from features.stories.underworld.events.tombs_ingress.underground_lake import TombsIngressUndergroundLakeView
-from features.stories.underworld.merchant.mysterious_merchant import MysteriousMerchantView
-from features.stories.underworld.treasure.fungal_caverns_treasure import FungalCavernsTreasureRoomView
-from features.stories.underworld.treasure.misty_tunnels_treasure import MistyTunnelsTreasureRoomView
-from features.stories.underworld.treasure.tombs_ingress_treasure import TombsIngressTreasureRoomView
 from features.stories.underworld_room_selection import UnderworldRoomSelectionView
 
 from typing import List, TYPE_CHECKING, Set, Tuple
 if TYPE_CHECKING:
     from features.player import Player
     from features.stats import Stats
+    from features.stories.underworld.combat.fungal_caverns.agaric_alchemists_duel import AgaricAlchemistsDuelView
+    from features.stories.underworld.combat.fungal_caverns.blind_salamander_duel import BlindSalamanderDuelView
+    from features.stories.underworld.combat.fungal_caverns.chanterspell_duel import ChanterspellDuelView
+    from features.stories.underworld.combat.fungal_caverns.deathless_caps_duel import DeathlessCapsDuelView
+    from features.stories.underworld.combat.fungal_caverns.glowing_moss_duel import GlowingMossDuelView
+    from features.stories.underworld.combat.fungal_caverns.hen_of_the_caverns_duel import HenOfTheCavernsDuelView
+    from features.stories.underworld.combat.fungal_caverns.malevolent_morel_duel import MalevolentMorelDuelView
+    from features.stories.underworld.combat.fungal_caverns.mushroom_maze_duel import MushroomMazeDuelView, TombsIngressIntroView
+    from features.stories.underworld.combat.fungal_caverns.mycelium_tree_duel import MyceliumTreeDuelView
+    from features.stories.underworld.combat.misty_tunnels.breath_of_darkness_duel import BreathOfDarknessDuelView
+    from features.stories.underworld.combat.misty_tunnels.choking_fog_duel import ChokingFogDuelView
+    from features.stories.underworld.combat.misty_tunnels.ichordrink_bats_duel import IchordrinkBatsDuelView
+    from features.stories.underworld.combat.misty_tunnels.misty_apparition_duel import MistyApparitionDuelView
+    from features.stories.underworld.combat.misty_tunnels.pale_widows_duel import PaleWidowDuelView
+    from features.stories.underworld.combat.misty_tunnels.scuttledark_scorpion_duel import ScuttledarkScorpionDuelView
+    from features.stories.underworld.combat.misty_tunnels.stonewalker_duel import StonewalkerDuelView
+    from features.stories.underworld.combat.misty_tunnels.tunneldigger_duel import FungalCavernsIntroView, TunneldiggerDuelView
+    from features.stories.underworld.combat.misty_tunnels.winding_tunnels_duel import WindingTunnelsDuelView
+    from features.stories.underworld.combat.tombs_ingress.cultists_of_avarice_duel import CultistsOfAvariceDuelView
+    from features.stories.underworld.combat.tombs_ingress.eyeless_echoes_duel import EyelessEchoesDuelView
+    from features.stories.underworld.combat.tombs_ingress.molten_gold_duel import MoltenGoldDuelView
+    from features.stories.underworld.combat.tombs_ingress.quaking_tunnels import QuakingTunnelsDuelView
+    from features.stories.underworld.combat.tombs_ingress.scratches_on_the_wall_duel import ScratchesOnTheWallDuelView
+    from features.stories.underworld.combat.tombs_ingress.timelost_echo_duel import TimelostEchoDuelView
+    from features.stories.underworld.combat.tombs_ingress.tomb_guardians_duel import TombGuardiansDuelView
+    from features.stories.underworld.combat.tombs_ingress.warping_anomaly_duel import WarpingAnomalyDuelView
+    from features.stories.underworld.combat.tombs_ingress.waylaid_chest_duel import WaylaidChestDuelView
+    from features.stories.underworld.events.fungal_caverns.crimson_rot import CrimsonRotView
+    from features.stories.underworld.events.fungal_caverns.deep_hole import DeepHoleView
+    from features.stories.underworld.events.fungal_caverns.dense_clusters import DenseClustersView
+    from features.stories.underworld.events.fungal_caverns.grand_mushroom_staff import GrandMushroomStaffView
+    from features.stories.underworld.events.fungal_caverns.mushroom_grove import MushroomGroveView
+    from features.stories.underworld.events.fungal_caverns.ore_vein import FungalCavernsOreVeinView
+    from features.stories.underworld.events.fungal_caverns.purple_cloud import PurpleCloudView
+    from features.stories.underworld.events.fungal_caverns.underground_lake import FungalCavernsUndergroundLakeView
+    from features.stories.underworld.events.misty_tunnels.crack_in_the_wall import CrackInTheWallView
+    from features.stories.underworld.events.misty_tunnels.dead_spelunker import DeadSpelunkerView
+    from features.stories.underworld.events.misty_tunnels.form_in_the_fog import FormInTheFogView
+    from features.stories.underworld.events.misty_tunnels.ore_vein import MistyTunnelsOreVeinView
+    from features.stories.underworld.events.misty_tunnels.spider_nest import SpiderNestView
+    from features.stories.underworld.events.misty_tunnels.torches_go_out import TorchesGoOutView
+    from features.stories.underworld.events.misty_tunnels.underground_lake import MistyTunnelsUndergroundLakeView
+    from features.stories.underworld.events.tombs_ingress.arcane_traps import ArcaneTrapsView
+    from features.stories.underworld.events.tombs_ingress.echo_of_knowledge import EchoOfKnowledgeView
+    from features.stories.underworld.events.tombs_ingress.golden_idol import GoldenIdolView
+    from features.stories.underworld.events.tombs_ingress.heavy_stone_door import HeavyStoneDoorView
+    from features.stories.underworld.events.tombs_ingress.old_notes import OldNotesView
+    from features.stories.underworld.events.tombs_ingress.ore_vein import TombsIngressOreVeinView
+    from features.stories.underworld.events.tombs_ingress.supply_room import SupplyRoomView
+    from features.stories.underworld.events.tombs_ingress.underground_lake import TombsIngressUndergroundLakeView
+    from features.stories.underworld.merchant.mysterious_merchant import MysteriousMerchantView
+    from features.stories.underworld.treasure.fungal_caverns_treasure import FungalCavernsTreasureRoomView
+    from features.stories.underworld.treasure.misty_tunnels_treasure import MistyTunnelsTreasureRoomView
+    from features.stories.underworld.treasure.tombs_ingress_treasure import TombsIngressTreasureRoomView
+
+# -----------------------------------------------------------------------------
+# ROOM VIEWS
+# -----------------------------------------------------------------------------
+
+# Imported the first time a party reaches them; see LazyClassRegistry
+ROOM_VIEWS = LazyClassRegistry({
+    "AgaricAlchemistsDuelView": "features.stories.underworld.combat.fungal_caverns.agaric_alchemists_duel",
+    "BlindSalamanderDuelView": "features.stories.underworld.combat.fungal_caverns.blind_salamander_duel",
+    "ChanterspellDuelView": "features.stories.underworld.combat.fungal_caverns.chanterspell_duel",
+    "DeathlessCapsDuelView": "features.stories.underworld.combat.fungal_caverns.deathless_caps_duel",
+    "GlowingMossDuelView": "features.stories.underworld.combat.fungal_caverns.glowing_moss_duel",
+    "HenOfTheCavernsDuelView": "features.stories.underworld.combat.fungal_caverns.hen_of_the_caverns_duel",
+    "MalevolentMorelDuelView": "features.stories.underworld.combat.fungal_caverns.malevolent_morel_duel",
+    "MushroomMazeDuelView": "features.stories.underworld.combat.fungal_caverns.mushroom_maze_duel",
+    "TombsIngressIntroView": "features.stories.underworld.combat.fungal_caverns.mushroom_maze_duel",
+    "MyceliumTreeDuelView": "features.stories.underworld.combat.fungal_caverns.mycelium_tree_duel",
+    "BreathOfDarknessDuelView": "features.stories.underworld.combat.misty_tunnels.breath_of_darkness_duel",
+    "ChokingFogDuelView": "features.stories.underworld.combat.misty_tunnels.choking_fog_duel",
+    "IchordrinkBatsDuelView": "features.stories.underworld.combat.misty_tunnels.ichordrink_bats_duel",
+    "MistyApparitionDuelView": "features.stories.underworld.combat.misty_tunnels.misty_apparition_duel",
+    "PaleWidowDuelView": "features.stories.underworld.combat.misty_tunnels.pale_widows_duel",
+    "ScuttledarkScorpionDuelView": "features.stories.underworld.combat.misty_tunnels.scuttledark_scorpion_duel",
+    "StonewalkerDuelView": "features.stories.underworld.combat.misty_tunnels.stonewalker_duel",
+    "FungalCavernsIntroView": "features.stories.underworld.combat.misty_tunnels.tunneldigger_duel",
+    "TunneldiggerDuelView": "features.stories.underworld.combat.misty_tunnels.tunneldigger_duel",
+    "WindingTunnelsDuelView": "features.stories.underworld.combat.misty_tunnels.winding_tunnels_duel",
+    "CultistsOfAvariceDuelView": "features.stories.underworld.combat.tombs_ingress.cultists_of_avarice_duel",
+    "EyelessEchoesDuelView": "features.stories.underworld.combat.tombs_ingress.eyeless_echoes_duel",
+    "MoltenGoldDuelView": "features.stories.underworld.combat.tombs_ingress.molten_gold_duel",
+    "QuakingTunnelsDuelView": "features.stories.underworld.combat.tombs_ingress.quaking_tunnels",
+    "ScratchesOnTheWallDuelView": "features.stories.underworld.combat.tombs_ingress.scratches_on_the_wall_duel",
+    "TimelostEchoDuelView": "features.stories.underworld.combat.tombs_ingress.timelost_echo_duel",
+    "TombGuardiansDuelView": "features.stories.underworld.combat.tombs_ingress.tomb_guardians_duel",
+    "WarpingAnomalyDuelView": "features.stories.underworld.combat.tombs_ingress.warping_anomaly_duel",
+    "WaylaidChestDuelView": "features.stories.underworld.combat.tombs_ingress.waylaid_chest_duel",
+    "CrimsonRotView": "features.stories.underworld.events.fungal_caverns.crimson_rot",
+    "DeepHoleView": "features.stories.underworld.events.fungal_caverns.deep_hole",
+    "DenseClustersView": "features.stories.underworld.events.fungal_caverns.dense_clusters",
+    "GrandMushroomStaffView": "features.stories.underworld.events.fungal_caverns.grand_mushroom_staff",
+    "MushroomGroveView": "features.stories.underworld.events.fungal_caverns.mushroom_grove",
+    "FungalCavernsOreVeinView": "features.stories.underworld.events.fungal_caverns.ore_vein",
+    "PurpleCloudView": "features.stories.underworld.events.fungal_caverns.purple_cloud",
+    "FungalCavernsUndergroundLakeView": "features.stories.underworld.events.fungal_caverns.underground_lake",
+    "CrackInTheWallView": "features.stories.underworld.events.misty_tunnels.crack_in_the_wall",
+    "DeadSpelunkerView": "features.stories.underworld.events.misty_tunnels.dead_spelunker",
+    "FormInTheFogView": "features.stories.underworld.events.misty_tunnels.form_in_the_fog",
+    "MistyTunnelsOreVeinView": "features.stories.underworld.events.misty_tunnels.ore_vein",
+    "SpiderNestView": "features.stories.underworld.events.misty_tunnels.spider_nest",
+    "TorchesGoOutView": "features.stories.underworld.events.misty_tunnels.torches_go_out",
+    "MistyTunnelsUndergroundLakeView": "features.stories.underworld.events.misty_tunnels.underground_lake",
+    "ArcaneTrapsView": "features.stories.underworld.events.tombs_ingress.arcane_traps",
+    "EchoOfKnowledgeView": "features.stories.underworld.events.tombs_ingress.echo_of_knowledge",
+    "GoldenIdolView": "features.stories.underworld.events.tombs_ingress.golden_idol",
+    "HeavyStoneDoorView": "features.stories.underworld.events.tombs_ingress.heavy_stone_door",
+    "OldNotesView": "features.stories.underworld.events.tombs_ingress.old_notes",
+    "TombsIngressOreVeinView": "features.stories.underworld.events.tombs_ingress.ore_vein",
+    "SupplyRoomView": "features.stories.underworld.events.tombs_ingress.supply_room",
+    "TombsIngressUndergroundLakeView": "features.stories.underworld.events.tombs_ingress.underground_lake",
+    "MysteriousMerchantView": "features.stories.underworld.merchant.mysterious_merchant",
+    "FungalCavernsTreasureRoomView": "features.stories.underworld.treasure.fungal_caverns_treasure",
+    "MistyTunnelsTreasureRoomView": "features.stories.underworld.treasure.misty_tunnels_treasure",
+    "TombsIngressTreasureRoomView": "features.stories.underworld.treasure.tombs_ingress_treasure"
+})
 
 # -----------------------------------------------------------------------------
 # UNDERWORLD DEFEAT VIEW
@@ -379,17 +445,17 @@ class StartButton(discord.ui.Button):
 
             await interaction.response.edit_message(embed=initial_info, view=mt_entrance_view, content=None)
         elif starting_section == UnderworldSection.FungalCaverns:
-            fc_entrance_view: FungalCavernsIntroView = FungalCavernsIntroView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            fc_entrance_view: FungalCavernsIntroView = ROOM_VIEWS.get("FungalCavernsIntroView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: discord.Embed = fc_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=fc_entrance_view, content=None)
         elif starting_section == UnderworldSection.TombsIngress:
-            ti_entrance_view: TombsIngressIntroView = TombsIngressIntroView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            ti_entrance_view: TombsIngressIntroView = ROOM_VIEWS.get("TombsIngressIntroView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: discord.Embed = ti_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=ti_entrance_view, content=None)
         elif starting_section == UnderworldSection.FinalBoss:
-            final_boss_entrance_view = EyelessEchoesDuelView(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
+            final_boss_entrance_view = ROOM_VIEWS.get("EyelessEchoesDuelView")(view.get_bot(), view.get_database(), view.get_guild_id(), view.get_users(), view.get_dungeon_run())
             initial_info: discord.Embed = final_boss_entrance_view.get_initial_embed()
 
             await interaction.response.edit_message(embed=initial_info, view=final_boss_entrance_view, content=None)
@@ -566,52 +632,12 @@ class UnderworldStory():
 
             return LOADED_ITEMS.get_new_item(item_key)
         else:
-            rand_key = random.choices(
-                [
-                    ItemKey.CrackedAgate, ItemKey.CrackedAmethyst, ItemKey.CrackedBloodstone, ItemKey.CrackedDiamond,
-                    ItemKey.CrackedEmerald, ItemKey.CrackedJade, ItemKey.CrackedLapis, ItemKey.CrackedMalachite,
-                    ItemKey.CrackedMoonstone, ItemKey.CrackedOpal, ItemKey.CrackedOnyx, ItemKey.CrackedPeridot,
-                    ItemKey.CrackedQuartz, ItemKey.CrackedRuby, ItemKey.CrackedSapphire, ItemKey.CrackedTanzanite,
-                    ItemKey.CrackedTopaz, ItemKey.CrackedTurquoise, ItemKey.CrackedZircon,
-
-                    ItemKey.Agate, ItemKey.Amethyst, ItemKey.Bloodstone, ItemKey.Diamond,
-                    ItemKey.Emerald, ItemKey.Jade, ItemKey.Lapis, ItemKey.Malachite,
-                    ItemKey.Moonstone, ItemKey.Opal, ItemKey.Onyx, ItemKey.Peridot,
-                    ItemKey.Quartz, ItemKey.Ruby, ItemKey.Sapphire, ItemKey.Tanzanite,
-                    ItemKey.Topaz, ItemKey.Turquoise, ItemKey.Zircon,
-                    
-                    ItemKey.FlawlessAgate, ItemKey.FlawlessAmethyst, ItemKey.FlawlessBloodstone, ItemKey.FlawlessDiamond,
-                    ItemKey.FlawlessEmerald, ItemKey.FlawlessJade, ItemKey.FlawlessLapis, ItemKey.FlawlessMalachite,
-                    ItemKey.FlawlessMoonstone, ItemKey.FlawlessOpal, ItemKey.FlawlessOnyx, ItemKey.FlawlessPeridot,
-                    ItemKey.FlawlessQuartz, ItemKey.FlawlessRuby, ItemKey.FlawlessSapphire, ItemKey.FlawlessTanzanite,
-                    ItemKey.FlawlessTopaz, ItemKey.FlawlessTurquoise, ItemKey.FlawlessZircon
-                ], 
-                k=1,
-                weights=[
-                    0.035 * 2/76, 0.035 * 5/76, 0.035 * 6/76, 0.035 * 3/76,
-                    0.035 * 7/76, 0.035 * 6/76, 0.035 * 1/76, 0.035 * 4/76,
-                    0.035 * 2/76, 0.035 * 2/76, 0.035 * 2/76, 0.035 * 8/76,
-                    0.035 * 10/76, 0.035 * 1/76, 0.035 * 1/76, 0.035 * 2/76,
-                    0.035 * 1/76, 0.035 * 6/76, 0.035 * 5/76,
-
-                    0.01 * 2/76, 0.01 * 5/76, 0.01 * 6/76, 0.01 * 3/76,
-                    0.01 * 7/76, 0.01 * 6/76, 0.01 * 1/76, 0.01 * 4/76,
-                    0.01 * 2/76, 0.01 * 2/76, 0.01 * 2/76, 0.01 * 8/76,
-                    0.01 * 10/76, 0.01 * 1/76, 0.01 * 1/76, 0.01 * 2/76,
-                    0.01 * 1/76, 0.01 * 6/76, 0.01 * 5/76,
-
-                    0.005 * 2/76, 0.005 * 5/76, 0.005 * 6/76, 0.005 * 3/76,
-                    0.005 * 7/76, 0.005 * 6/76, 0.005 * 1/76, 0.005 * 4/76,
-                    0.005 * 2/76, 0.005 * 2/76, 0.005 * 2/76, 0.005 * 8/76,
-                    0.005 * 10/76, 0.005 * 1/76, 0.005 * 1/76, 0.005 * 2/76,
-                    0.005 * 1/76, 0.005 * 6/76, 0.005 * 5/76,
-                ]
-            )[0]
+            rand_key = WISHING_WELL_GEMSTONE_LOOT_TABLE.roll()
             return LOADED_ITEMS.get_new_item(rand_key)
 
     @staticmethod
     def generate_shopkeep_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
-        return MysteriousMerchantView(bot, database, guild_id, users, dungeon_run)
+        return ROOM_VIEWS.get("MysteriousMerchantView")(bot, database, guild_id, users, dungeon_run)
 
     @staticmethod
     def generate_rest_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
@@ -620,132 +646,132 @@ class UnderworldStory():
     @staticmethod
     def generate_treasure_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
         if dungeon_run.section == UnderworldSection.MistyTunnels:
-            return MistyTunnelsTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("MistyTunnelsTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
         elif dungeon_run.section == UnderworldSection.FungalCaverns:
-            return FungalCavernsTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("FungalCavernsTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
         else:
-            return TombsIngressTreasureRoomView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("TombsIngressTreasureRoomView")(bot, database, guild_id, users, dungeon_run)
 
     @staticmethod
     def generate_combat_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun) -> Tuple[discord.ui.View, int]:
         if dungeon_run.section == UnderworldSection.MistyTunnels:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return BreathOfDarknessDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BreathOfDarknessDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return ChokingFogDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ChokingFogDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return IchordrinkBatsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("IchordrinkBatsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return MistyApparitionDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MistyApparitionDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return PaleWidowDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("PaleWidowDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return ScuttledarkScorpionDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ScuttledarkScorpionDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return StonewalkerDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("StonewalkerDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WindingTunnelsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WindingTunnelsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
         elif dungeon_run.section == UnderworldSection.FungalCaverns:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return AgaricAlchemistsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("AgaricAlchemistsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return BlindSalamanderDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("BlindSalamanderDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return ChanterspellDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ChanterspellDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return DeathlessCapsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DeathlessCapsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return GlowingMossDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GlowingMossDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return HenOfTheCavernsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("HenOfTheCavernsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return MalevolentMorelDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MalevolentMorelDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return MyceliumTreeDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MyceliumTreeDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
         else:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_combat])
             if rand_val == 0:
-                return CultistsOfAvariceDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("CultistsOfAvariceDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return MoltenGoldDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MoltenGoldDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return QuakingTunnelsDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("QuakingTunnelsDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return ScratchesOnTheWallDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ScratchesOnTheWallDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return TimelostEchoDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TimelostEchoDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return TombGuardiansDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TombGuardiansDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return WarpingAnomalyDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WarpingAnomalyDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return WaylaidChestDuelView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("WaylaidChestDuelView")(bot, database, guild_id, users, dungeon_run), rand_val
 
     @staticmethod
     def generate_event_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun) -> Tuple[discord.ui.View, int]:
         if dungeon_run.section == UnderworldSection.MistyTunnels:
             rand_val: int = random.choice([i for i in range(0, 7) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return CrackInTheWallView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("CrackInTheWallView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return DeadSpelunkerView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DeadSpelunkerView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return FormInTheFogView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("FormInTheFogView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return MistyTunnelsOreVeinView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MistyTunnelsOreVeinView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return SpiderNestView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("SpiderNestView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return TorchesGoOutView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TorchesGoOutView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return MistyTunnelsUndergroundLakeView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MistyTunnelsUndergroundLakeView")(bot, database, guild_id, users, dungeon_run), rand_val
         elif dungeon_run.section == UnderworldSection.FungalCaverns:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return CrimsonRotView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("CrimsonRotView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return DeepHoleView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DeepHoleView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return DenseClustersView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("DenseClustersView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return GrandMushroomStaffView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GrandMushroomStaffView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return MushroomGroveView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("MushroomGroveView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return FungalCavernsOreVeinView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("FungalCavernsOreVeinView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return PurpleCloudView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("PurpleCloudView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return FungalCavernsUndergroundLakeView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("FungalCavernsUndergroundLakeView")(bot, database, guild_id, users, dungeon_run), rand_val
         else:
             rand_val: int = random.choice([i for i in range(0, 8) if i != dungeon_run.previous_event])
             if rand_val == 0:
-                return ArcaneTrapsView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("ArcaneTrapsView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 1:
-                return EchoOfKnowledgeView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("EchoOfKnowledgeView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 2:
-                return GoldenIdolView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("GoldenIdolView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 3:
-                return HeavyStoneDoorView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("HeavyStoneDoorView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 4:
-                return OldNotesView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("OldNotesView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 5:
-                return TombsIngressOreVeinView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TombsIngressOreVeinView")(bot, database, guild_id, users, dungeon_run), rand_val
             elif rand_val == 6:
-                return SupplyRoomView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("SupplyRoomView")(bot, database, guild_id, users, dungeon_run), rand_val
             else:
-                return TombsIngressUndergroundLakeView(bot, database, guild_id, users, dungeon_run), rand_val
+                return ROOM_VIEWS.get("TombsIngressUndergroundLakeView")(bot, database, guild_id, users, dungeon_run), rand_val
 
     @staticmethod
     def generate_boss_room(bot: BenjaminBowtieBot, database: dict, guild_id: int, users: List[discord.User], dungeon_run: DungeonRun):
         if dungeon_run.section == UnderworldSection.MistyTunnels:
-            return TunneldiggerDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("TunneldiggerDuelView")(bot, database, guild_id, users, dungeon_run)
         elif dungeon_run.section == UnderworldSection.FungalCaverns:
-            return MushroomMazeDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("MushroomMazeDuelView")(bot, database, guild_id, users, dungeon_run)
         else:
-            return EyelessEchoesDuelView(bot, database, guild_id, users, dungeon_run)
+            return ROOM_VIEWS.get("EyelessEchoesDuelView")(bot, database, guild_id, users, dungeon_run)
 
     def __getstate__(self):
         return self.__dict__
@@ -21,6 +21,7 @@ from features.shared.constants import COMPANION_BATTLE_POINTS, DEX_DODGE_SCALE,
 from features.shared.effect import Effect, EffectType, ItemEffectCategory
 from features.shared.enums import ClassTag, Summons
 from features.shared.item import LOADED_ITEMS, WeaponStats
+from features.shared.metrics import METRICS
 from features.shared.statuseffect import *
 
 from typing import Dict, List, TYPE_CHECKING, Tuple
@@ -1879,6 +1880,7 @@ class DuelView(discord.ui.View):
             self._selected_item_index = -1
             return self.show_items()
 
+    @METRICS.timed("bot_npc_turn_seconds")
     def take_npc_turn(self):
         cur_npc: NPC = self._turn_order[self._turn_index] # type: ignore
         npc_dueling: Dueling = cur_npc.get_dueling()
@@ -6,14 +6,16 @@ from random import choice, choices, randint
 from discord.embeds import Embed
 from discord.ext import commands
 
-from typing import Dict, List
+from typing import List
 from features.npcs.npc import NPCRoles
 from features.player import Player
 
 from features.npcs.mrbones import Difficulty, MrBones
 from features.shared.enums import ClassTag
 from features.shared.item import ItemKey
+from features.shared.metrics import METRICS
 from features.stats import Stats
+from games.knucklebones_game import compute_points_in_col, create_board, get_roll_weights, is_board_full, place_die
 
 class AcceptButton(discord.ui.Button):
     def __init__(self):
@@ -118,16 +120,8 @@ class Knucklebones(discord.ui.View):
 
         self._turn = choice([self._player_1, self._player_2])
 
-        self._player_1_board = [
-            [0, 0, 0],
-            [0, 0, 0],
-            [0, 0, 0]
-        ]
-        self._player_2_board = [
-            [0, 0, 0],
-            [0, 0, 0],
-            [0, 0, 0]
-        ]
+        self._player_1_board = create_board()
+        self._player_2_board = create_board()
 
         self.add_item(AcceptButton())
         self.add_item(DeclineButton())
@@ -151,10 +145,7 @@ class Knucklebones(discord.ui.View):
         return "⬜" # "⬚"
 
     def _compute_points_in_col(self, board: List[List[int]], col_num: int):
-        counts: Dict[int, int] = {}
-        for i in range(3):
-            counts[board[i][col_num]] = counts.get(board[i][col_num], 0) + 1
-        return sum([num * count * count for num, count in counts.items()])
+        return compute_points_in_col(board, col_num)
 
     def _get_game_state_string(self):
         content = f"**{self._player_1_display_name}**\n\n"
@@ -194,15 +185,7 @@ class Knucklebones(discord.ui.View):
             return f"{base_result} {cur_display_name} is thinking...\n"
 
     def _check_game_complete(self):
-        p1_all_nonzero = True
-        p2_all_nonzero = True
-        for i in range(3):
-            for j in range(3):
-                if self._player_1_board[i][j] == 0:
-                    p1_all_nonzero = False
-                if self._player_2_board[i][j] == 0:
-                    p2_all_nonzero = False
-        return p1_all_nonzero or p2_all_nonzero
+        return is_board_full(self._player_1_board) or is_board_full(self._player_2_board)
 
     def _get_winner(self):
         player_1_total = 0
@@ -216,26 +199,21 @@ class Knucklebones(discord.ui.View):
             return (self._player_2, player_2_total)
         return (None, 0)
 
+    def _get_roll_weights(self, entity: Player | MrBones):
+        if not self._use_luck:
+            return get_roll_weights(0, False)
+        return get_roll_weights(entity.get_combined_attributes().luck, True)
+
     def _roll(self):
         if self._use_luck:
-            total_luck: int = self._turn.get_combined_attributes().luck
-            self._current_roll = choices(
-                [1, 2, 3, 4, 5, 6], k=1, 
-                weights=[
-                    1/6 - 0.001 * total_luck,
-                    1/6 - 0.001 * total_luck,
-                    1/6 - 0.001 * total_luck,
-                    1/6 + 0.001 * total_luck,
-                    1/6 + 0.001 * total_luck,
-                    1/6 + 0.001 * total_luck
-                ]
-            )[0]
+            self._current_roll = choices([1, 2, 3, 4, 5, 6], k=1, weights=self._get_roll_weights(self._turn))[0]
         else:
             self._current_roll = randint(1, 6)
 
     def _take_npc_turn(self):
         pre_npc_move_board = self._get_game_state_string() + "\n\n" + self._get_current_turn_string() + "\n᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆᠆\n\n"
-        npc_move_turn_str = self._turn.make_move(self._player_1_board, self._player_2_board, self._difficulty if self._difficulty != Difficulty.MrBones else Difficulty.Hard, self._compute_points_in_col, self._current_roll, self._player_2_display_name) + "\n\n"
+        with METRICS.timer("bot_knucklebones_npc_move_seconds", {"difficulty": str(self._difficulty)}):
+            npc_move_turn_str = self._turn.make_move(self._player_1_board, self._player_2_board, self._difficulty, self._compute_points_in_col, self._current_roll, self._player_2_display_name, self._get_roll_weights(self._player_2), self._get_roll_weights(self._player_1)) + "\n\n"
         self._roll()
         self._turn = self._player_1 if self._turn == self._player_2 else self._player_2
 
@@ -349,23 +327,10 @@ class Knucklebones(discord.ui.View):
 
     def place_roll(self, pos: int):
         can_place = False
-        for i in range(3):
-            if self._turn == self._player_1:
-                if self._player_1_board[i][pos] == 0:
-                    self._player_1_board[i][pos] = self._current_roll
-                    can_place = True
-                    for j in range(3):
-                        if self._player_2_board[j][pos] == self._current_roll:
-                            self._player_2_board[j][pos] = 0
-                    break
-            if self._turn == self._player_2:
-                if self._player_2_board[i][pos] == 0:
-                    self._player_2_board[i][pos] = self._current_roll
-                    can_place = True
-                    for j in range(3):
-                        if self._player_1_board[j][pos] == self._current_roll:
-                            self._player_1_board[j][pos] = 0
-                    break
+        if self._turn == self._player_1:
+            can_place = place_die(self._player_1_board, self._player_2_board, pos, self._current_roll)
+        elif self._turn == self._player_2:
+            can_place = place_die(self._player_2_board, self._player_1_board, pos, self._current_roll)
         
         if not can_place:
             return None
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from random import Random
+
+from typing import Dict, List
+
+# -----------------------------------------------------------------------------
+# RULES
+# -----------------------------------------------------------------------------
+
+# The game rules without any of the Discord view, so the view and headless
+# simulations (see knucklebones_simulator.py) play the same game.
+
+def create_board() -> List[List[int]]:
+    return [
+        [0, 0, 0],
+        [0, 0, 0],
+        [0, 0, 0]
+    ]
+
+
+def compute_points_in_col(board: List[List[int]], col_num: int):
+    counts: Dict[int, int] = {}
+    for i in range(3):
+        counts[board[i][col_num]] = counts.get(board[i][col_num], 0) + 1
+    return sum([num * count * count for num, count in counts.items()])
+
+
+def compute_board_total(board: List[List[int]]):
+    return sum(compute_points_in_col(board, col_num) for col_num in range(3))
+
+
+def is_board_full(board: List[List[int]]):
+    return all(board[i][j] != 0 for i in range(3) for j in range(3))
+
+
+def get_roll_weights(luck: int, use_luck: bool) -> List[float]:
+    if not use_luck:
+        return [1/6, 1/6, 1/6, 1/6, 1/6, 1/6]
+
+    return [
+        1/6 - 0.001 * luck,
+        1/6 - 0.001 * luck,
+        1/6 - 0.001 * luck,
+        1/6 + 0.001 * luck,
+        1/6 + 0.001 * luck,
+        1/6 + 0.001 * luck
+    ]
+
+
+# Places the roll in the first open spot in the column and knocks out matching
+# dice in the opponent's column. Returns False if the column is already full.
+def place_die(board: List[List[int]], opponent_board: List[List[int]], pos: int, roll: int):
+    for i in range(3):
+        if board[i][pos] == 0:
+            board[i][pos] = roll
+            for j in range(3):
+                if opponent_board[j][pos] == roll:
+                    opponent_board[j][pos] = 0
+            return True
+    return False
+
+# -----------------------------------------------------------------------------
+# HEADLESS GAME
+# -----------------------------------------------------------------------------
+
+class KnucklebonesGame():
+    def __init__(self, rng: Random, use_luck: bool=False, player_1_luck: int=0, player_2_luck: int=0):
+        self._rng = rng
+        self._use_luck = use_luck
+        self._roll_weights = [get_roll_weights(player_1_luck, use_luck), get_roll_weights(player_2_luck, use_luck)]
+
+        self.boards = [create_board(), create_board()]
+        self.turn: int = rng.randint(0, 1)
+        self.current_roll: int = 0
+        self.num_moves: int = 0
+
+        self.roll()
+
+    def get_roll_weights(self, player_index: int):
+        return self._roll_weights[player_index]
+
+    def roll(self):
+        if self._use_luck:
+            self.current_roll = self._rng.choices([1, 2, 3, 4, 5, 6], k=1, weights=self._roll_weights[self.turn])[0]
+        else:
+            self.current_roll = self._rng.randint(1, 6)
+
+    def place_roll(self, pos: int):
+        if not place_die(self.boards[self.turn], self.boards[1 - self.turn], pos, self.current_roll):
+            return False
+
+        self.num_moves += 1
+        if not self.is_complete():
+            self.turn = 1 - self.turn
+            self.roll()
+        return True
+
+    def is_complete(self):
+        return is_board_full(self.boards[0]) or is_board_full(self.boards[1])
+
+    def get_totals(self):
+        return (compute_board_total(self.boards[0]), compute_board_total(self.boards[1]))
+
+    # The index of the winning player, or None for a tie
+    def get_winner(self):
+        player_1_total, player_2_total = self.get_totals()
+        if player_1_total > player_2_total:
+            return 0
+        if player_2_total > player_1_total:
+            return 1
+        return None
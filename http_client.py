@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import aiohttp
+import asyncio
+import time
+
+from typing import Any, Dict, Tuple
+
+# A small JSON response so that cached and fresh results look the same to
+# callers, and nothing holds on to an aiohttp response after the body is read.
+class JSONResponse:
+    def __init__(self, status: int, data: Any):
+        self.status_code = status
+        self._data = data
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 400
+
+    def json(self):
+        return self._data
+
+
+class TTLCache:
+    def __init__(self, max_entries=1024):
+        self._max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, JSONResponse]] = {}
+
+    def get(self, key: Tuple):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return response
+
+    def set(self, key: Tuple, response: JSONResponse, ttl: float):
+        if len(self._entries) >= self._max_entries:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, response)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Shares one aiohttp session (and its connection pool) across every request the
+# bot makes. Identical concurrent requests only go out once and, when given a
+# TTL, successful responses are cached.
+class HTTPClient:
+    def __init__(self, timeout=15, max_connections=20, session: aiohttp.ClientSession | None=None):
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._max_connections = max_connections
+        # A session passed in belongs to the caller, who's responsible for closing it
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
+        self._cache = TTLCache()
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+
+    def _get_session(self):
+        # The session has to be created inside the running event loop
+        if self._owns_session and (self._session is None or self._session.closed):
+            connector = aiohttp.TCPConnector(limit=self._max_connections)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        return self._session
+
+    async def _fetch(self, method: str, url: str, params: Dict | None):
+        # aiohttp doesn't accept bools as query params
+        if params is not None:
+            params = {k: (str(v).lower() if isinstance(v, bool) else v) for k, v in params.items()}
+
+        async with self._get_session().request(method, url, params=params) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = None
+            return JSONResponse(response.status, data)
+
+    def _get_key(self, method: str, url: str, params: Dict | None):
+        return (method, url, tuple(sorted((params or {}).items())))
+
+    def get_cached(self, method: str, url: str, params: Dict | None=None):
+        return self._cache.get(self._get_key(method, url, params))
+
+    def set_cached(self, method: str, url: str, params: Dict | None, response: JSONResponse, ttl: float):
+        self._cache.set(self._get_key(method, url, params), response, ttl)
+
+    async def request(self, method: str, url: str, params: Dict | None=None, ttl: float | None=None, cache_params: Dict | None=None):
+        # cache_params lets callers leave things like access tokens out of the key
+        key = self._get_key(method, url, params if cache_params is None else cache_params)
+
+        if ttl is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Only GETs are safe to share between callers
+        if method != "GET":
+            response = await self._fetch(method, url, params)
+            if ttl is not None and response.ok:
+                self._cache.set(key, response, ttl)
+            return response
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await self._fetch(method, url, params)
+            if ttl is not None and response.ok:
+                self._cache.set(key, response, ttl)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark it retrieved in case nobody else was waiting on this request
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def get(self, url: str, params: Dict | None=None, ttl: float | None=None, cache_params: Dict | None=None):
+        return await self.request("GET", url, params, ttl, cache_params)
+
+    async def post(self, url: str, params: Dict | None=None):
+        return await self.request("POST", url, params)
+
+    async def close(self):
+        if self._owns_session:
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+            self._session = None
+        self._cache.clear()
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import argparse
 import json
 import numpy
 import os
-import random
+import time
 
+from concurrent.futures import ProcessPoolExecutor
 from math import ceil
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 from features.shared.attributes import Attributes
 from features.shared.effect import Effect, EffectType, ItemEffectCategory, ItemEffects
 from features.shared.enums import ClassTag, StateTag
-from features.shared.item import Rarity, WeaponStats, ArmorStats
+from features.shared.item import GENERATED_ITEM_CATALOG_FILE, LOADED_ITEMS, Rarity, WeaponStats, ArmorStats
 from features.shared.statuseffect import StatusEffectKey
 
 # Note: This is inclusive!
@@ -2682,411 +2684,328 @@ EFFECT_CHANCES: Dict[EffectType, float] = {
     EffectType.ResurrectOnce: 0.02
 }
 
-if __name__ == "__main__":
-    for item_index in range(300):
-        # Order should be as follows:
-        #   (1) Choose random item type using a class tag, i.e. dagger, shield, etc.
-        #   (2) Choose rarity at random from the list
-        #   (3) Generate effects based on rarity at random
-        #        (*) With a small chance to negate an effect value and change its rarity to Cursed
-        #   (4) Name the item based on the effects
-        #   (5) Generate armor or weapon stats based on item type
-        #   (6) Based on armor/weapon stats, give it a level requirement
-        #   (7) Based on the item type and armor/weapon stats, give it attribute requirements
-        #   (8) Based on the level requirement, rarity, and effects, assign it a value
-        #   (9) Choose a random number of slots to give the item based on its type and assign other details
-        item_type = random.choice([ClassTag.Weapon.Token]) # list(CLASS_TAGS.keys())
-        rarity = random.choices(
-            [Rarity.Uncommon, Rarity.Rare, Rarity.Epic, Rarity.Legendary, Rarity.Artifact],
-            [0.05, 0.4, 0.3, 0.2, 0.05],
-            k=1
-        )[0]
+
+# -----------------------------------------------------------------------------
+# GENERATION TABLES
+# -----------------------------------------------------------------------------
+
+RARITY_CHANCES: Dict[Rarity, float] = {
+    Rarity.Uncommon: 0.05,
+    Rarity.Rare: 0.4,
+    Rarity.Epic: 0.3,
+    Rarity.Legendary: 0.2,
+    Rarity.Artifact: 0.05
+}
+
+# Note: These are inclusive
+NUM_EFFECTS_BY_RARITY: Dict[Rarity, Tuple[int, int]] = {
+    Rarity.Uncommon: (1, 1),
+    Rarity.Rare: (1, 1),
+    Rarity.Epic: (1, 2),
+    Rarity.Legendary: (1, 3),
+    Rarity.Artifact: (1, 4)
+}
+
+# Cursed items don't get a multiplier
+VALUE_MULTIPLIER_BY_RARITY: Dict[Rarity, int] = {
+    Rarity.Uncommon: 2,
+    Rarity.Rare: 3,
+    Rarity.Epic: 4,
+    Rarity.Legendary: 5,
+    Rarity.Artifact: 6
+}
+
+CURSE_CHANCE = 0.3
+PREFIX_CHANCE = 0.5
+PREFIX_AND_SUFFIX_CHANCE = 0.25
+
+DMG_BUFF_FROM_ATTRIBUTE_TYPES: List[EffectType] = [EffectType.DmgBuffFromStr, EffectType.DmgBuffFromDex, EffectType.DmgBuffFromLck, EffectType.DmgBuffFromInt]
+
+# Highest min damage, number of targets, level requirement per max damage, the
+# attribute required, how far below max damage that requirement is, and the
+# damage buffs every weapon of the type gets
+WEAPON_GENERATION: Dict[ClassTag.Weapon | ClassTag.Equipment, Tuple[int, int, float, str, int, List[Tuple[EffectType, float]]]] = {
+    ClassTag.Weapon.Bow: (30, 2, 3.5, "dexterity", 0, [(EffectType.DmgBuffFromDex, 0.025)]),
+    ClassTag.Weapon.Dagger: (40, 1, 2, "dexterity", 0, [(EffectType.DmgBuffFromDex, 0.05)]),
+    ClassTag.Weapon.Greatsword: (60, 1, 2, "strength", 0, [(EffectType.DmgBuffFromStr, 0.025)]),
+    ClassTag.Weapon.Knuckles: (30, 2, 3.5, "strength", 0, [(EffectType.DmgBuffFromStr, 0.025)]),
+    ClassTag.Weapon.Spear: (60, 1, 2, "dexterity", 0, [(EffectType.DmgBuffFromStr, 0.02), (EffectType.DmgBuffFromDex, 0.02)]),
+    ClassTag.Weapon.Staff: (60, 1, 2, "intelligence", 0, [(EffectType.DmgBuffFromInt, 0.05)]),
+    ClassTag.Weapon.Sword: (50, 1, 2, "strength", 5, [(EffectType.DmgBuffFromStr, 0.025)]),
+    ClassTag.Weapon.Token: (50, 1, 2, "luck", 5, [(EffectType.DmgBuffFromLck, 0.025)])
+}
+
+# Highest armor, the range of the fraction of armor required in whichever
+# attribute the name suggests (None for no requirement), and the level
+# requirement per armor below and above ARMOR_LEVEL_THRESHOLD
+MIN_ARMOR = 5
+ARMOR_LEVEL_THRESHOLD = 60
+ARMOR_GENERATION: Dict[ClassTag.Weapon | ClassTag.Equipment, Tuple[int, Tuple[float, float] | None, float, float]] = {
+    ClassTag.Equipment.Helmet: (150, (0.2, 0.4), 0.75, 0.75),
+    ClassTag.Equipment.ChestArmor: (250, (0.1, 0.2), 0.3, 0.3),
+    ClassTag.Equipment.Gloves: (100, (0.2, 0.4), 1.4, 0.8),
+    ClassTag.Equipment.Leggings: (150, (0.2, 0.4), 1.2, 0.7),
+    ClassTag.Equipment.Boots: (150, (0.2, 0.4), 1.05, 0.6),
+    ClassTag.Weapon.Shield: (200, None, 0.9, 0.7)
+}
+
+KEY_DIRECTORIES: Dict[ClassTag.Weapon | ClassTag.Equipment, str] = {
+    ClassTag.Weapon.Bow: "items/weapon/bow",
+    ClassTag.Weapon.Dagger: "items/weapon/dagger",
+    ClassTag.Weapon.Greatsword: "items/weapon/greatsword",
+    ClassTag.Weapon.Knuckles: "items/weapon/knuckles",
+    ClassTag.Weapon.Spear: "items/weapon/spear",
+    ClassTag.Weapon.Staff: "items/weapon/staff",
+    ClassTag.Weapon.Sword: "items/weapon/sword",
+    ClassTag.Weapon.Token: "items/weapon/token",
+    ClassTag.Equipment.Helmet: "items/equipment/helmet",
+    ClassTag.Equipment.ChestArmor: "items/equipment/chest_armor",
+    ClassTag.Equipment.Gloves: "items/equipment/gloves",
+    ClassTag.Equipment.Leggings: "items/equipment/leggings",
+    ClassTag.Equipment.Boots: "items/equipment/boots",
+    ClassTag.Weapon.Shield: "items/weapon/shield",
+    ClassTag.Equipment.Ring: "items/equipment/ring",
+    ClassTag.Equipment.Amulet: "items/equipment/amulet"
+}
+
+# -----------------------------------------------------------------------------
+# EFFECT OPTIONS
+# -----------------------------------------------------------------------------
+
+# An effect is picked with a chain of uniform choices: a status effect (for
+# the status effect types), then a category, then a set of parameters. Those
+# are flattened here into every possible outcome and its probability, so all
+# the effects of a type in a batch are drawn with one numpy call. An outcome
+# of None gives no effect, same as when a choice along the way came up empty.
+EffectOption = Tuple[ItemEffectCategory, StatusEffectKey | None, List[int | float], List[int]]
+
+def expand_range(values: List[float] | range) -> List[int | float]:
+    # Since range is exclusive but I'd like to be able to identify parameters
+    # at a glance above, this remaps the range with stop + 1.
+    if isinstance(values, range):
+        return list(range(values.start, values.stop + 1))
+    return list(values)
+
+
+def get_category_options(possible_effects: Dict[ItemEffectCategory, List[List[List[float] | range]]] | None, status_effect_key: StatusEffectKey | None, probability: float):
+    options: List[Tuple[EffectOption | None, float]] = []
+    if possible_effects is None or len(possible_effects) == 0:
+        return [(None, probability)]
+    for category, all_params in possible_effects.items():
+        for effect_params in all_params:
+            option: EffectOption = (category, status_effect_key, expand_range(effect_params[0]), expand_range(effect_params[1]))
+            options.append((option, probability / (len(possible_effects) * len(all_params))))
+    return options
+
+
+def get_effect_options(rarity: Rarity, effect_type: EffectType):
+    weighted_options: List[Tuple[EffectOption | None, float]] = []
+    if effect_type != EffectType.ResistStatusEffect and effect_type != EffectType.ChanceStatusEffect:
+        weighted_options = get_category_options(EFFECTS_BY_RARITY[rarity].get(effect_type, None), None, 1)
+    else:
+        possible_statuses = EFFECTS_BY_RARITY[rarity].get(effect_type, None)
+        if possible_statuses is None or len(possible_statuses) == 0:
+            weighted_options = [(None, 1)]
+        else:
+            for status_effect_key, possible_effects in possible_statuses.items():
+                weighted_options += get_category_options(possible_effects, status_effect_key, 1 / len(possible_statuses))
+
+    options = [option for option, _ in weighted_options]
+    probabilities = numpy.array([probability for _, probability in weighted_options])
+    return options, probabilities / probabilities.sum()
+
+
+ALL_EFFECT_TYPES: List[EffectType] = list(EFFECT_CHANCES.keys())
+ALL_RARITIES: List[Rarity] = list(RARITY_CHANCES.keys())
+
+# By rarity, the indices into ALL_EFFECT_TYPES that can be rolled and their chances
+VALID_EFFECT_TYPES: Dict[Rarity, Tuple[numpy.ndarray, numpy.ndarray]] = {}
+EFFECT_OPTIONS: Dict[Tuple[Rarity, EffectType], Tuple[List[EffectOption | None], numpy.ndarray]] = {}
+for rarity in ALL_RARITIES:
+    valid_indices = [i for i, effect_type in enumerate(ALL_EFFECT_TYPES) if effect_type in EFFECTS_BY_RARITY[rarity].keys()]
+    valid_chances = numpy.array([EFFECT_CHANCES[ALL_EFFECT_TYPES[i]] for i in valid_indices])
+    VALID_EFFECT_TYPES[rarity] = (numpy.array(valid_indices), valid_chances / valid_chances.sum())
+    for i in valid_indices:
+        EFFECT_OPTIONS[(rarity, ALL_EFFECT_TYPES[i])] = get_effect_options(rarity, ALL_EFFECT_TYPES[i])
+
+# -----------------------------------------------------------------------------
+# BATCH GENERATION
+# -----------------------------------------------------------------------------
+
+def pick(values: List[Any] | Tuple[Any, ...], roll: float):
+    # A uniform choice using a roll drawn ahead of time
+    return values[int(roll * len(values))]
+
+
+def generate_batch(seed: numpy.random.SeedSequence, count: int, item_types: List[ClassTag.Weapon | ClassTag.Equipment]):
+    # Order should be as follows:
+    #   (1) Choose random item type using a class tag, i.e. dagger, shield, etc.
+    #   (2) Choose rarity at random from the list
+    #   (3) Generate effects based on rarity at random
+    #        (*) With a small chance to negate an effect value and change its rarity to Cursed
+    #   (4) Name the item based on the effects
+    #   (5) Generate armor or weapon stats based on item type
+    #   (6) Based on armor/weapon stats, give it a level requirement
+    #   (7) Based on the item type and armor/weapon stats, give it attribute requirements
+    #   (8) Based on the level requirement, rarity, and effects, assign it a value
+    #   (9) Choose a random number of slots to give the item based on its type and assign other details
+    #
+    # Every random draw for the batch is made up front with numpy, then each
+    # item is put together from its share of them. Items that don't end up
+    # with any effects or a name are skipped, so this can return fewer than count.
+    rng = numpy.random.default_rng(seed)
+
+    type_indices = rng.integers(len(item_types), size=count)
+    rarity_indices = rng.choice(len(ALL_RARITIES), size=count, p=numpy.array(list(RARITY_CHANCES.values())) / sum(RARITY_CHANCES.values()))
+    min_effects = numpy.array([NUM_EFFECTS_BY_RARITY[rarity][0] for rarity in ALL_RARITIES])
+    max_effects = numpy.array([NUM_EFFECTS_BY_RARITY[rarity][1] for rarity in ALL_RARITIES])
+    num_effects = rng.integers(min_effects[rarity_indices], max_effects[rarity_indices] + 1)
+
+    # One slot per effect an item might get, in item order
+    num_effect_slots = int(num_effects.sum())
+    slot_starts = numpy.concatenate(([0], numpy.cumsum(num_effects)[:-1]))
+    slot_rarity_indices = numpy.repeat(rarity_indices, num_effects)
+    slot_effect_type_indices = numpy.zeros(num_effect_slots, dtype=int)
+    for rarity_index, rarity in enumerate(ALL_RARITIES):
+        in_rarity = slot_rarity_indices == rarity_index
+        valid_indices, valid_chances = VALID_EFFECT_TYPES[rarity]
+        slot_effect_type_indices[in_rarity] = rng.choice(valid_indices, size=int(in_rarity.sum()), p=valid_chances)
+
+    slot_option_indices = numpy.zeros(num_effect_slots, dtype=int)
+    for rarity_index, effect_type_index in set(zip(slot_rarity_indices.tolist(), slot_effect_type_indices.tolist())):
+        in_group = (slot_rarity_indices == rarity_index) & (slot_effect_type_indices == effect_type_index)
+        options, probabilities = EFFECT_OPTIONS[(ALL_RARITIES[rarity_index], ALL_EFFECT_TYPES[effect_type_index])]
+        slot_option_indices[in_group] = rng.choice(len(options), size=int(in_group.sum()), p=probabilities)
+
+    value_rolls = rng.random(num_effect_slots)
+    time_rolls = rng.random(num_effect_slots)
+    curse_rolls = rng.random(num_effect_slots)
+
+    base_name_rolls = rng.random(count)
+    prefix_or_suffix_rolls = rng.random(count)
+    name_pick_rolls = rng.random(count)
+    prefix_and_suffix_rolls = rng.random(count)
+    second_name_pick_rolls = rng.random(count)
+    stat_rolls = rng.random(count)
+    attribute_rolls = rng.random(count)
+    socket_rolls = rng.random(count)
+    item_value_rolls = rng.random(count)
+
+    items: List[dict] = []
+    for i in range(count):
+        item_type = item_types[type_indices[i]]
+        rarity = ALL_RARITIES[rarity_indices[i]]
         pre_curse_rarity = rarity
 
         item_effects = ItemEffects([], [], [], [], [], [], [], [])
-        num_effects = 1
-        if rarity == Rarity.Uncommon:
-            num_effects = 1
-        elif rarity == Rarity.Rare:
-            num_effects = 1
-        elif rarity == Rarity.Epic:
-            num_effects = random.randint(1, 2)
-        elif rarity == Rarity.Legendary:
-            num_effects = random.randint(1, 3)
-        elif rarity == Rarity.Artifact:
-            num_effects = random.randint(1, 4)
-
-        valid_effect_types = {et: v for et, v in EFFECT_CHANCES.items() if et in EFFECTS_BY_RARITY[rarity].keys()}
-
-        possible_prefixes = []
-        possible_suffixes = []
-        
-        for effect_index in range(num_effects):
-            effect_type = random.choices(list(valid_effect_types.keys()), list(valid_effect_types.values()), k=1)[0]
-            item_effect_cat = None
-            effect = None
-
-            if effect_type != EffectType.ResistStatusEffect and effect_type != EffectType.ChanceStatusEffect:
-                possible_effects = EFFECTS_BY_RARITY[pre_curse_rarity].get(effect_type, None)
-                if possible_effects is None or len(possible_effects) == 0:
-                    continue
-                
-                if ClassTag.Weapon.Weapon not in CLASS_TAGS[item_type] and effect_type in [EffectType.DmgBuffFromStr, EffectType.DmgBuffFromDex, EffectType.DmgBuffFromLck, EffectType.DmgBuffFromInt]:
-                    continue 
-
-                item_effect_cat = random.choice(list(possible_effects.keys()))
-                effect_params: List[List[float] | range] = random.choice(possible_effects[item_effect_cat])
-
-                # Since range is exclusive but I'd like to be able to identify parameters at a glance
-                # above, this remaps the range with stop + 1.
-                value_range = effect_params[0]
-                if isinstance(value_range, range):
-                    value_range = range(value_range.start, value_range.stop + 1)
-                try:
-                    effect_value: int | float = round(random.choice(list(value_range)), 3)
-                except:
-                    pass
-
-                time_range = effect_params[1]
-                if isinstance(time_range, range):
-                    time_range = range(time_range.start, time_range.stop + 1)
-                effect_time: int = random.choice(list(time_range))
-
-                if random.random() < 0.3 and (len(BAD_PREFIXES.get(effect_type, [])) > 0 or len(BAD_SUFFIXES.get(effect_type, [])) > 0) and item_effect_cat == ItemEffectCategory.Permanent:
+        possible_prefixes: List[str] = []
+        possible_suffixes: List[str] = []
+
+        for slot in range(slot_starts[i], slot_starts[i] + num_effects[i]):
+            effect_type = ALL_EFFECT_TYPES[slot_effect_type_indices[slot]]
+            option = EFFECT_OPTIONS[(pre_curse_rarity, effect_type)][0][slot_option_indices[slot]]
+            if option is None:
+                continue
+            if ClassTag.Weapon.Weapon not in CLASS_TAGS[item_type] and effect_type in DMG_BUFF_FROM_ATTRIBUTE_TYPES:
+                continue
+
+            item_effect_cat, status_effect_key, effect_values, effect_times = option
+            effect_value: int | float = round(pick(effect_values, value_rolls[slot]), 3)
+            effect_time: int = pick(effect_times, time_rolls[slot])
+
+            if status_effect_key is None:
+                if curse_rolls[slot] < CURSE_CHANCE and (len(BAD_PREFIXES.get(effect_type, [])) > 0 or len(BAD_SUFFIXES.get(effect_type, [])) > 0) and item_effect_cat == ItemEffectCategory.Permanent:
                     effect_value *= -1
                     rarity = Rarity.Cursed
-                    possible_prefixes = BAD_PREFIXES.get(effect_type, [])
-                    possible_suffixes = BAD_SUFFIXES.get(effect_type, [])
+                    possible_prefixes = list(BAD_PREFIXES.get(effect_type, []))
+                    possible_suffixes = list(BAD_SUFFIXES.get(effect_type, []))
 
                 if rarity != Rarity.Cursed:
                     possible_prefixes += GOOD_PREFIXES.get(effect_type, [])
                     possible_suffixes += GOOD_SUFFIXES.get(effect_type, [])
 
-                effect = Effect(effect_type, effect_value, effect_time, [], [])
+                item_effects.add_effect_in_category(Effect(effect_type, effect_value, effect_time, [], []), item_effect_cat)
             else:
-                possible_statuses = EFFECTS_BY_RARITY[pre_curse_rarity].get(effect_type, None)
-                if possible_statuses is None or len(possible_statuses) == 0:
-                    continue
-                
-                status_effect_key = random.choice(list(possible_statuses.keys()))
-
-                possible_effects = possible_statuses[status_effect_key]
-                if possible_effects is None or len(possible_effects) == 0:
-                    continue
-                
-                item_effect_cat = random.choice(list(possible_effects.keys()))
-
-                effect_params: List[List[float] | range] = random.choice(possible_effects[item_effect_cat])
-
-                value_range = effect_params[0]
-                if isinstance(value_range, range):
-                    value_range = range(value_range.start, value_range.stop + 1)
-                try:
-                    effect_value = round(random.choice(list(value_range)), 3)
-                except:
-                    pass
-
-                time_range = effect_params[1]
-                if isinstance(time_range, range):
-                    time_range = range(time_range.start, time_range.stop + 1)
-                effect_time: int = random.choice(list(time_range))
-
                 if rarity != Rarity.Cursed:
                     possible_prefixes += GOOD_PREFIXES.get(effect_type, {}).get(status_effect_key, [])
                     possible_suffixes += GOOD_SUFFIXES.get(effect_type, {}).get(status_effect_key, [])
 
-                effect = Effect(effect_type, effect_value, effect_time, [], [], status_effect_key)
-
-            if item_effect_cat is not None and effect is not None:
-                if item_effect_cat == ItemEffectCategory.Permanent:
-                    item_effects.permanent.append(effect)
-                elif item_effect_cat == ItemEffectCategory.OnTurnStart:
-                    item_effects.on_turn_start.append(effect)
-                elif item_effect_cat == ItemEffectCategory.OnTurnEnd:
-                    item_effects.on_turn_end.append(effect)
-                elif item_effect_cat == ItemEffectCategory.OnDamaged:
-                    item_effects.on_damaged.append(effect)
-                elif item_effect_cat == ItemEffectCategory.OnSuccessfulAbilityUsed:
-                    item_effects.on_successful_ability_used.append(effect)
-                elif item_effect_cat == ItemEffectCategory.OnSuccessfulAttack:
-                    item_effects.on_successful_attack.append(effect)
-                elif item_effect_cat == ItemEffectCategory.OnAttacked:
-                    item_effects.on_attacked.append(effect)
-                elif item_effect_cat == ItemEffectCategory.OnAbilityUsedAgainst:
-                    item_effects.on_ability_used_against.append(effect)
-
-        base_name, icon = random.choice(NAMES_AND_ICONS[item_type])
-        name: str = ""
-        if len(item_effects) > 0:
-            prefix = ""
-            suffix = ""
-            if random.random() < 0.5:
-                if len(possible_prefixes) != 0:
-                    prefix = random.choice(possible_prefixes)
-            else:
-                if len(possible_suffixes) != 0:
-                    suffix = random.choice(possible_suffixes)
-            
-            # Occasionally, items get both a suffix and a prefix!
-            if random.random() < 0.25 and len(item_effects) > 1:
-                if prefix == "" and len(possible_prefixes) != 0:
-                    prefix = random.choice(possible_prefixes)
-                elif suffix == "" and len(possible_suffixes) != 0:
-                    suffix = random.choice(possible_suffixes)
-            
-            if prefix != "":
-                name = prefix + " " + base_name
-            if suffix != "":
-                name = base_name + " " + suffix
-        else:
-            # Just skip the item if it didn't get any valid item effects
+                item_effects.add_effect_in_category(Effect(effect_type, effect_value, effect_time, [], [], status_effect_key), item_effect_cat)
+
+        # Just skip the item if it didn't get any valid item effects
+        if len(item_effects) == 0:
             continue
+
+        base_name, icon = pick(NAMES_AND_ICONS[item_type], base_name_rolls[i])
+        prefix = ""
+        suffix = ""
+        if prefix_or_suffix_rolls[i] < PREFIX_CHANCE:
+            if len(possible_prefixes) != 0:
+                prefix = pick(possible_prefixes, name_pick_rolls[i])
+        else:
+            if len(possible_suffixes) != 0:
+                suffix = pick(possible_suffixes, name_pick_rolls[i])
+        
+        # Occasionally, items get both a suffix and a prefix!
+        if prefix_and_suffix_rolls[i] < PREFIX_AND_SUFFIX_CHANCE and len(item_effects) > 1:
+            if prefix == "" and len(possible_prefixes) != 0:
+                prefix = pick(possible_prefixes, second_name_pick_rolls[i])
+            elif suffix == "" and len(possible_suffixes) != 0:
+                suffix = pick(possible_suffixes, second_name_pick_rolls[i])
         
+        name: str = ""
+        if prefix != "":
+            name = prefix + " " + base_name
+        if suffix != "":
+            name = base_name + " " + suffix
+        # Without a prefix or suffix it'd just be the base name, which every
+        # item of the type shares
+        if name == "":
+            continue
+
         attr_reqs = Attributes(0, 0, 0, 0, 0, 0)
         level_req = 0
 
         weapon_stats = None
         armor_stats = None
-        if item_type == ClassTag.Weapon.Bow:
-            min_damage = random.randint(1, 30)
-            max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage, 2)
-
-            attr_reqs.dexterity = max_damage
-            level_req = int(3.5 * max_damage)
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromDex,
-                0.025,
-                -1,
-                [],
-                []
-            ))
-        elif item_type == ClassTag.Weapon.Dagger:
-            min_damage = random.randint(1, 40)
-            max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage)
-            
-            attr_reqs.dexterity = max_damage
-            level_req = 2 * max_damage
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromDex,
-                0.05,
-                -1,
-                [],
-                []
-            ))
-        elif item_type == ClassTag.Weapon.Greatsword:
-            min_damage = random.randint(1, 60)
-            max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage)
-
-            attr_reqs.strength = max_damage
-            level_req = 2 * max_damage
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromStr,
-                0.025,
-                -1,
-                [],
-                []
-            ))
-        elif item_type == ClassTag.Weapon.Knuckles:
-            min_damage = random.randint(1, 30)
-            max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage, 2)
-
-            attr_reqs.strength = max_damage
-            level_req = int(3.5 * max_damage)
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromStr,
-                0.025,
-                -1,
-                [],
-                []
-            ))
-        elif item_type == ClassTag.Weapon.Spear:
-            min_damage = random.randint(1, 60)
-            max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage)
-
-            attr_reqs.dexterity = max_damage
-            level_req = 2 * max_damage
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromStr,
-                0.02,
-                -1,
-                [],
-                []
-            ))
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromDex,
-                0.02,
-                -1,
-                [],
-                []
-            ))
-        elif item_type == ClassTag.Weapon.Staff:
-            min_damage = random.randint(1, 60)
+        if item_type in WEAPON_GENERATION:
+            max_min_damage, num_targets, level_req_scale, attribute, attribute_offset, dmg_buffs = WEAPON_GENERATION[item_type]
+            min_damage = 1 + int(stat_rolls[i] * max_min_damage)
             max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage)
-
-            attr_reqs.intelligence = max_damage
-            level_req = 2 * max_damage
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromInt,
-                0.05,
-                -1,
-                [],
-                []
-            ))
-        elif item_type == ClassTag.Weapon.Sword:
-            min_damage = random.randint(1, 50)
-            max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage)
-
-            attr_reqs.strength = max(max_damage - 5, 0)
-            level_req = 2 * max_damage
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromStr,
-                0.025,
-                -1,
-                [],
-                []
-            ))
-        elif item_type == ClassTag.Weapon.Token:
-            min_damage = random.randint(1, 50)
-            max_damage = ceil(min_damage * 1.25) + 1
-            weapon_stats = WeaponStats(min_damage, max_damage)
-
-            attr_reqs.luck = max(max_damage - 5, 0)
-            level_req = 2 * max_damage
-
-            item_effects.permanent.append(Effect(
-                EffectType.DmgBuffFromLck,
-                0.025,
-                -1,
-                [],
-                []
-            ))            
-        elif item_type == ClassTag.Equipment.Helmet:
-            armor = random.randint(5, 150)
-            armor_stats = ArmorStats(armor)
-
-            if base_name in INT_ARMOR_NAMES:
-                attr_reqs.intelligence = int(random.uniform(0.2, 0.4) * armor)
-            elif base_name in DEX_ARMOR_NAMES:
-                attr_reqs.dexterity = int(random.uniform(0.2, 0.4) * armor)
-            else:
-                attr_reqs.strength = int(random.uniform(0.2, 0.4) * armor)
-            level_req = int(0.75 * armor)
-        elif item_type == ClassTag.Equipment.ChestArmor:
-            armor = random.randint(5, 250)
-            armor_stats = ArmorStats(armor)
+            weapon_stats = WeaponStats(min_damage, max_damage, num_targets)
 
-            if base_name in INT_ARMOR_NAMES:
-                attr_reqs.intelligence = int(random.uniform(0.1, 0.2) * armor)
-            elif base_name in DEX_ARMOR_NAMES:
-                attr_reqs.dexterity = int(random.uniform(0.1, 0.2) * armor)
-            else:
-                attr_reqs.strength = int(random.uniform(0.1, 0.2) * armor)
-            level_req = int(0.3 * armor)
-        elif item_type == ClassTag.Equipment.Gloves:
-            armor = random.randint(5, 100)
-            armor_stats = ArmorStats(armor)
+            setattr(attr_reqs, attribute, max(max_damage - attribute_offset, 0))
+            level_req = int(level_req_scale * max_damage)
 
-            if base_name in INT_ARMOR_NAMES:
-                attr_reqs.intelligence = int(random.uniform(0.2, 0.4) * armor)
-            elif base_name in DEX_ARMOR_NAMES:
-                attr_reqs.dexterity = int(random.uniform(0.2, 0.4) * armor)
-            else:
-                attr_reqs.strength = int(random.uniform(0.2, 0.4) * armor)
-            level_req = int(1.4 * armor) if armor < 60 else int(0.8 * armor)
-        elif item_type == ClassTag.Equipment.Leggings:
-            armor = random.randint(5, 150)
+            for dmg_buff_type, dmg_buff_value in dmg_buffs:
+                item_effects.add_effect_in_category(Effect(dmg_buff_type, dmg_buff_value, -1, [], []), ItemEffectCategory.Permanent)
+        elif item_type in ARMOR_GENERATION:
+            max_armor, attribute_fraction, low_level_req_scale, high_level_req_scale = ARMOR_GENERATION[item_type]
+            armor = MIN_ARMOR + int(stat_rolls[i] * (max_armor - MIN_ARMOR + 1))
             armor_stats = ArmorStats(armor)
 
-            if base_name in INT_ARMOR_NAMES:
-                attr_reqs.intelligence = int(random.uniform(0.2, 0.4) * armor)
-            elif base_name in DEX_ARMOR_NAMES:
-                attr_reqs.dexterity = int(random.uniform(0.2, 0.4) * armor)
-            else:
-                attr_reqs.strength = int(random.uniform(0.2, 0.4) * armor)
-            level_req = int(1.2 * armor) if armor < 60 else int(0.7 * armor)
-        elif item_type == ClassTag.Equipment.Boots:
-            armor = random.randint(5, 150)
-            armor_stats = ArmorStats(armor)
-
-            if base_name in INT_ARMOR_NAMES:
-                attr_reqs.intelligence = int(random.uniform(0.2, 0.4) * armor)
-            elif base_name in DEX_ARMOR_NAMES:
-                attr_reqs.dexterity = int(random.uniform(0.2, 0.4) * armor)
-            else:
-                attr_reqs.strength = int(random.uniform(0.2, 0.4) * armor)
-            level_req = int(1.05 * armor) if armor < 60 else int(0.6 * armor)
-        elif item_type == ClassTag.Weapon.Shield:
-            armor = random.randint(5, 200)
-            armor_stats = ArmorStats(armor)
-
-            level_req = int(0.9 * armor) if armor < 60 else int(0.7 * armor)
+            if attribute_fraction is not None:
+                attr_req = int((attribute_fraction[0] + attribute_rolls[i] * (attribute_fraction[1] - attribute_fraction[0])) * armor)
+                if base_name in INT_ARMOR_NAMES:
+                    attr_reqs.intelligence = attr_req
+                elif base_name in DEX_ARMOR_NAMES:
+                    attr_reqs.dexterity = attr_req
+                else:
+                    attr_reqs.strength = attr_req
+            level_req = int((low_level_req_scale if armor < ARMOR_LEVEL_THRESHOLD else high_level_req_scale) * armor)
         elif item_type == ClassTag.Equipment.Ring or item_type == ClassTag.Equipment.Amulet:
             level_req = 10 * len(item_effects)
 
-        num_slots = random.choice(list(SLOTS_PER_ITEM_TYPE[item_type]))
+        num_slots = pick(list(SLOTS_PER_ITEM_TYPE[item_type]), socket_rolls[i])
 
         value = 15 * level_req
-        if rarity == Rarity.Uncommon:
-            value *= 2 + len(item_effects)
-        elif rarity == Rarity.Rare:
-            value *= 3 + len(item_effects)
-        elif rarity == Rarity.Epic:
-            value *= 4 + len(item_effects)
-        elif rarity == Rarity.Legendary:
-            value *= 5 + len(item_effects)
-        elif rarity == Rarity.Artifact:
-            value *= 6 + len(item_effects)
-        value += 5 * random.randint(level_req, 2 * level_req)
+        if rarity in VALUE_MULTIPLIER_BY_RARITY:
+            value *= VALUE_MULTIPLIER_BY_RARITY[rarity] + len(item_effects)
+        value += 5 * (level_req + int(item_value_rolls[i] * (level_req + 1)))
         value += 250 * num_slots
 
         path_name = name.replace(" ", "_").replace("'", "").lower()
-        key = ""
-        if item_type == ClassTag.Weapon.Bow:
-            key = f"items/weapon/bow/{path_name}"
-        elif item_type == ClassTag.Weapon.Dagger:
-            key = f"items/weapon/dagger/{path_name}"
-        elif item_type == ClassTag.Weapon.Greatsword:
-            key = f"items/weapon/greatsword/{path_name}"
-        elif item_type == ClassTag.Weapon.Knuckles:
-            key = f"items/weapon/knuckles/{path_name}"
-        elif item_type == ClassTag.Weapon.Spear:
-            key = f"items/weapon/spear/{path_name}"
-        elif item_type == ClassTag.Weapon.Staff:
-            key = f"items/weapon/staff/{path_name}"
-        elif item_type == ClassTag.Weapon.Sword:
-            key = f"items/weapon/sword/{path_name}"
-        elif item_type == ClassTag.Weapon.Token:
-            key = f"items/weapon/token/{path_name}"
-        elif item_type == ClassTag.Equipment.Helmet:
-            key = f"items/equipment/helmet/{path_name}"
-        elif item_type == ClassTag.Equipment.ChestArmor:
-            key = f"items/equipment/chest_armor/{path_name}"
-        elif item_type == ClassTag.Equipment.Gloves:
-            key = f"items/equipment/gloves/{path_name}"
-        elif item_type == ClassTag.Equipment.Leggings:
-            key = f"items/equipment/leggings/{path_name}"
-        elif item_type == ClassTag.Equipment.Boots:
-            key = f"items/equipment/boots/{path_name}"
-        elif item_type == ClassTag.Weapon.Shield:
-            key = f"items/weapon/shield/{path_name}"
-        elif item_type == ClassTag.Equipment.Ring:
-            key = f"items/equipment/ring/{path_name}"
-        elif item_type == ClassTag.Equipment.Amulet:
-            key = f"items/equipment/amulet/{path_name}"
+        key = f"{KEY_DIRECTORIES[item_type]}/{path_name}"
 
         item = {
             "key": key,
@@ -3104,18 +3023,9 @@ if __name__ == "__main__":
         }
 
         if rarity == Rarity.Artifact:
-            item["state_tags"].append(StateTag.NeedsIdentification)
-
-        if len(item_effects) > 0:
-            item["item_effects"] = {}
-            item["item_effects"]["permanent"] = [effect.__dict__ for effect in item_effects.permanent]
-            item["item_effects"]["on_turn_start"] = [effect.__dict__ for effect in item_effects.on_turn_start]
-            item["item_effects"]["on_turn_end"] = [effect.__dict__ for effect in item_effects.on_turn_end]
-            item["item_effects"]["on_damaged"] = [effect.__dict__ for effect in item_effects.on_damaged]
-            item["item_effects"]["on_successful_ability_used"] = [effect.__dict__ for effect in item_effects.on_successful_ability_used]
-            item["item_effects"]["on_successful_attack"] = [effect.__dict__ for effect in item_effects.on_successful_attack]
-            item["item_effects"]["on_attacked"] = [effect.__dict__ for effect in item_effects.on_attacked]
-            item["item_effects"]["on_ability_used_against"] = [effect.__dict__ for effect in item_effects.on_ability_used_against]
+            item["state_tags"].append(str(StateTag.NeedsIdentification))
+
+        item["item_effects"] = {category: [effect.__getstate__() for effect in effects] for category, effects in item_effects.__getstate__().items()}
 
         if weapon_stats is not None:
             item["weapon_stats"] = {
@@ -3145,8 +3055,106 @@ if __name__ == "__main__":
         if len(attr_requirements_dict) > 0:
             item["attr_requirements"] = attr_requirements_dict
 
-        json_str = json.dumps(item, indent=4)
-        filename = f"./generated_items/{key}.json"
+        items.append(item)
+    return items
+
+# -----------------------------------------------------------------------------
+# CATALOG OUTPUT
+# -----------------------------------------------------------------------------
+
+# Batches are a fixed size with their own seeds, so a seed gives the same items
+# no matter how many workers there are
+BATCH_SIZE = 500
+# Extra items asked for to make up for the ones skipped or thrown out as duplicates
+OVERGENERATION = 1.25
+# Every type only has so many names, so stop once a round stops finding new ones
+MAX_GENERATION_ROUNDS = 10
+
+def generate_items(count: int, item_types: List[ClassTag.Weapon | ClassTag.Equipment], seed: int, num_workers: int):
+    # Items with a key or name already in the game's catalog, or already
+    # generated, are thrown out; keys are made from names, so two items with
+    # the same name would overwrite each other
+    catalog: Dict[str, dict] = {}
+    seen_keys = set(LOADED_ITEMS.get_all_keys())
+    seen_names = set(LOADED_ITEMS.get_item_state(key)["name"] for key in LOADED_ITEMS.get_all_keys())
+
+    seed_sequence = numpy.random.SeedSequence(seed)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        for _ in range(MAX_GENERATION_ROUNDS):
+            num_remaining = count - len(catalog)
+            if num_remaining <= 0:
+                break
+
+            num_batches = ceil(num_remaining * OVERGENERATION / BATCH_SIZE)
+            batch_seeds = seed_sequence.spawn(num_batches)
+            num_before = len(catalog)
+            for batch in executor.map(generate_batch, batch_seeds, [BATCH_SIZE] * num_batches, [item_types] * num_batches):
+                for item in batch:
+                    if len(catalog) >= count:
+                        break
+                    if item["key"] in seen_keys or item["name"] in seen_names:
+                        continue
+                    seen_keys.add(item["key"])
+                    seen_names.add(item["name"])
+                    catalog[item["key"]] = item
+
+            if len(catalog) == num_before:
+                break
+    return catalog
+
+
+def write_catalog(catalog: Dict[str, dict], path: str):
+    # One file keyed by item key, which LoadedItems merges in with the rest of
+    # the items. Earlier runs' items are kept, since players may already have
+    # them, and new ones were already deduped against them.
+    merged_catalog: Dict[str, dict] = {}
+    if os.path.isfile(path):
+        with open(path, "r") as file:
+            merged_catalog = json.load(file)
+    merged_catalog.update(catalog)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.tmp", "w") as file:
+        json.dump(merged_catalog, file, separators=(",", ":"))
+    os.replace(f"{path}.tmp", path)
+
+
+def write_item_files(catalog: Dict[str, dict], directory: str):
+    # The layout under features/, one file per item, for looking through them
+    for key, item in catalog.items():
+        filename = os.path.join(directory, f"{key}.json")
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         with open(filename, "w") as file:
-            file.write(json_str)
+            file.write(json.dumps(item, indent=4))
+
+
+if __name__ == "__main__":
+    item_types_by_name = {str(item_type).lower(): item_type for item_type in CLASS_TAGS.keys()}
+
+    parser = argparse.ArgumentParser(description="Generate random equipment into the game's generated item catalog.")
+    parser.add_argument("--count", type=int, default=300, help="Number of unique items to generate")
+    parser.add_argument("--types", nargs="*", default=None, help=f"Item types to generate, from: {', '.join(item_types_by_name.keys())}; defaults to all")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for a reproducible run; one is picked and printed if not given")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--output", default=GENERATED_ITEM_CATALOG_FILE, help="Catalog to add the items to; the game loads the default one")
+    parser.add_argument("--split", action="store_true", help="Also write each item to its own file under generated_items/ for reviewing")
+    args = parser.parse_args()
+
+    item_types = list(CLASS_TAGS.keys())
+    if args.types is not None:
+        unknown_types = [name for name in args.types if name.lower() not in item_types_by_name]
+        if len(unknown_types) > 0:
+            parser.error(f"Unknown item types: {', '.join(unknown_types)}")
+        item_types = [item_types_by_name[name.lower()] for name in args.types]
+
+    seed = args.seed if args.seed is not None else int(numpy.random.SeedSequence().entropy % (2 ** 63))
+
+    start_time = time.perf_counter()
+    catalog = generate_items(args.count, item_types, seed, max(1, args.workers))
+    write_catalog(catalog, args.output)
+    if args.split:
+        write_item_files(catalog, "./generated_items")
+
+    print(f"Generated {len(catalog)} items with seed {seed} in {time.perf_counter() - start_time:.2f}s, written to {args.output}")
+    if len(catalog) < args.count:
+        print(f"Only found {len(catalog)} unique names out of the {args.count} asked for.")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import argparse
+import numpy
+import random
+import time
+
+from dataclasses import dataclass, field
+from multiprocessing import Pool, freeze_support
+
+from features.npcs.mrbones import Difficulty, MrBones
+from games.knucklebones_game import KnucklebonesGame, compute_points_in_col
+
+from typing import List, Tuple
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Picks a random column that still has room
+RANDOM_STRATEGY = "Random"
+
+# (Player 1, Player 2, use luck, Player 1 luck, Player 2 luck); Mr. Bones
+# plays with his own luck when luck is enabled.
+MATCHUPS: List[Tuple[str, str, bool, int, int]] = [
+    (Difficulty.Easy, RANDOM_STRATEGY, False, 0, 0),
+    (Difficulty.Medium, RANDOM_STRATEGY, False, 0, 0),
+    (Difficulty.Hard, RANDOM_STRATEGY, False, 0, 0),
+    (Difficulty.Medium, Difficulty.Easy, False, 0, 0),
+    (Difficulty.Hard, Difficulty.Medium, False, 0, 0),
+    (Difficulty.MrBones, Difficulty.Hard, False, 0, 0),
+    (Difficulty.MrBones, Difficulty.Hard, True, -1, 0),
+    (Difficulty.Hard, Difficulty.Hard, True, 30, 0)
+]
+
+NUM_GAMES = 100000
+GAMES_PER_CHUNK = 500
+NUM_PROCESSES = 4
+BASE_SEED = 0
+
+# Move latencies are bucketed on a log scale from 1us to 1s so chunks can be
+# merged without keeping every sample around.
+LATENCY_BUCKETS = numpy.logspace(-6, 0, 121)
+
+# -----------------------------------------------------------------------------
+# RESULTS
+# -----------------------------------------------------------------------------
+
+@dataclass
+class ChunkResult():
+    wins: List[int] = field(default_factory=lambda: [0, 0])
+    ties: int = 0
+    total_moves: int = 0
+    # Golden Knucklebone bonus the winner would've received, int(total / 8)
+    golden_knucklebone_bonus: List[int] = field(default_factory=lambda: [0, 0])
+    latency_counts: List[numpy.ndarray] = field(default_factory=lambda: [numpy.zeros(len(LATENCY_BUCKETS) + 1, dtype=numpy.int64) for _ in range(2)])
+
+    def merge(self, other: ChunkResult):
+        for i in range(2):
+            self.wins[i] += other.wins[i]
+            self.golden_knucklebone_bonus[i] += other.golden_knucklebone_bonus[i]
+            self.latency_counts[i] += other.latency_counts[i]
+        self.ties += other.ties
+        self.total_moves += other.total_moves
+
+# -----------------------------------------------------------------------------
+# HELPER FUNCTIONS
+# -----------------------------------------------------------------------------
+
+_MR_BONES: MrBones | None = None
+
+def get_mr_bones():
+    # Setting up the NPC isn't free, so each worker only does it once
+    global _MR_BONES
+    if _MR_BONES is None:
+        _MR_BONES = MrBones()
+    return _MR_BONES
+
+
+def choose_column(game: KnucklebonesGame, strategy: str, rng: random.Random):
+    board = game.boards[game.turn]
+    opponent_board = game.boards[1 - game.turn]
+
+    if strategy == RANDOM_STRATEGY:
+        return rng.choice([col for col in range(3) if any(board[i][col] == 0 for i in range(3))])
+
+    # make_move plays the move on the boards it's given, so hand it copies
+    # and read back which column changed.
+    npc_board = [row[:] for row in board]
+    player_board = [row[:] for row in opponent_board]
+    get_mr_bones().make_move(player_board, npc_board, Difficulty(strategy), compute_points_in_col, game.current_roll, "", game.get_roll_weights(game.turn), game.get_roll_weights(1 - game.turn))
+    for col in range(3):
+        if any(npc_board[i][col] != board[i][col] for i in range(3)):
+            return col
+    return 0
+
+
+def record_latency(latency_counts: numpy.ndarray, latency: float):
+    latency_counts[numpy.searchsorted(LATENCY_BUCKETS, latency)] += 1
+
+
+def get_latency_percentile(latency_counts: numpy.ndarray, percentile: float):
+    total = latency_counts.sum()
+    if total == 0:
+        return 0
+    index = int(numpy.searchsorted(numpy.cumsum(latency_counts), total * percentile))
+    return LATENCY_BUCKETS[min(index, len(LATENCY_BUCKETS) - 1)]
+
+
+def run_chunk(strategies: Tuple[str, str], use_luck: bool, lucks: Tuple[int, int], num_games: int, seed: int):
+    # Easy and Medium draw from the module-level random, so seed that too
+    random.seed(seed)
+    rng = random.Random(seed)
+    result = ChunkResult()
+
+    # Keep the one-time NPC setup out of the first move's latency
+    get_mr_bones()
+
+    for _ in range(num_games):
+        game = KnucklebonesGame(rng, use_luck, lucks[0], lucks[1])
+        while not game.is_complete():
+            start_time = time.perf_counter()
+            col = choose_column(game, strategies[game.turn], rng)
+            if strategies[game.turn] != RANDOM_STRATEGY:
+                record_latency(result.latency_counts[game.turn], time.perf_counter() - start_time)
+            game.place_roll(col)
+
+        result.total_moves += game.num_moves
+        winner = game.get_winner()
+        if winner is None:
+            result.ties += 1
+        else:
+            result.wins[winner] += 1
+            result.golden_knucklebone_bonus[winner] += int(game.get_totals()[winner] / 8)
+
+    return result
+
+
+def run_matchup(pool, strategies: Tuple[str, str], use_luck: bool, lucks: Tuple[int, int], num_games: int, seed: int):
+    lucks = tuple(get_mr_bones().get_combined_attributes().luck if luck < 0 else luck for luck in lucks) # type: ignore
+
+    chunk_sizes = [GAMES_PER_CHUNK] * (num_games // GAMES_PER_CHUNK)
+    if num_games % GAMES_PER_CHUNK > 0:
+        chunk_sizes.append(num_games % GAMES_PER_CHUNK)
+
+    chunk_results: List[ChunkResult] = pool.starmap(run_chunk, [(strategies, use_luck, lucks, size, seed + i) for i, size in enumerate(chunk_sizes)])
+    result = ChunkResult()
+    for chunk_result in chunk_results:
+        result.merge(chunk_result)
+
+    print(f"{strategies[0]} (Luck {lucks[0]}) vs. {strategies[1]} (Luck {lucks[1]}){' with luck' if use_luck else ''}, {num_games} games:")
+    print(f"  Win rate: {result.wins[0] / num_games:.4f} / {result.wins[1] / num_games:.4f}, tie rate: {result.ties / num_games:.4f}")
+    print(f"  Average moves per game: {result.total_moves / num_games:.2f}")
+    # Each side stakes the same bet, so per coin bet Player 1 expects to come
+    # away with the difference between their win and loss rates.
+    print(f"  Expected payout per coin bet: {(result.wins[0] - result.wins[1]) / num_games:+.4f} / {(result.wins[1] - result.wins[0]) / num_games:+.4f}")
+    print(f"  Golden Knucklebone bonus per game: {result.golden_knucklebone_bonus[0] / num_games:.2f} / {result.golden_knucklebone_bonus[1] / num_games:.2f}")
+    for i in range(2):
+        if strategies[i] == RANDOM_STRATEGY:
+            continue
+        percentiles = ", ".join(f"p{p * 100:g} {get_latency_percentile(result.latency_counts[i], p) * 1000:.3f}ms" for p in (0.5, 0.9, 0.99, 0.999))
+        print(f"  Player {i + 1} move latency: {percentiles}")
+
+
+if __name__ == "__main__":
+    freeze_support()
+
+    parser = argparse.ArgumentParser(description="Play AI Knucklebones games headlessly and report the results.")
+    parser.add_argument("--games", type=int, default=NUM_GAMES, help="Games per matchup")
+    parser.add_argument("--processes", type=int, default=NUM_PROCESSES)
+    parser.add_argument("--seed", type=int, default=BASE_SEED)
+    args = parser.parse_args()
+
+    pool = Pool(processes=args.processes)
+    for i, (player_1_strategy, player_2_strategy, use_luck, player_1_luck, player_2_luck) in enumerate(MATCHUPS):
+        # Spread the seeds out so chunks in different matchups never share one
+        run_matchup(pool, (player_1_strategy, player_2_strategy), use_luck, (player_1_luck, player_2_luck), args.games, args.seed + i * 1000003)
+    pool.close()
+    pool.join()
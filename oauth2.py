@@ -1,5 +1,8 @@
 from http.server import HTTPServer, BaseHTTPRequestHandler
 
+from http_client import HTTPClient
+
+import asyncio
 import binascii
 import os
 import requests
@@ -9,7 +12,7 @@ import webbrowser
 
 # Adapted from: https://pyquestions.com/oauth-and-redirect-uri-in-offline-python-script
 class OAuth2:
-    def __init__(self, auth_url, token_url, client_id, client_secret, init_token=None, init_refresh_token=None, init_code=None):
+    def __init__(self, auth_url, token_url, client_id, client_secret, init_token=None, init_refresh_token=None, init_code=None, http_client=None):
         self._client_id = client_id
         self._client_secret = client_secret
         self._server, self._port = "localhost", 8080
@@ -17,6 +20,8 @@ class OAuth2:
         self._last_request_time = 0
         self._auth_url = auth_url
         self._token_url = token_url
+        self._http_client = http_client if http_client is not None else HTTPClient()
+        self._refresh_lock = asyncio.Lock()
 
         # The init token and code system is to avoid having to open a webbrowser while SSHing into
         # the bot running on an external server. You still need a valid set of data to start, but
@@ -65,48 +70,73 @@ class OAuth2:
             self._get_token(params)
     
     def _get_token(self, params):
+        # Only used for the initial interactive auth, which happens before the
+        # bot connects, so blocking here is fine.
         data = requests.get(self._token_url, params).json()
         self.token = data["access_token"]
         self.refresh_token = data["refresh_token"]
 
-    def _refresh_token(self):
-        params = {
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "grant_type": "refresh_token",
-            "refresh_token": self.refresh_token
-        }
-        self._get_token(params)
+    async def _refresh_token(self, stale_token):
+        # Many requests can find out the token expired at the same time, but only
+        # the first should refresh it; the rest wait and then use the new token.
+        async with self._refresh_lock:
+            if self.token != stale_token:
+                return
+
+            params = {
+                "client_id": self._client_id,
+                "client_secret": self._client_secret,
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token
+            }
+            data = (await self._http_client.get(self._token_url, params)).json()
+            if not isinstance(data, dict) or "access_token" not in data or "refresh_token" not in data:
+                raise PermissionError("Could not refresh the OAuth2 token")
+            self.token = data["access_token"]
+            self.refresh_token = data["refresh_token"]
     
-    def _request(self, func, url, params, sleep=5, cooldown=600):
+    async def _request(self, method, url, params, ttl=None, sleep=5, cooldown=600):
+        cache_params = dict(params)
+        if ttl is not None:
+            cached = self._http_client.get_cached(method, url, cache_params)
+            if cached is not None:
+                return cached
+
         t = time.time()
-        if t - self._last_request_time < sleep:
-            time.sleep(sleep - t + self._last_request_time)
-        self._last_request_time = t
+        self._last_request_time = max(t, self._last_request_time + sleep)
+        if self._last_request_time > t:
+            await asyncio.sleep(self._last_request_time - t)
         max_sleep = 16 * sleep
-        params["access_token"] = self.token
         
         while True:
             try:
-                response = func(url, params)
+                token = self.token
+                params["access_token"] = token
+                response = await self._http_client.request(method, url, params)
                 data = response.json()
+                # Error bodies aren't always objects, and anything else can't
+                # carry one of the error fields below
+                if not isinstance(data, dict):
+                    data = {}
                 if data.get("error_code") == 429:
                     sleep *= 2
-                    time.sleep(sleep)
+                    await asyncio.sleep(sleep)
                     if sleep > max_sleep:
                         raise ConnectionError("Request timed out - server is busy.")
                 elif data.get("error") == "user_api_threshold":
                     raise ConnectionError("Too many requests")
                 elif data.get("error") == "invalid_token":
-                    self._refresh_token()
-                    params["access_token"] = self.token
+                    await self._refresh_token(token)
                 else:
+                    # Only cache once we know it isn't an error wrapped in a 200
+                    if ttl is not None and response.ok:
+                        self._http_client.set_cached(method, url, cache_params, response, ttl)
                     return response
             except ConnectionError:
-                time.sleep(cooldown)
+                await asyncio.sleep(cooldown)
 
-    def get(self, url, params):
-        return self._request(requests.get, url, params)
+    async def get(self, url, params, ttl=None):
+        return await self._request("GET", url, params, ttl)
 
-    def post(self, url, params):
-        return self._request(requests.post, url, params)
+    async def post(self, url, params):
+        return await self._request("POST", url, params)
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import argparse
+import datetime
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from features.shared.metrics import METRICS_EXPORT_SECONDS, METRICS_FILE
+from features.shared.sharding import SHARD_COUNT_ENV, SHARD_IDS_ENV, ShardConfig, split_database
+
+from typing import Dict, List, Tuple
+
+# -----------------------------------------------------------------------------
+# SHARD COORDINATOR
+# -----------------------------------------------------------------------------
+
+# Runs the bot as several processes, each connecting with its own subset of
+# shards and keeping its own database, tick schedule and metrics, so the bot
+# isn't limited to one core. This process just supervises them:
+#
+#   python shard_coordinator.py --shards 8 --processes 4
+#
+# Before starting them it splits the database into a file per shard, if it
+# isn't already split for that many shards. It restarts any bot process that
+# exits, merges each process' metrics file into metrics.prom, and reads owner
+# commands from stdin:
+#
+#   status            Which processes are running and for how long
+#   save              Every process saves its database
+#   restart <index>   Restart one process
+#   stop              Stop every process and exit
+#
+# Owner commands sent in Discord still work, but only reach the process that
+# owns the guild they're sent in.
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+BOT_SCRIPT = os.path.join(REPO_ROOT, "bot.py")
+
+POLL_SECONDS = 1
+# A process that exits sooner than this after starting is probably crashing on
+# startup, so each restart waits twice as long as the last, up to the max
+MIN_HEALTHY_UPTIME_SECONDS = 60
+RESTART_DELAY_SECONDS = 5
+MAX_RESTART_DELAY_SECONDS = 300
+# Processes save their database as they stop, so they get a while to do it
+STOP_TIMEOUT_SECONDS = 300
+
+
+def log(message: str):
+    print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}", flush=True)
+
+
+def split_shards(shard_count: int, num_processes: int) -> List[List[int]]:
+    # Contiguous ranges, spread as evenly as they'll go
+    shard_groups: List[List[int]] = []
+    start = 0
+    for i in range(num_processes):
+        size = shard_count // num_processes + (1 if i < shard_count % num_processes else 0)
+        shard_groups.append(list(range(start, start + size)))
+        start += size
+    return shard_groups
+
+# -----------------------------------------------------------------------------
+# SHARD PROCESS
+# -----------------------------------------------------------------------------
+
+class ShardProcess():
+    def __init__(self, shard_count: int, shard_ids: List[int]):
+        self._config = ShardConfig(shard_count, shard_ids)
+        self._process: subprocess.Popen | None = None
+
+        self._start_time: float = 0
+        self._restart_delay: float = RESTART_DELAY_SECONDS
+        self._restart_at: float | None = None
+        self._num_restarts: int = 0
+        self._is_stopping: bool = False
+
+    def get_config(self):
+        return self._config
+
+    def get_name(self):
+        return f"shards {self._config.get_name()}"
+
+    def start(self):
+        env = dict(os.environ)
+        env[SHARD_COUNT_ENV] = str(self._config.get_shard_count())
+        env[SHARD_IDS_ENV] = ",".join(str(shard_id) for shard_id in self._config.get_shard_ids() or [])
+
+        # In its own session so Ctrl+C on the coordinator doesn't also reach
+        # the bot directly; a second SIGINT would interrupt its final save
+        self._process = subprocess.Popen([sys.executable, BOT_SCRIPT], cwd=REPO_ROOT, env=env, start_new_session=True)
+        self._start_time = time.monotonic()
+        self._restart_at = None
+        log(f"Started {self.get_name()} (pid {self._process.pid})")
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def get_uptime(self):
+        return time.monotonic() - self._start_time if self.is_running() else 0
+
+    def get_num_restarts(self):
+        return self._num_restarts
+
+    def check(self):
+        # Restarts the process if it's exited, after a delay
+        if self._process is None:
+            return
+
+        if self._restart_at is not None:
+            if time.monotonic() >= self._restart_at:
+                self._num_restarts += 1
+                self.start()
+            return
+
+        exit_code = self._process.poll()
+        if exit_code is None:
+            return
+
+        if time.monotonic() - self._start_time < MIN_HEALTHY_UPTIME_SECONDS:
+            self._restart_delay = min(self._restart_delay * 2, MAX_RESTART_DELAY_SECONDS)
+        else:
+            self._restart_delay = RESTART_DELAY_SECONDS
+        self._restart_at = time.monotonic() + self._restart_delay
+        log(f"{self.get_name()} exited with code {exit_code}, restarting in {self._restart_delay}s")
+
+    def begin_stop(self):
+        # Lets every process save at once when they're all being stopped
+        if self.is_running():
+            assert self._process is not None
+            self._process.send_signal(signal.SIGINT)
+            self._is_stopping = True
+
+    def send_signal(self, sig: int):
+        if self.is_running():
+            assert self._process is not None
+            self._process.send_signal(sig)
+
+    def stop(self):
+        if self._process is None:
+            return
+        process = self._process
+        self._process = None
+        is_stopping = self._is_stopping
+        self._is_stopping = False
+        if process.poll() is not None:
+            return
+
+        # Same as pressing Ctrl+C on a single bot process, which saves the
+        # database as the bot closes
+        if not is_stopping:
+            process.send_signal(signal.SIGINT)
+        try:
+            process.wait(STOP_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            log(f"{self.get_name()} didn't stop in {STOP_TIMEOUT_SECONDS}s, killing it")
+            process.kill()
+            process.wait()
+        log(f"Stopped {self.get_name()}")
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+# -----------------------------------------------------------------------------
+# METRICS
+# -----------------------------------------------------------------------------
+
+def merge_prometheus_files(paths: List[str]):
+    # Each process labels its series with its shard, so merging is just
+    # grouping every file's series under one HELP and TYPE per metric
+    families: Dict[str, Tuple[List[str], List[str]]] = {}
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        with open(path, "r") as file:
+            current_name: str | None = None
+            for line in file.read().splitlines():
+                if line.startswith("# HELP ") or line.startswith("# TYPE "):
+                    current_name = line.split(" ")[2]
+                    header_lines, _ = families.setdefault(current_name, ([], []))
+                    if line not in header_lines:
+                        header_lines.append(line)
+                elif line != "" and current_name is not None:
+                    families[current_name][1].append(line)
+
+    lines: List[str] = []
+    for header_lines, series_lines in families.values():
+        lines += header_lines + series_lines
+    return "\n".join(lines) + "\n"
+
+
+def write_merged_metrics(shard_processes: List[ShardProcess]):
+    merged = merge_prometheus_files([shard_process.get_config().get_metrics_path(METRICS_FILE) for shard_process in shard_processes])
+    tmp_path = f"{METRICS_FILE}.tmp"
+    with open(tmp_path, "w") as file:
+        file.write(merged)
+    os.replace(tmp_path, METRICS_FILE)
+
+# -----------------------------------------------------------------------------
+# OWNER COMMANDS
+# -----------------------------------------------------------------------------
+
+def read_commands(commands: queue.Queue[str]):
+    for line in sys.stdin:
+        commands.put(line.strip())
+
+
+def handle_command(command: str, shard_processes: List[ShardProcess]):
+    # Returns whether the coordinator should keep running
+    parts = command.split()
+    if len(parts) == 0:
+        return True
+
+    if parts[0] == "status":
+        for i, shard_process in enumerate(shard_processes):
+            status_str = f"up {datetime.timedelta(seconds=int(shard_process.get_uptime()))}" if shard_process.is_running() else "down"
+            log(f"{i}: {shard_process.get_name()}, {status_str}, {shard_process.get_num_restarts()} restarts")
+    elif parts[0] == "save":
+        if not hasattr(signal, "SIGUSR1"):
+            log("Saving through the coordinator isn't supported on this platform")
+            return True
+        for shard_process in shard_processes:
+            shard_process.send_signal(signal.SIGUSR1)
+        log("Asked every process to save its database")
+    elif parts[0] == "restart" and len(parts) == 2 and parts[1].isdigit() and int(parts[1]) < len(shard_processes):
+        shard_processes[int(parts[1])].restart()
+    elif parts[0] == "stop":
+        return False
+    else:
+        log("Commands: status, save, restart <index>, stop")
+    return True
+
+# -----------------------------------------------------------------------------
+# MAIN
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the bot as several processes that each own some of its shards.")
+    parser.add_argument("--shards", type=int, required=True, help="Total number of shards")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Number of bot processes; defaults to one per core")
+    args = parser.parse_args()
+
+    # The bot's files are all relative to the repo, which is where the bot
+    # processes run
+    os.chdir(REPO_ROOT)
+    try:
+        if split_database(args.shards):
+            log(f"Split the database into {args.shards} shards")
+    except RuntimeError as e:
+        log(f"Couldn't split the database: {e}")
+        sys.exit(1)
+
+    num_processes = max(1, min(args.processes, args.shards))
+    shard_processes = [ShardProcess(args.shards, shard_ids) for shard_ids in split_shards(args.shards, num_processes)]
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    commands: queue.Queue[str] = queue.Queue()
+    threading.Thread(target=read_commands, args=(commands,), name="coordinator-commands", daemon=True).start()
+
+    for shard_process in shard_processes:
+        shard_process.start()
+
+    last_metrics_write = time.monotonic()
+    while not stop_event.wait(POLL_SECONDS):
+        while not commands.empty():
+            if not handle_command(commands.get(), shard_processes):
+                stop_event.set()
+                break
+
+        if stop_event.is_set():
+            break
+
+        for shard_process in shard_processes:
+            shard_process.check()
+
+        if time.monotonic() - last_metrics_write >= METRICS_EXPORT_SECONDS:
+            write_merged_metrics(shard_processes)
+            last_metrics_write = time.monotonic()
+
+    for shard_process in shard_processes:
+        shard_process.begin_stop()
+    for shard_process in shard_processes:
+        shard_process.stop()
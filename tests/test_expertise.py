@@ -0,0 +1,60 @@
+import unittest
+
+from math import ceil
+
+from features.expertise import INITIAL_TABLE_SIZE, Expertise, get_max_hp_for_con, get_max_mana_for_int
+from features.shared.attributes import Attributes
+from features.shared.constants import BASE_CON_HEALTH_SCALE, BASE_HP, BASE_INT_MANA_SCALE, BASE_MANA, CON_HEALTH_SCALE_ADJUST, CON_HEALTH_SCALE_REDUCTION, INT_MANA_SCALE_ADJUST, INT_MANA_SCALE_REDUCTION, MIN_CON_HEALTH_SCALE, MIN_INT_MANA_SCALE
+
+# -----------------------------------------------------------------------------
+# ORIGINAL LOOPS
+# -----------------------------------------------------------------------------
+
+# What update_stats did before the tables, once per point of the attribute
+def loop_max_hp(constitution: int):
+    max_hp: int = BASE_HP
+    for con in range(constitution):
+        max_hp += ceil(max_hp * max(BASE_CON_HEALTH_SCALE - CON_HEALTH_SCALE_REDUCTION * (con / CON_HEALTH_SCALE_ADJUST), MIN_CON_HEALTH_SCALE))
+    return max_hp
+
+
+def loop_max_mana(intelligence: int):
+    max_mana: int = BASE_MANA
+    for intel in range(intelligence):
+        max_mana += ceil(max_mana * max(BASE_INT_MANA_SCALE - INT_MANA_SCALE_REDUCTION * (intel / INT_MANA_SCALE_ADJUST), MIN_INT_MANA_SCALE))
+    return max_mana
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+# Attributes aren't capped, so this goes from debuffed values well past the
+# initial table and the point where the scales bottom out
+ATTRIBUTE_RANGE = range(-20, 4 * INITIAL_TABLE_SIZE)
+
+class TestMaxHPAndManaTables(unittest.TestCase):
+    def test_max_hp_matches_loop(self):
+        for constitution in ATTRIBUTE_RANGE:
+            self.assertEqual(get_max_hp_for_con(constitution), loop_max_hp(constitution), f"Con {constitution}")
+
+    def test_max_mana_matches_loop(self):
+        for intelligence in ATTRIBUTE_RANGE:
+            self.assertEqual(get_max_mana_for_int(intelligence), loop_max_mana(intelligence), f"Int {intelligence}")
+
+    def test_tables_extend_out_of_order(self):
+        # Asking for a large value first has to fill in everything below it
+        attribute = 8 * INITIAL_TABLE_SIZE
+        self.assertEqual(get_max_hp_for_con(attribute), loop_max_hp(attribute))
+        self.assertEqual(get_max_mana_for_int(attribute), loop_max_mana(attribute))
+        self.assertEqual(get_max_hp_for_con(attribute - 1), loop_max_hp(attribute - 1))
+
+    def test_update_stats(self):
+        expertise = Expertise()
+        for constitution, intelligence in [(0, 0), (5, 12), (300, 40), (-3, 700)]:
+            expertise.update_stats(Attributes(constitution, 0, 0, intelligence, 0, 0))
+            self.assertEqual(expertise.max_hp, loop_max_hp(constitution))
+            self.assertEqual(expertise.max_mana, loop_max_mana(intelligence))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import copy
+import random
+import unittest
+
+from features.house.garden import GardenPlot, sample_first_mutation
+from features.house.house import House
+from features.shared.enums import HouseRoom
+from features.shared.item import LOADED_ITEMS, ItemKey
+
+from typing import List
+
+# -----------------------------------------------------------------------------
+# HELPERS
+# -----------------------------------------------------------------------------
+
+def make_garden(size: int, seaclover_indices: List[int], ash_indices: List[int]):
+    # Mature Seaclover in some plots and empty Ash plots that can mutate next
+    # to them
+    house = House()
+    house.house_rooms.append(HouseRoom.Garden)
+    house.garden_plots = [GardenPlot() for _ in range(size * size)]
+    for i in seaclover_indices:
+        plot = house.garden_plots[i]
+        plot.plant_seed(LOADED_ITEMS.get_new_item(ItemKey.SeacloverSeed))
+        assert plot.seed_data is not None
+        plot.tick(plot.seed_data.ticks_until_mature)
+    for i in ash_indices:
+        house.garden_plots[i].soil = LOADED_ITEMS.get_new_item(ItemKey.Ash)
+    return house
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestSampleFirstMutation(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def test_certain_mutation_happens_on_the_first_tick(self):
+        self.assertEqual(sample_first_mutation([(ItemKey.GraspleafSeed, 1)]), (1, ItemKey.GraspleafSeed))
+
+    def test_impossible_mutations(self):
+        self.assertIsNone(sample_first_mutation([]))
+        self.assertIsNone(sample_first_mutation([(ItemKey.GraspleafSeed, 0)]))
+        # Always rolled, but never picked over the starting minimum of 1
+        self.assertIsNone(sample_first_mutation([(ItemKey.GraspleafSeed, 1.2)]))
+
+    def test_later_results_win_ties(self):
+        self.assertEqual(sample_first_mutation([(ItemKey.GraspleafSeed, 1), (ItemKey.BramblefrondSeed, 1)]), (1, ItemKey.BramblefrondSeed))
+
+    def test_matches_rolling_every_tick(self):
+        chances = [(ItemKey.GraspleafSeed, 0.3), (ItemKey.BramblefrondSeed, 0.1)]
+        num_samples = 20000
+        samples = [sample_first_mutation(chances) for _ in range(num_samples)]
+
+        # Each tick nothing happens with 0.7 * 0.9 = 0.63, so it's first on
+        # tick 1 with 0.37 and tick 2 with 0.63 * 0.37
+        first_ticks = [sample[0] for sample in samples if sample is not None]
+        self.assertAlmostEqual(first_ticks.count(1) / num_samples, 0.37, delta=0.015)
+        self.assertAlmostEqual(first_ticks.count(2) / num_samples, 0.63 * 0.37, delta=0.015)
+
+        # The rarer Bramblefrond wins whenever it comes up: 0.1 of the 0.37
+        results = [sample[1] for sample in samples if sample is not None]
+        self.assertAlmostEqual(results.count(ItemKey.BramblefrondSeed) / num_samples, 0.1 / 0.37, delta=0.015)
+
+
+class TestGardenCatchUp(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def test_matches_ticking_one_at_a_time(self):
+        # The Ash plot between two Seaclover mutates with 0.6 a tick
+        garden = make_garden(2, [0, 3], [1])
+        num_runs = 3000
+        num_ticks = 2
+
+        one_at_a_time = 0
+        caught_up = 0
+        for _ in range(num_runs):
+            house = copy.deepcopy(garden)
+            for _ in range(num_ticks):
+                house.tick()
+            one_at_a_time += house.garden_plots[1].seed is not None
+
+            house = copy.deepcopy(garden)
+            house.tick(num_ticks)
+            caught_up += house.garden_plots[1].seed is not None
+
+        self.assertAlmostEqual(one_at_a_time / num_runs, 1 - 0.4 ** num_ticks, delta=0.03)
+        self.assertAlmostEqual(caught_up / num_runs, 1 - 0.4 ** num_ticks, delta=0.03)
+
+    def test_cost_doesnt_grow_with_time_away(self):
+        garden = make_garden(4, [0, 3, 6, 9, 12, 15], [i for i in range(16) if i % 3 != 0])
+
+        num_steps: List[int] = []
+        for num_ticks in (24 * 7, 24 * 365):
+            house = copy.deepcopy(garden)
+            sample_next_mutations = house._sample_next_mutations
+            steps = [0]
+            def counting_sample_next_mutations(max_ticks: int):
+                steps[0] += 1
+                return sample_next_mutations(max_ticks)
+            house._sample_next_mutations = counting_sample_next_mutations # type: ignore
+            house.tick(num_ticks)
+            num_steps.append(steps[0])
+
+        # Mutations can't go on forever, since none of them lead back to the
+        # plants they need, so even a year away takes a handful of steps
+        self.assertLess(num_steps[0], 100)
+        self.assertLess(num_steps[1], 100)
@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+
+from features.shared.guild_locks import GuildLocks
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestSnapshot(unittest.IsolatedAsyncioTestCase):
+    async def test_copy_is_unaffected_by_later_changes(self):
+        locks = GuildLocks()
+        data = {"members": {"1": {"coins": 5, "items": ["Sword"]}}}
+
+        snapshot = await locks.snapshot(1, data)
+        data["members"]["1"]["coins"] = 10
+        data["members"]["1"]["items"].append("Shield")
+
+        self.assertEqual(snapshot, {"members": {"1": {"coins": 5, "items": ["Sword"]}}})
+
+    async def test_waits_for_the_holder(self):
+        locks = GuildLocks()
+        data = {"coins": 0}
+        entered = asyncio.Event()
+
+        async def change_in_two_steps():
+            async with locks.hold(1):
+                data["coins"] = 1
+                entered.set()
+                await asyncio.sleep(0.01)
+                data["coins"] = 2
+
+        task = asyncio.create_task(change_in_two_steps())
+        await entered.wait()
+        snapshot = await locks.snapshot(1, data)
+        await task
+
+        # Never the half-changed state
+        self.assertEqual(snapshot, {"coins": 2})
+
+    async def test_other_guilds_dont_wait(self):
+        locks = GuildLocks()
+        async with locks.hold(1):
+            async with asyncio.timeout(1):
+                snapshot = await locks.snapshot(2, [1, 2])
+        self.assertEqual(snapshot, [1, 2])
+
+    async def test_can_be_taken_while_holding_the_lock(self):
+        locks = GuildLocks()
+        async with locks.hold(1):
+            # Same task, so it doesn't wait on itself
+            async with asyncio.timeout(1):
+                snapshot = await locks.snapshot(1, [1, 2])
+        self.assertEqual(snapshot, [1, 2])
@@ -0,0 +1,162 @@
+import aiohttp
+import asyncio
+import os
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from cogs.images import Images
+from http_client import HTTPClient
+from oauth2 import OAuth2
+from unittest import mock
+
+from typing import Dict
+
+# -----------------------------------------------------------------------------
+# STUB SERVER
+# -----------------------------------------------------------------------------
+
+# Stands in for XKCD and DeviantArt, counting how many requests reach it
+class StubServer():
+    def __init__(self, response_delay: float=0):
+        self.hits: Dict[str, int] = {}
+        self.response_delay = response_delay
+        self.valid_token = "new_token"
+        self.token_body = {"access_token": self.valid_token, "refresh_token": "new_refresh_token"}
+        self.gallery_error = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/info.0.json", self._xkcd_latest)
+        self.app.router.add_get("/{comic_num}/info.0.json", self._xkcd_comic)
+        self.app.router.add_get("/oauth2/token", self._token)
+        self.app.router.add_get("/api/gallery/all", self._gallery)
+        self.server = TestServer(self.app)
+
+    def get_url(self, path: str=""):
+        return str(self.server.make_url(path))
+
+    def _hit(self, name: str):
+        self.hits[name] = self.hits.get(name, 0) + 1
+
+    def _comic(self, num: int):
+        return {"num": num, "title": f"Comic {num}", "alt": "", "img": "", "year": "2020", "month": "1", "day": "1"}
+
+    async def _xkcd_latest(self, request: web.Request):
+        self._hit("latest")
+        await asyncio.sleep(self.response_delay)
+        return web.json_response(self._comic(100))
+
+    async def _xkcd_comic(self, request: web.Request):
+        self._hit("comic")
+        await asyncio.sleep(self.response_delay)
+        return web.json_response(self._comic(int(request.match_info["comic_num"])))
+
+    async def _token(self, request: web.Request):
+        self._hit("token")
+        await asyncio.sleep(self.response_delay)
+        return web.json_response(self.token_body)
+
+    async def _gallery(self, request: web.Request):
+        self._hit("gallery")
+        if self.gallery_error is not None:
+            return web.json_response(self.gallery_error, status=502)
+        # DA reports expired tokens in a 200
+        if request.query.get("access_token") != self.valid_token:
+            return web.json_response({"error": "invalid_token"})
+        return web.json_response({"results": []})
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestHTTPClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.stub = StubServer()
+        await self.stub.server.start_server()
+        self.session = aiohttp.ClientSession()
+        self.client = HTTPClient(session=self.session)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.session.close()
+        await self.stub.server.close()
+
+    async def test_ttl_cache(self):
+        url = self.stub.get_url("/1/info.0.json")
+        first = await self.client.get(url, ttl=0.2)
+        second = await self.client.get(url, ttl=0.2)
+        self.assertEqual(self.stub.hits["comic"], 1)
+        self.assertEqual(first.json(), second.json())
+
+        await asyncio.sleep(0.3)
+        await self.client.get(url, ttl=0.2)
+        self.assertEqual(self.stub.hits["comic"], 2)
+
+    async def test_uncached_requests_go_out(self):
+        url = self.stub.get_url("/1/info.0.json")
+        await self.client.get(url)
+        await self.client.get(url)
+        self.assertEqual(self.stub.hits["comic"], 2)
+
+    async def test_concurrent_gets_are_single_flight(self):
+        self.stub.response_delay = 0.1
+        responses = await asyncio.gather(*[self.client.get(self.stub.get_url("/info.0.json")) for _ in range(5)])
+        self.assertEqual(self.stub.hits["latest"], 1)
+        self.assertTrue(all(response.json()["num"] == 100 for response in responses))
+
+    async def test_refresh_is_single_flight(self):
+        self.stub.response_delay = 0.1
+        oauth = OAuth2(self.stub.get_url("/oauth2/authorize"), self.stub.get_url("/oauth2/token"), "id", "secret", "stale_token", "refresh_token", "code", self.client)
+
+        responses = await asyncio.gather(*[oauth._request("GET", self.stub.get_url("/api/gallery/all"), {"offset": i}, sleep=0) for i in range(3)])
+        self.assertEqual(self.stub.hits["token"], 1)
+        self.assertEqual(oauth.token, self.stub.valid_token)
+        self.assertTrue(all(response.json() == {"results": []} for response in responses))
+
+    async def test_list_error_body_is_returned(self):
+        self.stub.gallery_error = ["Bad Gateway"]
+        oauth = OAuth2(self.stub.get_url("/oauth2/authorize"), self.stub.get_url("/oauth2/token"), "id", "secret", self.stub.valid_token, "refresh_token", "code", self.client)
+
+        response = await oauth._request("GET", self.stub.get_url("/api/gallery/all"), {}, ttl=60, sleep=0)
+        self.assertFalse(response.ok)
+        self.assertEqual(response.json(), ["Bad Gateway"])
+        self.assertIsNone(self.client.get_cached("GET", self.stub.get_url("/api/gallery/all"), {}))
+
+    async def test_bad_token_body_fails_auth(self):
+        self.stub.token_body = ["invalid_client"]
+        oauth = OAuth2(self.stub.get_url("/oauth2/authorize"), self.stub.get_url("/oauth2/token"), "id", "secret", "stale_token", "refresh_token", "code", self.client)
+
+        # Both fail cleanly, so the refresh lock was released after the first
+        for _ in range(2):
+            with self.assertRaises(PermissionError):
+                await oauth._request("GET", self.stub.get_url("/api/gallery/all"), {}, sleep=0)
+        self.assertEqual(oauth.token, "stale_token")
+
+
+class TestImagesCog(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.stub = StubServer()
+        await self.stub.server.start_server()
+        self.session = aiohttp.ClientSession()
+
+        env = {"DA_CLIENT_ID": "id", "DA_CLIENT_SECRET": "secret", "DA_OAUTH_TOKEN": "token", "DA_OAUTH_REFRESH_TOKEN": "refresh_token", "DA_OAUTH_CODE": "code"}
+        with mock.patch.dict(os.environ, env):
+            self.cog = Images(mock.MagicMock(), HTTPClient(session=self.session), xkcd_base_url=self.stub.get_url(), da_oauth_url=self.stub.get_url("/oauth2"), da_api_url=self.stub.get_url("/api"))
+
+    async def asyncTearDown(self):
+        await self.cog.cog_unload()
+        await self.session.close()
+        await self.stub.server.close()
+
+    async def test_xkcd_uses_base_url_and_cache(self):
+        context = mock.MagicMock()
+        context.send = mock.AsyncMock()
+
+        await Images.xkcd_handler.callback(self.cog, context, "42")
+        await Images.xkcd_handler.callback(self.cog, context, "42")
+        self.assertEqual(self.stub.hits["comic"], 1)
+        self.assertEqual(context.send.await_args.kwargs["embed"].title, "XKCD #42: Comic 42")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+import unittest
+
+from features.shared.item import LOADED_ITEMS, Item, load_item_states
+from item_generator import generate_items, write_catalog, CLASS_TAGS
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestGeneratedCatalog(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.catalog_path = os.path.join(self._directory.name, "generated_catalog.json")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_generated_items_load_with_the_game_items(self):
+        catalog = generate_items(20, list(CLASS_TAGS.keys()), seed=1, num_workers=1)
+        write_catalog(catalog, self.catalog_path)
+
+        states = load_item_states(self.catalog_path)
+        self.assertEqual(len(states), len(LOADED_ITEMS.get_all_keys()) + 20)
+        for key in catalog.keys():
+            item = Item.load_from_state(states[key])
+            self.assertEqual(item.get_key(), key)
+
+    def test_later_runs_add_to_the_catalog(self):
+        first = generate_items(5, list(CLASS_TAGS.keys()), seed=1, num_workers=1)
+        second = generate_items(5, list(CLASS_TAGS.keys()), seed=2, num_workers=1)
+        write_catalog(first, self.catalog_path)
+        write_catalog(second, self.catalog_path)
+
+        with open(self.catalog_path, "r") as file:
+            self.assertEqual(set(json.load(file).keys()), set(first.keys()) | set(second.keys()))
+
+    def test_hand_made_items_win_over_the_catalog(self):
+        key = next(iter(LOADED_ITEMS.get_all_keys()))
+        with open(self.catalog_path, "w") as file:
+            json.dump({key: {"key": key, "name": "Impostor"}}, file)
+
+        self.assertEqual(load_item_states(self.catalog_path)[key], LOADED_ITEMS.get_item_state(key))
@@ -0,0 +1,121 @@
+import copy
+import jsonpickle
+import unittest
+
+from features.leaderboards import GuildLeaderboards, RankedIndex
+from features.player import Player
+from features.stats import LeaderboardCategory, Stats
+
+from typing import List, Tuple
+
+# -----------------------------------------------------------------------------
+# RANKED INDEX
+# -----------------------------------------------------------------------------
+
+class TestRankedIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = RankedIndex()
+        self.index.bulk_load({"a": 10, "b": 30, "c": 10, "d": 5})
+
+    def test_orders_highest_first_and_breaks_ties_by_id(self):
+        self.assertEqual(self.index.get_top(4), [("b", 30), ("a", 10), ("c", 10), ("d", 5)])
+
+    def test_tied_players_share_a_rank(self):
+        self.assertEqual([self.index.get_rank(player_id) for player_id in "abcd"], [2, 1, 2, 4])
+
+    def test_unknown_players_have_no_rank(self):
+        self.assertIsNone(self.index.get_rank("e"))
+        self.assertEqual(self.index.get_value("e"), 0)
+
+    def test_updates_move_the_player(self):
+        self.index.set_value("d", 20)
+        self.assertEqual(self.index.get_top(4), [("b", 30), ("d", 20), ("a", 10), ("c", 10)])
+        self.assertEqual(self.index.get_rank("a"), 3)
+
+        self.index.add_to_value("c", 1)
+        self.assertEqual(self.index.get_rank("c"), 3)
+        self.assertEqual(self.index.get_rank("a"), 4)
+        self.assertEqual(len(self.index), 4)
+
+    def test_updates_to_break_a_tie(self):
+        self.index.add_to_value("a", -5)
+        self.assertEqual(self.index.get_top(4), [("b", 30), ("c", 10), ("a", 5), ("d", 5)])
+        self.assertEqual(self.index.get_rank("a"), 3)
+        self.assertEqual(self.index.get_rank("d"), 3)
+
+    def test_adding_to_a_new_player(self):
+        self.index.add_to_value("e", 40)
+        self.assertEqual(self.index.get_rank("e"), 1)
+        self.assertEqual(len(self.index), 5)
+
+    def test_pages(self):
+        self.assertEqual(self.index.get_top(2, start=2), [("c", 10), ("d", 5)])
+        self.assertEqual(self.index.get_top(2, start=4), [])
+
+# -----------------------------------------------------------------------------
+# STAT LISTENERS
+# -----------------------------------------------------------------------------
+
+class TestLeaderboardStat(unittest.TestCase):
+    def setUp(self):
+        self.stats = Stats()
+        self.changes: List[Tuple[LeaderboardCategory, int]] = []
+        self.stats.set_leaderboard_listener(lambda category, delta: self.changes.append((category, delta)))
+
+    def test_fires_on_changes(self):
+        self.stats.fish.common_fish_caught += 2
+        self.stats.fish.rare_fish_caught += 1
+        self.stats.market.coins_made += 50
+
+        self.assertEqual(self.changes, [
+            (LeaderboardCategory.FishCaught, 2),
+            (LeaderboardCategory.FishCaught, 1),
+            (LeaderboardCategory.CoinsMade, 50)
+        ])
+        self.assertEqual(self.stats.get_leaderboard_value(LeaderboardCategory.FishCaught), 3)
+
+    def test_not_for_unchanged_values_or_other_counters(self):
+        self.stats.fish.common_fish_caught += 0
+        self.stats.fish.common_items_caught += 1
+        self.assertEqual(self.changes, [])
+
+    def test_not_for_copies(self):
+        stats_copy = copy.deepcopy(self.stats)
+        stats_copy.fish.common_fish_caught += 2
+
+        decoded = jsonpickle.decode(jsonpickle.encode(self.stats, make_refs=False))
+        decoded.fish.common_fish_caught += 3
+
+        self.assertEqual(self.changes, [])
+        self.assertEqual(stats_copy.fish.common_fish_caught, 2)
+        self.assertEqual(decoded.fish.common_fish_caught, 3)
+        self.assertEqual(self.stats.fish.common_fish_caught, 0)
+
+    def test_counters_save_like_any_other(self):
+        self.stats.fish.common_fish_caught += 2
+        decoded = jsonpickle.decode(jsonpickle.encode(self.stats, make_refs=False))
+        self.assertEqual(decoded.fish.common_fish_caught, 2)
+
+# -----------------------------------------------------------------------------
+# GUILD LEADERBOARDS
+# -----------------------------------------------------------------------------
+
+class TestGuildLeaderboards(unittest.TestCase):
+    def test_follows_players_stats(self):
+        first = Player("1")
+        second = Player("2")
+        first.get_stats().dueling.duels_won += 3
+
+        leaderboards = GuildLeaderboards()
+        leaderboards.bulk_load({"1": first, "2": second})
+        index = leaderboards.get_index(LeaderboardCategory.DuelsWon)
+        self.assertEqual(index.get_top(2), [("1", 3), ("2", 0)])
+
+        second.get_stats().dueling.duels_won += 5
+        copy.deepcopy(first).get_stats().dueling.duels_won += 10
+        self.assertEqual(index.get_top(2), [("2", 5), ("1", 3)])
+
+        third = Player("3")
+        leaderboards.add_player("3", third)
+        third.get_stats().dueling.duels_won += 4
+        self.assertEqual(index.get_rank("3"), 2)
@@ -0,0 +1,183 @@
+import os
+import tempfile
+import time
+import unittest
+
+from features.mail import MailStore, Mail
+from features.player import Player
+from features.shared.constants import MAIL_RETENTION_SECONDS
+
+from typing import Dict, List
+
+# -----------------------------------------------------------------------------
+# HELPERS
+# -----------------------------------------------------------------------------
+
+def make_mail(sender_name: str):
+    return Mail(sender_name, None, 1, "", "2024-01-01", -1)
+
+
+def owns_everything(guild_id_str: str):
+    return True
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class MailStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, "mail.db")
+        self.store = self.open_store()
+
+    def tearDown(self):
+        self.store.close()
+        self._directory.cleanup()
+
+    def open_store(self):
+        store = MailStore()
+        store.open(self.path)
+        return store
+
+    def restart(self):
+        # Like the process stopping and starting again on the same file
+        self.store.close()
+        self.store = self.open_store()
+
+    def get_unclaimed_names(self, guild_id: str, recipient_id: str) -> List[str]:
+        return [mail.get_sender_name() for mail in self.store.get_page(guild_id, recipient_id, 0, 100)]
+
+
+class TestRollBack(MailStoreTestCase):
+    def test_undoes_sends_and_claims_after_the_save(self):
+        self.store.send_all("g", "u", [make_mail("a"), make_mail("b")])
+        self.store.claim_all("g", "u")
+        saved_sequence = self.store.get_sequence()
+
+        self.store.send("g", "u", make_mail("c"))
+        self.store.claim_all("g", "u")
+        self.store.send("g", "u", make_mail("d"))
+
+        self.restart()
+        self.store.roll_back_to_saved({"g": saved_sequence}, owns_everything)
+
+        # a and b were claimed before the save; c and d were sent after it
+        self.assertEqual(self.get_unclaimed_names("g", "u"), [])
+        num_rows = self.store._get_connection().execute("SELECT COUNT(*) FROM mail").fetchone()[0]
+        self.assertEqual(num_rows, 2)
+
+    def test_undoes_claims_of_mail_sent_before_the_save(self):
+        self.store.send_all("g", "u", [make_mail("a"), make_mail("b")])
+        saved_sequence = self.store.get_sequence()
+        first_mail = self.store.get_page("g", "u", 0, 1)[0]
+        self.store.claim("g", "u", first_mail.get_mail_id())
+
+        self.restart()
+        self.store.roll_back_to_saved({"g": saved_sequence}, owns_everything)
+
+        self.assertEqual(self.get_unclaimed_names("g", "u"), ["a", "b"])
+
+    def test_never_saved_guilds_lose_their_mail(self):
+        self.store.send("g", "u", make_mail("a"))
+        self.store.send("h", "u", make_mail("b"))
+        self.store.send("i", "u", make_mail("c"))
+
+        # h is in the database but has never been saved with a sequence, and
+        # i isn't in the database at all
+        self.store.roll_back_to_saved({"g": self.store.get_sequence(), "h": None}, owns_everything)
+
+        self.assertEqual(self.get_unclaimed_names("g", "u"), ["a"])
+        self.assertEqual(self.get_unclaimed_names("h", "u"), [])
+        self.assertEqual(self.get_unclaimed_names("i", "u"), [])
+
+    def test_leaves_other_processes_guilds_alone(self):
+        self.store.send("g", "u", make_mail("a"))
+        self.store.send("h", "u", make_mail("b"))
+
+        self.store.roll_back_to_saved({"g": 0}, lambda guild_id_str: guild_id_str == "g")
+
+        self.assertEqual(self.get_unclaimed_names("g", "u"), [])
+        self.assertEqual(self.get_unclaimed_names("h", "u"), ["b"])
+
+
+class TestCompact(MailStoreTestCase):
+    def test_keeps_claimed_mail_within_retention(self):
+        self.store.send_all("g", "u", [make_mail("a"), make_mail("b")])
+        self.store.claim_all("g", "u")
+
+        self.assertEqual(self.store.compact({"g": self.store.get_sequence()}), 0)
+        self.assertEqual(self.store.compact({"g": self.store.get_sequence()}, time.time() + MAIL_RETENTION_SECONDS + 1), 2)
+
+    def test_keeps_claims_newer_than_the_save(self):
+        self.store.send_all("g", "u", [make_mail("a"), make_mail("b")])
+        first_mail = self.store.get_page("g", "u", 0, 1)[0]
+        self.store.claim("g", "u", first_mail.get_mail_id())
+        saved_sequence = self.store.get_sequence()
+        self.store.claim_all("g", "u")
+
+        # Only a's claim is in the save; b's could still be rolled back
+        self.assertEqual(self.store.compact({"g": saved_sequence}, time.time() + MAIL_RETENTION_SECONDS + 1), 1)
+
+    def test_never_deletes_unclaimed_mail(self):
+        self.store.send("g", "u", make_mail("a"))
+
+        self.assertEqual(self.store.compact({"g": self.store.get_sequence()}, time.time() + MAIL_RETENTION_SECONDS + 1), 0)
+        self.assertEqual(self.get_unclaimed_names("g", "u"), ["a"])
+
+    def test_only_compacts_the_given_guilds(self):
+        self.store.send("g", "u", make_mail("a"))
+        self.store.send("h", "u", make_mail("b"))
+        self.store.claim_all("g", "u")
+        self.store.claim_all("h", "u")
+
+        self.assertEqual(self.store.compact({"g": self.store.get_sequence()}, time.time() + MAIL_RETENTION_SECONDS + 1), 1)
+
+
+class TestMigration(MailStoreTestCase):
+    def load_database(self, player_states: Dict[str, dict], mail_sequence: int | None):
+        # As if decoded from a save made before the mail store existed, or
+        # after it if there's a mail sequence
+        members: Dict[str, Player] = {}
+        for user_id_str, state in player_states.items():
+            player = Player.__new__(Player)
+            player.__setstate__(dict(state))
+            members[user_id_str] = player
+        guild_data: dict = {"members": members}
+        if mail_sequence is not None:
+            guild_data["mail_sequence"] = mail_sequence
+        return {"g": guild_data}
+
+    def setUp(self):
+        super().setUp()
+        state = dict(Player("u").__getstate__())
+        state["_mailbox"] = [make_mail("a"), make_mail("b"), make_mail("c")]
+        self.legacy_states = {"u": state}
+
+    def test_moves_mail_in_once(self):
+        database = self.load_database(self.legacy_states, None)
+        self.store.sync_with_database(database, owns_everything)
+
+        self.assertEqual(self.get_unclaimed_names("g", "u"), ["a", "b", "c"])
+        self.assertEqual(database["g"]["members"]["u"].take_unmigrated_mail(), [])
+        self.assertNotIn("_unmigrated_mail", database["g"]["members"]["u"].__getstate__())
+
+    def test_crash_before_the_first_save_moves_it_in_again_once(self):
+        self.store.sync_with_database(self.load_database(self.legacy_states, None), owns_everything)
+        self.store.claim_all("g", "u")
+
+        # The save on disk still has the old mailbox
+        self.restart()
+        self.store.sync_with_database(self.load_database(self.legacy_states, None), owns_everything)
+
+        self.assertEqual(self.get_unclaimed_names("g", "u"), ["a", "b", "c"])
+
+    def test_nothing_moves_in_after_the_first_save(self):
+        database = self.load_database(self.legacy_states, None)
+        self.store.sync_with_database(database, owns_everything)
+        saved_states = {"u": dict(database["g"]["members"]["u"].__getstate__())}
+        saved_sequence = self.store.get_sequence()
+
+        self.restart()
+        self.store.sync_with_database(self.load_database(saved_states, saved_sequence), owns_everything)
+
+        self.assertEqual(self.get_unclaimed_names("g", "u"), ["a", "b", "c"])
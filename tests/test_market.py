@@ -0,0 +1,89 @@
+import unittest
+
+from features.inventory import Inventory
+from features.market import SELL_XP_BY_RARITY, get_filtered_sell_counts, sell_items
+from features.player import Player
+from features.shared.enums import ClassTag, get_tag_mask
+from features.shared.item import LOADED_ITEMS, Item, ItemKey, Rarity
+
+from typing import Dict, List
+
+# -----------------------------------------------------------------------------
+# HELPERS
+# -----------------------------------------------------------------------------
+
+def make_items(key: ItemKey, count: int) -> List[Item]:
+    return [LOADED_ITEMS.get_new_item(key) for _ in range(count)]
+
+
+def make_bound_item(key: ItemKey, count: int) -> Item:
+    # Nothing in the catalog is bound yet, so one is made from an existing item
+    state = dict(LOADED_ITEMS.get_item_state(key))
+    state["class_tags"] = state["class_tags"] + [ClassTag.Misc.Bound]
+    item = Item.load_from_state(state)
+    item.add_amount(count - item.get_count())
+    return item
+
+
+def get_counts_by_key(inventory: Inventory, slot_counts: Dict[int, int]) -> Dict[str, int]:
+    inventory_slots = inventory.get_inventory_slots()
+    return {inventory_slots[i].get_key(): count for i, count in slot_counts.items()}
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestFilteredSellCounts(unittest.TestCase):
+    def setUp(self):
+        self.inventory = Inventory()
+        # A common and an uncommon fish, an uncommon gemstone and a rare
+        # gemstone that's bound
+        self.inventory.add_items(make_items(ItemKey.Minnow, 5) + make_items(ItemKey.Oyster, 3) + make_items(ItemKey.Agate, 2))
+        # Organizing would rebuild it from the catalog and lose the tag
+        self.inventory.get_inventory_slots().append(make_bound_item(ItemKey.Amethyst, 4))
+
+    def test_no_filters_sells_everything_not_bound(self):
+        slot_counts = get_filtered_sell_counts(self.inventory, [], 0, 0)
+        self.assertEqual(get_counts_by_key(self.inventory, slot_counts), {ItemKey.Minnow: 5, ItemKey.Oyster: 3, ItemKey.Agate: 2})
+
+    def test_rarity_filter(self):
+        slot_counts = get_filtered_sell_counts(self.inventory, [Rarity.Uncommon], 0, 0)
+        self.assertEqual(get_counts_by_key(self.inventory, slot_counts), {ItemKey.Oyster: 3, ItemKey.Agate: 2})
+
+    def test_tag_filter(self):
+        slot_counts = get_filtered_sell_counts(self.inventory, [], get_tag_mask([ClassTag.Creature.Fish]), 0)
+        self.assertEqual(get_counts_by_key(self.inventory, slot_counts), {ItemKey.Minnow: 5, ItemKey.Oyster: 3})
+
+    def test_bound_items_are_skipped_even_when_they_match(self):
+        slot_counts = get_filtered_sell_counts(self.inventory, [Rarity.Rare], get_tag_mask([ClassTag.Valuable.Gemstone]), 0)
+        self.assertEqual(slot_counts, {})
+
+    def test_rarity_and_tag_filters_both_apply(self):
+        slot_counts = get_filtered_sell_counts(self.inventory, [Rarity.Uncommon], get_tag_mask([ClassTag.Creature.Fish]), 0)
+        self.assertEqual(get_counts_by_key(self.inventory, slot_counts), {ItemKey.Oyster: 3})
+
+    def test_keeps_that_many_of_each(self):
+        slot_counts = get_filtered_sell_counts(self.inventory, [], 0, 3)
+        # Oysters and Agate are all kept, so they aren't in it at all
+        self.assertEqual(get_counts_by_key(self.inventory, slot_counts), {ItemKey.Minnow: 2})
+
+
+class TestSellItems(unittest.TestCase):
+    def test_sells_counts_and_pays_once(self):
+        player = Player("1")
+        inventory = player.get_inventory()
+        inventory.add_items(make_items(ItemKey.Minnow, 5) + make_items(ItemKey.Oyster, 3))
+        minnow_value = LOADED_ITEMS.get_new_item(ItemKey.Minnow).get_value()
+        oyster_value = LOADED_ITEMS.get_new_item(ItemKey.Oyster).get_value()
+
+        slot_counts = get_filtered_sell_counts(inventory, [], 0, 1)
+        num_sold, total_amount, xp_to_add = sell_items(player, slot_counts)
+
+        self.assertEqual(num_sold, 6)
+        self.assertEqual(total_amount, 4 * minnow_value + 2 * oyster_value)
+        self.assertEqual(inventory.get_coins(), total_amount)
+        self.assertEqual(sorted(item.get_count() for item in inventory.get_inventory_slots()), [1, 1])
+        self.assertEqual(player.get_stats().market.items_sold, 6)
+        self.assertEqual(player.get_stats().market.coins_made, total_amount)
+        # Only the uncommon oysters give Merchant xp
+        self.assertEqual(xp_to_add, 2 * SELL_XP_BY_RARITY[Rarity.Uncommon])
@@ -0,0 +1,70 @@
+import time
+import unittest
+
+from features.shared.notifications import MAX_DM_LENGTH, MAX_REQUESTS_PER_SECOND, NotificationDispatcher, RateLimiter
+from features.shared.sharding import ShardConfig
+from unittest import mock
+
+# -----------------------------------------------------------------------------
+# HELPERS
+# -----------------------------------------------------------------------------
+
+def make_user():
+    user = mock.MagicMock()
+    user.dm_channel = None
+    channel = mock.MagicMock()
+    channel.send = mock.AsyncMock()
+
+    async def create_dm():
+        user.dm_channel = channel
+        return channel
+
+    user.create_dm = mock.AsyncMock(side_effect=create_dm)
+    return user
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestRateLimits(unittest.IsolatedAsyncioTestCase):
+    def test_budget_is_split_between_processes(self):
+        self.assertEqual(ShardConfig().get_share(), 1)
+        self.assertEqual(ShardConfig(8, [2, 3]).get_share(), 0.25)
+
+        whole = NotificationDispatcher()
+        quarter = NotificationDispatcher(ShardConfig(8, [2, 3]).get_share())
+        self.assertEqual(whole._global_limiter.get_max_per_second(), MAX_REQUESTS_PER_SECOND)
+        self.assertEqual(quarter._global_limiter.get_max_per_second(), int(MAX_REQUESTS_PER_SECOND / 4))
+        for route, limiter in quarter._route_limiters.items():
+            self.assertLess(limiter.get_max_per_second(), whole._route_limiters[route].get_max_per_second())
+
+        # Every process can still send something
+        tiny = NotificationDispatcher(1 / 1000)
+        self.assertEqual(tiny._global_limiter.get_max_per_second(), 1)
+
+    async def test_limiter_waits_for_the_window(self):
+        limiter = RateLimiter(2)
+        start_time = time.monotonic()
+        await limiter.wait()
+        await limiter.wait()
+        self.assertLess(time.monotonic() - start_time, 0.5)
+
+        await limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.9)
+
+class TestSend(unittest.IsolatedAsyncioTestCase):
+    async def test_dm_channel_is_opened_once(self):
+        dispatcher = NotificationDispatcher()
+        user = make_user()
+        bot = mock.MagicMock()
+        bot.get_user.return_value = user
+
+        dispatcher.notify(1, "a" * MAX_DM_LENGTH)
+        dispatcher.notify(1, "b")
+        await dispatcher.flush(bot)
+        dispatcher.notify(1, "c")
+        await dispatcher.flush(bot)
+
+        self.assertEqual(user.create_dm.await_count, 1)
+        self.assertEqual(user.dm_channel.send.await_count, 3)
+        self.assertEqual(dispatcher.get_stats()["total_sent"], 3)
@@ -0,0 +1,72 @@
+import datetime
+import unittest
+
+from features.shared.tick_scheduler import TickScheduler
+
+# -----------------------------------------------------------------------------
+# HELPERS
+# -----------------------------------------------------------------------------
+
+def at(hour: int, minute: int):
+    return datetime.datetime(2024, 1, 1, hour, minute, tzinfo=datetime.timezone.utc)
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestDueSlots(unittest.TestCase):
+    def setUp(self):
+        # Slots at :00, :15, :30 and :45
+        self.scheduler = TickScheduler(num_slots=4)
+
+    def test_first_run_is_only_the_current_slot(self):
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 31)), [2])
+
+    def test_on_time_runs(self):
+        self.assertEqual([self.scheduler.get_due_slots(at(0, minute)) for minute in (0, 15, 30, 45)], [[0], [1], [2], [3]])
+        self.assertEqual(self.scheduler.get_due_slots(at(1, 0)), [0])
+
+    def test_late_run_doesnt_repeat_the_slot(self):
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 15)), [1])
+        # Fired again within the same slot after a stall
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 29)), [])
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 30)), [2])
+
+    def test_late_run_catches_up_on_passed_over_slots(self):
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 0)), [0])
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 50)), [1, 2, 3])
+
+    def test_catching_up_across_the_hour(self):
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 40)), [2])
+        self.assertEqual(self.scheduler.get_due_slots(at(1, 20)), [3, 0, 1])
+
+    def test_more_than_an_hour_behind_runs_each_slot_once(self):
+        self.assertEqual(self.scheduler.get_due_slots(at(0, 0)), [0])
+        self.assertEqual(self.scheduler.get_due_slots(at(3, 20)), [2, 3, 0, 1])
+        self.assertEqual(self.scheduler.get_due_slots(at(3, 30)), [2])
+
+
+class TestSlots(unittest.TestCase):
+    def test_slots_must_divide_the_hour(self):
+        with self.assertRaises(ValueError):
+            TickScheduler(num_slots=7)
+        with self.assertRaises(ValueError):
+            TickScheduler(num_slots=0)
+
+    def test_tick_times_cover_every_slot_of_every_hour(self):
+        tick_times = TickScheduler(num_slots=4).get_tick_times()
+        self.assertEqual(len(tick_times), 96)
+        self.assertEqual(tick_times[:5], [datetime.time(0, 0), datetime.time(0, 15), datetime.time(0, 30), datetime.time(0, 45), datetime.time(1, 0)])
+
+    def test_players_keep_their_slot(self):
+        first = TickScheduler(num_slots=12)
+        second = TickScheduler(num_slots=12)
+        for user_id in ("1", "123456789012345678", "42"):
+            self.assertEqual(first.get_slot_for_user(user_id), second.get_slot_for_user(user_id))
+            self.assertIn(first.get_slot_for_user(user_id), range(12))
+
+    def test_slot_members(self):
+        scheduler = TickScheduler(num_slots=4)
+        database = {"g": {"members": {str(user_id): None for user_id in range(20)}}, "h": {"members": {}}}
+        members = [member for slot in range(4) for member in scheduler.get_slot_members(database, slot)]
+        self.assertEqual(sorted(members), sorted(("g", str(user_id)) for user_id in range(20)))
@@ -0,0 +1,69 @@
+import asyncio
+import discord
+import sys
+import unittest
+
+from features.shared.guild_locks import GUILD_LOCKS, instrument_view_locking
+from features.shared.metrics import METRICS, instrument_view_callbacks
+from features.shared.profiler import PROFILER, instrument_view_profiling
+from features.shared.watchdog import EventLoopWatchdog
+from unittest import mock
+
+from typing import Tuple
+
+# -----------------------------------------------------------------------------
+# FAKE VIEWS
+# -----------------------------------------------------------------------------
+
+# Each records what the watchdog would report if the loop stalled inside its
+# callback
+
+class StallButton(discord.ui.Button):
+    def __init__(self, watchdog: EventLoopWatchdog):
+        super().__init__(label="Stall")
+        self._watchdog = watchdog
+        self.reported: Tuple[str, str] | None = None
+
+    async def callback(self, interaction: discord.Interaction):
+        self.reported = self._watchdog._get_activity_and_call_site(sys._getframe())
+
+
+class StallModal(discord.ui.Modal):
+    def __init__(self, watchdog: EventLoopWatchdog):
+        super().__init__(title="Stall")
+        self._watchdog = watchdog
+        self.reported: Tuple[str, str] | None = None
+
+    async def on_submit(self, interaction: discord.Interaction):
+        self.reported = self._watchdog._get_activity_and_call_site(sys._getframe())
+
+# -----------------------------------------------------------------------------
+# TESTS
+# -----------------------------------------------------------------------------
+
+class TestStallAttribution(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # As bot.py installs them
+        instrument_view_callbacks(METRICS)
+        instrument_view_profiling(PROFILER)
+        instrument_view_locking(GUILD_LOCKS)
+
+        self.watchdog = EventLoopWatchdog()
+        self.interaction = mock.MagicMock()
+        self.interaction.guild_id = 1
+
+    async def test_view_callback_is_the_activity(self):
+        view = discord.ui.View()
+        button = StallButton(self.watchdog)
+        view.add_item(button)
+
+        # Its own task, like discord.py dispatches it, so nothing from the test
+        # is further out on the stack
+        await asyncio.create_task(view._scheduled_task(button, self.interaction))
+        self.assertEqual(button.reported, ("StallButton.callback", "StallButton.callback"))
+
+    async def test_modal_submit_is_the_activity(self):
+        modal = StallModal(self.watchdog)
+
+        await asyncio.create_task(modal._scheduled_task(self.interaction, [], {}))
+        self.assertEqual(modal.reported, ("StallModal.on_submit", "StallModal.on_submit"))